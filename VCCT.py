@@ -3,45 +3,18 @@ from tkinter import filedialog
 from tkinter import ttk
 import os
 import io
-import subprocess
-from moviepy.editor import VideoFileClip
 from PIL import Image, ImageTk
 import threading
 import base64
-
-def compress_video(input_path, output_path):
-    target_size = 16 * 1024 * 1024 
-    video = VideoFileClip(input_path) 
-    duration = video.duration 
-    original_size = os.path.getsize(input_path) 
-    target_bitrate = int((target_size * 8) / duration) 
-
-    compression_complete = threading.Event()  # Create an event to signal completion
-
-    def run_ffmpeg():
-        ffmpeg_path = r"C:\ffmpeg\bin\ffmpeg.exe"  # Specify the full path to ffmpeg
-        process = subprocess.Popen(
-            [ffmpeg_path, '-i', input_path, '-c:v', 'libx264', '-preset', 'medium', '-b:v', f'{target_bitrate}', '-c:a', 'aac', '-b:a', '128k', '-y', output_path],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        
-        # Capture output and error
-        stdout, stderr = process.communicate()  # Wait for the process to complete and capture output
-        print(stdout.decode())  # Print standard output
-        print(stderr.decode())  # Print standard error
-
-        compression_complete.set()  # Signal that compression is complete
-
-    threading.Thread(target=run_ffmpeg).start()
-
-    return original_size, compression_complete  # Return the original size and the event
+from mediatool import compress_video, convert_to_mp4, convert_to_gif
 
 def video_processing_thread(action, input_path, output_path):
     try:
         if action == "compress":
             original_size, compression_complete = compress_video(input_path, output_path)
             compression_complete.wait()  # Wait for the compression to finish
+            if compression_complete.error is not None:
+                raise compression_complete.error
             compressed_size = os.path.getsize(output_path)  # Now get the compressed size
             update_size_labels(original_size, compressed_size)  # Update size labels
         elif action == "convert_mp4":
@@ -61,33 +34,6 @@ def update_size_labels(original_size, compressed_size):
     original_size_label['text'] = f"Originalgröße: {original_size / 1024 / 1024:.2f} MB"
     compressed_size_label['text'] = f"Komprimierte Größe: {compressed_size / 1024 / 1024:.2f} MB"
 
-def convert_to_mp4(input_path, output_path):
-    video = VideoFileClip(input_path) 
-    video.write_videofile(output_path, codec="libx264") 
-
-def convert_to_gif(input_path, output_path):
-    video = VideoFileClip(input_path)
-    fps = video.fps
-    width = int(video.w)
-    height = int(video.h)
-    images = []
-    temp_filenames = []  # List to keep track of temporary filenames
-
-    for i in range(int(video.duration * fps)):
-        temp_filename = f"frame_{i}.png"
-        video.save_frame(temp_filename, t=i/fps)
-        img = Image.open(temp_filename).resize((width, height))
-        images.append(img)
-        temp_filenames.append(temp_filename)  # Store the filename
-
-    # Save images as GIF
-    images[0].save(output_path, format='GIF', append_images=images[1:],
-                   save_all=True, duration=1/fps, loop=0)
-
-    # Clean up temporary images
-    for temp_filename in temp_filenames:
-        os.remove(temp_filename)  # Remove the temporary file
-
 def browse_input_file():
     filepath = filedialog.askopenfilename(filetypes=[("Video files", "*.*")])  # Allow all video files
     input_entry.delete(0, tk.END)
@@ -6,7 +6,7 @@ import sys
 def install_packages():
     packages = ['imageio', 'meson', 'python-poppler', 'python-ffmpeg', 'scipy', 'tqdm', 'tesseract', 'decorator',
                 'imageio_ffmpeg', 'numpy', 'prolog', 'python-dotenv', 'moviepy', 'Pillow', 'opencv-python',
-                'pytesseract', 'PyPDF2', 'audioop-lts', 'PyMuPDF', 'pdf2image', 'pydub', 'requests']
+                'pytesseract', 'PyPDF2>=3.0,<4', 'audioop-lts', 'PyMuPDF', 'pdf2image', 'pydub', 'requests']
 
     for package in packages:
         try:
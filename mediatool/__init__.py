@@ -0,0 +1,36 @@
+"""
+Processing core of the Multimedia Werkzeug.
+
+The functions in this package have no GUI side effects and can be used from scripts, from the
+command line (python -m mediatool) and on machines without a display.
+
+The submodules are imported on first access of one of their functions, so e.g. OpenCV, tesseract and
+the spellchecker are only loaded once a PDF is processed.
+"""
+
+import importlib
+
+from . import config
+
+# Public name -> submodule that defines it
+lazy_exports = {
+    'probe_media': 'ffmpeg', 'run_ffmpeg_with_progress': 'ffmpeg', 'format_progress': 'ffmpeg',
+    'compress_video': 'video', 'convert_to_mp4': 'video', 'convert_to_gif': 'video', 'video_thumbnails': 'video',
+    'improve_pdf_for_ai_reading': 'pdf', 'compress_pdf': 'pdf',
+    'convert_audio': 'audio', 'audio_format': 'audio',
+    'waveform_peaks': 'waveform', 'waveform_columns': 'waveform',
+    'Job': 'jobs', 'JobScheduler': 'jobs',
+    'CancelToken': 'process', 'ProcessCancelled': 'process', 'run_process': 'process',
+}
+
+__all__ = ['config', *lazy_exports]
+
+def __getattr__(name):
+    if name not in lazy_exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{lazy_exports[name]}', __name__), name)
+    globals()[name] = value  # Later lookups do not go through __getattr__
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + list(lazy_exports))
@@ -0,0 +1,79 @@
+import os
+
+from . import config
+from .ffmpeg import probe_media, run_ffmpeg_with_progress
+
+# ---------------------- Audio Processing Functions ---------------------- #
+# Define the available audio formats: ffmpeg encoder and the source codecs that can be copied without re-encoding
+audio_format = {
+    'mp3': ('libmp3lame', {'mp3'}),
+    'wav': ('pcm_s16le', {'pcm_u8', 'pcm_s16le', 'pcm_s24le', 'pcm_s32le', 'pcm_f32le'}),
+    'flac': ('flac', {'flac'}),
+    'ogg': ('libvorbis', {'vorbis', 'opus', 'flac'}),
+    'm4a': ('aac', {'aac', 'alac'}),
+    'opus': ('libopus', {'opus'}),
+    # Add other formats as needed
+}
+
+def output_paths(output_path, formats, bitrates):
+    """Returns one output path per target. Formats that are requested with several bitrates get the bitrate appended."""
+    base = os.path.splitext(output_path)[0]
+    paths = []
+    for format, bitrate in zip(formats, bitrates):
+        suffix = f"_{bitrate // 1000}k" if bitrate and formats.count(format) > 1 else ""
+        paths.append(f"{base}{suffix}.{format}")
+    return paths
+
+def convert_audio(input_path, output_path, format, bitrate=None, stream_copy=True, progress_callback=None, cancel_token=None):
+    """
+    Converts the first audio track of a file with ffmpeg, to one or several formats.
+
+    ffmpeg decodes and encodes in one streaming pass, so memory use does not depend on the length of the
+    recording. Several targets are written by the same ffmpeg process, so the input is decoded only once.
+    If the source codec can be stored in a target format as it is, the track is only copied for that target.
+
+    :param format: Target format, a key of audio_format, or a list of them.
+    :param bitrate: Bitrate in bits per second for lossy formats, or a list with one bitrate per format.
+                    Default is the encoder default.
+    :param stream_copy: Copy the track if its codec matches the target format and it is not above bitrate.
+    :param progress_callback: Optional, receives the progress, see run_ffmpeg_with_progress.
+    :param cancel_token: Optional CancelToken that stops ffmpeg.
+    :return: Path of the output file, or a list of paths if format is a list.
+    """
+    formats = [format] if isinstance(format, str) else list(format)
+    formats = [name.lower() for name in formats]
+    bitrates = list(bitrate) if isinstance(bitrate, (list, tuple)) else [bitrate] * len(formats)
+    if len(bitrates) != len(formats):
+        raise ValueError("Expected one bitrate per audio format")
+    for name in formats:
+        if name not in audio_format:
+            raise ValueError(f"Unsupported audio format: {name}")
+    # Ensure the output paths have the correct file extension for the selected formats
+    paths = output_paths(output_path, formats, bitrates)
+    if len(set(paths)) != len(paths):
+        raise ValueError("The same audio format and bitrate were requested twice")
+    
+    # Fail fast on files without an audio track instead of decoding them
+    media = probe_media(input_path)
+    audio_stream = media['audio']
+    if audio_stream is None:
+        raise ValueError(f"No audio stream found in: {input_path}")
+
+    command = [config.ffmpeg_path, '-y', '-i', input_path]
+    for name, target_bitrate, path in zip(formats, bitrates, paths):
+        # Every output gets its own encoder, all of them are fed from the same decoder
+        encoder, copy_codecs = audio_format[name]
+        command += ['-map', f"0:{audio_stream['index']}"]
+        if (stream_copy and audio_stream['codec'] in copy_codecs
+                and not (target_bitrate and audio_stream['bit_rate'] and audio_stream['bit_rate'] > target_bitrate)):
+            command += ['-c:a', 'copy']
+        else:
+            command += ['-c:a', encoder]
+            if target_bitrate and name not in ('wav', 'flac'):
+                command += ['-b:a', f'{target_bitrate}']
+        command.append(path)
+
+    returncode, log = run_ffmpeg_with_progress(command, media['duration'], progress_callback, cancel_token=cancel_token)
+    if returncode != 0:
+        raise RuntimeError("FFmpeg failed: " + "\n".join(log[-10:]))
+    return paths[0] if isinstance(format, str) else paths
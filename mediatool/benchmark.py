@@ -0,0 +1,353 @@
+"""
+Offline benchmark of the media pipelines: python -m mediatool.benchmark
+
+All input files are generated locally and deterministically: ffmpeg test sources for video, tones and
+seeded noise for audio, and scanned-looking PDFs drawn with reportlab from noisy page images. Every case
+runs in a fresh Python process, so caches and imported modules of one case do not speed up the next.
+Wall time, CPU time, peak memory and output size are stored as JSON and compared with a saved baseline.
+The run also fails if the startup imports of the GUI load one of its deferred modules.
+"""
+
+import argparse, ast, json, os, platform, shutil, statistics, subprocess, sys, time
+
+from . import config
+from .process import run_process
+
+# ---------------------- Fixtures ---------------------- #
+
+benchmark_dir = os.path.join(os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', '.cache')),
+                             'MultiMediaTool', 'benchmark')
+
+# Input size of each fixture per size class
+video_sizes = {'small': (10, '640x360'), 'large': (60, '1280x720')}  # Seconds, resolution
+audio_sizes = {'small': 60, 'large': 600}  # Seconds
+pdf_sizes = {'small': 4, 'large': 24}  # Pages
+
+def make_video(path, duration, resolution):
+    """Writes an H.264/AAC test clip with moving content, so the encoder has real work to do."""
+    run_process([config.ffmpeg_path, '-v', 'error', '-y',
+                 '-f', 'lavfi', '-i', f'testsrc2=size={resolution}:rate=30:duration={duration}',
+                 '-f', 'lavfi', '-i', f'sine=frequency=440:sample_rate=48000:duration={duration}',
+                 '-c:v', 'libx264', '-preset', 'veryfast', '-crf', '18', '-pix_fmt', 'yuv420p',
+                 '-c:a', 'aac', '-b:a', '192k', '-shortest', path], check=True, stdout=None, stderr=None)
+
+def make_audio(path, duration):
+    """Writes a 16-bit stereo WAV file with a tone mixed with seeded noise."""
+    run_process([config.ffmpeg_path, '-v', 'error', '-y',
+                 '-f', 'lavfi', '-i', f'sine=frequency=440:sample_rate=44100:duration={duration}',
+                 '-f', 'lavfi', '-i', f'anoisesrc=color=pink:seed=1:amplitude=0.2:sample_rate=44100:duration={duration}',
+                 '-filter_complex', '[0][1]amix=inputs=2,aformat=channel_layouts=stereo',
+                 '-c:a', 'pcm_s16le', path], check=True, stdout=None, stderr=None)
+
+def scanned_page(number, width=1240, height=1754):
+    """Returns a grayscale page image at 150 DPI with lines of text, a slight tilt and seeded sensor noise."""
+    import numpy as np
+    from PIL import Image, ImageDraw
+
+    image = Image.new('L', (width, height), 255)
+    draw = ImageDraw.Draw(image)
+    words = ["Rechnung", "Vertrag", "Datum", "Betrag", "Kunde", "Seite", "Anlage", "Zahlung", "Frist", "Adresse"]
+    for line in range(60):
+        text = " ".join(words[(number * 7 + line * 3 + index) % len(words)] for index in range(9))
+        draw.text((100, 120 + line * 25), f"{line + 1:02d}  {text}", fill=0)
+    image = image.rotate(0.4, fillcolor=255)  # Scans are rarely perfectly straight
+
+    noise = np.random.RandomState(number).normal(0, 18, (height, width))
+    pixels = np.clip(np.asarray(image, dtype=np.float32) + noise, 0, 255).astype(np.uint8)
+    return Image.fromarray(pixels)
+
+def make_pdf(path, pages):
+    """Writes an image-only PDF that looks like a scan, one noisy page image per A4 page."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfgen import canvas
+
+    # invariant leaves out the creation date and document ID, so the file is the same on every run
+    pdf = canvas.Canvas(path, pagesize=A4, invariant=1)
+    for number in range(pages):
+        pdf.drawImage(ImageReader(scanned_page(number)), 0, 0, *A4)
+        pdf.showPage()
+    pdf.save()
+
+def fixture_path(kind, size):
+    """Returns the path of a fixture and generates it on first use."""
+    folder = os.path.join(benchmark_dir, 'fixtures')
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"{kind}_{size}" + {'video': '.mp4', 'audio': '.wav', 'pdf': '.pdf'}[kind])
+    if os.path.exists(path):
+        return path
+
+    print(f"Generating {os.path.basename(path)}")
+    temp_path = path + '.tmp' + os.path.splitext(path)[1]
+    if kind == 'video':
+        make_video(temp_path, *video_sizes[size])
+    elif kind == 'audio':
+        make_audio(temp_path, audio_sizes[size])
+    else:
+        make_pdf(temp_path, pdf_sizes[size])
+    os.replace(temp_path, path)  # A fixture only exists once it was written completely
+    return path
+
+# ---------------------- Pipelines ---------------------- #
+
+# Pipeline -> fixture kind and output extension
+pipelines = {
+    'compress_video': ('video', '.mp4'),
+    'convert_to_mp4': ('video', '.mp4'),
+    'convert_to_gif': ('video', '.gif'),
+    'convert_audio': ('audio', '.mp3'),
+    'compress_pdf': ('pdf', '.pdf'),
+    'compress_pdf_native': ('pdf', '.pdf'),
+    'improve_pdf_for_ai_reading': ('pdf', '.pdf'),
+}
+
+def run_pipeline(pipeline, input_path, output_path):
+    """Runs one pipeline with fixed settings. Called in the child process of a case."""
+    if pipeline == 'compress_video':
+        from .video import compress_video
+        # A quarter of the input size, so the two-pass encode always runs
+        _, compression_complete = compress_video(input_path, output_path, target_size=os.path.getsize(input_path) // 4)
+        compression_complete.wait()
+        if compression_complete.error is not None:
+            raise compression_complete.error
+    elif pipeline == 'convert_to_mp4':
+        from .video import convert_to_mp4
+        convert_to_mp4(input_path, output_path, stream_copy=False)  # Measure the encoder, not a remux
+    elif pipeline == 'convert_to_gif':
+        from .video import convert_to_gif
+        convert_to_gif(input_path, output_path, fps=10, max_width=320)
+    elif pipeline == 'convert_audio':
+        from .audio import convert_audio
+        convert_audio(input_path, output_path, 'mp3', bitrate=192000)
+    elif pipeline in ('compress_pdf', 'compress_pdf_native'):
+        from .pdf import compress_pdf
+        compress_pdf(input_path, output_path, engine='native' if pipeline == 'compress_pdf_native' else 'ghostscript')
+    elif pipeline == 'improve_pdf_for_ai_reading':
+        from .pdf import improve_pdf_for_ai_reading
+        improve_pdf_for_ai_reading(input_path, output_path, use_cache=False)  # Cached pages would skip the OCR
+
+# ---------------------- Measurement ---------------------- #
+
+package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def child_env():
+    """Environment for child Python processes, which import mediatool from this checkout."""
+    return dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [package_root, os.environ.get('PYTHONPATH')])))
+
+def run_case(pipeline, size):
+    """
+    Runs one pipeline on one fixture in a new Python process and measures it.
+
+    CPU time and peak memory come from the resource usage of the child process, which includes the ffmpeg,
+    Ghostscript and tesseract processes it started. Peak memory is that of the largest single process.
+    They are not available on Windows and are None there.
+
+    :return: Dict with 'wall_time', 'cpu_time' and 'cpu_utilization' in seconds and cores, 'peak_rss' and
+             'output_size' in bytes, and 'error' with the end of the log if the run failed.
+    """
+    kind, extension = pipelines[pipeline]
+    input_path = fixture_path(kind, size)
+    output_path = os.path.join(benchmark_dir, 'output', f"{pipeline}_{size}{extension}")
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    if os.path.exists(output_path):
+        os.remove(output_path)
+
+    command = [sys.executable, '-m', 'mediatool.benchmark', '--run-case', pipeline, input_path, output_path,
+               '--ffmpeg', config.ffmpeg_path, '--ffprobe', config.ffprobe_path, '--gs', config.gs_path]
+    log_path = output_path + '.log'
+    with open(log_path, 'wb') as log:
+        started = time.perf_counter()
+        process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT, env=child_env())
+        if hasattr(os, 'wait4'):
+            # Unlike process.wait(), wait4 also returns the resource usage of the child and its children
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+        else:
+            process.wait()
+            usage = None
+        wall_time = time.perf_counter() - started
+
+    result = {'wall_time': wall_time, 'cpu_time': None, 'cpu_utilization': None, 'peak_rss': None,
+              'output_size': os.path.getsize(output_path) if os.path.exists(output_path) else None, 'error': None}
+    if usage is not None:
+        result['cpu_time'] = usage.ru_utime + usage.ru_stime
+        result['cpu_utilization'] = result['cpu_time'] / wall_time
+        result['peak_rss'] = usage.ru_maxrss * (1 if sys.platform == 'darwin' else 1024)  # Linux reports KiB
+    if process.returncode != 0 or result['output_size'] is None:
+        with open(log_path, encoding='utf-8', errors='replace') as f:
+            lines = [line.strip() for line in f if line.strip()]
+        result['error'] = lines[-1] if lines else f"Exit code {process.returncode}"
+    return result
+
+def run_benchmarks(selected_pipelines, sizes, repeat=1):
+    """
+    Runs every pipeline on every size repeat times.
+
+    :return: List of result dicts with 'pipeline' and 'size', see run_case. With repeat > 1 the times are
+             the median of the runs and the peak memory is the maximum.
+    """
+    results = []
+    for pipeline in selected_pipelines:
+        for size in sizes:
+            runs = []
+            for _ in range(repeat):
+                runs.append(run_case(pipeline, size))
+                if runs[-1]['error']:
+                    break  # A failing pipeline fails every time, e.g. if a program is missing
+            result = dict(runs[-1], pipeline=pipeline, size=size, runs=len(runs))
+            if not result['error']:
+                for key in ('wall_time', 'cpu_time', 'cpu_utilization'):
+                    if result[key] is not None:
+                        result[key] = statistics.median(run[key] for run in runs)
+                if result['peak_rss'] is not None:
+                    result['peak_rss'] = max(run['peak_rss'] for run in runs)
+            print(format_result(result))
+            results.append(result)
+    return results
+
+def environment():
+    """Describes the machine and program versions, results from different environments are not comparable."""
+    try:
+        ffmpeg_version = run_process([config.ffmpeg_path, '-version']).stdout.decode(errors='replace').split('\n')[0].strip()
+    except OSError:
+        ffmpeg_version = None
+    return {
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+        'ffmpeg': ffmpeg_version,
+    }
+
+# ---------------------- Startup Imports ---------------------- #
+
+def check_startup_imports():
+    """
+    Runs the module-level imports of multiTool.py in a new Python process and returns the modules of its
+    deferred_modules list that they load. Those modules are slow to import and must only be loaded once a
+    PDF or waveform is processed. multiTool.py itself is not imported, it opens its window on import.
+    """
+    with open(os.path.join(package_root, 'multiTool.py'), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    deferred = next(ast.literal_eval(node.value) for node in tree.body if isinstance(node, ast.Assign)
+                    and any(getattr(target, 'id', None) == 'deferred_modules' for target in node.targets))
+
+    code = ast.unparse(ast.Module(imports, type_ignores=[]))
+    code += f"\nimport sys\nprint(','.join(name for name in {deferred!r} if name in sys.modules))"
+    result = run_process([sys.executable, '-c', code], env=child_env())
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup imports failed: {result.stderr.decode(errors='replace').strip()}")
+    return [name for name in result.stdout.decode().strip().split(',') if name]
+
+# ---------------------- Report ---------------------- #
+
+def format_result(result):
+    if result['error']:
+        return f"{result['pipeline']:<28} {result['size']:<6} failed: {result['error']}"
+    parts = [f"{result['pipeline']:<28} {result['size']:<6} {result['wall_time']:8.2f} s"]
+    if result['cpu_utilization'] is not None:
+        parts.append(f"CPU {result['cpu_utilization']:5.2f} cores")
+    if result['peak_rss'] is not None:
+        parts.append(f"RSS {result['peak_rss'] / 1024 / 1024:7.1f} MB")
+    parts.append(f"output {result['output_size'] / 1024 / 1024:7.2f} MB")
+    return " | ".join(parts)
+
+def compare(results, baseline, tolerance):
+    """
+    Prints the change of every result against the baseline.
+
+    :param tolerance: Relative increase of wall time, peak memory or output size that counts as a regression, e.g. 0.1.
+    :return: Number of regressions.
+    """
+    if baseline['environment'] != environment():
+        print("Warning: the baseline was recorded in a different environment:", baseline['environment'])
+    previous = {(result['pipeline'], result['size']): result for result in baseline['results']}
+    regressions = 0
+    for result in results:
+        old = previous.get((result['pipeline'], result['size']))
+        if old is None or old['error'] or result['error']:
+            continue
+        changes = []
+        for key, label in (('wall_time', 'time'), ('peak_rss', 'RSS'), ('output_size', 'size')):
+            if not old[key] or result[key] is None:
+                continue
+            change = result[key] / old[key] - 1
+            flag = ""
+            if change > tolerance:
+                flag = " REGRESSION"
+                regressions += 1
+            changes.append(f"{label} {change:+.1%}{flag}")
+        print(f"{result['pipeline']:<28} {result['size']:<6} " + ", ".join(changes))
+    return regressions
+
+# ---------------------- Command Line ---------------------- #
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m mediatool.benchmark',
+        description='Benchmarks the media pipelines on generated input files and compares them with a baseline.'
+    )
+    parser.add_argument('--pipelines', type=lambda value: value.split(','), default=list(pipelines),
+                        help=f"Pipelines to run, separated by commas. Default is all: {', '.join(pipelines)}.")
+    parser.add_argument('--sizes', type=lambda value: value.split(','), default=['small', 'large'],
+                        help='Input sizes to run, separated by commas: small, large. Default is both.')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per case, the median is reported. Default is 1.')
+    parser.add_argument('--output', help='Write the results to this JSON file.')
+    parser.add_argument('--baseline', default=os.path.join(benchmark_dir, 'baseline.json'),
+                        help='Baseline to compare with. Default is baseline.json in the benchmark folder.')
+    parser.add_argument('--save-baseline', action='store_true', help='Store the results as the new baseline.')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='Relative increase that counts as a regression. Default is 0.1 (10%%).')
+    parser.add_argument('--clean', action='store_true', help='Delete the generated input and output files first.')
+    parser.add_argument('--run-case', nargs=3, metavar=('PIPELINE', 'INPUT', 'OUTPUT'), help=argparse.SUPPRESS)
+    parser.add_argument('--ffmpeg', default=config.ffmpeg_path, help='Path to ffmpeg.')
+    parser.add_argument('--ffprobe', default=config.ffprobe_path, help='Path to ffprobe.')
+    parser.add_argument('--gs', default=config.gs_path, help='Path to the Ghostscript executable.')
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    config.ffmpeg_path = args.ffmpeg
+    config.ffprobe_path = args.ffprobe
+    config.gs_path = args.gs
+    config.process_priority = 'normal'  # Lowered priorities would make the times depend on other load
+
+    if args.run_case:
+        run_pipeline(*args.run_case)
+        return 0
+
+    unknown = [name for name in args.pipelines if name not in pipelines]
+    unknown += [size for size in args.sizes if size not in video_sizes]
+    if unknown:
+        print(f"Unknown pipeline or size: {', '.join(unknown)}")
+        return 2
+    if args.clean:
+        for folder in ('fixtures', 'output'):
+            shutil.rmtree(os.path.join(benchmark_dir, folder), ignore_errors=True)
+
+    # Fails the run like a regression, a module imported at startup slows down every start of the GUI
+    loaded = check_startup_imports()
+    if loaded:
+        print(f"Startup imports load modules that must be deferred: {', '.join(loaded)}")
+
+    results = run_benchmarks(args.pipelines, args.sizes, args.repeat)
+    report = {'environment': environment(), 'results': results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    regressions = 0
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\nCompared with {args.baseline}:")
+        regressions = compare(results, baseline, args.tolerance)
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved as {args.baseline}")
+    return 1 if regressions or loaded else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,201 @@
+import argparse, glob, os
+
+from . import config
+from .jobs import JobScheduler
+from .video import compress_video, convert_to_mp4, convert_to_gif
+from .pdf import improve_pdf_for_ai_reading, compress_pdf
+from .audio import convert_audio, audio_format
+from .waveform import peaks_suffix
+from .process import CancelToken, priority_levels
+
+# ---------------------- Command Line Interface ---------------------- #
+
+# Suffix and extension of the output file for each operation. None keeps the extension of the input file.
+operations = {
+    'compress-video': ('_compressed', None),
+    'convert-mp4': ('', '.mp4'),
+    'convert-gif': ('', '.gif'),
+    'compress-pdf': ('_compressed', '.pdf'),
+    'improve-pdf': ('_ocr', '.pdf'),
+    'convert-audio': ('', None),
+}
+
+def expand_inputs(patterns):
+    """
+    Expands glob patterns, which the Windows shell does not do, and drops duplicates while keeping the order.
+    Waveform cache files found by a pattern are skipped.
+    """
+    paths = []
+    for pattern in patterns:
+        if any(char in pattern for char in '*?['):
+            paths.extend(path for path in sorted(glob.glob(pattern, recursive=True)) if not path.endswith(peaks_suffix))
+        else:
+            paths.append(pattern)
+    return list(dict.fromkeys(paths))
+
+def output_path_for(input_path, args):
+    """Returns the output path for an input file, in --output-dir or next to the input file."""
+    suffix, extension = operations[args.operation]
+    stem, input_extension = os.path.splitext(os.path.basename(input_path))
+    if args.operation == 'convert-audio':
+        extension = f".{args.format[0]}"
+    extension = extension or input_extension
+    output_dir = args.output_dir or os.path.dirname(os.path.abspath(input_path))
+
+    output_path = os.path.join(output_dir, stem + suffix + extension)
+    if os.path.abspath(output_path) == os.path.abspath(input_path):
+        # Never overwrite the input, e.g. when converting an MP4 to MP4
+        output_path = os.path.join(output_dir, stem + '_converted' + extension)
+    return output_path
+
+def run_operation(input_path, output_path, args, cancel_token=None):
+    if args.operation == 'compress-video':
+        _, compression_complete = compress_video(input_path, output_path,
+                                                 target_size=int(args.target_size * 1024 * 1024),
+                                                 audio_bitrate=args.audio_bitrate * 1000, segments=args.segments,
+                                                 cancel_token=cancel_token)
+        compression_complete.wait()
+        if compression_complete.error is not None:
+            raise compression_complete.error
+    elif args.operation == 'convert-mp4':
+        convert_to_mp4(input_path, output_path, stream_copy=not args.no_stream_copy, cancel_token=cancel_token)
+    elif args.operation == 'convert-gif':
+        convert_to_gif(input_path, output_path, fps=args.gif_fps, max_width=args.gif_max_width, palette=args.gif_palette,
+                       cancel_token=cancel_token)
+    elif args.operation == 'compress-pdf':
+        compress_pdf(input_path, output_path, args.quality, workers=args.pdf_workers, engine=args.pdf_engine,
+                     cancel_token=cancel_token)
+    elif args.operation == 'improve-pdf':
+        # The cores are shared by the files processed at the same time
+        ocr_workers = args.ocr_workers or max(1, (os.cpu_count() or 1) // max(1, args.jobs))
+        improve_pdf_for_ai_reading(input_path, output_path, workers=ocr_workers, window_size=args.page_window,
+                                   skip_text_pages=not args.ocr_all_pages, use_cache=not args.no_ocr_cache,
+                                   cancel_token=cancel_token)
+    elif args.operation == 'convert-audio':
+        bitrate = [value * 1000 for value in args.bitrate] if args.bitrate else None
+        if bitrate and len(bitrate) == 1:
+            bitrate = bitrate[0]  # Same bitrate for all formats
+        # All formats are encoded from one decoding pass
+        output_path = ", ".join(convert_audio(input_path, output_path, args.format, bitrate=bitrate, cancel_token=cancel_token))
+    return output_path
+
+def audio_formats(value):
+    formats = [name.strip().lower() for name in value.split(',') if name.strip()]
+    unknown = [name for name in formats if name not in audio_format]
+    if not formats or unknown:
+        raise argparse.ArgumentTypeError(f"unsupported audio format: {', '.join(unknown) or value}")
+    return formats
+
+def bitrates(value):
+    try:
+        return [int(bitrate) for bitrate in value.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid bitrate: {value}")
+
+def cpu_list(value):
+    try:
+        cpus = {int(cpu) for cpu in value.split(',')}
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid CPU list: {value}")
+    if hasattr(os, 'sched_getaffinity'):
+        available = os.sched_getaffinity(0)
+    else:
+        available = set(range(os.cpu_count() or 1))
+    if not cpus <= available:
+        unavailable = ','.join(str(cpu) for cpu in sorted(cpus - available))
+        usable = ','.join(str(cpu) for cpu in sorted(available))
+        raise argparse.ArgumentTypeError(f"CPU {unavailable} not available, usable CPUs are {usable}")
+    return cpus
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m mediatool',
+        description='Processes video, PDF and audio files without the GUI.'
+    )
+    parser.add_argument('operation', choices=operations, help='Processing step to run on every input file.')
+    parser.add_argument('inputs', nargs='+', help='Input files or glob patterns such as "scans/*.pdf".')
+    parser.add_argument('-o', '--output-dir', help='Directory for the output files. Default is the directory of each input file.')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Number of files processed at the same time. Default is 1.')
+    parser.add_argument('--timeout', type=float, help='Maximum time in seconds per file. Slower files are cancelled. Default is no limit.')
+
+    video = parser.add_argument_group('video')
+    video.add_argument('--target-size', type=float, default=16, help='Target size in MB for compress-video. Default is 16.')
+    video.add_argument('--audio-bitrate', type=int, default=128, help='Maximum audio bitrate in kbit/s for compress-video. Default is 128.')
+    video.add_argument('--segments', type=int, default=1,
+                       help='Split long videos into up to this many segments that compress-video encodes at the same time. Default is 1.')
+    video.add_argument('--no-stream-copy', action='store_true', help='Re-encode all streams in convert-mp4.')
+    video.add_argument('--gif-fps', type=float, help='Frame rate of the GIF. Default is the frame rate of the video.')
+    video.add_argument('--gif-max-width', type=int, help='Maximum width of the GIF.')
+    video.add_argument('--gif-palette', choices=['adaptive', 'shared'], default='adaptive', help='GIF palette mode. Default is adaptive.')
+
+    pdf = parser.add_argument_group('pdf')
+    pdf.add_argument('--ocr-workers', type=int, help='Number of pages processed at the same time in improve-pdf. Default is the number of CPU cores divided by --jobs.')
+    pdf.add_argument('--page-window', type=int, help='Number of pages rasterized at once in improve-pdf. Default is two per OCR worker.')
+    pdf.add_argument('--ocr-all-pages', action='store_true', help='OCR pages in improve-pdf even if they already have a text layer.')
+    pdf.add_argument('--no-ocr-cache', action='store_true', help='Do not reuse or store OCR results of single pages in improve-pdf.')
+    pdf.add_argument('--pdf-workers', type=int, help='Number of Ghostscript processes or images processed at the same time in compress-pdf. Default is the number of CPU cores.')
+    pdf.add_argument('--pdf-engine', choices=['ghostscript', 'native'], default='ghostscript', help='compress-pdf engine. native only recompresses the images and needs no Ghostscript. Default is ghostscript.')
+    pdf.add_argument('--quality', choices=['screen', 'ebook', 'printer', 'prepress'], default='ebook', help='Ghostscript preset for compress-pdf. Default is ebook.')
+
+    audio = parser.add_argument_group('audio')
+    audio.add_argument('--format', type=audio_formats, default=['mp3'],
+                       help=f"Target formats for convert-audio, separated by commas, e.g. mp3,ogg. One of {', '.join(audio_format)}. Default is mp3.")
+    audio.add_argument('--bitrate', type=bitrates,
+                       help='Bitrate in kbit/s for lossy formats in convert-audio, one for all formats or one per format, e.g. 128,96. Default is the encoder default.')
+
+    tools = parser.add_argument_group('external programs')
+    tools.add_argument('--ffmpeg', default=config.ffmpeg_path, help='Path to ffmpeg.')
+    tools.add_argument('--ffprobe', default=config.ffprobe_path, help='Path to ffprobe.')
+    tools.add_argument('--gs', default=config.gs_path, help='Path to the Ghostscript executable.')
+    tools.add_argument('--priority', choices=priority_levels, default=config.process_priority,
+                       help=f'Priority of the external programs. Default is {config.process_priority}.')
+    tools.add_argument('--cpus', type=cpu_list, default=config.process_cpus,
+                       help='CPU numbers the external programs may run on, separated by commas, e.g. 0,1. Default is all CPUs.')
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    config.ffmpeg_path = args.ffmpeg
+    config.ffprobe_path = args.ffprobe
+    config.gs_path = args.gs
+    config.process_priority = args.priority
+    config.process_cpus = args.cpus
+
+    input_paths = expand_inputs(args.inputs)
+    if not input_paths:
+        print("No input files found.")
+        return 2
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    scheduler = JobScheduler({args.operation: max(1, args.jobs)})
+    jobs = []
+    failed = 0
+    for input_path in input_paths:
+        output_path = output_path_for(input_path, args)
+        try:
+            jobs.append((input_path, scheduler.submit(args.operation, run_operation, args=(input_path, output_path, args),
+                                                      kwargs={'cancel_token': CancelToken()}, output_path=output_path,
+                                                      timeout=args.timeout)))
+        except ValueError as e:
+            print(f"Skipping {input_path}: {e}")
+            failed += 1
+
+    try:
+        for number, (input_path, job) in enumerate(jobs, start=1):
+            job.wait()
+            if job.state == 'done':
+                print(f"[{number}/{len(jobs)}] {input_path} -> {job.result}")
+            else:
+                print(f"[{number}/{len(jobs)}] {input_path} {job.state}: {job.error}")
+                failed += 1
+    except KeyboardInterrupt:
+        # The external programs run in their own process groups and do not get the Ctrl+C themselves
+        print("Cancelling...")
+        scheduler.cancel_all()
+        for _, job in jobs:
+            job.wait()  # Lets the workers remove partial output files
+        return 130
+
+    print(f"{len(input_paths) - failed} of {len(input_paths)} files processed.")
+    return 1 if failed else 0
@@ -0,0 +1,20 @@
+"""Paths to the external programs and caches used by the processing functions. Can be changed at runtime."""
+
+import os
+
+ffmpeg_path = r"C:\ffmpeg\bin\ffmpeg.exe"
+ffprobe_path = r"C:\ffmpeg\bin\ffprobe.exe"
+tesseract_path = r"C:\tesseract\tesseract.exe"
+pdftoppm_path = r"C:\poppler\Library\bin\pdftoppm.exe"
+gs_path = r"C:\gs\bin\gswin64.exe"
+
+# On-disk cache for OCR results of single pages, used to resume interrupted jobs
+ocr_cache_dir = os.path.join(os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', '.cache')),
+                             'MultiMediaTool', 'ocr_cache')
+ocr_cache_max_size = 2 * 1024 * 1024 * 1024  # 2 GB, the least recently used pages are removed first
+
+# Priority of ffmpeg, Ghostscript and tesseract: 'normal', 'below_normal' or 'idle'.
+# Below normal keeps the GUI and other programs responsive while long jobs run.
+process_priority = 'below_normal'
+# CPU numbers the external programs may run on, e.g. {0, 1, 2, 3}. None allows all CPUs.
+process_cpus = None
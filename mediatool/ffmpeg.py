@@ -0,0 +1,194 @@
+import os, subprocess, threading, json
+from fractions import Fraction
+from functools import lru_cache
+from collections import deque
+
+from . import config
+from .process import start_process, run_process
+
+# ---------------------- Media Probe Functions ---------------------- #
+
+def parse_frame_rate(rate):
+    """Converts an ffprobe frame rate such as '30000/1001' to a float, or None if it is unknown."""
+    try:
+        value = Fraction(rate)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    return float(value) if value > 0 else None
+
+def parse_number(value, cast=float):
+    """Converts an ffprobe number string to int/float, or None if it is missing or 'N/A'."""
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return None
+
+def probe_media(path):
+    """
+    Reads the metadata of a media file with a single ffprobe call.
+
+    Results are cached per path, file size and modification time, so repeated lookups in batch runs
+    do not start a new process. The returned dict is shared between callers and must not be modified.
+
+    :param path: Path to the video or audio file.
+    :return: Dict with 'duration', 'size', 'bit_rate', 'format_name', 'streams', 'video' and 'audio'.
+             'video' and 'audio' describe the first stream of that type or are None.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Input file not found: {path}")
+    stat = os.stat(path)
+    return probe_media_cached(os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+@lru_cache(maxsize=256)
+def probe_media_cached(path, size, mtime):
+    """Runs ffprobe for probe_media. size and mtime are only part of the cache key."""
+    result = run_process(
+        [config.ffprobe_path, '-v', 'error', '-print_format', 'json', '-show_format', '-show_streams', path]
+    )
+    if result.returncode != 0:
+        raise ValueError(f"ffprobe could not read {path}: {result.stderr.decode(errors='replace').strip()}")
+
+    data = json.loads(result.stdout.decode(errors='replace'))
+    container = data.get('format', {})
+    streams = []
+    for stream in data.get('streams', []):
+        info = {
+            'index': stream.get('index'),
+            'type': stream.get('codec_type'),
+            'codec': stream.get('codec_name'),
+            'profile': stream.get('profile'),
+            'bit_rate': parse_number(stream.get('bit_rate'), int),
+            'duration': parse_number(stream.get('duration')),
+            'cover_art': bool(stream.get('disposition', {}).get('attached_pic')),
+        }
+        if info['type'] == 'video':
+            width, height = stream.get('width'), stream.get('height')
+            # Rotated phone videos are decoded upright by ffmpeg, so report the displayed size
+            rotation = parse_number(stream.get('tags', {}).get('rotate'), int) or 0
+            for side_data in stream.get('side_data_list', []):
+                rotation = parse_number(side_data.get('rotation'), int) or rotation
+            if width and height and abs(rotation) % 180 == 90:
+                width, height = height, width
+            info.update({
+                'width': width,
+                'height': height,
+                'fps': parse_frame_rate(stream.get('avg_frame_rate')) or parse_frame_rate(stream.get('r_frame_rate')),
+                'pix_fmt': stream.get('pix_fmt'),
+                'frames': parse_number(stream.get('nb_frames'), int),
+            })
+        elif info['type'] == 'audio':
+            info.update({
+                'sample_rate': parse_number(stream.get('sample_rate'), int),
+                'channels': stream.get('channels'),
+            })
+        streams.append(info)
+
+    duration = parse_number(container.get('duration'))
+    if duration is None:
+        duration = max((s['duration'] for s in streams if s['duration']), default=None)
+
+    return {
+        'path': path,
+        'size': size,
+        'duration': duration,
+        'bit_rate': parse_number(container.get('bit_rate'), int),
+        'format_name': container.get('format_name'),
+        'streams': streams,
+        'video': next((s for s in streams if s['type'] == 'video' and not s['cover_art']), None),
+        'audio': next((s for s in streams if s['type'] == 'audio'), None),
+    }
+
+def keyframe_times(path):
+    """Returns the timestamps in seconds of the keyframes of the first video stream, read from the packets without decoding."""
+    result = run_process(
+        [config.ffprobe_path, '-v', 'error', '-select_streams', 'v:0', '-show_entries', 'packet=pts_time,flags',
+         '-of', 'csv=p=0', path]
+    )
+    if result.returncode != 0:
+        raise ValueError(f"ffprobe could not read {path}: {result.stderr.decode(errors='replace').strip()}")
+    times = []
+    for line in result.stdout.decode(errors='replace').splitlines():
+        pts_time, _, flags = line.partition(',')
+        time_position = parse_number(pts_time)
+        if 'K' in flags and time_position is not None:
+            times.append(time_position)
+    return sorted(times)
+
+# ---------------------- FFmpeg Progress Functions ---------------------- #
+
+def run_ffmpeg_with_progress(command, duration=None, progress_callback=None, log_size=200, cancel_token=None):
+    """
+    Runs an ffmpeg command and reports its progress while it is running.
+
+    ffmpeg writes machine-readable progress blocks to stdout. Its diagnostic output on stderr is read in a
+    separate thread and only the last log_size lines are kept, so long encodes do not grow memory.
+
+    :param command: ffmpeg command line, starting with the path to the executable.
+    :param duration: Duration of the input in seconds, needed for percent and ETA.
+    :param progress_callback: Called with a dict with 'percent', 'fps', 'speed', 'eta', 'out_time' and 'done'.
+                              Values ffmpeg has not reported yet are None.
+    :param log_size: Number of stderr lines to keep.
+    :param cancel_token: Optional CancelToken that stops ffmpeg, see start_process.
+    :return: Return code of ffmpeg and the last log_size lines of its stderr output.
+    :raises ProcessCancelled: If ffmpeg was stopped through the token.
+    """
+    command = [command[0], '-progress', 'pipe:1', '-nostats', *command[1:]]
+    log = deque(maxlen=log_size)
+
+    with start_process(command, cancel_token, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+        def read_log():
+            for line in process.stderr:
+                log.append(line.decode(errors='replace').rstrip())
+
+        log_thread = threading.Thread(target=read_log, daemon=True)
+        log_thread.start()
+
+        values = {}
+        for line in process.stdout:
+            key, _, value = line.decode(errors='replace').strip().partition('=')
+            if key != 'progress':
+                values[key] = value
+                continue
+
+            # 'progress' closes a block of key=value pairs
+            out_time = parse_number(values.get('out_time_us'), int)
+            out_time = out_time / 1000000 if out_time is not None and out_time >= 0 else None
+            speed = parse_number(values.get('speed', '').rstrip('x'))
+            percent = eta = None
+            if duration and out_time is not None:
+                percent = min(100.0, out_time / duration * 100)
+                if speed:
+                    eta = max(0.0, (duration - out_time) / speed)
+            if value == 'end':
+                percent, eta = 100.0, 0.0
+
+            if progress_callback:
+                progress_callback({
+                    'percent': percent,
+                    'fps': parse_number(values.get('fps')),
+                    'speed': speed,
+                    'eta': eta,
+                    'out_time': out_time,
+                    'done': value == 'end',
+                })
+            values = {}
+
+        process.wait()
+        log_thread.join()
+    return process.returncode, list(log)
+
+def format_progress(progress, text="Verarbeite Videodatei..."):
+    """Formats a progress dict from run_ffmpeg_with_progress for the GUI, e.g. 'Verarbeite Videodatei... 42% | 120 fps | 4.0x | Restzeit 0:01:23'."""
+    parts = [text]
+    if progress.get('pass'):
+        parts[0] += f" Durchgang {progress['pass']}/{progress['passes']}"
+    if progress.get('percent') is not None:
+        parts[0] += f" {progress['percent']:.0f}%"
+    if progress.get('fps'):
+        parts.append(f"{progress['fps']:.0f} fps")
+    if progress.get('speed'):
+        parts.append(f"{progress['speed']:.1f}x")
+    if progress.get('eta') is not None:
+        eta = int(progress['eta'])
+        parts.append(f"Restzeit {eta // 3600}:{eta % 3600 // 60:02d}:{eta % 60:02d}")
+    return " | ".join(parts)
@@ -0,0 +1,41 @@
+import os, uuid
+from contextlib import contextmanager
+
+# ---------------------- File Helpers ---------------------- #
+
+@contextmanager
+def atomic_output(path):
+    """
+    Yields a temporary path next to path. The temporary file replaces path when the block finishes.
+
+    An interrupted or failed write therefore never leaves a truncated file behind, and an existing file is only
+    ever replaced by a complete one. If the block raises, the temporary file is removed and path is untouched.
+    Files written to the temporary path must be closed before the block ends, Windows cannot replace open files.
+    """
+    # Not created with mkstemp, which would give the output owner-only permissions instead of the usual ones
+    directory, name = os.path.split(os.path.abspath(path))
+    temp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+    try:
+        yield temp_path
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def output_state(path):
+    """Returns the size and modification time of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def remove_partial_output(path, previous_state):
+    """Removes the output file of a failed job or program if it created or overwrote it, so no truncated file is left."""
+    state = output_state(path)
+    if state is not None and state != previous_state:
+        try:
+            os.remove(path)
+            print(f"Removed partial output {path}")
+        except OSError as e:
+            print(f"Could not remove partial output {path}: {e}")
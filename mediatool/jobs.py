@@ -0,0 +1,129 @@
+import os, threading, queue, itertools
+
+from .files import output_state, remove_partial_output
+from .process import CancelToken
+
+# ---------------------- Job Scheduler ---------------------- #
+
+class Job:
+    """A unit of work run by the JobScheduler. state is one of 'queued', 'running', 'done', 'failed' or 'cancelled'."""
+
+    def __init__(self, job_id, kind, func, args, kwargs, output_path, priority, timeout, cancel_token):
+        self.id = job_id
+        self.kind = kind
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.output_path = output_path
+        self.priority = priority
+        self.timeout = timeout
+        self.cancel_token = cancel_token
+        self.state = 'queued'
+        self.result = None
+        self.error = None
+        self.finished = threading.Event()
+
+    def wait(self, timeout=None):
+        """Blocks until the job is done, failed or cancelled. Returns False if the timeout expired first."""
+        return self.finished.wait(timeout)
+
+    def cancel(self):
+        """Stops the external programs of a running job. A queued job is not started."""
+        self.cancel_token.cancel()
+
+class JobScheduler:
+    """
+    Runs jobs on a fixed number of worker threads per job type.
+
+    Jobs of one type are started by priority (lower first) and in submission order within a priority.
+    A job whose output file is already being written by a queued or running job is rejected.
+    Jobs can be cancelled and given a time limit, see submit. If a job fails or is cancelled, an output
+    file it created or overwrote is removed.
+    """
+
+    def __init__(self, slots):
+        """:param slots: Dict mapping a job type such as 'video' to the number of jobs of that type run at once."""
+        self.slots = dict(slots)
+        self.queues = {}
+        self.active_outputs = {}  # Normalized output path -> job
+        self.pending = {}  # Job type -> number of queued and running jobs
+        self.active_jobs = set()  # Queued and running jobs
+        self.lock = threading.Lock()
+        self.job_ids = itertools.count(1)
+
+    def submit(self, kind, func, args=(), kwargs=None, output_path=None, priority=0, timeout=None):
+        """
+        Queues func(*args, **kwargs) as a job of the given type.
+
+        If kwargs contains a 'cancel_token', Job.cancel() and the time limit stop the external programs func
+        starts with it. Otherwise they only keep a queued job from starting.
+
+        :param timeout: Seconds the job may run before it is cancelled. None for no limit.
+        :raises ValueError: If a queued or running job already writes to output_path.
+        :return: The Job, which can be used to check its state, wait for it or cancel it.
+        """
+        kwargs = kwargs or {}
+        output_key = os.path.normcase(os.path.abspath(output_path)) if output_path else None
+        with self.lock:
+            if output_key in self.active_outputs:
+                raise ValueError(f"A job for {output_path} is already queued or running")
+
+            job = Job(next(self.job_ids), kind, func, args, kwargs, output_path, priority, timeout,
+                      kwargs.get('cancel_token') or CancelToken())
+            if output_key:
+                self.active_outputs[output_key] = job
+            self.pending[kind] = self.pending.get(kind, 0) + 1
+            self.active_jobs.add(job)
+
+            if kind not in self.queues:
+                # Start the workers for this job type on first use
+                self.queues[kind] = queue.PriorityQueue()
+                for _ in range(self.slots.get(kind, 1)):
+                    threading.Thread(target=self.run_worker, args=(kind,), daemon=True).start()
+
+            self.queues[kind].put((priority, job.id, job))
+        return job
+
+    def pending_jobs(self, kind):
+        """Returns the number of queued and running jobs of the given type."""
+        with self.lock:
+            return self.pending.get(kind, 0)
+
+    def cancel_all(self):
+        """Cancels all queued and running jobs, e.g. before the program exits, so no external program keeps running."""
+        with self.lock:
+            jobs = list(self.active_jobs)
+        for job in jobs:
+            job.cancel()
+
+    def run_worker(self, kind):
+        while True:
+            _, _, job = self.queues[kind].get()
+            timer = None
+            previous_output = output_state(job.output_path) if job.output_path else None
+            try:
+                if job.cancel_token.cancelled:
+                    job.state = 'cancelled'
+                    continue
+                job.state = 'running'
+                if job.timeout:
+                    timer = threading.Timer(job.timeout, job.cancel_token.cancel, args=('timeout',))
+                    timer.daemon = True
+                    timer.start()
+                job.result = job.func(*job.args, **job.kwargs)
+                job.state = 'done'
+            except Exception as e:
+                job.error = e
+                job.state = 'cancelled' if job.cancel_token.cancelled else 'failed'
+                print(f"Job {job.id} ({job.kind}) {job.state}: {e}")
+                if job.output_path:
+                    remove_partial_output(job.output_path, previous_output)
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                with self.lock:
+                    if job.output_path:
+                        self.active_outputs.pop(os.path.normcase(os.path.abspath(job.output_path)), None)
+                    self.pending[kind] -= 1
+                    self.active_jobs.discard(job)
+                job.finished.set()
@@ -0,0 +1,84 @@
+import os, hashlib
+
+from .files import atomic_output
+
+# ---------------------- OCR Page Cache ---------------------- #
+
+class OcrCache:
+    """
+    On-disk cache for the OCR results of single pages.
+
+    Entries are keyed by a hash of the rasterized page and the OCR settings, so a rerun of an interrupted
+    job, or the same scan submitted again, skips every page that was already recognized. The cache is
+    best effort: unreadable entries count as misses and write errors are ignored.
+    """
+
+    def __init__(self, folder, max_size):
+        """
+        :param folder: Directory for the cache files. Created on first use.
+        :param max_size: Maximum total size in bytes. The least recently used entries are removed first.
+        """
+        self.folder = folder
+        self.max_size = max_size
+
+    @staticmethod
+    def page_key(image, settings):
+        """Returns the cache key for a page image (PIL) and a string describing the OCR settings."""
+        digest = hashlib.sha256()
+        digest.update(f"{settings}|{image.mode}|{image.size}".encode())
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def paths(self, key):
+        base = os.path.join(self.folder, key[:2], key)
+        return base + '.txt', base + '.pdf'
+
+    def get(self, key):
+        """Returns (text, pdf_bytes) for a cached page or None."""
+        text_path, pdf_path = self.paths(key)
+        try:
+            with open(text_path, encoding='utf-8') as f:
+                text = f.read()
+            with open(pdf_path, 'rb') as f:
+                pdf_bytes = f.read()
+            os.utime(pdf_path)  # Mark the entry as recently used for the eviction
+        except OSError:
+            return None
+        return text, pdf_bytes
+
+    def put(self, key, text, pdf_bytes):
+        """Stores the OCR result of a page. The PDF is written last, so a page only counts as cached once both files exist."""
+        text_path, pdf_path = self.paths(key)
+        try:
+            os.makedirs(os.path.dirname(pdf_path), exist_ok=True)
+            for path, data in ((text_path, text.encode('utf-8')), (pdf_path, pdf_bytes)):
+                with atomic_output(path) as temp_path, open(temp_path, 'wb') as f:
+                    f.write(data)
+        except OSError as e:
+            print(f"OCR cache write failed: {e}")
+
+    def evict(self):
+        """Removes the least recently used entries until the cache is no larger than max_size."""
+        entries = {}
+        total = 0
+        for directory, _, filenames in os.walk(self.folder):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                total += stat.st_size
+                entry = entries.setdefault(os.path.splitext(path)[0], [0, 0])
+                entry[0] = max(entry[0], stat.st_mtime)
+                entry[1] += stat.st_size
+
+        for base, (last_used, size) in sorted(entries.items(), key=lambda item: item[1][0]):
+            if total <= self.max_size:
+                break
+            for extension in ('.pdf', '.txt', '.tmp'):
+                try:
+                    os.remove(base + extension)
+                except OSError:
+                    pass
+            total -= size
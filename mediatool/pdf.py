@@ -0,0 +1,490 @@
+import os, io, shutil, subprocess, tempfile, threading, zlib, cv2, pytesseract
+import numpy as np
+from PIL import Image
+from collections import deque
+from pdf2image import convert_from_path, pdfinfo_from_path
+from PyPDF2 import PdfReader
+from PyPDF2.generic import NameObject, NumberObject
+from spellchecker import SpellChecker
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import lru_cache
+
+from . import config
+from .ocr_cache import OcrCache
+from .files import atomic_output
+from .pdf_writer import StreamingPdfWriter
+from .process import run_process
+
+# ---------------------- PDF Processing Functions ---------------------- #
+
+german_spell_checker = None
+spell_checker_lock = threading.Lock()
+
+def spell_checker():
+    """Returns the German spellchecker. Loading the dictionary takes most of a second, so it is done on first use."""
+    global german_spell_checker
+    if german_spell_checker is None:
+        with spell_checker_lock:  # Parallel OCR workers must not each load the dictionary
+            if german_spell_checker is None:
+                german_spell_checker = SpellChecker(language='de')
+    return german_spell_checker
+
+def enhance_image(image):
+    """Enhances the document for better OCR by sharpening and improving contrast."""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    kernel = np.array([[0, -1, 0], [-1, 5,-1], [0, -1, 0]])  # Sharpening kernel
+    sharpened = cv2.filter2D(gray, -1, kernel)
+    enhanced = cv2.convertScaleAbs(sharpened, alpha=1.5, beta=0)  # Contrast adjustment
+    return enhanced
+
+# Tesseract settings for scanned German documents
+ocr_lang = 'deu'
+ocr_config = r'--oem 3 --psm 6'
+
+def extract_text_and_pdf(image, cancel_token=None, threads=None):
+    """
+    Runs tesseract once and returns the recognized text and a searchable PDF page of the image.
+
+    Both results come from the same recognition pass, tesseract writes them with its txt and pdf renderers.
+
+    :param cancel_token: Optional CancelToken that stops tesseract.
+    :param threads: Maximum number of threads of tesseract. Default is tesseract's own choice.
+    """
+    env = dict(os.environ, OMP_THREAD_LIMIT=str(threads)) if threads else None  # Read by tesseract
+    with pytesseract.pytesseract.save(image) as (temp_name, input_filename):
+        # 'txt' and 'pdf' select tesseract's txt and pdf config files, which enable both renderers
+        command = [pytesseract.pytesseract.tesseract_cmd, input_filename, temp_name, '-l', ocr_lang,
+                   *ocr_config.split(), 'txt', 'pdf']
+        result = run_process(command, cancel_token, env=env)
+        if result.returncode != 0:
+            raise pytesseract.TesseractError(result.returncode, result.stderr.decode(errors='replace').strip())
+        with open(f"{temp_name}.txt", encoding='utf-8') as f:
+            text = f.read()
+        with open(f"{temp_name}.pdf", 'rb') as f:
+            pdf_bytes = f.read()
+    return text, pdf_bytes
+
+@lru_cache(maxsize=65536)
+def correct_word(word):
+    """
+    Returns the spelling correction of a single word, or the word itself if there is none.
+
+    Numbers and punctuation are passed through and known words are returned without the expensive
+    edit-distance search. Results are cached, so every distinct word is only corrected once.
+    """
+    # Keep leading and trailing punctuation, e.g. 'Haus,' is checked as 'Haus'
+    start, end = 0, len(word)
+    while start < end and not word[start].isalnum():
+        start += 1
+    while end > start and not word[end - 1].isalnum():
+        end -= 1
+    core = word[start:end]
+
+    spell = spell_checker()
+    if not core.isalpha() or spell.known([core]):
+        return word
+
+    correction = spell.correction(core)
+    if correction is None:
+        return word
+    if core[0].isupper():
+        correction = correction[0].upper() + correction[1:]  # The dictionary is lower case, keep nouns capitalized
+    return word[:start] + correction + word[end:]
+
+def correct_words(words):
+    """Corrects a list of words. Every distinct word is looked up only once."""
+    corrections = {word: correct_word(word) for word in set(words)}
+    return [corrections[word] for word in words]
+
+def correct_text(text):
+    """AI-powered text correction for missing letters, handling None values."""
+    return ' '.join(correct_words(text.split()))
+
+# Part of the OCR cache key, increase it when enhance_image or correct_text produce different results
+ocr_cache_version = 1
+
+def ocr_page(image, cache=None, cancel_token=None, threads=None):
+    """
+    Runs the OCR pipeline for one page image and returns the corrected text and the page as PDF bytes.
+
+    :param cache: Optional OcrCache. Pages found in the cache are not recognized again.
+    :param cancel_token: Optional CancelToken that stops tesseract.
+    :param threads: Maximum number of threads of tesseract, see extract_text_and_pdf.
+    """
+    if cache is not None:
+        key = cache.page_key(image, f"{ocr_cache_version}|{ocr_lang}|{ocr_config}")
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    np_img = np.array(image)
+    enhanced_image = enhance_image(np_img)
+    # One OCR pass creates both the text and the new PDF page
+    extracted_text, pdf_bytes = extract_text_and_pdf(enhanced_image, cancel_token, threads)
+    corrected_text = correct_text(extracted_text)
+
+    if cache is not None:
+        cache.put(key, corrected_text, pdf_bytes)
+    return corrected_text, pdf_bytes
+
+def page_windows(pages, window_size):
+    """Groups ascending page numbers into (first_page, last_page) ranges of consecutive pages with at most window_size pages."""
+    windows = []
+    for page in pages:
+        if windows and page == windows[-1][1] + 1 and page - windows[-1][0] < window_size:
+            windows[-1][1] = page
+        else:
+            windows.append([page, page])
+    return [tuple(window) for window in windows]
+
+def iter_pdf_pages(input_path, window_size=8, pages=None):
+    """
+    Rasterizes a PDF window_size pages at a time and yields the page images in order.
+
+    The pages of a window are spooled to a temporary folder by poppler and loaded one by one, so only the
+    pages that are currently being processed are held in memory.
+
+    :param pages: Ascending 1-based page numbers to rasterize. Default is all pages.
+    """
+    if pages is None:
+        pages = range(1, pdfinfo_from_path(input_path)['Pages'] + 1)
+    for first_page, last_page in page_windows(pages, window_size):
+        with tempfile.TemporaryDirectory(prefix="pdf_pages_") as folder:
+            paths = convert_from_path(input_path, first_page=first_page, last_page=last_page,
+                                      output_folder=folder, paths_only=True)
+            for path in sorted(paths):
+                with Image.open(path) as image:
+                    image.load()  # Read the page into memory so the file can be deleted
+                yield image
+
+def has_text_layer(page, min_chars=20):
+    """Returns True if a PDF page already has extractable text, e.g. because it was born digital."""
+    try:
+        text = page.extract_text() or ''
+    except Exception:
+        return False  # Pages PyPDF2 cannot parse are treated as scans
+    return len(''.join(text.split())) >= min_chars
+
+def improve_pdf_for_ai_reading(input_path, output_path, workers=None, window_size=None, skip_text_pages=True, use_cache=True,
+                               cancel_token=None):
+    """
+    Enhances a scanned PDF for better OCR and saves a corrected structured PDF.
+
+    Pages are processed in parallel. Each worker runs its own tesseract process, which is limited to
+    one thread so the workers do not compete for the same cores. The PDF is rasterized in windows and
+    at most two pages per worker are held in memory. Finished pages are written to disk right away,
+    so memory use does not grow with the page count.
+
+    :param workers: Number of pages processed at the same time. Default is the number of CPU cores.
+    :param window_size: Number of pages rasterized per poppler call. Default is two pages per worker.
+    :param skip_text_pages: Copy pages that already have a text layer unchanged and only OCR image-only pages.
+    :param use_cache: Reuse OCR results of pages recognized before, e.g. when an interrupted job is restarted.
+    :param cancel_token: Optional CancelToken. Cancelling it stops the running tesseract processes, no further
+                         pages are started and the output file is not written.
+    """
+    if not output_path.lower().endswith('.pdf'):
+        output_path = os.path.splitext(output_path)[0] + '.pdf'
+    
+    workers = workers or os.cpu_count() or 1
+    ocr_threads = 1 if workers > 1 else None
+
+    window_size = window_size or workers * 2
+
+    def add_page(item):
+        if isinstance(item, Future):
+            corrected_text, pdf_bytes = item.result()
+            item = PdfReader(io.BytesIO(pdf_bytes)).pages[0]
+        writer.add_page(item)  # Written to disk right away, nothing is kept for later pages
+
+    cache = OcrCache(config.ocr_cache_dir, config.ocr_cache_max_size) if use_cache else None
+
+    input_reader = PdfReader(input_path)
+    ocr_pages = [number for number, page in enumerate(input_reader.pages, start=1)
+                 if not (skip_text_pages and has_text_layer(page))]
+    ocr_page_numbers = set(ocr_pages)
+    print(f"{len(ocr_pages)} von {len(input_reader.pages)} Seiten werden per OCR erkannt")
+    images = iter_pdf_pages(input_path, window_size, ocr_pages)
+
+    # Pages are streamed into a temporary file, which only replaces the output once all pages are written
+    with atomic_output(output_path) as temp_path:
+        with StreamingPdfWriter(temp_path) as writer, ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()  # OCR futures and copied pages in page order
+            for number, page in enumerate(input_reader.pages, start=1):
+                if cancel_token is not None:
+                    cancel_token.check()
+                if number in ocr_page_numbers:
+                    pending.append(executor.submit(ocr_page, next(images), cache, cancel_token, ocr_threads))
+                else:
+                    pending.append(page)  # Already has a text layer, copy it unchanged
+                if len(pending) >= workers * 2:
+                    add_page(pending.popleft())  # Wait for the oldest page before rasterizing more
+            while pending:
+                add_page(pending.popleft())
+
+    if cache is not None:
+        cache.evict()
+    
+    print(f"✅ Verbesserte PDF gespeichert als: {output_path}")
+
+
+
+# Ghostscript only uses one core. Large documents are split into page ranges of at least this many pages,
+# which are compressed by separate Ghostscript processes. Smaller documents are compressed in one run.
+gs_min_chunk_pages = 50
+
+def gs_command(input_path, output_path, quality, first_page=None, last_page=None):
+    command = [
+        config.gs_path, "-sDEVICE=pdfwrite",
+        "-dCompatibilityLevel=1.4",
+        "-dPDFSETTINGS=/{}".format(quality),
+        "-dNOPAUSE", "-dQUIET", "-dBATCH",
+    ]
+    if first_page is not None:
+        command += ["-dFirstPage={}".format(first_page), "-dLastPage={}".format(last_page)]
+    return command + ["-sOutputFile={}".format(output_path), input_path]
+
+def page_ranges(page_count, chunks):
+    """Splits pages 1..page_count into at most the given number of contiguous (first, last) ranges of similar size."""
+    chunks = max(1, min(chunks, page_count))
+    bounds = [page_count * number // chunks for number in range(chunks + 1)]
+    return [(bounds[number] + 1, bounds[number + 1]) for number in range(chunks)]
+
+def compress_pdf_ghostscript(input_path, output_path, quality, workers, cancel_token=None):
+    """Runs Ghostscript over the whole document, or over page ranges in parallel for large documents."""
+    page_count = len(PdfReader(input_path).pages)
+    # Two ranges per process, so one slow range does not leave the other cores idle at the end
+    ranges = page_ranges(page_count, min(workers * 2, page_count // gs_min_chunk_pages))
+    if workers == 1 or len(ranges) == 1:
+        run_process(gs_command(input_path, output_path, quality), cancel_token, check=True, stdout=None, stderr=None)
+        return
+
+    print(f"Komprimiere {page_count} Seiten in {len(ranges)} Teilen")
+    chunk_paths = [f"{output_path}.{number}.pdf" for number in range(len(ranges))]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        runs = [executor.submit(run_process, gs_command(input_path, chunk_path, quality, first, last), cancel_token,
+                                check=True, stdout=None, stderr=None)
+                for chunk_path, (first, last) in zip(chunk_paths, ranges)]
+        for run in runs:
+            run.result()
+    with StreamingPdfWriter(output_path) as writer:
+        for chunk_path in chunk_paths:
+            for page in PdfReader(chunk_path).pages:
+                writer.add_page(page)
+
+# ---------------------- PDF Image Recompression ---------------------- #
+
+# Image resolution in DPI and JPEG quality of the native engine, matching the Ghostscript presets
+image_presets = {
+    'screen': (72, 40),
+    'ebook': (150, 60),
+    'printer': (300, 80),
+    'prepress': (300, 90),
+}
+
+def image_components(image_object):
+    """Returns the number of color components of an image XObject, or None for color spaces that are not recompressed."""
+    color_space = image_object.get('/ColorSpace')
+    color_space = color_space.get_object() if color_space is not None else None
+    if isinstance(color_space, list) and color_space and color_space[0] in ('/CalGray', '/CalRGB'):
+        color_space = '/DeviceGray' if color_space[0] == '/CalGray' else '/DeviceRGB'
+    if color_space == '/DeviceGray':
+        return 1
+    if color_space == '/DeviceRGB':
+        return 3
+    if isinstance(color_space, list) and len(color_space) == 2 and color_space[0] == '/ICCBased':
+        components = color_space[1].get_object().get('/N')
+        return components if components in (1, 3) else None
+    return None  # Indexed, CMYK, Lab, ...
+
+def image_filters(image_object):
+    filters = image_object.get('/Filter')
+    filters = filters.get_object() if filters is not None else []
+    return [filters] if isinstance(filters, str) else list(filters)
+
+def page_images(page, seen):
+    """Yields the image XObjects of a page and its form XObjects that are not in seen, and adds them to seen."""
+    resources = page.get('/Resources')
+    x_objects = resources.get_object().get('/XObject') if resources is not None else None
+    if x_objects is None:
+        return
+    for reference in x_objects.get_object().values():
+        key = (reference.idnum, reference.generation) if hasattr(reference, 'idnum') else id(reference)
+        if key in seen:
+            continue
+        seen.add(key)
+        x_object = reference.get_object()
+        if x_object.get('/Subtype') == '/Form':
+            yield from page_images(x_object, seen)
+        elif x_object.get('/Subtype') == '/Image':
+            yield x_object
+
+def is_recompressible(image_object):
+    """Images with masks, decode arrays, 1-bit or special compression (JBIG2, CCITT, JPEG 2000) are left unchanged."""
+    filters = image_filters(image_object)
+    return (not image_object.get('/ImageMask')
+            and '/Mask' not in image_object  # Color key masks match exact colors, which JPEG does not keep
+            and '/Decode' not in image_object
+            and image_object.get('/BitsPerComponent') == 8
+            and image_components(image_object) is not None
+            and all(name in ('/FlateDecode', '/ASCII85Decode') for name in filters[:-1])
+            and (not filters or filters[-1] in ('/FlateDecode', '/ASCII85Decode', '/DCTDecode')))
+
+def ascii85_decode(data):
+    """Decodes ASCII85 with NumPy. PyPDF2's decoder is pure Python and needs several seconds for a scanned page."""
+    data = bytes(data).split(b'~>')[0].translate(None, b' \t\n\r\x0b\x0c\x00').replace(b'z', b'!!!!!')
+    if data.startswith(b'<~'):
+        data = data[2:]
+    padding = -len(data) % 5
+    digits = np.frombuffer(data + b'u' * padding, dtype=np.uint8).reshape(-1, 5).astype(np.uint64) - 33
+    values = digits @ (85 ** np.arange(4, -1, -1, dtype=np.uint64))
+    return values.astype('>u4').tobytes()[:len(values) * 4 - padding]
+
+def image_data(image_object):
+    """Returns the decoded data of an image XObject, or the JPEG file for DCTDecode images."""
+    if '/DecodeParms' in image_object:
+        return image_object.get_data()  # Predictors are left to PyPDF2
+    data = image_object._data  # The raw stream, see recompress_pdf_images
+    for name in image_filters(image_object):
+        if name == '/ASCII85Decode':
+            data = ascii85_decode(data)
+        elif name == '/FlateDecode':
+            data = zlib.decompress(data)
+    return data
+
+def recompress_image(image_object, max_size, jpeg_quality):
+    """
+    Downsamples an image XObject and encodes it as JPEG.
+
+    :param max_size: Maximum number of pixels along the longer side.
+    :return: (jpeg_bytes, width, height), or None if the image would not get smaller.
+    """
+    width, height = image_object['/Width'], image_object['/Height']
+    scale = min(1, max_size / max(width, height))
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    components = image_components(image_object)
+
+    if image_filters(image_object)[-1:] == ['/DCTDecode']:
+        image = Image.open(io.BytesIO(image_data(image_object)))
+        image.draft(image.mode, size)  # Lets the JPEG decoder skip detail that is removed anyway
+        if image.mode != ('L' if components == 1 else 'RGB'):
+            return None  # E.g. CMYK JPEG in an RGB color space
+    else:
+        pixels = np.frombuffer(image_data(image_object), dtype=np.uint8)[:width * height * components]
+        if pixels.size < width * height * components:
+            return None
+        image = Image.fromarray(pixels.reshape(height, width, components).squeeze(axis=2) if components == 1
+                                else pixels.reshape(height, width, components))
+
+    if image.size != size and scale < 0.9:  # Resampling a few percent only costs sharpness
+        image = image.resize(size, Image.LANCZOS)
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=jpeg_quality, optimize=True)
+    if buffer.tell() >= len(image_object._data):
+        return None
+    return buffer.getvalue(), image.width, image.height
+
+def recompress_pdf_images(input_path, output_path, dpi=150, jpeg_quality=60, workers=None, cancel_token=None):
+    """
+    Compresses a PDF by downsampling and re-encoding its embedded images. Fonts, text and vector content are copied unchanged.
+
+    The resolution of an image is measured against the size of the page, so an image that covers the whole
+    page ends up with about dpi pixels per inch. Images are recompressed in parallel, at most two pages per
+    worker at a time.
+
+    :param dpi: Target resolution of the images.
+    :param jpeg_quality: JPEG quality (1-95) of the re-encoded images.
+    :param workers: Number of images processed at the same time. Default is the number of CPU cores.
+    :param cancel_token: Optional CancelToken, checked before each page.
+    """
+    workers = workers or os.cpu_count() or 1
+    reader = PdfReader(input_path)
+    seen = set()
+    counts = [0, 0]  # Recompressed and total images
+
+    def add_page(page, images):
+        for image_object, future in images:
+            result = future.result()
+            counts[1] += 1
+            if result is None:
+                continue
+            data, width, height = result
+            # PyPDF2 has no public way to replace the encoded data of a stream read from a file, set_data raises
+            # for it. _data and decoded_self are stable across PyPDF2 3.x, which installer.py pins.
+            image_object._data = data
+            image_object.decoded_self = None
+            image_object[NameObject('/Filter')] = NameObject('/DCTDecode')
+            image_object[NameObject('/Width')] = NumberObject(width)
+            image_object[NameObject('/Height')] = NumberObject(height)
+            image_object.pop('/DecodeParms', None)
+            counts[0] += 1
+        writer.add_page(page)
+
+    # Pillow and NumPy release the GIL while decoding, resampling and encoding, so threads use several cores
+    with StreamingPdfWriter(output_path) as writer, ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()  # Pages and their image futures in page order
+        for page in reader.pages:
+            if cancel_token is not None:
+                cancel_token.check()
+            max_size = dpi * max(float(page.mediabox.width), float(page.mediabox.height)) / 72
+            images = [(image_object, executor.submit(recompress_image, image_object, max_size, jpeg_quality))
+                      for image_object in page_images(page, seen) if is_recompressible(image_object)]
+            pending.append((page, images))
+            if len(pending) >= workers * 2:
+                add_page(*pending.popleft())
+        while pending:
+            add_page(*pending.popleft())
+
+    print(f"{counts[0]} von {counts[1]} Bildern neu komprimiert")
+
+# ---------------------- PDF Compression ---------------------- #
+
+def compress_pdf(input_path: str, output_path: str, quality: str = "ebook", workers: int = None, engine: str = "ghostscript",
+                 cancel_token=None):
+    """
+    Compress a PDF file without compromising readability.
+
+    The ghostscript engine rewrites the whole document. Documents with many pages are split into page ranges
+    that are compressed in parallel and merged afterwards. The native engine only downsamples and re-encodes
+    the embedded images and needs no external program. If the result is not smaller than the input, the
+    original file is saved instead.
+    
+    :param input_path: Path to the input PDF file.
+    :param output_path: Path to save the compressed PDF file.
+    :param quality: Compression quality (screen, ebook, printer, prepress). Default is 'ebook'.
+    :param workers: Number of Ghostscript processes or images processed at the same time. Default is the number of CPU cores.
+    :param engine: 'ghostscript' or 'native'. Default is 'ghostscript'.
+    :param cancel_token: Optional CancelToken that stops the compression. The output file is not written then.
+    :raises ValueError: If engine is unknown.
+    :raises RuntimeError: If Ghostscript fails. The output file is not written then.
+    """
+    # Ensure the output path ends with .pdf
+    if not output_path.lower().endswith('.pdf'):
+        output_path = os.path.splitext(output_path)[0] + '.pdf'
+    
+    if engine not in ("ghostscript", "native"):
+        raise ValueError(f"Unknown PDF compression engine: {engine}")
+
+    # Ensure Ghostscript is installed
+    if engine == "ghostscript" and config.gs_path is None:
+        raise FileNotFoundError("Ghostscript executable not found. Please ensure Ghostscript is installed and in your PATH.")
+
+    workers = workers or os.cpu_count() or 1
+    
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(output_path))) as temp_dir:
+        compressed_path = os.path.join(temp_dir, 'compressed.pdf')
+        if engine == "native":
+            dpi, jpeg_quality = image_presets[quality]
+            recompress_pdf_images(input_path, compressed_path, dpi, jpeg_quality, workers, cancel_token)
+        else:
+            try:
+                compress_pdf_ghostscript(input_path, compressed_path, quality, workers, cancel_token)
+            except subprocess.CalledProcessError as e:
+                raise RuntimeError(f"Ghostscript failed with exit code {e.returncode}, see the log above") from e
+
+        if os.path.getsize(compressed_path) >= os.path.getsize(input_path):
+            # Already optimized documents can grow when they are rewritten
+            shutil.copyfile(input_path, output_path)
+            print(f"Komprimierte PDF wäre größer als das Original, Original gespeichert als: {output_path}")
+        else:
+            os.replace(compressed_path, output_path)
+            print(f"Komprimierte PDF gespeichert als: {output_path}")
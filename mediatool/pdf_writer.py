@@ -0,0 +1,117 @@
+import weakref
+from collections import deque
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject, NullObject, StreamObject
+
+# ---------------------- Streaming PDF Writer ---------------------- #
+
+class StreamingPdfWriter:
+    """
+    Writes a PDF page by page straight to a file.
+
+    PyPDF2's PdfWriter keeps every page and all objects it references in memory until write() is called.
+    This writer copies the objects of each page as soon as it is added and only keeps their file offsets,
+    so memory use does not grow with the number of pages. Objects shared between pages of the same source
+    document, such as fonts, are written once.
+
+    Usage:
+        with StreamingPdfWriter(output_path) as writer:
+            writer.add_page(reader.pages[0])
+    """
+
+    def __init__(self, path):
+        self.fp = open(path, "wb")
+        self.fp.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+        self.offsets = {}  # Object number -> file offset
+        self.next_number = 1
+        self.pages_number = self.reserve()
+        self.page_numbers = []
+        # Source object (idnum, generation) -> object number in this file, per source document
+        self.object_maps = weakref.WeakKeyDictionary()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.fp.close()
+
+    def reserve(self):
+        number = self.next_number
+        self.next_number += 1
+        return number
+
+    def add_page(self, page):
+        """Copies a page of a PdfReader and everything it references into the output file."""
+        object_map = self.object_maps.setdefault(page.pdf, {})
+        page_number = self.reserve()
+        if page.indirect_ref is not None:
+            object_map[(page.indirect_ref.idnum, page.indirect_ref.generation)] = page_number
+
+        queue = deque()
+        page_copy = DictionaryObject({
+            key: self.remap(value, object_map, queue) for key, value in page.items() if key != '/Parent'
+        })
+        page_copy[NameObject('/Parent')] = IndirectObject(self.pages_number, 0, None)
+        self.write_object(page_number, page_copy)
+
+        # Write everything the page references, each object as soon as it is reached
+        while queue:
+            number, source = queue.popleft()
+            self.write_object(number, self.remap(source, object_map, queue, resolve=False))
+
+        self.page_numbers.append(page_number)
+
+    def remap(self, obj, object_map, queue, resolve=True):
+        """Returns a copy of obj with references renumbered for this file. New referenced objects are queued."""
+        if isinstance(obj, IndirectObject) and resolve:
+            key = (obj.idnum, obj.generation)
+            if key not in object_map:
+                target = obj.get_object()
+                if isinstance(target, DictionaryObject) and target.get('/Type') == '/Page':
+                    # Links to other pages would pull in the whole source page tree
+                    return NullObject()
+                object_map[key] = self.reserve()
+                queue.append((object_map[key], target))
+            return IndirectObject(object_map[key], 0, None)
+        if isinstance(obj, StreamObject):
+            stream = obj.__class__()
+            stream._data = obj._data  # Copy the encoded data as is, without decoding it
+            stream.update({key: self.remap(value, object_map, queue) for key, value in obj.items()})
+            return stream
+        if isinstance(obj, DictionaryObject):
+            return DictionaryObject({key: self.remap(value, object_map, queue) for key, value in obj.items()})
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(self.remap(value, object_map, queue) for value in obj)
+        return obj
+
+    def write_object(self, number, obj):
+        self.offsets[number] = self.fp.tell()
+        self.fp.write(f"{number} 0 obj\n".encode())
+        obj.write_to_stream(self.fp, None)
+        self.fp.write(b"\nendobj\n")
+
+    def close(self):
+        """Writes the page tree, catalog and cross-reference table and closes the file."""
+        kids = " ".join(f"{number} 0 R" for number in self.page_numbers)
+        self.write_raw(self.pages_number, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.page_numbers)} >>")
+        catalog_number = self.reserve()
+        self.write_raw(catalog_number, f"<< /Type /Catalog /Pages {self.pages_number} 0 R >>")
+
+        xref_offset = self.fp.tell()
+        self.fp.write(f"xref\n0 {self.next_number}\n".encode())
+        self.fp.write(b"0000000000 65535 f \n")
+        for number in range(1, self.next_number):
+            # Reserved numbers of objects that were never written are marked as free
+            if number in self.offsets:
+                self.fp.write(f"{self.offsets[number]:010d} 00000 n \n".encode())
+            else:
+                self.fp.write(b"0000000000 00001 f \n")
+        self.fp.write(f"trailer\n<< /Size {self.next_number} /Root {catalog_number} 0 R >>\n".encode())
+        self.fp.write(f"startxref\n{xref_offset}\n%%EOF\n".encode())
+        self.fp.close()
+
+    def write_raw(self, number, text):
+        self.offsets[number] = self.fp.tell()
+        self.fp.write(f"{number} 0 obj\n{text}\nendobj\n".encode())
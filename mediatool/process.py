@@ -0,0 +1,168 @@
+import os, signal, subprocess, threading
+from contextlib import contextmanager
+
+from . import config
+
+# ---------------------- External Process Runner ---------------------- #
+
+# The programs started here do their work outside the Python interpreter and a thread waiting for one does
+# not hold the GIL. Callers therefore run several of them from a ThreadPoolExecutor to use several cores.
+
+# Niceness on Linux/macOS and priority class on Windows for each priority level
+priority_levels = {
+    'normal': (0, 0x00000020),  # NORMAL_PRIORITY_CLASS
+    'below_normal': (10, 0x00004000),  # BELOW_NORMAL_PRIORITY_CLASS
+    'idle': (19, 0x00000040),  # IDLE_PRIORITY_CLASS
+}
+
+class ProcessCancelled(Exception):
+    """Raised when an external program was stopped because its job was cancelled or ran out of time."""
+
+class CancelToken:
+    """
+    Cancels the external programs of one job and holds their resource limits.
+
+    Every program started with the token through start_process or run_process is registered with it.
+    cancel() kills all of them together with the programs they started, and no new program is started
+    afterwards. One token is shared by all threads of a job.
+    """
+
+    def __init__(self, priority=None, cpus=None):
+        """
+        :param priority: 'normal', 'below_normal' or 'idle'. Default is config.process_priority.
+        :param cpus: Set of CPU numbers the programs may run on. Default is config.process_cpus.
+        """
+        self.priority = priority
+        self.cpus = cpus
+        self.reason = None  # 'cancelled' or 'timeout' once the token was cancelled
+        self.processes = set()
+        self.lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self.reason is not None
+
+    def cancel(self, reason='cancelled'):
+        """Kills the running programs of the job. Can be called from any thread, also more than once."""
+        with self.lock:
+            if self.reason is None:
+                self.reason = reason
+            processes = list(self.processes)
+        for process in processes:
+            kill_process_tree(process)
+
+    def check(self):
+        """Raises ProcessCancelled if the token was cancelled."""
+        if self.reason == 'timeout':
+            raise ProcessCancelled("Job exceeded its time limit")
+        if self.reason is not None:
+            raise ProcessCancelled("Job was cancelled")
+
+    def add(self, process):
+        with self.lock:
+            self.processes.add(process)
+            cancelled = self.cancelled
+        if cancelled:
+            kill_process_tree(process)  # Cancelled while the program was starting
+
+    def remove(self, process):
+        with self.lock:
+            self.processes.discard(process)
+
+def process_options(priority):
+    """Returns the Popen arguments that start a program in its own process group, at the priority on Windows."""
+    if os.name == 'nt':
+        return {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP | priority_levels[priority][1]}
+    # No preexec_fn for the limits, it is not safe in a process with threads. set_limits applies them instead.
+    return {'start_new_session': True}
+
+def set_limits(process, priority, cpus):
+    """Sets the niceness and the CPUs of a started program on Linux/macOS, the CPUs on Windows."""
+    if os.name == 'nt':
+        if cpus:
+            set_windows_affinity(process, cpus)
+        return
+    nice = priority_levels[priority][0]
+    try:
+        if nice:
+            os.setpriority(os.PRIO_PROCESS, process.pid, nice)
+        if cpus and hasattr(os, 'sched_setaffinity'):
+            os.sched_setaffinity(process.pid, cpus)
+    except ProcessLookupError:
+        pass  # Already exited
+
+def set_windows_affinity(process, cpus):
+    import ctypes
+    mask = sum(1 << cpu for cpu in cpus)
+    ctypes.windll.kernel32.SetProcessAffinityMask(int(process._handle), mask)
+
+def kill_process_tree(process):
+    """Kills a program started by start_process and every program it started. Does nothing if it has exited."""
+    if process.poll() is not None:
+        return
+    if os.name == 'nt':
+        # /T also ends the child processes of the program
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)  # The program leads its own process group
+        except (ProcessLookupError, PermissionError):
+            pass  # Exited in the meantime
+
+@contextmanager
+def start_process(command, cancel_token=None, **popen_args):
+    """
+    Starts an external program and yields its Popen object.
+
+    The program runs in its own process group, at the priority and on the CPUs of the token or of config.
+    It is registered with the token, so cancelling the token kills it. A program that is still running when
+    the block is left, e.g. because the caller stopped reading its output or raised, is killed with its
+    children, so no orphaned processes remain.
+
+    Usage:
+        with start_process(command, cancel_token, stdout=subprocess.PIPE) as process:
+            for line in process.stdout:
+                ...
+            process.wait()
+
+    :param popen_args: Further arguments for subprocess.Popen, e.g. stdout.
+    :raises ProcessCancelled: If the token was cancelled before the start or while the program ran.
+    """
+    if cancel_token is not None:
+        cancel_token.check()
+    priority = (cancel_token and cancel_token.priority) or config.process_priority
+    cpus = (cancel_token and cancel_token.cpus) or config.process_cpus
+
+    process = subprocess.Popen(command, **process_options(priority), **popen_args)
+    try:
+        with process:  # Closes the pipes and waits for the program
+            try:
+                # Inside the try, so the program is killed and reaped if its limits cannot be applied
+                set_limits(process, priority, cpus)
+                if cancel_token is not None:
+                    cancel_token.add(process)
+                yield process
+            finally:
+                kill_process_tree(process)
+    finally:
+        if cancel_token is not None:
+            cancel_token.remove(process)
+    if cancel_token is not None:
+        cancel_token.check()
+
+def run_process(command, cancel_token=None, timeout=None, check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                env=None):
+    """
+    Runs an external program to the end like subprocess.run, see start_process.
+
+    :param timeout: Seconds after which the program is killed and subprocess.TimeoutExpired is raised.
+    :param check: Raise subprocess.CalledProcessError if the program fails.
+    :param env: Environment of the program. Default is the environment of this process.
+    :return: subprocess.CompletedProcess with the captured stdout and stderr as bytes.
+    """
+    with start_process(command, cancel_token, stdout=stdout, stderr=stderr, env=env) as process:
+        output, errors = process.communicate(timeout=timeout)
+    if check and process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command, output, errors)
+    return subprocess.CompletedProcess(command, process.returncode, output, errors)
@@ -0,0 +1,441 @@
+import os, io, re, subprocess, threading, shutil, time, tempfile
+from PIL import Image, GifImagePlugin
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from . import config
+from .files import atomic_output, output_state, remove_partial_output
+from .ffmpeg import probe_media, keyframe_times, run_ffmpeg_with_progress
+from .process import start_process, run_process
+
+# ---------------------- Video Processing Functions ---------------------- #
+
+def compress_video(input_path, output_path, target_size=16 * 1024 * 1024, audio_bitrate=128000, progress_callback=None,
+                   segments=1, cancel_token=None):
+    """
+    Compresses a video to a target file size with a two-pass libx264 encode.
+
+    The video bitrate is calculated from the target size minus the audio track and an allowance for the
+    container overhead. Files that are already smaller than the target size are copied without re-encoding.
+
+    With segments > 1 long videos are split at keyframes into segments that are encoded at the same time,
+    see encode_segments. This scales to more cores than a single x264 process.
+
+    :param input_path: Path to the input video.
+    :param output_path: Path to save the compressed video.
+    :param target_size: Target file size in bytes. Default is 16 MB.
+    :param audio_bitrate: Maximum AAC bitrate in bits per second. Default is 128k.
+    :param progress_callback: Optional, receives the progress of each pass, see run_ffmpeg_with_progress.
+    :param segments: Maximum number of segments encoded at the same time. Default is 1, one x264 process.
+    :param cancel_token: Optional CancelToken that stops the encode. The event is set as well then.
+    :return: Original file size and an event that is set when the compression is complete. The error attribute
+        of the event is None on success, else the exception, e.g. RuntimeError or ProcessCancelled. A partial
+        output file is removed on failure.
+    """
+    media = probe_media(input_path)
+    duration = media['duration']
+    original_size = media['size']
+    if not duration:
+        raise ValueError(f"Could not determine the duration of {input_path}")
+
+    compression_complete = threading.Event()  # Create an event to signal completion
+    compression_complete.error = None
+
+    if original_size <= target_size:
+        # Nothing to gain from re-encoding, keep the original
+        shutil.copyfile(input_path, output_path)
+        compression_complete.set()
+        return original_size, compression_complete
+
+    # Never encode the audio at a higher bitrate than the source
+    if media['audio'] is not None:
+        if media['audio']['bit_rate']:
+            audio_bitrate = min(audio_bitrate, media['audio']['bit_rate'])
+        audio_args = ['-c:a', 'aac', '-b:a', f'{audio_bitrate}']
+    else:
+        audio_bitrate = 0
+        audio_args = ['-an']
+
+    size_margin = 0.05  # Reserve for container overhead and the rate control tolerance of x264
+    total_bitrate = (target_size * 8 * (1 - size_margin)) / duration
+    target_bitrate = int(total_bitrate - audio_bitrate)
+    if target_bitrate < 50000:
+        raise ValueError(f"Target size of {target_size / 1024 / 1024:.2f} MB is too small for a video of {duration:.0f} seconds")
+
+    def run_ffmpeg():
+        if not config.ffmpeg_path:
+            print("FFmpeg not found in PATH.")
+            compression_complete.error = RuntimeError("FFmpeg not found in PATH")
+            compression_complete.set()  # Signal that compression is complete even if it fails
+            return
+
+        video_args = ['-c:v', 'libx264', '-preset', 'medium', '-b:v', f'{target_bitrate}']
+        passlog_dir = tempfile.mkdtemp(prefix="compress_video_")
+        passlog_file = os.path.join(passlog_dir, "ffmpeg2pass")
+        passes = [
+            # First pass only analyses the video, the output is discarded
+            [config.ffmpeg_path, '-y', '-i', input_path, *video_args, '-pass', '1', '-passlogfile', passlog_file,
+             '-an', '-f', 'null', '-'],
+            [config.ffmpeg_path, '-y', '-i', input_path, *video_args, '-pass', '2', '-passlogfile', passlog_file,
+             *audio_args, output_path],
+        ]
+
+        previous_output = output_state(output_path)
+        try:
+            bounds = []
+            if segments > 1:
+                try:
+                    bounds = segment_bounds(duration, keyframe_times(input_path), segments)
+                except (OSError, ValueError) as e:
+                    print(f"Keyframes could not be read, encoding without segments: {e}")
+            if len(bounds) > 1:
+                returncode, log = encode_segments(input_path, output_path, bounds, target_bitrate, audio_args,
+                                                  passlog_dir, progress_callback, cancel_token)
+                print("\n".join(log))  # Print the end of the ffmpeg log
+                if returncode != 0:
+                    raise RuntimeError("FFmpeg failed: " + "\n".join(log[-10:]))
+                return
+
+            for number, command in enumerate(passes, start=1):
+                def report_pass(progress, number=number):
+                    if progress_callback:
+                        progress_callback({**progress, 'pass': number, 'passes': len(passes)})
+
+                returncode, log = run_ffmpeg_with_progress(command, duration, report_pass, cancel_token=cancel_token)
+                print("\n".join(log))  # Print the end of the ffmpeg log
+                if returncode != 0:
+                    raise RuntimeError(f"FFmpeg failed in pass {number}: " + "\n".join(log[-10:]))
+        except Exception as e:
+            # Runs in its own thread, the caller gets the error through the event
+            print(f"Video compression stopped: {e}")
+            compression_complete.error = e
+            remove_partial_output(output_path, previous_output)
+        finally:
+            shutil.rmtree(passlog_dir, ignore_errors=True)
+            compression_complete.set()  # Signal that compression is complete
+
+    threading.Thread(target=run_ffmpeg).start()
+
+    return original_size, compression_complete  # Return the original size and the event
+
+# ---------------------- Segment-Parallel Encoding ---------------------- #
+
+min_segment_duration = 60  # Seconds. Shorter segments do not pay off the extra x264 start-up and lookahead.
+
+def segment_bounds(duration, keyframes, segments):
+    """Splits a video into at most the given number of (start, end) ranges of similar length that start at keyframes."""
+    segments = min(segments, int(duration // min_segment_duration))
+    starts = [0.0]
+    for number in range(1, segments):
+        start = next((keyframe for keyframe in keyframes if keyframe >= duration * number / segments), None)
+        if start is not None and starts[-1] < start < duration:
+            starts.append(start)
+    return list(zip(starts, starts[1:] + [duration]))
+
+def pass_log_complexity(passlog_file):
+    """Sums the bits x264 spent on all frames in the first pass, a measure of how hard a segment is to encode."""
+    total = 0
+    with open(passlog_file + '-0.log') as f:
+        for line in f:
+            total += sum(int(bits) for bits in re.findall(r'\b(?:tex|mv|misc):(\d+)', line))
+    return total
+
+def segment_bitrates(target_bitrate, durations, complexities):
+    """
+    Shares the bit budget of the whole video between segments in proportion to their first-pass complexity,
+    like a single two-pass encode would. No segment gets less than half or more than twice the average.
+    """
+    if not all(complexities):
+        return [target_bitrate] * len(durations)
+    total_bits = target_bitrate * sum(durations)
+    bitrates = [total_bits * complexity / sum(complexities) / duration for complexity, duration in zip(complexities, durations)]
+    bitrates = [min(max(bitrate, target_bitrate / 2), target_bitrate * 2) for bitrate in bitrates]
+    scale = total_bits / sum(bitrate * duration for bitrate, duration in zip(bitrates, durations))
+    return [int(bitrate * scale) for bitrate in bitrates]
+
+def encode_segments(input_path, output_path, bounds, target_bitrate, audio_args, work_dir, progress_callback=None,
+                    cancel_token=None):
+    """
+    Two-pass encodes the segments of a video at the same time and joins them without re-encoding.
+
+    Every segment starts at a keyframe and is encoded by its own ffmpeg process. After the first pass the
+    bit budget is shared between the segments by their complexity. The encoded segments are joined with the
+    concat demuxer, and the audio is encoded from the input in the same step.
+
+    :param bounds: (start, end) of every segment in seconds, see segment_bounds.
+    :param target_bitrate: Average video bitrate in bits per second.
+    :param audio_args: ffmpeg audio options of the output, e.g. ['-c:a', 'aac', '-b:a', '128000'] or ['-an'].
+    :param work_dir: Directory for the pass logs and encoded segments.
+    :param cancel_token: Optional CancelToken, cancelling it stops all segment encodes.
+    :return: Return code of ffmpeg and the end of its log, from the first run that failed or the join.
+    """
+    durations = [end - start for start, end in bounds]
+    duration = sum(durations)
+    threads = max(1, (os.cpu_count() or 1) // len(bounds))  # Share the cores between the x264 processes
+    segment_paths = [os.path.join(work_dir, f"segment{index}.mp4") for index in range(len(bounds))]
+
+    def run_pass(number, bitrates):
+        out_times = [0.0] * len(bounds)
+        started = time.monotonic()
+        lock = threading.Lock()
+
+        def run_segment(index):
+            start, end = bounds[index]
+            # Seek a millisecond early so rounding never drops the keyframe the segment starts with
+            command = [config.ffmpeg_path, '-y', '-ss', f'{max(0.0, start - 0.001):.3f}', '-i', input_path,
+                       '-t', f'{end - start:.3f}', '-map', '0:v:0', '-c:v', 'libx264', '-preset', 'medium',
+                       '-b:v', f'{bitrates[index]}', '-threads', f'{threads}', '-pass', f'{number}',
+                       '-passlogfile', os.path.join(work_dir, f"segment{index}"), '-an']
+            # In ABR mode x264 writes the same H.264 headers for every bitrate, so the segments can be joined as they are
+            command += ['-f', 'null', '-'] if number == 1 else [segment_paths[index]]
+
+            def report_segment(progress):
+                if not progress_callback or progress['out_time'] is None:
+                    return
+                with lock:
+                    out_times[index] = progress['out_time']
+                    done = sum(out_times)
+                elapsed = time.monotonic() - started
+                speed = done / elapsed if elapsed and done else None
+                progress_callback({
+                    'percent': min(100.0, done / duration * 100),
+                    'fps': None,
+                    'speed': speed,
+                    'eta': max(0.0, (duration - done) / speed) if speed else None,
+                    'out_time': done,
+                    'done': False,
+                    'pass': number,
+                    'passes': 2,
+                })
+
+            return run_ffmpeg_with_progress(command, end - start, report_segment, cancel_token=cancel_token)
+
+        with ThreadPoolExecutor(max_workers=len(bounds)) as executor:
+            results = list(executor.map(run_segment, range(len(bounds))))
+        return next(((returncode, log) for returncode, log in results if returncode != 0), None)
+
+    failed = run_pass(1, [target_bitrate] * len(bounds))
+    if failed:
+        return failed
+    try:
+        complexities = [pass_log_complexity(os.path.join(work_dir, f"segment{index}")) for index in range(len(bounds))]
+    except (OSError, ValueError):
+        complexities = [0]  # Fall back to the same bitrate for every segment
+    failed = run_pass(2, segment_bitrates(target_bitrate, durations, complexities))
+    if failed:
+        return failed
+
+    list_path = os.path.join(work_dir, "segments.txt")
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in segment_paths:
+            f.write("file '{}'\n".format(path.replace("'", "'\\''")))
+    command = [config.ffmpeg_path, '-y', '-f', 'concat', '-safe', '0', '-i', list_path, '-i', input_path, '-map', '0:v:0']
+    if '-an' not in audio_args:
+        command += ['-map', '1:a:0']
+    command += ['-c:v', 'copy', *audio_args, '-movflags', '+faststart', output_path]
+    return run_ffmpeg_with_progress(command, duration, cancel_token=cancel_token)
+
+# Codecs that can be stored in an MP4 container without re-encoding
+mp4_video_codecs = {'h264', 'hevc', 'mpeg4', 'av1'}
+mp4_audio_codecs = {'aac', 'mp3', 'ac3', 'eac3'}
+
+def convert_to_mp4(input_path, output_path, stream_copy=True, progress_callback=None, cancel_token=None):
+    """
+    Converts a video to MP4.
+
+    Streams that are already MP4-compatible are copied without decoding, so e.g. an MKV with H.264/AAC
+    is only remuxed. Only the streams that need it are re-encoded to H.264/AAC.
+
+    :param input_path: Path to the input video.
+    :param output_path: Path to save the MP4 file.
+    :param stream_copy: Copy compatible streams. If False, all streams are re-encoded.
+    :param progress_callback: Optional, receives the progress, see run_ffmpeg_with_progress.
+    :param cancel_token: Optional CancelToken that stops ffmpeg.
+    """
+    try:
+        # Print the input and output paths for debugging
+        print(f"Input Path: {input_path}")
+        print(f"Output Path: {output_path}")
+
+        # Check that the input file exists and contains a video stream
+        media = probe_media(input_path)
+        video_stream = media['video']
+        if video_stream is None:
+            raise ValueError(f"No video stream found in: {input_path}")
+
+        command = [config.ffmpeg_path, '-y', '-i', input_path, '-map', f"0:{video_stream['index']}"]
+        if stream_copy and video_stream['codec'] in mp4_video_codecs:
+            command += ['-c:v', 'copy']
+            if video_stream['codec'] == 'hevc':
+                command += ['-tag:v', 'hvc1']  # Needed for playback on Apple devices
+        else:
+            command += ['-c:v', 'libx264', '-preset', 'medium', '-pix_fmt', 'yuv420p']
+
+        audio_streams = [stream for stream in media['streams'] if stream['type'] == 'audio']
+        for number, stream in enumerate(audio_streams):
+            command += ['-map', f"0:{stream['index']}"]
+            if stream_copy and stream['codec'] in mp4_audio_codecs:
+                command += [f'-c:a:{number}', 'copy']
+            else:
+                command += [f'-c:a:{number}', 'aac', f'-b:a:{number}', '192k']
+
+        # Move the index to the front of the file so playback can start before the download is finished
+        command += ['-movflags', '+faststart', output_path]
+
+        returncode, log = run_ffmpeg_with_progress(command, media['duration'], progress_callback, cancel_token=cancel_token)
+        if returncode != 0:
+            raise RuntimeError("FFmpeg failed: " + "\n".join(log[-10:]))
+    
+    except Exception as e:
+        print(f"Error during video processing: {e}")
+        raise  # Re-raise the exception after printing the error
+
+def iter_video_frames(input_path, width, height, fps, cancel_token=None, log_size=50):
+    """
+    Decodes a video with ffmpeg and yields its frames as RGB PIL images, scaled to width x height at the given fps.
+    Only one frame is held in memory at a time. ffmpeg is stopped if the consumer stops early.
+
+    :raises RuntimeError: If ffmpeg fails, with the end of its log. Frames decoded before the error have been yielded.
+    """
+    command = [config.ffmpeg_path, '-v', 'error', '-i', input_path, '-an',
+               '-vf', f'fps={fps},scale={width}:{height}:flags=lanczos',
+               '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-']
+    frame_size = width * height * 3
+    log = deque(maxlen=log_size)
+    with start_process(command, cancel_token, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+        # stderr is drained in a thread, ffmpeg would block once the pipe buffer is full
+        log_thread = threading.Thread(
+            target=lambda: log.extend(line.decode(errors='replace').rstrip() for line in process.stderr), daemon=True)
+        log_thread.start()
+        while True:
+            data = process.stdout.read(frame_size)
+            if len(data) < frame_size:
+                break
+            yield Image.frombytes("RGB", (width, height), data)
+        process.wait()
+        log_thread.join()
+        if process.returncode != 0:
+            if cancel_token is not None:
+                cancel_token.check()  # Killed on purpose, not a decoding error
+            raise RuntimeError("FFmpeg failed: " + "\n".join(list(log)[-10:]))
+
+def grab_keyframe(input_path, time_position, height):
+    """Returns the keyframe at or before time_position in seconds as an RGB PIL image, scaled to the given height."""
+    # Seeking before -i jumps to the keyframe before the position and only keyframes are decoded from there.
+    # ffmpeg returns nothing if that keyframe is far before the position, e.g. in clips with a single
+    # keyframe. Then the frames from the keyframe to the position are decoded as well.
+    for skip_args in (['-skip_frame', 'nokey'], []):
+        result = run_process(
+            [config.ffmpeg_path, '-v', 'error', *skip_args, '-ss', f'{time_position:.3f}', '-i', input_path,
+             '-map', '0:v:0', '-frames:v', '1', '-vf', f'scale=-2:{height}', '-c:v', 'bmp', '-f', 'image2pipe', '-'],
+            stderr=subprocess.DEVNULL
+        )
+        if result.stdout:
+            return Image.open(io.BytesIO(result.stdout)).convert("RGB")
+    return None
+
+@lru_cache(maxsize=32)
+def video_thumbnails_cached(input_path, size, mtime, count, height):
+    """Grabs the frames for video_thumbnails, cached per file version like probe_media_cached."""
+    duration = probe_media(input_path)['duration'] or 0
+    positions = [duration * (number + 0.5) / count for number in range(count)]
+    # Every frame is grabbed by its own short ffmpeg process, all of them at the same time
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        frames = list(executor.map(lambda position: grab_keyframe(input_path, position, height), positions))
+    return tuple(frame for frame in frames if frame is not None)
+
+def video_thumbnails(input_path, count=8, height=72):
+    """
+    Returns count evenly spaced frames of a video as RGB PIL images, e.g. for a preview strip.
+
+    Each frame is the keyframe closest before its position, so only one frame is decoded per thumbnail
+    no matter how long the video is. Results are cached per path, file size and modification time and
+    are shared between callers, so the images must not be modified.
+
+    :param count: Number of thumbnails.
+    :param height: Height of the thumbnails in pixels. The width follows the aspect ratio of the video.
+    :return: Tuple of images. Positions where no frame could be decoded are left out.
+    """
+    media = probe_media(input_path)
+    if media['video'] is None:
+        raise ValueError(f"No video stream found in: {input_path}")
+    stat = os.stat(input_path)
+    return video_thumbnails_cached(os.path.abspath(input_path), stat.st_size, stat.st_mtime_ns, count, height)
+
+def write_gif_frames(frames, output_path, fps, palette="adaptive"):
+    """
+    Writes RGB frames to a GIF file one at a time, so memory use does not depend on the clip length.
+    The file is written under a temporary name and only replaces output_path once all frames were written.
+
+    :param frames: Iterable of PIL images in RGB mode.
+    :param output_path: Path to save the GIF file.
+    :param fps: Frame rate of the GIF.
+    :param palette: 'shared' quantizes every frame against the palette of the first frame,
+                    'adaptive' gives each frame its own local palette.
+    :raises ValueError: If frames is empty.
+    """
+    duration = int(1000 / fps)  # Frame duration in milliseconds
+    shared_palette = None
+
+    with atomic_output(output_path) as temp_path, open(temp_path, "wb") as fp:
+        for frame in frames:
+            if palette == "adaptive" or shared_palette is None:
+                frame = frame.quantize(colors=256)
+            else:
+                frame = frame.quantize(palette=shared_palette)
+
+            if shared_palette is None:
+                # The first frame defines the global header and palette
+                shared_palette = frame
+                header, _ = GifImagePlugin.getheader(frame, info={"loop": 0, "duration": duration})
+                for block in header:
+                    fp.write(block)
+
+            for block in GifImagePlugin.getdata(frame, duration=duration, include_color_table=(palette == "adaptive")):
+                fp.write(block)
+
+        if shared_palette is None:
+            raise ValueError(f"No video frames to write to {output_path}")
+        fp.write(b";")  # GIF trailer
+
+def convert_to_gif(input_path, output_path, fps=None, max_width=None, palette="adaptive", progress_callback=None,
+                   cancel_token=None):
+    """
+    Converts a video to GIF by streaming decoded frames directly into the GIF encoder.
+
+    :param fps: Output frame rate. Defaults to the frame rate of the video.
+    :param max_width: Maximum width of the GIF. Larger videos are scaled down keeping the aspect ratio.
+    :param palette: 'shared' (one palette for all frames) or 'adaptive' (one palette per frame).
+    :param progress_callback: Optional, receives a dict with 'percent', 'fps', 'eta' and 'done'.
+    :param cancel_token: Optional CancelToken that stops decoding.
+    """
+    media = probe_media(input_path)
+    if media['video'] is None or not media['video']['fps']:
+        raise ValueError(f"No video stream found in: {input_path}")
+
+    fps = min(fps or media['video']['fps'], media['video']['fps'])
+    width = media['video']['width']
+    height = media['video']['height']
+    if max_width and width > max_width:
+        height = max(1, round(height * max_width / width))
+        width = int(max_width)
+
+    def frames():
+        total = media['duration'] * fps if media['duration'] else None
+        started = last_report = time.monotonic()
+        for number, frame in enumerate(iter_video_frames(input_path, width, height, fps, cancel_token), start=1):
+            yield frame
+            # Report about twice a second like ffmpeg does, not on every frame
+            if progress_callback and total and time.monotonic() - last_report >= 0.5:
+                last_report = time.monotonic()
+                elapsed = last_report - started
+                percent = min(100.0, number / total * 100)
+                progress_callback({
+                    'percent': percent,
+                    'fps': number / elapsed if elapsed else None,
+                    'eta': elapsed * (100 - percent) / percent,
+                    'done': False,
+                })
+
+    write_gif_frames(frames(), output_path, fps, palette)
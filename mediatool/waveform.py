@@ -0,0 +1,140 @@
+import os, tempfile, wave
+import numpy as np
+
+from . import config
+from .files import atomic_output
+from .process import run_process
+
+# ---------------------- Waveform Peak Index ---------------------- #
+
+peak_index_version = 1
+peaks_suffix = '.peaks.npz'  # Of the cache file next to the audio file, see waveform_peaks
+samples_per_peak = 1024  # Samples per bucket at the finest zoom level
+zoom_factor = 4  # Number of buckets of one level that make up one bucket of the next level
+min_buckets = 256  # No coarser level is built once a level has fewer buckets than this
+decode_sample_rate = 8000  # Files that are not 16-bit PCM WAV are decoded at this rate for the index
+
+def wav_samples(path):
+    """
+    Memory-maps the samples of a 16-bit PCM WAV file without decoding it.
+
+    :return: (int16 array of shape (frames, channels), sample_rate), or None for other files.
+    """
+    try:
+        with open(path, 'rb') as fp, wave.open(fp, 'rb') as wav:
+            if wav.getsampwidth() != 2 or wav.getcomptype() != 'NONE':
+                return None
+            channels, sample_rate, frames = wav.getnchannels(), wav.getframerate(), wav.getnframes()
+            offset = fp.tell()  # The reader stops at the start of the data chunk
+    except (wave.Error, EOFError):
+        return None  # Not a WAV file, or a variant the wave module does not read, e.g. WAVE_FORMAT_EXTENSIBLE
+    # Streamed recordings can have a wrong frame count in the header
+    frames = min(frames, (os.path.getsize(path) - offset) // (2 * channels))
+    if frames <= 0:
+        return None
+    samples = np.memmap(path, dtype='<i2', mode='r', offset=offset, shape=(frames * channels,))
+    return samples.reshape(frames, channels), sample_rate
+
+def bucket_peaks(samples, bucket, chunk_buckets=65536):
+    """Returns the minimum and maximum of every bucket samples as an int16 array of shape (buckets, 2)."""
+    count = -(-len(samples) // bucket)
+    peaks = np.empty((count, 2), dtype=np.int16)
+    for first in range(0, count, chunk_buckets):
+        # Only one chunk of the memory-mapped file is read at a time
+        # Channels are interleaved, so a bucket is a contiguous run of bucket * channels values
+        block = np.asarray(samples[first * bucket:(first + chunk_buckets) * bucket]).reshape(-1)
+        starts = np.arange(0, len(block), bucket * samples.shape[1])
+        peaks[first:first + len(starts), 0] = np.minimum.reduceat(block, starts)
+        peaks[first:first + len(starts), 1] = np.maximum.reduceat(block, starts)
+    return peaks
+
+def merge_peaks(peaks, factor):
+    """Combines every factor buckets into one, which gives the next coarser zoom level."""
+    starts = np.arange(0, len(peaks), factor)
+    return np.stack([np.minimum.reduceat(peaks[:, 0], starts), np.maximum.reduceat(peaks[:, 1], starts)], axis=1)
+
+def build_peak_index(path):
+    """Computes the peak levels of the first audio track of a file, see waveform_peaks."""
+    temp_path = None
+    try:
+        source = wav_samples(path)
+        if source is None:
+            # Let ffmpeg decode to a raw mono file, which is then memory-mapped like a WAV file
+            fd, temp_path = tempfile.mkstemp(suffix='.pcm')
+            os.close(fd)
+            run_process([config.ffmpeg_path, '-v', 'error', '-y', '-i', path, '-map', '0:a:0', '-ac', '1',
+                         '-ar', str(decode_sample_rate), '-f', 's16le', temp_path], check=True, stdout=None, stderr=None)
+            if os.path.getsize(temp_path) < 2:
+                raise ValueError(f"No audio samples found in: {path}")
+            source = np.memmap(temp_path, dtype='<i2', mode='r').reshape(-1, 1), decode_sample_rate
+
+        samples, sample_rate = source
+        frames = len(samples)
+        levels = [bucket_peaks(samples, samples_per_peak)]
+        del samples, source  # Close the memory map, Windows cannot delete a mapped file
+    finally:
+        if temp_path is not None:
+            os.remove(temp_path)
+
+    while len(levels[-1]) >= min_buckets * zoom_factor:
+        levels.append(merge_peaks(levels[-1], zoom_factor))
+    return {'sample_rate': sample_rate, 'frames': frames, 'duration': frames / sample_rate, 'levels': levels}
+
+def waveform_peaks(path):
+    """
+    Returns the waveform overview of an audio file as min/max peaks at several zoom levels.
+
+    Level 0 has one bucket per samples_per_peak samples, every further level combines zoom_factor buckets.
+    The samples are processed with NumPy over a memory-mapped PCM file in chunks, so even multi-hour
+    recordings need little memory. The index is cached next to the file as the hidden file .<file>.peaks.npz
+    and rebuilt when the file changes.
+
+    :return: Dict with 'sample_rate', 'frames', 'duration' and 'levels', a list of int16 arrays of shape (buckets, 2).
+    """
+    stat = os.stat(path)
+    identity = np.array([peak_index_version, samples_per_peak, zoom_factor, stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+    directory, name = os.path.split(path)
+    cache_path = os.path.join(directory, f".{name}{peaks_suffix}")
+    try:
+        with np.load(cache_path) as cached:
+            if np.array_equal(cached['identity'], identity):
+                levels = [cached[f'level{number}'] for number in range(int(cached['level_count']))]
+                frames, sample_rate = (int(value) for value in cached['audio'])
+                return {'sample_rate': sample_rate, 'frames': frames, 'duration': frames / sample_rate, 'levels': levels}
+    except (OSError, KeyError, ValueError):
+        pass  # No cache yet or unreadable, build the index
+
+    index = build_peak_index(path)
+    try:
+        with atomic_output(cache_path) as temp_path, open(temp_path, 'wb') as fp:
+            np.savez(fp, identity=identity, audio=np.array([index['frames'], index['sample_rate']]),
+                     level_count=len(index['levels']),
+                     **{f'level{number}': level for number, level in enumerate(index['levels'])})
+    except OSError as e:
+        print(f"Waveform cache write failed: {e}")
+    return index
+
+def waveform_columns(index, width, start=0.0, end=None):
+    """
+    Reduces a peak index to one (min, max) pair per pixel column, from the coarsest level that still has enough detail.
+
+    :param start: Start of the shown range in seconds.
+    :param end: End of the shown range in seconds. Default is the end of the file.
+    :return: Two float arrays with the minimum and maximum of each column, scaled to -1..1.
+    """
+    end = index['duration'] if end is None else end
+    first_frame = int(start * index['sample_rate'])
+    last_frame = max(first_frame + 1, int(end * index['sample_rate']))
+
+    for number in range(len(index['levels']) - 1, -1, -1):
+        bucket = samples_per_peak * zoom_factor ** number
+        if (last_frame - first_frame) / bucket >= width or number == 0:
+            break
+    peaks = index['levels'][number][first_frame // bucket:-(-last_frame // bucket)]
+    if len(peaks) == 0:
+        return np.zeros(width), np.zeros(width)
+
+    starts = np.linspace(0, len(peaks), width, endpoint=False).astype(int)
+    mins = np.minimum.reduceat(peaks[:, 0], starts) / 32768
+    maxs = np.maximum.reduceat(peaks[:, 1], starts) / 32768
+    return mins, maxs
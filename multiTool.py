@@ -1,254 +1,231 @@
 import tkinter as tk
-import wave, requests, os, sys, io, subprocess, threading, base64, shutil, cv2, time, pytesseract, imageio, moviepy
+import os, io, sys, threading, base64, time, itertools
 from tkinter import filedialog, ttk, messagebox
-from moviepy.video.io.VideoFileClip import VideoFileClip
-from PIL import Image, ImageTk, ImageDraw, ImageFont
-import numpy as np
+from PIL import Image, ImageTk
 from io import BytesIO
-from pdf2image import convert_from_path
-from PyPDF2 import PdfWriter, PdfReader
-from pydub import AudioSegment  # New import for audio processing
-from spellchecker import SpellChecker
-from reportlab.pdfgen import canvas
+from collections import OrderedDict
+import mediatool
+from mediatool import (compress_video, convert_to_mp4, convert_to_gif, video_thumbnails, convert_audio, audio_format,
+                       format_progress, JobScheduler, CancelToken, ProcessCancelled)
 
-# ---------------------- Video Processing Functions ---------------------- #
-
-def compress_video(input_path, output_path):
-    target_size = 16 * 1024 * 1024  # 16 MB
-    video = VideoFileClip(input_path)
-    duration = video.duration
-    original_size = os.path.getsize(input_path)
-    target_bitrate = int((target_size * 8) / duration)
+# The PDF and waveform functions pull in OpenCV, Tesseract, the spell checker and NumPy. They are used as
+# mediatool.<name>, so these modules are only loaded the first time one of the functions is called.
+startup_started = time.perf_counter()
+startup_budget = 1.0  # Seconds until the window is ready
+deferred_modules = ['cv2', 'pytesseract', 'spellchecker', 'pdf2image', 'numpy', 'PyPDF2']  # Checked by mediatool.benchmark
 
-    compression_complete = threading.Event()  # Create an event to signal completion
+# ---------------------- GUI Event Bus ---------------------- #
 
-    def run_ffmpeg():
-        # Determine the path to the FFmpeg executable
-        if getattr(sys, 'frozen', False):
-            # If the application is frozen (compiled), get the path to the executable
-            base_path = sys._MEIPASS  # This is the temporary folder where the executable is unpacked
-        else:
-            # If running in a normal Python environment, use the current directory
-            base_path = os.path.dirname(os.path.abspath(__file__))
-
-        ffmpeg_path = r"C:\ffmpeg\bin\ffmpeg.exe"
-        if not ffmpeg_path:
-            print("FFmpeg not found in PATH.")
-            compression_complete.set()  # Signal that compression is complete even if it fails
-            return
-
-        process = subprocess.Popen(
-            [ffmpeg_path, '-i', input_path, '-c:v', 'libx264', '-preset', 'medium',
-             '-b:v', f'{target_bitrate}', '-c:a', 'aac', '-b:a', '128k', '-y', output_path],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-
-        # Capture output and error
-        stdout, stderr = process.communicate()  # Wait for the process to complete and capture output
-        print(stdout.decode())  # Print standard output
-        print(stderr.decode())  # Print standard error
+class EventBus:
+    """
+    Passes GUI updates from worker threads to the Tk main loop.
 
-        compression_complete.set()  # Signal that compression is complete
+    Tk widgets may only be used from the thread that runs mainloop. Workers post callbacks instead, which
+    the main loop runs every interval milliseconds. Updates posted with a key replace the pending update
+    with the same key, so a label that several progress reports arrive for in one interval is only set
+    once, no matter how many jobs are running.
+    """
 
-    threading.Thread(target=run_ffmpeg).start()
+    def __init__(self, interval=100):
+        self.interval = interval
+        self.pending = OrderedDict()  # Key -> callback, in the order they were last posted
+        self.lock = threading.Lock()
+        self.event_ids = itertools.count()
+
+    def post(self, callback, key=None):
+        """Queues callback() to run on the main loop. Can be called from any thread."""
+        with self.lock:
+            if key is None:
+                key = next(self.event_ids)  # Never replaced, e.g. error messages
+            self.pending.pop(key, None)  # Move a replaced update to the end, after the events posted before it
+            self.pending[key] = callback
+
+    def set_text(self, widget, text):
+        """Sets the text of a label from any thread. Only the last text posted within one interval is shown."""
+        self.post(lambda: widget.config(text=text), key=(str(widget), 'text'))
+
+    def start(self, root):
+        """Starts draining the posted callbacks on the main loop of root."""
+        self.root = root
+        root.after(self.interval, self.drain)
+
+    def drain(self):
+        with self.lock:
+            callbacks = list(self.pending.values())
+            self.pending.clear()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"GUI update failed: {e}")  # One broken update must not stop the others
+        self.root.after(self.interval, self.drain)
+
+events = EventBus()
 
-    return original_size, compression_complete  # Return the original size and the event
+# ---------------------- Video Processing Functions ---------------------- #
 
-def convert_to_mp4(input_path, output_path):
-    try:
-        # Print the input and output paths for debugging
-        print(f"Input Path: {input_path}")
-        print(f"Output Path: {output_path}")
-
-        # Check if the input file exists
-        if not os.path.exists(input_path):
-            raise FileNotFoundError(f"Input file not found: {input_path}")
-        
-        # Load the video file
-        video = VideoFileClip(input_path)
-        
-        # Check if the VideoFileClip object is properly created
-        if video is None:
-            raise ValueError("VideoFileClip returned None. The file may not have been loaded correctly.")
-
-        # Convert and save the video to MP4 format
-        video.write_videofile(output_path, codec="libx264")
-    
-    except Exception as e:
-        print(f"Error during video processing: {e}")
-        raise  # Re-raise the exception after printing the error
-
-def convert_to_gif(input_path, output_path):
-    video = VideoFileClip(input_path)
-    fps = video.fps
-    width = int(video.w)
-    height = int(video.h)
-    images = []
-    temp_filenames = []  # List to keep track of temporary filenames
-
-    for i in range(int(video.duration * fps)):
-        temp_filename = f"frame_{i}.png"
-        video.save_frame(temp_filename, t=i/fps)
-        img = Image.open(temp_filename).resize((width, height))
-        images.append(img)
-        temp_filenames.append(temp_filename)  # Store the filename
-
-    # Save images as GIF
-    images[0].save(output_path, format='GIF', append_images=images[1:],
-                   save_all=True, duration=int(1000 / fps), loop=0)
-
-    # Clean up temporary images
-    for temp_filename in temp_filenames:
-        os.remove(temp_filename)  # Remove the temporary file
+def show_done(progress_label, kind, text="Fertig"):
+    """Shows 'Fertig', or the given text, and the number of jobs of the given type that are still queued."""
+    remaining = scheduler.pending_jobs(kind) - 1  # The calling job is still counted as running
+    if remaining > 0:
+        text += f", {remaining} weitere Aufträge in der Warteschlange"
+    events.set_text(progress_label, text)
 
 def update_size_labels(original_size, compressed_size, original_label, compressed_label):
     original_label['text'] = f"Originalgröße: {original_size / 1024 / 1024:.2f} MB"
     compressed_label['text'] = f"Komprimierte Größe: {compressed_size / 1024 / 1024:.2f} MB"
 
-def video_processing_thread(action, input_path, output_path, original_label, compressed_label, progress_label):
+def video_processing_thread(action, input_path, output_path, original_label, compressed_label, progress_label, cancel_token=None):
+    logged_step = None
+    done_text = "Fertig"
+
+    def report_progress(progress):
+        nonlocal logged_step
+        text = format_progress(progress)
+        events.set_text(progress_label, text)
+        # Only log every 10% to keep the console readable
+        step = (progress.get('pass') or 1, int(progress['percent'] or 0) // 10)
+        if step != logged_step:
+            logged_step = step
+            print(text)
+
     try:
         if action == "compress":
-            original_size, compression_complete = compress_video(input_path, output_path)
+            original_size, compression_complete = compress_video(input_path, output_path, progress_callback=report_progress,
+                                                                 cancel_token=cancel_token)
             compression_complete.wait()  # Wait for the compression to finish
+            if compression_complete.error is not None:
+                raise compression_complete.error
             compressed_size = os.path.getsize(output_path)  # Now get the compressed size
-            update_size_labels(original_size, compressed_size, original_label, compressed_label)  # Update size labels
+            events.post(lambda: update_size_labels(original_size, compressed_size, original_label, compressed_label))
         elif action == "convert_mp4":
-            convert_to_mp4(input_path, output_path)
+            convert_to_mp4(input_path, output_path, progress_callback=report_progress, cancel_token=cancel_token)
         elif action == "convert_gif":
-            convert_to_gif(input_path, output_path)
+            convert_to_gif(input_path, output_path, progress_callback=report_progress, cancel_token=cancel_token)
+    except ProcessCancelled:
+        done_text = "Abgebrochen"
+        raise  # Mark the job as cancelled
     except Exception as e:
         print(f"Error during processing: {e}")
-        messagebox.showerror("Fehler", f"Fehler bei der Videoverarbeitung: {e}")
+        message = f"Fehler bei der Videoverarbeitung: {e}"
+        events.post(lambda: messagebox.showerror("Fehler", message))
+        raise  # Mark the job as failed
     finally:
-        progress_label.after(0, lambda: progress_label.config(text="Fertig"))
+        show_done(progress_label, 'video', done_text)
 
 # ---------------------- PDF Processing Functions ---------------------- #
-tesseract_path = r"C:\tesseract\tesseract.exe"
-pdftoppm_path = r"C:\poppler\Library\bin\pdftoppm.exe"
-
-# Initialize German spellchecker
-spell = SpellChecker(language='de')
-
-def enhance_image(image):
-    """Enhances the document for better OCR by sharpening and improving contrast."""
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    kernel = np.array([[0, -1, 0], [-1, 5,-1], [0, -1, 0]])  # Sharpening kernel
-    sharpened = cv2.filter2D(gray, -1, kernel)
-    enhanced = cv2.convertScaleAbs(sharpened, alpha=1.5, beta=0)  # Contrast adjustment
-    return enhanced
-
-def extract_text(image):
-    """Extracts text using OCR with better accuracy."""
-    custom_config = r'--oem 3 --psm 6 -l deu'
-    return pytesseract.image_to_string(image, config=custom_config)
-
-def correct_text(text):
-    """AI-powered text correction for missing letters, handling None values."""
-    spell = SpellChecker(language='de')
-    words = text.split()
-    corrected_words = [spell.correction(word) if spell.correction(word) is not None else word for word in words]
-    return ' '.join(corrected_words)
-
-def improve_pdf_for_ai_reading(input_path, output_path):
-    """Enhances a scanned PDF for better OCR and saves a corrected structured PDF."""
-    if not output_path.lower().endswith('.pdf'):
-        output_path = os.path.splitext(output_path)[0] + '.pdf'
-    
-    images = convert_from_path(input_path)  # Convert PDF to images
-    writer = PdfWriter()
-    
-    for img in images:
-        np_img = np.array(img)
-        enhanced_image = enhance_image(np_img)
-        extracted_text = extract_text(enhanced_image)
-        corrected_text = correct_text(extracted_text)
-        
-        # Create a new PDF page with corrected text
-        pdf_bytes = io.BytesIO(pytesseract.image_to_pdf_or_hocr(enhanced_image, extension='pdf'))
-        reader = PdfReader(pdf_bytes)
-        writer.add_page(reader.pages[0])
-    
-    with open(output_path, "wb") as f:
-        writer.write(f)
-    
-    print(f"✅ Verbesserte PDF gespeichert als: {output_path}")
-
 
-
-def compress_pdf(input_path: str, output_path: str, quality: str = "ebook"):
-    """
-    Compress a PDF file without compromising readability using Ghostscript.
-    
-    :param input_path: Path to the input PDF file.
-    :param output_path: Path to save the compressed PDF file.
-    :param quality: Compression quality (screen, ebook, printer, prepress). Default is 'ebook'.
-    """
-    # Ensure the output path ends with .pdf
-    if not output_path.lower().endswith('.pdf'):
-        output_path = os.path.splitext(output_path)[0] + '.pdf'
-    
-    # Ensure Ghostscript is installed
-    gs_path = r"C:\gs\bin\gswin64.exe"
-    if gs_path is None:
-        raise FileNotFoundError("Ghostscript executable not found. Please ensure Ghostscript is installed and in your PATH.")
-    
-    command = [
-        gs_path, "-sDEVICE=pdfwrite",
-        "-dCompatibilityLevel=1.4",
-        "-dPDFSETTINGS=/{}".format(quality),
-        "-dNOPAUSE", "-dQUIET", "-dBATCH",
-        "-sOutputFile={}".format(output_path),
-        input_path
-    ]
-    
-    try:
-        subprocess.run(command, check=True)
-        print(f"Komprimierte PDF gespeichert als: {output_path}")
-    except subprocess.CalledProcessError as e:
-        print(f"Fehler bei der PDF-Komprimierung: {e}")
-        
-def pdf_processing_thread(action, input_path, output_path, progress_label, quality=None):
+def pdf_processing_thread(action, input_path, output_path, progress_label, quality=None, engine=None, cancel_token=None):
+    done_text = "Fertig"
     try:
         if action == "compress":
-            compress_pdf(input_path, output_path, quality)
+            mediatool.compress_pdf(input_path, output_path, quality, engine=engine, cancel_token=cancel_token)
         elif action == "improve":
-            improve_pdf_for_ai_reading(input_path, output_path)
+            mediatool.improve_pdf_for_ai_reading(input_path, output_path, cancel_token=cancel_token)
+    except ProcessCancelled:
+        done_text = "Abgebrochen"
+        raise  # Mark the job as cancelled
     except Exception as e:
         print(f"Fehler bei der PDF-Verarbeitung: {e}")
-        messagebox.showerror("Fehler", f"Fehler bei der PDF-Verarbeitung: {e}")
+        message = f"Fehler bei der PDF-Verarbeitung: {e}"
+        events.post(lambda: messagebox.showerror("Fehler", message))
+        raise  # Mark the job as failed
     finally:
-        progress_label.after(0, lambda: progress_label.config(text="Fertig"))
+        show_done(progress_label, 'pdf', done_text)
 
 # ---------------------- Audio Processing Functions ---------------------- #
-# Define the available audio formats
-audio_format = {
-    'mp3': 'mp3',
-    'wav': 'wav',
-    'flac': 'flac',
-    # Add other formats as needed
-}
 
-def convert_audio(input_path, output_path, format):
-    # Ensure the output_path has the correct file extension for the selected format
-    output_path = os.path.splitext(output_path)[0] + f".{format.lower()}"
-    
-    audio = AudioSegment.from_file(input_path)  # Load audio file
-    audio.export(output_path, format=format)    # Export to the specified format
+def audio_processing_thread(input_path, output_path, audio_formats, progress_label, cancel_token=None):
+    def report_progress(progress):
+        text = format_progress(progress, "Verarbeite Audiodatei...")
+        events.set_text(progress_label, text)
 
-def audio_processing_thread(input_path, output_path, audio_format, progress_label):
+    done_text = "Fertig"
     try:
-        convert_audio(input_path, output_path, audio_format)  # Call the conversion function
-        # Update the output path with the forced format's extension
-        output_path = os.path.splitext(output_path)[0] + f".{audio_format.lower()}"
-        progress_label['text'] = f"Audio Datei erfolgreich verarbeitet and gespeichert unter: {output_path}"
+        # All formats are encoded from one decoding pass, returns the output paths with the formats' extensions
+        output_paths = convert_audio(input_path, output_path, audio_formats, progress_callback=report_progress,
+                                     cancel_token=cancel_token)
+        events.set_text(progress_label, f"Audio Datei erfolgreich verarbeitet and gespeichert unter: {', '.join(output_paths)}")
+    except ProcessCancelled:
+        done_text = "Abgebrochen"
+        raise  # Mark the job as cancelled
     except Exception as e:
-        progress_label['text'] = f"Error: {str(e)}"  # Handle any errors during conversion
+        events.set_text(progress_label, f"Error: {str(e)}")  # Handle any errors during conversion
+        raise  # Mark the job as failed
     finally:
-        progress_label.after(0, lambda: progress_label.config(text="Fertig"))
+        show_done(progress_label, 'audio', done_text)
+
+# ---------------------- Job Scheduler ---------------------- #
+
+# Number of jobs of each type that run at the same time. ffmpeg and Ghostscript use several cores per job.
+job_slots = {
+    'video': 1,
+    'pdf': 1,
+    'audio': max(1, (os.cpu_count() or 2) // 2),
+}
+scheduler = JobScheduler(job_slots)
 
 # ---------------------- GUI Functions ---------------------- #
 
+def split_input_paths(text):
+    """Splits the content of an input entry into file paths. Several files are separated by ';'."""
+    return [path.strip() for path in text.split(";") if path.strip()]
+
+def batch_output_path(input_path, output_path, extension, batch):
+    """
+    Returns the output path for one file of a job.
+
+    For a single file this is output_path with the given extension. For a batch the input file name is
+    appended, e.g. output 'C:/out/result' and input 'clip1.mov' give 'C:/out/result_clip1.mp4'.
+    """
+    base = os.path.splitext(output_path)[0]
+    if batch:
+        base += "_" + os.path.splitext(os.path.basename(input_path))[0]
+    return base + extension
+
+# Shown in the job list
+job_kind_names = {'video': "Video", 'pdf': "PDF", 'audio': "Audio"}
+job_state_names = {'queued': "wartet", 'running': "läuft"}
+
+def show_job(job):
+    """Adds a queued job to the job list with its state and a button to cancel it. The row is removed once the job has finished."""
+    row = tk.Frame(jobs_frame)
+    row.pack(fill='x')
+    tk.Label(row, text=f"{job_kind_names[job.kind]}: {os.path.basename(job.output_path)}", anchor='w').pack(side='left', padx=10)
+    state_label = tk.Label(row, anchor='w')
+    state_label.pack(side='left')
+    cancel_button = tk.Button(row, text="Abbrechen", command=job.cancel)
+    cancel_button.pack(side='right', padx=10)
+
+    def refresh():
+        if job.finished.is_set():
+            row.destroy()
+            return
+        if job.cancel_token.cancelled:
+            state_label.config(text="wird abgebrochen...")
+            cancel_button.config(state='disabled')
+        else:
+            state_label.config(text=job_state_names.get(job.state, ""))
+        row.after(500, refresh)
+
+    refresh()
+
+def submit_jobs(kind, func, jobs, progress_label):
+    """Submits (args, output_path) pairs to the scheduler and shows an error for rejected duplicates."""
+    for args, output_path in jobs:
+        try:
+            # The token lets the Cancel button of the job stop its ffmpeg, Ghostscript or tesseract processes
+            job = scheduler.submit(kind, func, args=args, kwargs={'cancel_token': CancelToken()}, output_path=output_path)
+        except ValueError:
+            messagebox.showerror("Fehler", f"Für diese Ausgabedatei läuft bereits ein Auftrag: {output_path}")
+            continue
+        show_job(job)
+    queued = scheduler.pending_jobs(kind)
+    if queued > 1:
+        # Through the event bus, so it replaces the "Verarbeite ..." text posted before instead of being overwritten by it
+        events.set_text(progress_label, f"{queued} Aufträge in der Warteschlange...")
+
+
 def browse_input_file(entry_widget):
     filetypes = [
         ("All files", "*.*"),
@@ -257,9 +234,10 @@ def browse_input_file(entry_widget):
         ("PDF files", "*.pdf")
     ]
     
-    filepath = filedialog.askopenfilename(filetypes=filetypes)
+    # Several files can be selected and are processed one after another
+    filepaths = filedialog.askopenfilenames(filetypes=filetypes)
     entry_widget.delete(0, tk.END)
-    entry_widget.insert(0, filepath)
+    entry_widget.insert(0, ";".join(filepaths))
 
 
 def browse_output_file(entry_widget, action):
@@ -284,66 +262,132 @@ def start_video_processing(action, original_label, compressed_label, progress_la
     original_label['text'] = ""
     compressed_label['text'] = ""
     # set progress label
-    progress_label.after(0, lambda: progress_label.config(text="Verarbeite Videodatei..."))
+    events.set_text(progress_label, "Verarbeite Videodatei...")
     progress_label.grid()
     
-    input_path = video_input_entry.get()
+    input_paths = split_input_paths(video_input_entry.get())
     output_path = video_output_entry.get()
     
-    if not input_path or not output_path:
+    if not input_paths or not output_path:
         messagebox.showerror("Fehler", "Bitte wählen Sie Eingabe- und Ausgabedateien aus.")
         return
     
-    # Change the output extension to match the input file's extension
-    if action == "compress":
-        output_extension = os.path.splitext(input_path)[1]
-        output_path = os.path.splitext(output_path)[0] + output_extension
-    elif action == "convert_mp4":
-        output_path = os.path.splitext(output_path)[0] + ".mp4"
-    elif action == "convert_gif":
-        output_path = os.path.splitext(output_path)[0] + ".gif"
+    jobs = []
+    for input_path in input_paths:
+        # Change the output extension to match the input file's extension
+        if action == "compress":
+            output_extension = os.path.splitext(input_path)[1]
+        elif action == "convert_mp4":
+            output_extension = ".mp4"
+        elif action == "convert_gif":
+            output_extension = ".gif"
+        job_output_path = batch_output_path(input_path, output_path, output_extension, len(input_paths) > 1)
+        jobs.append(((action, input_path, job_output_path, original_label, compressed_label, progress_label), job_output_path))
     
-    # Start the video processing in a separate thread
-    threading.Thread(target=video_processing_thread, args=(action, input_path, output_path, original_label, compressed_label, progress_label)).start()
+    # Queue the video processing, the scheduler limits how many jobs run at once
+    submit_jobs('video', video_processing_thread, jobs, progress_label)
     
+def show_thumbnails(strip, input_paths):
+    """Shows evenly spaced frames of the first selected video. The frames are grabbed in a background thread."""
+    for label in strip.winfo_children():
+        label.destroy()
+    if not input_paths:
+        return
+
+    def grab_frames():
+        try:
+            frames = video_thumbnails(input_paths[0])
+        except Exception as e:
+            print(f"Video preview failed: {e}")
+            return
+        events.post(lambda: draw_thumbnails(strip, frames, input_paths[0]))
+
+    threading.Thread(target=grab_frames, daemon=True).start()
+
+def draw_thumbnails(strip, frames, input_path):
+    if split_input_paths(video_input_entry.get())[:1] != [input_path]:
+        return  # Another file was selected while the frames were grabbed
+    for frame in frames:
+        photo = ImageTk.PhotoImage(frame)
+        label = tk.Label(strip, image=photo)
+        label.image = photo  # Keep a reference, Tk does not
+        label.pack(side="left", padx=1)
+
 def start_pdf_processing(action, progress_label):
     # set progress label
-    progress_label.after(0, lambda: progress_label.config(text="Verarbeite PDF..."))
+    events.set_text(progress_label, "Verarbeite PDF...")
     progress_label.grid()
     
-    input_path = pdf_input_entry.get()
+    input_paths = split_input_paths(pdf_input_entry.get())
     output_path = pdf_output_entry.get()
     
-    if not input_path or not output_path:
+    if not input_paths or not output_path:
         messagebox.showerror("Fehler", "Bitte wählen Sie Eingabe- und Ausgabedateien für PDF aus.")
         return
 
-    # Ensure output extension is .pdf
-    output_path = os.path.splitext(output_path)[0] + ".pdf"
-
     # Determine compression quality if compressing
     quality_mapping = {"Niedrig": "screen", "Mittel": "ebook", "Hoch": "printer"}
     compression_quality = quality_mapping.get(quality_var.get(), "ebook")  # Default to "Mittel"
+    engine_mapping = {"Ghostscript": "ghostscript", "Nur Bilder": "native"}
+    compression_engine = engine_mapping.get(engine_var.get(), "ghostscript")
 
-    # Start the PDF processing in a separate thread
-    threading.Thread(
-        target=pdf_processing_thread, 
-        args=(action, input_path, output_path, progress_label, compression_quality if action == "compress" else None)
-    ).start()
+    jobs = []
+    for input_path in input_paths:
+        # Ensure output extension is .pdf
+        job_output_path = batch_output_path(input_path, output_path, ".pdf", len(input_paths) > 1)
+        jobs.append(((action, input_path, job_output_path, progress_label, compression_quality if action == "compress" else None, compression_engine), job_output_path))
+
+    # Queue the PDF processing, the scheduler limits how many jobs run at once
+    submit_jobs('pdf', pdf_processing_thread, jobs, progress_label)
     
-def start_audio_processing(audio_format, progress_label):
-    print(f"Audio format: {audio_format}")
-    progress_label.after(0, lambda: progress_label.config(text="Verarbeite Audiodatei..."))
+def start_audio_processing(audio_formats, progress_label):
+    print(f"Audio formats: {', '.join(audio_formats)}")
+    events.set_text(progress_label, "Verarbeite Audiodatei...")
     
-    input_path = audio_input_entry.get()
+    input_paths = split_input_paths(audio_input_entry.get())
     output_path = audio_output_entry.get()
     
-    if not input_path or not output_path:
+    if not input_paths or not output_path:
         messagebox.showerror("Fehler", "Bitte wählen Sie Eingabe- und Ausgabedateien für Audio aus.")
         return
+    if not audio_formats:
+        messagebox.showerror("Fehler", "Bitte wählen Sie mindestens ein Audioformat aus.")
+        return
+
+    jobs = []
+    for input_path in input_paths:
+        job_output_path = batch_output_path(input_path, output_path, f".{audio_formats[0]}", len(input_paths) > 1)
+        jobs.append(((input_path, job_output_path, audio_formats, progress_label), job_output_path))
+
+    # Queue the audio processing, the scheduler limits how many jobs run at once
+    submit_jobs('audio', audio_processing_thread, jobs, progress_label)
+
+def show_waveform(canvas, input_paths):
+    """Draws the waveform of the first selected audio file. The peak index is built in a background thread."""
+    canvas.delete("all")
+    if not input_paths:
+        return
 
-    # Start the audio processing in a separate thread
-    threading.Thread(target=audio_processing_thread, args=(input_path, output_path, audio_format, progress_label)).start()
+    def build_index():
+        try:
+            index = mediatool.waveform_peaks(input_paths[0])
+        except Exception as e:
+            print(f"Waveform preview failed: {e}")
+            return
+        events.post(lambda: draw_waveform(canvas, index, input_paths[0]))
+
+    threading.Thread(target=build_index, daemon=True).start()
+
+def draw_waveform(canvas, index, input_path):
+    if split_input_paths(audio_input_entry.get())[:1] != [input_path]:
+        return  # Another file was selected while the index was built
+    width, height = int(canvas['width']), int(canvas['height'])
+    mins, maxs = mediatool.waveform_columns(index, width)
+    middle = height / 2
+    canvas.delete("all")
+    for x, (low, high) in enumerate(zip(mins, maxs)):
+        # One vertical line per pixel column from the minimum to the maximum of the samples in it
+        canvas.create_line(x, middle - high * middle, x, middle - low * middle + 1, fill="#12c4ad")
 
 # ---------------------- GUI Setup ---------------------- #
 # Add ciSio Logo to bar
@@ -362,12 +406,28 @@ icon_photo = ImageTk.PhotoImage(icon_image)
 root.iconphoto(True, icon_photo)
 # cisio logo
 base64_logo = """iVBORw0KGgoAAAANSUhEUgAACAAAAAK4CAYAAADgTh1mAAAAAXNSR0IArs4c6QAAIABJREFUeF7s3XlgXXWZ//HPc+5N0r3N0palYHXAEUFUpgI2aTGKOlbZkhJBQH/gguAP0XFAdFCCgojIuKCjjArujmnTUtEO/JQJbdNSsKiouFAFhFKgzdI9aXLveX4TlplSWrLcc5J77nnnX873+T7P6zl/lOSTGxNfCCCAAAIIIIAAAggggAACzxVwmUu2aJGs+yUK/kHSg+NlOzfNDmY/8+SjfT2ZZw9NLt9dls/YoYFlD4ISAQQQQAABBKIXyEmqMH9o687MhmerV1ZnvKcv8Om7s/6wpIkzHg5f0iPfvl2+ebP89NPlZgqj74aKCCCAAAIIIIAAAggUr4AVb2t0hgACCCCAAAIIIIAAAgjEJ9DSosykVx+W7VrfVTFxfBj0q2xcZrJbsD1XEYy3Kf19wUsUaKq5zzap0k0TZXqp+8DPH8xkfmx83VEZAQQQQAABBAYVMHW56xFJu02+y9z+ImmXB7YxzNsjprA/kw/vzWQt7PdM//hJ2Vy4sye3q6q8X1sr8n/4fxt2NzcTEBjUmQcQQAABBBBAAAEEEiVAACBR66JZBBBAAAEEEEAAAQQQGK7AwA/6Kw6qmbCzN5hgmb7xZRWZcZazCZYNZ+RzmmWB/t6kaTI7RvLxch0x3Dt4HgEEEEAAAQSKWMC0y1wPu/SESY+G7hvkwRMW2P0KtdWzvivMh7uyQXnvxEna+aajn+zhkwOKeJ+0hgACCCCAAAIIIPCCAgQAeEEQQAABBBBAAAEEEECgZATa2pTdXDFlSjZfXmNBboJbdqrnwumW9cM8tNlyvcilQ830ooFPCi6ZwRkEAQQQQAABBEYq0OPSQ4H5+tCDx+W+3mQPKch3BtK2TGhdveO1VQ9272hqUn6kl3AOAQQQQAABBBBAAIHREiAAMFrS3IMAAggggAACCCCAAAKRC7SsmTW+zHbMlGdm5MOwJjA72N1mu8IjA7MZHurFMh0Q+cUURAABBBBAAIFSFuiXtNlMf5PrAXc9bNIjygSbwlBP9EsbMxs7Opqa1FfKCMyGAAIIIIAAAgggkEwBAgDJ3BtdI4AAAggggAACCCCQSoEb16mseuf02UEmPzs0zbZQh8rsxSZ/kUyz3DVLUjaVOAyNAAIIIIAAAvEJ2FM/7N+k0P5qgT8Q5rXBMvZQxsOH8+aPlFdM2HzSnI274muAyggggAACCCCAAAIIDE2AAMDQnHgKAQQQQAABBBBAAAEExkhg6V0HzM719b00U2aHh3k/3AJ7kbvPDvTUx/lXjlFbXIsAAggggAACKRdw1xNmz3w6gPSYy/9srvt7d5etz3ZtGviEAP5kQMrfEcZHAAEEEEAAAQTGQoAAwFiocycCCCCAAAIIIIAAAgjsV6ClbfokZcKXZwI/2l1HmelwuQ5WYAfKfQZ0CCCAAAIIIIBAEQrkBv5sgFyPSr7RAnswzNuvA+u757d12//SbAqLsGdaQgABBBBAAAEEEChBAQIAJbhURkIAAQQQQAABBBBAIGkCLesqp2Z77VgPdLyHepXJXuzyGeZeI7OKpM1DvwgggAACCCCQeoGep/5kgPS4pMdMWp0Lg18pO+6eprkbBv4bXwgggAACCCCAAAIIxCJAACAWVooigAACCCCAAAIIIIDAYAItLSoPDqo80WRvlHS8pJl6+iP9J0nKDnae/44AAggggAACCCREIG9St2Rb3fwxd93hoa2eWO6/XHB817aEzECbCCCAAAIIIIAAAgkRIACQkEXRJgIIIIAAAggggAACpSLQemdNfVAWvjV0/aNcM2WaKGmcJP7/pFSWzBwIIIAAAgggsG+BgT8F4Nrl8h6TbXTp5ya15oMJ9/HJALw0CCCAAAIIIIAAAlEI8A22KBSpgQACCCCAAAIIIIAAAi8osLitZk5Qlm90t0Y3HRIM/Ia/KePOD/15dRBAAAEEEEAgtQIuKS/3vJs9FCi4Kbfbf3j66zs3mmngv/GFAAIIIIAAAggggMCwBQgADJuMAwgggAACCCCAAAIIIPBCAs3NCl5+urLlHVUz82W+QKG9R9IrJZUhhwACCCCAAAIIIDCIgOt2D9RaUTHuBz3jN+b+sEi55maFuCGAAAIIIIAAAgggMBQBAgBDUeIZBBBAAAEEEEAAAQQQGFSgZc2s8Zlc7zSZHynzsyT9o6QDBj3IAwgggAACCCCAAALPEzBXhwItdYXfN1X8aWvf+G3/53UP7+bTAXhZEEAAAQQQQAABBF5IgAAA7wcCCCCAAAIIIIAAAgiMWKClRZnswTOrFe4+MFTwOjNvkGz+iAtyEAEEEEAAAQQQQGBvgV2S1niolkwm/GVPX35DdvP27qYm5aFCAAEEEEAAAQQQQGBvAQIAvBMIIIAAAggggAACCCAwbIGB3/ZX2HtoEPoRZnqjTAslnzHsQhxAAAEEEEAAAQQQGKpAv6S/yvSz0P2OvJU9MLNv09/q65UbagGeQwABBBBAAAEEECh9AQIApb9jJkQAAQQQQAABBBBAIDKBljVTqqw/+7Iga/9gCt/kstfLNSGyCyiEAAIIIIAAAgggMBSBx2RaY24/M7ff9z/e8bumJvUN5SDPIIAAAggggAACCJS2AAGA0t4v0yGAAAIIIIAAAgggULBAc7OCl54wuWpcWdmr3e1ENz9BrqPMNLHg4hRAAAEEEEAAAQQQGLGAS9tMfq9kbXK7K58L1jbVb94x4oIcRAABBBBAAAEEEEi8AAGAxK+QARBAAAEEEEAAAQQQiEfAXbb0jslVXlZ2ogK93k3HmuwIySviuZGqCCCAAAIIIIAAAiMUcMl/Y25tZv4Lt/J7G2qf3DTCWhxDAAEEEEAAAQQQSLAAAYAEL4/WEUAAAQQQQAABBBCIS+DWdZNr+nrL3iDZyTJ/jble7FI2rvuoiwACCCCAAAIIIFC4gMl2y/yBMLTfyPynQdn4OxqOe6yz8MpUQAABBBBAAAEEEEiKAAGApGyKPhFAAAEEEEAAAQQQGAWBJXdPrvZc9u3uOt1kh5p0KD/4HwV4rkAAAQQQQAABBKIV6JO0Qa57lLGW8YHfseD4rm3RXkE1BBBAAAEEEEAAgWIUIABQjFuhJwQQQAABBBBAAAEERlngp6umVvYrOD00e6fkL5Vs+ii3wHUIIIAAAggggAACkQvYbpNvCqVfhmFw06QDp/1iweF/2R35NRREAAEEEEAAAQQQKBoBAgBFswoaQQABBBBAAAEEEEBg9AWWL1dF7+Sqeje/VG7HKNBkuYLR74QbEUAAAQQQQAABBOIScKk/kLaGsruCwK5vmNuxIq67qIsAAggggAACCCAwtgIEAMbWn9sRQAABBBBAAAEEEBgTgXXrVPZIT+VxbsElktfLNJEf/I/JKrgUAQQQQAABBBAYTYFQbv1ufof16/zG+q4No3k5dyGAAAIIIIAAAgjEL0AAIH5jbkAAAQQQQAABBBBAoGgEblynspqeqYcoyH7EQz/PTOOKpjkaQQABBBBAAAEEEBg1ATPtkvR1C8IbpvVu2VBfr9yoXc5FCCCAAAIIIIAAArEJEACIjZbCCCCAAAIIIIAAAggUj0DL/SrPbJl2oMLMOZJfLFNN8XRHJwgggAACCCCAAAJjIeBSaNIDCu3f1J//Sf6ALY83Ham+seiFOxFAAAEEEEAAAQSiESAAEI0jVRBAAAEEEEAAAQQQKEqBlhZlModWHRjk/XWh2yWSji7KRmkKAQQQQAABBBBAYCwFcjKtCUN9JRgftFdt79jMJwKM5Tq4GwEEEEAAAQQQGLkAAYCR23ESAQQQQAABBBBAAIGiFmhdWXOgB/lXB7J3udRU1M3SHAIIIIAAAggggEAxCHTL7dYg8B9UZLR2wXFd22XyYmiMHhBAAAEEEEAAAQSGJkAAYGhOPIUAAggggAACCCCAQGIEvnv7zIlTJve/MnQ1yXWGSzMk8W//xGyQRhFAAAEEEEAAgbEVMNMf3e37gdvtp9Z1/NpM4dh2xO0IIIAAAggggAACQxXgm4BDleI5BBBAAAEEEEAAAQSKXGDg4/6DQ6e/xHL5t8p0plyvklRe5G3THgIIIIAAAggggEBxCvSZaZWkH0t9yxpqd2wqzjbpCgEEEEAAAQQQQGBPAQIAvA8IIIAAAggggAACCJSAQMvPK6cGFXaiBTpT8vmSTS+BsRgBAQQQQAABBBBAYOwFOiT9NBPoP8q3dN25YIF2j31LdIAAAggggAACCCCwPwECALwbCCCAAAIIIIAAAggkWKC5WcEr3zj1xWGYfZ/MT5Z0uKRMgkeidQQQQAABBBBAAIHiE3CX7gukpUFeN596QtejxdciHSGAAAIIIIAAAggMCBAA4D1AAAEEEEAAAQQQQCChAi0tKg8OqjrV5O+X2zEyTU3oKLSNAAIIIIAAAgggUPwCLqlb0orA9PX+aV13Nh2pvuJvmw4RQAABBBBAAIF0CRAASNe+mRYBBBBAAAEEEECgRASWtddM7pd/2cxPdNdBJgUlMhpjIIAAAggggAACCBS3QJ9Mf1VoP8xXBN9sOnbzE8XdLt0hgAACCCCAAALpEiAAkK59My0CCCCAAAIIIIBACQgsWlXzusDCr0h2mOQVJTASIyCAAAIIIIAAAggkS2Dg0wB2Sv5fmcCunbq76576euWSNQLdIoAAAggggAACpSlAAKA098pUCCCAAAIIIIAAAiUo0NI2fVKQzV9lpvPMNMmdP+lVgmtmJAQQQAABBBBAIEkCoaQn3e2zvWX+7bOP79qWpObpFQEEEEAAAQQQKEUBAgCluFVmQgABBBBAAAEEECgpgbY2ZTdna16ZsfAGl47j4/5Lar0MgwACCCCAAAIIlISAyb+bC4KP/+G1nY83mwaCAXwhgAACCCCAAAIIjIEAAYAxQOdKBBBAAAEEEEAAAQSGItDcrOCVJ0yb4mV2hss+Kmn2UM7xDAIIIIAAAggggAACYyNgfzX5BbnKzF1NR27eMTY9cCsCCCCAAAIIIJBuAQIA6d4/0yOAAAIIIIAAAggUqcDy5aronVp5uLvOd7dzzDS1SFulLQQQQAABBBBAAAEE/lfAtTOUPh8E4c35x7ZsaGpSHh4EEEAAAQQQQACB0RMgADB61tyEAAIIIIAAAggggMCgAu6yRfdWTsnuDl4n9wtDqd6kskEP8gACCCCAAAIIIIAAAsUiYArd/VbL+7+WT5yw7qQ5G3cVS2v0gQACCCCAAAIIlLoAAYBS3zDzIYAAAggggAACCCRGYOCH/0tW1RxgQXhWKL3HpL9PTPM0igACCCCAAAIIIIDAcwXykv3W3L+Sy2WWN9VvfgIgBBBAAAEEEEAAgfgFCADEb8wNCCCAAAIIIIAAAggMSWDJ6sqjJHuvu86SVD2kQzyEAAIIIIAAAggggECxCphChXpM5t/zbPbbC4/fvL5YW6UvBBBAAAEEEECgVAQIAJTKJpkDAQQQQAABBBBAINECi1ZUvSnI6GJJJ0oqT/QwNI8AAggggAACCCCAwHMFuiS7LRP4V/te23V3kykPEAIIIIAAAggggEA8AgQA4nGlKgIIIIAAAggggAACQxJoa5s9rqNs67sC2QWSXjmkQzyEAAIIIIAAAggggEDiBKxX7vcGbp/vz46/vWnuhp7EjUDDCCCAAAIIIIBAAgQIACRgSbSIAAIIIIAAAgggUJoCy9prDsop/wG5nSPTIaU5JVMhgAACCCCAAAIIIPC0gEthIP1FgX05Vx5+v2lO91ZsEEAAAQQQQAABBKIVIAAQrSfVEEAAAQQQQAABBBAYkkDrqpkvMctd6fK3SpomiX+bD0mOhxBAAAEEEEAAAQRKQGCTS9/N9IdXn1a/ZUsJzMMICCCAAAIIIIBA0QjwTcaiWQWNIIAAAggggAACCKRFYPGa6a8OwvzVLnu95BVpmZs5EUAAAQQQQAABBBDYQ2CXS7cG1vfBhtodm5BBAAEEEEAAAQQQiEaAAEA0jlRBAAEEEEAAAQQQQGBIAotXVZ5kZlfJdJRcwZAO8RACCCCAAAIIIIAAAiUoMPAnAUz263xP+IamN/LnAEpwxYyEAAIIIIAAAmMgQABgDNC5EgEEEEAAAQQQQCB9Ai1rZo0PcrsWKNAVJr0ifQJMjAACCCCAAAIIIIDAfgU6s8r/4+6NW3/d1KQ8TggggAACCCCAAAIjFyAAMHI7TiKAAAIIIIAAAgggMKiAu2zRLyqnZMdZo5uulnTAoId4AAEEEEAAAQQQQACBtAm4Nnioj4RlE25tmruhJ23jMy8CCCCAAAIIIBCVAAGAqCSpgwACCCCAAAIIIIDAXgIDP/z/yd0zZuRy/edJdpGkA0FCAAEEEEAAAQQQQACBfQu46wkF+mRY4S1Nc/iTALwnCCCAAAIIIIDASAQIAIxEjTMIIIAAAggggAACCAxBYMnqSTM8LL9Qpo9KGjeEIzyCAAIIIIAAAggggEC6BUwbzPWlXGA/aprb+Vi6MZgeAQQQQAABBBAYvgABgOGbcQIBBBBAAAEEEEAAgUEFlq2Zfljec+9xt4v54f+gXDyAAAIIIIAAAggggMAeAr7ZTDcFOfvqqSd0PQoNAggggAACCCCAwNAFCAAM3YonEUAAAQQQQAABBBAYksCSu6qP8JxfKdPpQzrAQwgggAACCCCAAAIIILC3wCYzv5kQAC8GAggggAACCCAwPAECAMPz4mkEEEAAAQQQQAABBF5QYMnqyqPcrdlMDe7i39u8LwgggAACCCCAAAIIjFDATE+6+yLzzA2/vaPjL83NCkdYimMIIIAAAggggEBqBPiGZGpWzaAIIIAAAggggAACcQvcsqbyFbnQmiWdZFJZ3PdRHwEEEEAAAQQQQACBUhdwaVtg+pnCoPm0uo71ZvJSn5n5EEAAAQQQQACBQgQIABSix1kEEEAAAQQQQAABBJ4RWLyy8mgLnvrh/1skjQMGAQQQQAABBBBAAAEEIhPokes2BeGHG2u3PCIRAohMlkIIIIAAAgggUHICBABKbqUMhAACCCCAAAIIIDDaAk997H9on3LTW4wf/o82P/chgAACCCCAAAIIpEHAbbfMfzE+7Dt3wfwdm9MwMjMigAACCCCAAAIjESAAMBI1ziCAAAIIIIAAAggg8IxAy8qql2cy+pRcJ0kqBwYBBBBAAAEEEEAAAQRiE+iXbFXPNj/t7AVd22K7hcIIIIAAAggggECCBQgAJHh5tI4AAggggAACCCAwtgJLVtW81IPwKrkaJQVj2w23I4AAAggggAACCCCQCgGXtKZnmxYQAkjFvhkSAQQQQAABBIYpQABgmGA8jgACCCCAAAIIIICAu6z17umHBfn8le46ExEEEEAAAQQQQAABBBAYVQGXWVt5X9/bT6rf3jGqN3MZAggggAACCCBQ5AIEAIp8QbSHAAIIIIAAAgggUFwCza7g6HtqDvOcXy73c4qrO7pBAAEEEEAAAQQQQCA1An1uas30hReeVr9lS2qmZlAEEEAAAQQQQGAQAQIAvCIIIIAAAggggAACCAxRYOA3/xfdOf3vMmW5T0j2ziEe4zEEEEAAAQQQQAABBBCIQcClbeb6hgVln2uofXJTDFdQEgEEEEAAAQQQSJwAAYDErYyGEUAAAQQQQAABBMZKYNnaGTPzufwnXP6BseqBexFAAAEEEEAAAQQQQGAPAVOnuW7KBfalprmdj2GDAAIIIIAAAgikXYAAQNrfAOZHAAEEEEAAAQQQGJLAbWumVO307Ifl+mdJ44Z0iIcQQAABBBBAAAEEEEBgFAR8s8u+Ms7zN7xt3tbuUbiQKxBAAAEEEEAAgaIVIABQtKuhMQQQQAABBBBAAIFiEVi+XBU9kys/JQUXy7yiWPqiDwQQQAABBBBAAAEEEPgfgQdc/oVxHv6YEABvBQIIIIAAAgikWYAAQJq3z+wIIIAAAggggAACgwo89cP/KVUXSLqG3/wflIsHEEAAAQQQQAABBBAYS4EH5HbVzl3ZJe9885M7x7IR7kYAAQQQQAABBMZKgADAWMlzLwIIIIAAAggggEAiBFpXVV8o849LOjgRDdMkAggggAACCCCAAAIpFnDpN1n5v5Rv675jwQLtTjEFoyOAAAIIIIBASgUIAKR08YyNAAIIIIAAAgggMLjAkjVVp4ehPm2mw+UKBj/BEwgggAACCCCAAAIIIDDGAnmZ7rYwvPC3d2z5XXOzwjHuh+sRQAABBBBAAIFRFSAAMKrcXIYAAggggAACCCCQFIHWlZW1Fth17jpWpkxS+qZPBBBAAAEEEEAAAQQQUE7SnfL8+Y3ztj4kyTFBAAEEEEAAAQTSIkAAIC2bZk4EEEAAAQQQQACBIQssXjP91Rbmr5VULyk75IM8iAACCCCAAAIIIIAAAsUikDPT98bNqLpgweF/4U8BFMtW6AMBBBBAAAEEYhcgABA7MRcggAACCCCAAAIIJElg2dqJM3O5iqtMdo7LK5LUO70igAACCCCAAAIIIIDAcwTygfSZ0+q6PokLAggggAACCCCQFgECAGnZNHMigAACCCCAAAIIDCrw3dtnTpw0oe9jbnaJpPJBD/AAAggggAACCCCAAAIIFL2Am97XOLfrW2YKi75ZGkQAAQQQQAABBAoUIABQICDHEUAAAQQQQAABBEpDYPlyVfRMqTpHss9IPr00pmIKBBBAAAEEEEAAAQQQkNQVeNh43x1bVjY3EwLgjUAAAQQQQACB0hYgAFDa+2U6BBBAAAEE9iuweM20V1sY8PHmcbwjYdC3syfz53e++cmdcZSnZvQCN65TWVVv5YmB7HOSjor+BioigAACCCCAAAIIIIDAGAq4pPut389sqO/+/Rj2wdUIIIAAAggggEDsAgQAYifmAgQQQAABBIpToLW96iFJs4uzu8R39Vh/GJx8xvyOXyV+khQM4K6gdVXlUZaxz8j11hSMzIgIIIAAAggggAACCKRRoF+y2/r68x88s37Lw2kEYGYEEEAAAQQQSIcAAYB07JkpEUAAAQQQeJ4AAYBYXwoCALHyRlt82doZM3O5/iskuyDaylRDAAEEEEAAAQQQQACBYhIw0zZ33bS7v//qd9Rv7yim3ugFAQQQQAABBBCISoAAQFSS1EEAAQQQQCBhAgQAYl0YAYBYeaMrvny5KnZNrvqASVfKNCm6ylRCAAEEEEAAAQQQQACBohRwbXD3q6vzU79dX/9wb1H2SFMIIIAAAggggEABAgQACsDjKAIIIIAAAkkWIAAQ6/YIAMTKG13xJe3VDS7/gqRDo6tKJQQQQAABBBBAAAEEEChigVDuv/GMfXzh3K7bi7hPWkMAAQQQQAABBEYkQABgRGwcQgABBBBAIPkCBABi3SEBgFh5oyn+k1WVh/abLZd0ZDQVqYIAAggggAACCCCAAAIJEeiTdKtLVyys67o/IT3TJgIIIIAAAgggMCQBAgBDYuIhBBBAAAEESk+AAECsOyUAECtv4cVvXXfQhP7e3u+51FB4NSoggAACCCCAAAIIIIBA0gRM2uZuX7Mg+68NtU9uSlr/9IsAAggggAACCOxPgAAA7wYCCCCAAAIpFSAAEOviCQDEylt48dbVVZ9WaJfIvKLwalRAAAEEEEAAAQQQQACBhAo8bqH/U2W+e3F9vXIJnYG2EUAAAQQQQACB5wgQAOCFQAABBBBAIKUCBABiXTwBgFh5Cyu+pL26Qeb/5q6ZhVXiNAIIIIAAAggggAACCCRcwCW712UXLKzrWJfwWWgfAQQQQAABBBB4SoAAAC8CAggggAACKRUgABDr4gkAxMo78uLL1k6cmctVLJPpNXIFI6/ESQQQQAABBBBAAAEEECgRAZf07/n+THNT/eYnSmQmxkAAAQQQQACBFAsQAEjx8hkdAQQQQCDdAgQAYt0/AYBYeUdW/MZ1Kpu+u+rr7vYOyceNrAqnEEAAAQQQQAABBBBAoEQF3rutv+v759art0TnYywEEEAAAQQQSIkAAYCULJoxEUAAAQQQ2FuAAECs7wQBgFh5h1+8rU3ZzmzVOwNTs0uHDL8CJxBAAAEEEEAAAQQQQKCkBUwPe95PaZzX/TszDXwqAF8IIIAAAggggEAiBQgAJHJtNI0AAggggEDhAgQACjd8gQoEAGLlHX7xpaunvSr04CuSaod/mhMIDF3ApFzo2i1TfuineBIBBBBAAAEEXkjApIykiSghELuA6WemsvMaap/cFPtdXIAAAggggAACCMQkQAAgJljKIoAAAgggUOwCBABi3RABgFh5h1d8yd2Tq5Ur+0QY6j1mfON4eHo8vQ+BLZJ6TdoaSn1ybTdTTqbtcsub+U6ZnnC3HvQQQAABBBBAIBoBl080txc/Xc2z7ppm9j+hgAnPhAOmSBr4M098vzMa9tRWcbePdY7vvP78OepPLQKDI4AAAggggECiBfgHcaLXR/MIIIAAAgiMXIAAwMjthnCSAMAQkEbjkZvbNG5KefUZcv+kpGe+aTwaN3NHCQj0SeqQtNldHWbqcNNOyR6Uh1tN/oiU3Z6XNmYs15uftuXxpiM1cIYvBBBAAAEEEIhRYPnywyp2TNkyOwjzFa5gekbhdM8E0xVqlgKfZrKZLk2Te41k0yWfEWM7lC5Nga7Qw8bT5225szTHYyoEEEAAAQQQKHUBAgClvmHmQwABBBBAYD8CBABifTUIAMTKO/TirXfVHOO58HNmesPQT/FkKgVcW2V6XNLD7too099MeiwTaEPo/lhPGD62vm7r1mZTmEofhkYAAQQQQCAhAq1rq2Z5mJkeKHewwswsKXyJ5Ae6dLCkQyU7gD8nkJBljmmb3lben2s6qX77QCCULwQQQAABBBBAIFECBAAStS6aRQABBBBAIDoBAgDRWe6jEgGAWHmHVvyHv5gxs6Ii/08y/wDf5B2aWcqe6pP8Ucl+K/mfAtlfc+5PmuuRUBWPN81/YnPKPBgXAQQQQACBkhRoa1N2c0X1zEyfDgpbanXfAAAgAElEQVTKdXB+4JMC3A8LpKNkOsKlmdJTf06ALwT2FMhJ9snGus5rYEEAAQQQQAABBJImQAAgaRujXwQQQAABBCISIAAQEeS+yxAAiJV38OI3rlNZTU/122R+g57+bS++EBgQ2C75A5LuMrdfy/RoTsEjFdLGU+o6tkOEAAIIIIAAAqUv0NKiTPZFk6dZLnNIKDvYTLPD0F5jpuPkelnpCzDhUATM5O72oOX1voYTOv9rKGd4BgEEEEAAAQQQKBYBAgDFsgn6QAABBBBAYJQFCADECk4AIFbewYsvXT3j7/Keu8Gktwz+NE+UuEDfwG/5u4e3m/k9ntej4fiyx6fv3NxRX69cic/OeAgggAACCCAwiMDy9arY8UTlTHlwQFbhSzwTzPfQTzDTy8FLt4BL/Sb9pNfz7z1r3tbudGswPQIIIIAAAggkSYAAQJK2Ra8IIIAAAghEKEAAIELM55ciABAr7wsXb2mbPikoy10g2adMGjeGrXD1GAqYtNHl37GsteV6Mg/1Z/s61+e2bm/mh/5juBWuRgABBBBAoLgFbrxRZdOPmlmZy/fXZE1HyuytLn+TpAOLu3O6i0/ANsv82sbaruvju4PKCCCAAAIIIIBAtAIEAKL1pBoCCCCAAAKJESAAEOuqCADEyrv/4u6ype3TjnYLbtfTf8+Vr3QJ7DLXCrfw6+PKy+7JVgTbt/75yd6mJuXTxcC0CCCAAAIIIFCowMCflKpU5YSK3swB+SB/ood2jsle5fKKQmtzPlECLmltPu/nN53Q/btEdU6zCCCAAAIIIJBaAQIAqV09gyOAAAIIpF2AAECsbwABgFh591/81nUHTejf3fsVd507Ri1w7dgIPCa371uo74zb2fngPfeov7lZ4di0wq0IIIAAAgggUGoC7gruvVeZR3ZWz/NMeJ7LmkwqK7U5mWe/Arvc9c3w8QmXNTVt6MEJAQQQQAABBBAodgECAMW+IfpDAAEEEEAgJgECADHBPl2WAECsvPsvvnR11ZtC18Bv//NV2gIDv4m1W9LvPfSbwnHZpU3Hbn6itEdmOgQQQAABBBAoFoHWtVWzlPPLJTtJUs1AGMAlvs9aLAuKp4/fy/yyhrndy8008G9RvhBAAAEEEEAAgaIV4B+mRbsaGkMAAQQQQCBeAQIAsfoSAIiVd9/Fl7XXTM6Z3yn3Y8bgeq4cBQGTci7rlvxBSd8M+sPFp9Vv2TIKV3MFAggggAACCCDwPIFla2fMzPXnLpDp7ZIOcGmKSQFUpSpgP9Q4++fGOR2Pl+qEzIUAAggggAACpSFAAKA09sgUCCCAAAIIDFuAAMCwyYZzgADAcLQieLalRZng4OrLzP2qCMpRovgE8iZtlOv37ropn53ws6a5fPxq8a2JjhBAAAEEEEifwMCfB1i2surgfNZOdffTTXq5pCrxiQAl+DLYJgX2yReVd9w0Z476S3BARkIAAQQQQACBEhEgAFAii2QMBBBAAAEEhitAAGC4YsN6ngDAsLgKf3jxysqjLbCBj/4/oPBqVCgygYHfsPqVhf79sgnjf3LSnI27iqw/2kEAAQQQQAABBJ4S+NGKqkMqAjvLzU+WdISkqQQBSuvlcLOfyv2yhXVd95fWZEyDAAIIIIAAAqUkQACglLbJLAgggAACCAxDgADAMLCG/ygBgOGbjfjEresOmtDf03uDm87lG6wjZiy6gyZ1u3S3zJarwhbzUatFtyIaQgABBBBAAIF9CNy4TmWVPTVHZy082aU3muwYl1eAVTICu0zenFHm66fUdWwvmakYBAEEEEAAAQRKSoAAQEmtk2EQQAABBBAYugABgKFbjeBJAgAjQBvpkSVrKt/moX1L0oyR1uBcEQm47ZZ83cAP/j0bLAof2fxgU5PyRdQhrSCAAAIIIIAAAoMKtLSoPHtg5bHK2MkeWoPkfzfoIR5IhIDJ783l7KI/3Nl1d3OzwkQ0TZMIIIAAAgggkCoBAgCpWjfDIoAAAggg8L8CBABifRsIAMTK+7/Fb22bXNNXVvZtSW+WlB2la7kmHoG8SX+R2S2SL8vZhN80zd3QE89VVEUAAQQQQAABBEZHoKVt+qSgIjxRod5k8jMlTRudm7klRoGcSZ/p8fwXz5q3tTvGeyiNAAIIIIAAAgiMSIAAwIjYOIQAAggggEDyBQgAxLpDAgCx8v5v8cXtle83BZ+SfPooXck18Qhsl+l2U/j93r786nfUb++I5xqqIoAAAggggAACYyPQ0jb9gExZ/q2S3iHp9WPTBbdGJWDSnz30d+ef6F7Lp1VFpUodBBBAAAEEEIhKgABAVJLUQQABBBBAIGECBABiXRgBgFh5ny7esqry0EB2k5leJykzCldyRfQCLukRc7vOgtxtmyq2PnL+HPVHfw0VEUAAAQQQQACBsRdYvl4VuzdNO8Ld3u4KzpOcP2E19msZaQcDf6Lqm72e/xifAjBSQs4hgAACCCCAQFwCBADikqUuAggggAACRS5AACDWBREAiJX36eKtq6svkutfJJ85CtdxRQwCbv7TTJhpnjAl86c3v/LJnTFcQUkEEEAAAQQQQKCoBJqbFcx5w9SpfUF2vod+qUxzi6pBmhmygEvbMoG98dTXdv7STAPBVr4QQAABBBBAAIGiECAAUBRroAkEEEAAAQRGX4AAQKzmBABi5ZVaVsx8cZDp/6qZ3ixXEPN1lI9awLVDpg/lg9zS01+7rZtvmEYNTD0EEEAAAQQQKHaBG9eprLK35iVZCy+Q650uVRZ7z/T3fAGTvjNuW9f5CxZoNz4IIIAAAggggECxCBAAKJZN0AcCCCCAAAKjLEAAIFZwAgCx8kqL2ysvMbPL5KqK+SrKRy1gti7ozZ1x36qtDzU3K4y6PPUQQAABBBBAAIEkCbS0KJM5sPpkN7/GpL9PUu/0KskUZvJ6xanzu/6ABwIIIIAAAgggUCwCBACKZRP0gQACCCCAwCgLEACIFZwAQIy8Latq/iFj+eskq4/xGkpHKzDwkai9Ln11t+c/w99JjRaXaggggAACCCCQfIEld1UfEeb8BpPVybwi+ROlZwJzLfrtHV1nEG5Nz86ZFAEEEEAAgWIXIABQ7BuiPwQQQAABBGISIAAQE+zTZQkAxMR7440qm35k5YdCtyvMNDGmaygbrUDOpb8q9KsqJoxfctKcjbuiLU81BBBAAAEEEECgNAS+e/vMiRMn9l9lpjPdNbM0pkrHFIGFrz6tdstv0jEtUyKAAAIIIIBAsQsQACj2DdEfAggggAACMQkQAIgJ9umyBABi4r1lZdXL84F9VvKTYrqCstEK7JC0Vm7XVuU676yvVy7a8lRDAAEEEEAAAQRKT2Dp6sqz3e1ylw6TlCm9CUtwIvNb8tO63950pPpKcDpGQgABBBBAAIGECRAASNjCaBcBBBBAAIGoBAgARCW5zzoEAGLgbblf5dktVWe5PxUAmBHDFZSMTsBN6nRpmZl/saG2+/fRlaYSAggggAACCCBQ+gKLVlTNDTK6UlKdpHGlP3HiJ+yzIHxTw9wtKxI/CQMggAACCCCAQOIFCAAkfoUMgAACCCCAwMgECACMzG2IpwgADBFqOI8tXjH9cAvyn5Fp4XDO8eyoC7hLGyV9yzz/ncZ5Wx8c9Q64EAEEEEAAAQQQSL6ALVlR/TLP+KVmanDXlOSPVNIThCa/tWzc+HfwJ69Kes8MhwACCCCAQCIECAAkYk00iQACCCCAQPQCBACiN92jIgGAiHmXrz+sYtem7tMD9y+4VBNxecpFJWAK3bXe3L/cq/BHZ83b2h1VaeoggAACCCCAAAJpE3CXLbqr+qCM6yKF/g6ZDkmbQZLmNanDM3Zm42s7f5GkvukVAQQQQAABBEpPgABA6e2UiRBAAAEEEBiSAAGAITGN9CECACOV28+51rVVs9Tvn5HZORGXplyUAm7rQ/m/vHh81y1z5qg/ytLUQgABBBBAAAEE0iqw5O7J1WFf2bvM/ELJ/i6tDsU/t+2W/Ef5yq7zm45UX/H3S4cIIIAAAgggUKoCBABKdbPMhQACCCCAwCACBABifUUIAETI29KiTPkh1fVh3r/v0swIS1MqSgHzlQqDT3eM71xxPj/8j1KWWggggAACCCCAgFrWTKnKhmUnuXSx5K+GpPgETPKnPw0rfF/D/C0riq9DOkIAAQQQQACBtAgQAEjLppkTAQQQQACBvQQIAMT6ShAAiJB34DeevL/sWknvjrAspSIUMPmdMl3UUNv9+wjLUgoBBBBAAAEEEEBgD4Hb75s5cee2/gVuulzS0eAUpcAOc/17w7yujxRldzSFAAIIIIAAAqkQIACQijUzJAIIIIAAAs8XIAAQ61tBACAi3oG/e7psZeVRYcZ+zm//R4QacZmBH/4HoX3g1Pldf4i4NOUQQAABBBBAAAEE9hK48daDJlRX9b7FXFdJehlARSfgku7xIHPBwrmbf1103dEQAggggAACCKRCgABAKtbMkAgggAACCDxfgABArG8FAYCIeNvaZo/rym6/UuaXSOLfrhG5RlXm2R/+nzKv649mGvhmJ18IIIAAAggggAACMQu03K9y655+XODhF2X+KklBzFdSfhgCJnXL7PqG2s6rh3GMRxFAAAEEEEAAgcgE+CZqZJQUQgABBBBAIFkCBABi3RcBgIh4l7ZNmxZmg9/JNCuikpSJTMBXuuzChXVP/eY/P/yPzJVCCCCAAAIIIIDA4AIDn5S1dGX1yzzjiyS9nLDs4Gaj+oTrNqnsA43znnxwVO/lMgQQQAABBBBAgH8Y8g4ggAACCCCQXgECALHungBARLyt7VXvlvTNiMpRJhqBvMlXeRh+pHH+1l9FU5IqCCCAAAIIIIAAAiMRWLyq5qTAwptcqhnJec7EJvCQyT/RUNf9g9huoDACCCCAAAIIILAfAT4BgFcDAQQQQACBlAoQAIh18QQAIuC9cZ3KanZXr5X7MRGUo0QUAqY+udrNdHlDbdddUZSkBgIIIIAAAggggEBhAk+FAILwG+6aWVglTkcq4Pr3njJdcvbxXdsirUsxBBBAAAEEEEBgEAECALwiCCCAAAIIpFSAAECsiycAEAHvT9ZWHd+fEz9kjsAyohJ9kq/OSFecWte9KqKalEEAAQQQQAABBBCIQGAgBGAWflnS7AjKUSIagV+GHlx6+ryOO6MpRxUEEEAAAQQQQGBoAgQAhubEUwgggAACCJScAAGAWFdKACAC3tbVVYvkWhhBKUoULpCT9OtAfsVpdd3/WXg5KiCAAAIIIIAAAghEKeAuW7q6+jR3/6pMB0RZm1ojFDDtMtmntvZN/tK59Q/3jrAKxxBAAAEEEEAAgWELEAAYNhkHEEAAAQQQKA0BAgCx7pEAQIG8raumvkTK3CfTpAJLcbxwgVDSAya/Krexe1FTk/oKL0kFBBBAAAEEEEAAgagFbl130IT+3T0XudtFkg6Ouj71hi/g0pJQwceb6jr+PPzTnEAAAQQQQAABBEYmQABgZG6cQgABBBBAIPECBABiXSEBgAJ5W1dXNUv6hFxBgaU4XoCAmdxDPWHyq3OPd3+DH/4XgMlRBBBAAAEEEEBgFAR+umpqZZ9lPhRKHzJpyihcyRUvJGB6zPO6uHFe11IzDQRr+UIAAQQQQAABBGIXIAAQOzEXIIAAAgggUJwCBABi3QsBgAJ4W9ZVTg167U6TXlVAGY5GI9Aj1+eCXPjF0+q3bImmJFUQQAABBBBAAAEE4hIY+FMAt6yd9qIwH1wm6TxJZXHdRd0hCpiuz+f7rm2av2PzEE/wGAIIIIAAAgggUJAAAYCC+DiMAAIIIIBAcgUIAMS6OwIABfAuXlV5kpl9V9K0AspwNAIBk3091x9c2VS/+YkIylECAQQQQAABBBBAYBQEmpsVvKq+8shcxppNOokQwCigv9AVbr9ys/MX1nWsG+NOuB4BBBBAAAEEUiJAACAli2ZMBBBAAAEE9hYgABDrO0EAoADexe3V3zPzJrnKCyjD0cIFfq5+nddY37Wh8FJUQAABBBBAAAEEEBhNgRvXqWz67up5Lv+0XHNH827uep5Ar7ku3Jrr+tG59erFBwEEEEAAAQQQiFuAAEDcwtRHAAEEEECgSAUIAMS6GAIAI+S9ZUXVIfmMlpvpyIGPLx1hGY4VLGB/dfkpC+u67i+4FAUQQAABBBBAAAEExkTg5rbZ46aWbzsndF1u0qFj0gSXPiVg8h/kguCjTXM7H4MEAQQQQAABBBCIW4BvqsYtTH0EEEAAAQSKVIAAQKyLIQAwQt7W1dMukgdXSKoeYQmOFSrg2mlBeNZvf77l1uZmhYWW4zwCCCCAAAIIIIDA2Am0rJk1PpPvuULmF0qaPHadpPxm0wbP+FsXHt/925RLMD4CCCCAAAIIjIIAAYBRQOYKBBBAAAEEilGAAECsWyEAMELe1lWVS2U28HdKMyMswbFCBcw+kbfx1zfN3dBTaCnOI4AAAggggAACCIy9wPJfTZreu6vsG+72Nhn/zh6rjbiCC7b3T/r2ufUP82cAxmoJ3IsAAggggEBKBAgApGTRjIkAAggggMDeAgQAYn0nCACMgHfxqurjZP4Nk14xguMcKVzAJb9VYeb9jfM7Hi+8HBUQQAABBBBAAAEEikVgcVvNHMuG35I99W9tvic8Fosx3Z7P953TNH/H5rG4njsRQAABBBBAID0C/GMvPbtmUgQQQAABBJ4jQAAg1heCAMAIeFvbqz4k6WOSZozgOEcKF3jA3N99Wl33GjM++r9wTioggAACCCCAAALFJbBkVeUH3Ab+3JZPL67OUtPNLsvYnIbXdv5JkqdmagZFAAEEEEAAgVEXIAAw6uRciAACCCCAQHEIEACIdQ8EAIbJ+93bZ06cODH375K/nY//HyZeNI93S7o0H0z4AR/9Hw0oVRBAAAEEEEAAgWITWLNm1vjH8z03yvxMSdli6y8N/YRul3WN7/zX8+eoPw3zMiMCCCCAAAIIjI0AAYCxcedWBBBAAAEExlyAAECsKyAAMEzeJasq69zsC5LmDPMojxcq4LbbTDcHef/MqSd0PVpoOc4jgAACCCCAAAIIFK/Af6yqeWmZhYskHV28XZZuZyatygUT3kzotnR3zGQIIIAAAggUgwABgGLYAj0ggAACCCAwBgIEAGJFJwAwTN7W1dUXyf1yPv5/mHARPO6uuwP5PzfM626PoBwlEEAAAQQQQAABBIpcoLW9auBTt74paVKRt1qK7fXm+zOvaKrf/JdSHI6ZEEAAAQQQQKA4BAgAFMce6AIBBBBAAIFRFyAAECs5AYBh8Lb8vHJqdpxd56bz+Pj/YcBF8+gmkz5bNm7cjSfN2bgrmpJUQQABBBBAAAEEEChmgZvbNG5yWfW/mvyCYu6zVHtzt4sXzuv8cqnOx1wIIIAAAgggMPYCBADGfgd0gAACCCCAwJgIEACIlZ0AwDB4W1dXv0bSdXI/YRjHeLRQAVOfXEuzQe7yU+Zu4zeQCvXkPAIIIIAAAgggkCCBpXdNm+15W+qyVyWo7dJo1WxFY23n60pjGKZAAAEEEEAAgWIUIABQjFuhJwQQQAABBEZBgABArMgEAIbBu7i9+l3mfo1MBw7jGI8WKuD6oyy4LL+x42dNTcoXWo7zCCCAAAIIIIAAAskRaG5WcPQbqhrd9F1J45LTeUl0uqvM/YiT53U/UhLTMAQCCCCAAAIIFJ0AAYCiWwkNIYAAAgggMDoCBABidSYAMETe5WurpuzK6fJA+rBL2SEe47HCBXa47NtbZR9/d13H9sLLUQEBBBBAAAEEEEAgaQJL7p5c7X1lX5HpjKT1nvR+TX52Q133D5I+B/0jgAACCCCAQHEKEAAozr3QFQIIIIAAArELEACIlZgAwBB5F6+pfpl5eI3cTh3iER6LQMCl3wQZe0fDazv/GEE5SiCAAAIIIIAAAggkUMBdweKVVccHWf1YrlkJHCG5LZsWNdZ2NSV3ADpHAAEEEEAAgWIWIABQzNuhNwQQQAABBGIUIAAQI65EAGCIvIvbKxeYBV+U++FDPMJjhQt0yvyTv5vb/fVmU1h4OSoggAACCCCAAAIIJFWg5eeVUzPj7EMyNSd1hoT2vSXbGRx6yil8GldC90fbCCCAAAIIFLUAAYCiXg/NIYAAAgggEJ8AAYD4bEUAYEi4N65T2Yy+qgvd9QX3//6WI1+jIeCS7u3ZpjecvaBr22hcyB0IIIAAAggggAACxS3QsrL62EzGvyPXy4q701Lqznab/KSGuq6fl9JUzIIAAggggAACxSHAN1qLYw90gQACCCCAwKgLEACIlZxPABgCb8sd1Qdnyv2TMr1vCI/zSAQCLm0z6X2NdV0/jqAcJRBAAAEEEEAAAQRKQKCtbfa4zrKt7wlkX3ApWwIjFf0IJuVk+mpDbdeHir5ZGkQAAQQQQACBxAkQAEjcymgYAQQQQACBaAQIAETjuJ8qBACGwLt4xbRXB9ngS+6aN4THeSQCATPd0VDbdWIEpSiBAAIIIIAAAgggUEICrXdNPcbywfUue10JjVXMo7iZflnZ11VbX69cMTdKbwgggAACCCCQPAECAMnbGR0jgAACCCAQiQABgEgY91eEAMAgvM3NCo46sfIfTcHNks+IdRsUf1rAbbektzXO6/wFJAgggAACCCCAAAII7CnQsmbW+Gy46wMuXSlpAjqjIvC4ZzMnLDx+8/pRuY1LEEAAAQQQQCA1AgQAUrNqBkUAAQQQQOC5AgQAYn0jCAAMwtvSNn1StiL/fg91XayboPieArc11nW9BRIEEEAAAQQQQAABBPYlsKy9Zk5O+c9JVo9Q/AImdbvbxY3zOr8X/23cgAACCCCAAAJpEiAAkKZtMysCCCCAAAJ7CBAAiPV1IAAwCG/r2qpZytlnJT8r1k1Q/CkBd+30jN50+tyuNZAggAACCCCAAAIIILAvgbaHZo/r3rj9Iy6/RK6pKMUr4FJvIP9WQ133/433JqojgAACCCCAQNoECACkbePMiwACCCCAwDMCBABifRUIAAzC27Ki8hWZjP1Q0lGxboLiTwuYFjXWdjXBgQACCCCAAAIIIIDACwksbp86xyxzvVzzkYpdIJSpfdKksgVvfuWTO2O/jQsQQAABBBBAIDUCBABSs2oGRQABBBBA4LkCBABifSMIALwAr7tscfu0EwILlksaH+smKD7ww/+tYU4LTj+B3/7ndUAAAQQQQAABBBB4YYHl61Wxe1PVZe662KVKvGIXeMCD8IyFc7f8OvabuAABBBBAAAEEUiNAACA1q2ZQBBBAAAEEnitAACDWN4IAwAvwtqyZNT7I7XyXBfa1WLdA8WcE7CdZ2dmn1HVshwQBBBBAAAEEEEAAgcEEWldXv0bu/yZpzmDP8t8LFnjCXf+ycF7XTQVXogACCCCAAAIIIPDsdwORQAABBBBAAIF0ChAAiHXvBABegHfJ3ZOrlSv7nLvOi3ULFJe7egMPz6jMb/lZfb1ykCCAAAIIIIAAAgggMJjAzW0aN7ms+vMmP1fShMGe578XJLDDpa8vrOu6pKAqHEYAAQQQQAABBPYQ4BMAeB0QQAABBBBIqQABgFgXTwDgBXhb11bNUk6LJR0X6xYoPiDQHvSH55xWv+VhOBBAAAEEEEAAAQQQGKrAotXVpwTuX5Q0e6hneG4EAqbQQ1tenZt8en39w70jqMARBBBAAAEEEEDgeQIEAHgpEEAAAQQQSKkAAYBYF08A4AV4l6yqealb+HtJZbFugeIy03lb+7p+dG69+GYi7wMCCCCAAAIIIIDAkAWWL1dFz5TqRZK/RVJ2yAd5cCQCd3k+866FJ2xeP5LDnEEAAQQQQAABBPYWIADAO4EAAggggEBKBQgAxLp4AgD74W1rU7azvPoMc/9erBuguGT6o+cyZy08YfOv4UAAAQQQQAABBBBAYLgCre1V75F0raSq4Z7l+WEIuNa726UL53feMoxTPIoAAggggAACCOxXgAAALwcCCCCAAAIpFSAAEOviCQDsh/fmttnjppZvb3b3j8a6gZQXN5OHoW4IgrKrG2qf3JRyDsZHAAEEEEAAAQQQGIHAsrUTZ+byFavkOnwExzkydIFuN7t+YW3n1UM/wpMIIIAAAggggMD+BQgA8HYggAACCCCQUgECALEungDAfnhvv2/mxB3b+1skLYh1AykvbtKW0P2dC+d135pyCsZHAAEEEEAAAQQQKECgdXXV5931QePPdxWg+MJHTcrJdXPu8a4LmpqUj+0iCiOAAAIIIIBAagQIAKRm1QyKAAIIIIDAcwUIAMT6RhAA2A9vy88rp2Ym2H3//Q2uF8W6gbQXN92eMb/k1Lndv0s7BfMjgAACCCCAAAIIjFxgycqaExSEP3FpysircHJQAfNbTP3nN9Tu4NO7BsXiAQQQQAABBBAYTIAAwGBC/HcEEEAAAQRKVIAAQKyLJQCwH96WtumHZcry62PVp3i/Qm+e1FP+pTe/+cmdcCCAAAIIIIAAAgggUIhAa3vVPZJeU0gNzg4i4LbCPfzgwvndv8UKAQQQQAABBBAoVIAAQKGCnEcAAQQQQCChAgQAYl0cAYD98C5eVXOmWfjDWPVTXtxMD4dmH144t/OWlFMwPgIIIIAAAggggEAEAktWVV7mZtdEUIoS+xf4k9w+3jivcylICCCAAAIIIIBAoQIEAAoV5DwCCCCAAAIJFSAAEOviCADsh7d1dVWzXFfEqp/y4ma+TLngYw0ndP4x5RSMjwACCCCAAAIIIBCBQEt7zd9n3O+TeUUE5Sixb4EnPPRPLZzf/TWAEEAAAQQQQACBQgUIABQqyHkEEEAAAQQSKkAAINbFEQDYD29re/UyyU+OVT/Nxd12m/m1uWDCZ5vmbuhJMwWzI4AAAggggAACCEQn0Npe1S6pNrqKVHqugPXK/NrG2q5mZBBAAAEEEEAAgUIFCAAUKsh5BK1L+RQAACAASURBVBBAAAEEEipAACDWxREA2A9va3vV3yQdGqt+uos/6NLHFtZ1taSbgekRQAABBBBAAAEEohRYvKrqYjN9Mcqa1NpLwHSzZcdf0nDcY53YIIAAAggggAAChQgQAChEj7MIIIAAAggkWIAAQKzLIwCwD96WtumTsmX5bpeyseqnu/jPPJ/78MITtq1PNwPTI4AAAggggAACCEQpsKy95qCcwoF/Y06Isi619hBwLQ2C7CWn1W76Ky4IIIAAAggggEAhAgQACtHjLAIIIIAAAgkWIAAQ6/IIAOyDd+ma6mPD0O+OVT7dxXOSf62qv/uf6uuVSzcF0yOAAAIIIIAAAghEKdDWpmxXtrJNZnVR1qXWHgKmlR7apQvndfL/TLwYCCCAAAIIIFCQAAGAgvg4jAACCCCAQHIFCADEujsCAPvgXdJec5Yr/H6s8uku/qgFam6Y23VTuhmYHgEEEEAAAQQQQCBqAXcFre3Vl5r5NVHXpt7/CDwQWnjp6bVblmGCAAIIIIAAAggUIkAAoBA9ziKAAAIIIJBgAQIAsS6PAMA+eBevrPqkBboyVvkUF3dpXWj6YFNt110pZmB0BBBAAAEEEEAAgRgE3GW33l11XH9O/FszBt9nSj5q5pc21Hb/R3xXUBkBBBBAAAEE0iBAACANW2ZGBBBAAAEE9iFAACDW14IAwL7eudXVd8j99bHKp7e4S/7Tiinhu9529Nbu9DIwOQIIIIAAAggggEBcAsvWzpiZy+XukXRoXHekvq75Rxtruz+XegcAEEAAAQQQQKAgAQIABfFxGAEEEEAAgeQKEACIdXcEAPbB27q6ao1cr41VPqXFXdoWmN3QUNt5eUoJGBsBBBBAAAEEEEAgZoHla6um9Ob1BXedF/NVaS7/6Xww4ZqmuRt60ozA7AgggAACCCBQmAABgML8OI0AAggggEBiBQgAxLo6AgB78ba4MpnVVb2SsrHKp7S4mR4210dPq+tqSSkBYyOAAAIIIIAAAgjELLB8/WEVvU9uOdcVfi3mq9Jc/lv5wK5omtv5WJoRmB0BBBBAAAEEChMgAFCYH6cRQAABBBBIrAABgFhXRwBgL97WtVWzLKeHnABALC+eSb8JpbMX1nXdH8sFFEUAAQQQQAABBBBIvYC7glvWTpsf5jK3ybwi9SBxALjf4pngYwvndv4pjvLURAABBBBAAIF0CBAASMeemRIBBBBAAIHnCRAAiPWlIACwF++iFTPmBpncSkmZWOXTWTyU67+yFjScUtexPZ0ETI0AAggggAACCCAwGgJLVtW81BXeItMRo3Ff+u7wtsAzl5w2r+Pe9M3OxAgggAACCCAQlQABgKgkqYMAAggggEDCBAgAxLowAgB78S5ur2oy6YcEAGJ573pc9p2FdZ0XxFKdoggggAACCCCAAAIIPCOwrL3moLzCL7jUBEosAvdZEFzcMLdjRSzVKYoAAggggAACqRAgAJCKNTMkAggggAACzxcgABDrW0EAYC/epauqPhKaPicpiFU+ncW7A9eVp83r+lI6x2dqBBBAAAEEEEAAgdESWNo2bVpYHnxErstH686U3fNgKP+/p9d1/2fK5mZcBBBAAAEEEIhQgABAhJiUQgABBBBAIEkCBABi3RYBgL14F6+q+qIFukhOACDyN8+0QR68s7Guoy3y2hREAAEEEEAAAQQQQGAPgbY2ZTvLqhpM+jEwsQjsMPP3NtR2/0cs1SmKAAIIIIAAAqkQIACQijUzJAIIIIAAAs8XIAAQ61tBAGAv3iXtVT926XRJ/Psz6lfPtX68l9cumP/E5qhLUw8BBBBAAAEEEEAAgb0FlqyqrHMLWiWfgU70AuY6r2Fe183RV6YiAggggAACCKRFgG/ApmXTzIkAAggggMBeAgQAYn0lCADsxbu4vep2k95IACDy984l3fu72q7jmk1h5NUpiAACCCCAAAIIIIDA3v8vuXLqMQoyN0l6JTjRC5j0T1v7u752br16o69ORQQQQAABBBBIgwABgDRsmRkRQAABBBDYhwABgFhfCwIAe3+TsL3qEUmHxKqezuL9MmtprO08O53jMzUCCCCAAAIIIIDAaAssWzP9sFyYu16yk0f77nTcZ9fkg/7PN83d1pWOeZkSAQQQQAABBKIWIAAQtSj1EEAAAQQQSIgAAYBYF0UAYC/e1vaqjZIOjFU9ncV7JP90Y133Nekcn6kRQAABBBBAAAEERlugZc2s8eXaeVjowfTRvjsN95kyf9tUsemR8+eoPw3zMiMCCCCAAAIIRC9AACB6UyoigAACCCCQCAECALGuiQDAHryta6tmKad7JfE3QqN/7XaYgvc31HX8IPrSVEQAAQQQQAABBBBAAAEEEEAAAQQQQACBpAkQAEjaxugXAQQQQACBiAQIAEQEue8yBAD2cFncXjPHLLxNrupY1dNZfEvgwYmnzesYCFjwhQACCCCAAAIIIIAAAggggAACCCCAAAIpFyAAkPIXgPERQAABBNIrQAAg1t0TANiDlwBArO9alyw8prF2y99ivYXiCCCAAAIIIIAAAggggAACCCCAAAIIIJAIAQIAiVgTTSKAAAIIIBC9AAGA6E33qEgAYA+M1vaaeilslVQZq3oai7seb5zXdVAaR2dmBBBAAAEEEEAAAQQQQAABBBBAAAEEEHi+AAEA3goEEEAAAQRSKkAAINbFEwDYg3fJqqpz3fQlSZNjVU9n8V821nUdm87RmRoBBBBAAAEEEEAAAQQQQAABBBBAAAEE9hYgAMA7gQACCCCAQEoFCADEungCAHsGANor3+9u18k0KVb1FBZ3s2ULaztPTeHojIwAAggggAACCCCAAAIIIIAAAggggAAC+xAgAMBrgQACCCCAQEoFCADEungCAAQAYn3Bni1usq831HVeMCqXcQkCCCCAAAIIIIAAAggggAACCCCAAAIIFL0AAYCiXxENIoAAAgggEI8AAYB4XJ+pSgBgD94lfAJAbC+bu12+cF7n1bFdQGEEEEAAAQQQQAABBBBAAAEEEEAAAQQQSJQAAYBErYtmEUAAAQQQiE6AAEB0lvuoRABgD5TW9qovSHq/pHGxqqewuMkvbajrvi6FozMyAggggAACCCCAAAIIIIAAAggggAACCOxDgAAArwUCCCCAAAIpFSAAEOviCQDswbt4ddW3zHW2pPJY1VNYPDC78LTazq+lcHRGRgABBBBAAAEEEEAAAQQQQAABBBBAAAECALwDCCCAAAIIIPCsAAGAWN8FAgB78BIAiO9dy4fB65rmd6yI7wYqI4AAAggggAACCCCAAAIIIIAAAggggECSBPgEgCRti14RQAABBBCIUIAAQISYzy9FAGAPEwIA8b1ruTBb9/b5m1bHdwOVEUAAAQQQQAABBBBAAAEEEEAAAQQQQCBJAgQAkrQtekUAAQQQQCBCAQIAEWI+vxQBgD1MCADE964RAIjPlsoIIIAAAggggAACCCCAAAIIIIAAAggkUYAAQBK3Rs8IIIAAAghEIEAAIALE/ZcgAEAAINYX7NniBABGhZlLEEAAAQQQQAABBBBAAAEEEEAAAQQQSIwAAYDErIpGEUAAAQQQiFaAAEC0nntVIwCwBwifABDfu0YAID5bKiOAAAIIIIAAAggggAACCCCAAAIIIJBEAQIASdwaPSOAAAIIIBCBAAGACBD3X4IAAAGAWF+wZ4sTABgVZi5BAAEEEEAAAQQQQAABBBBAAAEEEEAgMQIEABKzKhpFAAEEEEAgWgECANF67lWNAMAeIHwCQHzvGgGA+GypjAACCCCAAAIIIIAAAggggAACCCCAQBIFCAAkcWv0jAACCCCAQAQCBAAiQNx/CQIABABifcGeLU4AYFSYuQQBBBBAAAEEEEAAAQQQQAABBBBAAIHECBAASMyqaBQBBBBAAIFoBQgAROu5VzUCAHuA8AkA8b1rBADis6UyAggggAACCCCAAAIIIIAAAggggAACSRQgAJDErdEzAggggAACEQgQAIgAcf8lCAAQAIj1BXu2OAGAUWHmEgQQQAABBBBAAAEEEEAAAQQQQAABBBIjQAAgMauiUQQQQAABBKIVIAAQrede1QgA7AHCJwDE964RAIjPlsoIIIAAAggggAACCCCAAAIIIIAAAggkUYAAQBK3Rs8IIIAAAghEIEAAIALE/ZcgAEAAINYX7NniBABGhZlLEEAAAQQQQAABBBBAAAEEEEAAAQQQSIwAAYDErIpGEUAAAQQQiFaAAEC0nntVIwCwBwifABDru/aexrqub8V6A8URQAABBBBAAAEEEEAAAQQQQAABBBBAIDECBAASsyoaRQABBBBAIFoBAgDReu5VjQDAHiCtqysvldsnJU2MVT2FxU1+aUNd93UpHJ2REUAAAQQQQAABBBBAAAEEEEAAAQQQQGAfAgQAeC0QQAABBBBIqQABgFgXTwBgD94l7ZXvd7frZJoUq3oKi5v7ZQ3zuq9N4eiMjAACCCCAAAIIIIAAAggggAACCCCAAAIEAHgHEEAAAQQQQOBZAQIAsb4LBAD24CUAEN+7ZtLnG+q6LonvBiojgAACCCCAAAIIIIAAAggggAACCCCAQJIE+ASAJG2LXhFAAAEEEIhQgABAhJjPL0UAYA+TJaur3uuu6yVNjlU9hcXdbNnC2s5TUzg6IyOAAAIIIIAAAggggAACCCCAAAIIIIDAPgQIAPBaIIAAAgggkFIBAgCxLp4AwB68i1ZWn2Lm3zHT1FjVU1jcZXcurOusT+HojIwAAggggAACCCCAAAIIIIAAAggggAACBAB4BxBAAAEEEEDgWQECALG+CwQA9uBd3F4zxyy8Ta7qWNXTWNz1aOO8rkPTODozI4AAAggggAACCCCAAAIIIIAAAggggMDzBfgEAN4KBBBAAAEEUipAACDWxRMAIAAQ6wv2bHGTOjL6/+zdCZgdVZk+8Pc7dW9vWTp9u7MQArKo7AJDD0s2aFnNADEJ9DAjMuKomWH+o6OOC+po44o6LrMo4OjgOIDMJQsxEkWEJulOCBB2wiY7IWvve99bdb6/1SwSSEh333vuVu99Hh7QVH3nnN93Op10vVVlDlk4t603JwNyEApQgAIUoAAFKEABClCAAhSgAAUoQAEKUKCgBRgAKOj2cHIUoAAFKEABdwIMALizBcAAwBt4ky01B3piNgE61al6BIsL0OlbzG2c3/FYBJfPJVOAAhSgAAUoQAEKUIACFKAABShAAQpQgAJvEmAAgFuCAhSgAAUoEFEBBgCcNp4BgDfwNjcj1h5LvCSCGU7Vo1m8V61ccsH89pujuXyumgIUoAAFKEABClCAAhSgAAUoQAEKUIACFHijAAMA3A8UoAAFKECBiAowAOC08QwAvIl3eWtiK4D9nKpHs/iAAF9aPLfjB9FcPldNAQpQgAIUoAAFKEABClCAAhSgAAUoQAEKMADAPUABClCAAhSgABgAcLoJGAB4awCgRQRzVMEAaja3niAF4OdL5nQszWZZ1qIABShAAQpQgAIUoAAFKEABClCAAhSgAAWKU4A/gC3OvnHWFKAABShAgYwFGADImPDtCjAA8CadZetrV4rqQoABgKzuPIGFxcYl8zrmZLUui1GAAhSgAAUoQAEKUIACFKAABShAAQpQgAJFKcAAQFG2jZOmAAUoQAEKZC7AAEDmhm9TgQGAN+Esa01cK8DfMACQ/X2nwJM27dU3Nuzqy351VqQABShAAQpQgAIUoAAFKEABClCAAhSgAAWKSYABgGLqFudKAQpQgAIUyKIAAwBZxHxrKQYA3mSysiXxaSv4DgDjVD6axV/QtLnggoa2TdFcPldNAQpQgAIUoAAFKEABClCAAhSgAAUoQAEKvCbAAAD3AgUoQAEKUCCiAgwAOG08AwBv4l3eUnsZRP+DAYDs7zsB2lT1i0vmdf4k+9VZkQIUoAAFKEABClCAAhSgAAUoQAEKUIACFCgmAQYAiqlbnCsFKEABClAgiwIMAGQR862lGAB4k8lNa6fNNp6/DoDnVD6CxVXRD+CaC+Z1fDqCy+eSKUABClCAAhSgAAUoQAEKUIACFKAABShAgTcIMADA7UABClCAAhSIqAADAE4bzwDAm3hvbK45Oh6XBxkAcLDvFAFE1lT2tF+4YAGGHYzAkhSgAAUoQAEKUIACFKAABShAAQpQgAIUoECRCDAAUCSN4jQpQAEKUIAC2RZgACDborvVYwDgTbzJ5KxKb+ZAD4CYU/mIFhfofSmxf3nRnO5nIkrAZVOAAhSgAAUoQAEKUIACFKAABShAAQpQgAIAGADgNqAABShAAQpEVIABAKeNZwBgD7zLWxNbAOzvVD6yxfVpD/jE++d2roksARdOAQpQgAIUoAAFKEABClCAAhSgAAUoQAEKMADAPUABClCAAhSIqgADAE47zwDAngMArQDmOJWPanFBO1S+t2Ru+7eiSsB1U4ACFKAABShAAQpQgAIUoAAFKEABClCAAnwCAPcABShAAQpQILICDAA4bT0DAHsMANT+B6D/z6l8dIv7ArnRr2n/28ajkIouA1dOAQpQgAIUoAAFKEABClCAAhSgAAUoQIFoC/AVANHuP1dPAQpQgAIRFmAAwGnzGQDYA++K9YlPqeJ7TuUjXFyAVoj+/eI5nY9GmIFLpwAFKEABClCAAhSgAAUoQAEKUIACFKBApAUYAIh0+7l4ClCAAhSIsgADAE67zwDAHniXrUucLQa/dSof6eL6DCBfXDK34/8izcDFU4ACFKAABShAAQpQgAIUoAAFKEABClAgwgIMAES4+Vw6BShAAQpEW4ABAKf9ZwBgD7y/vrf6kOFh7xmn8lEurjosxvxw8Zz2z0eZgWunAAUoQAEKUIACFKAABShAAQpQgAIUoECUBRgAiHL3uXYKUIACFIi0AAMATtvPAMBeeJe3JtSpfMSLC5D008OfaGzo3x5xCi6fAhSgAAUoQAEKUIACFKAABShAAQpQgAKRFGAAIJJt56IpQAEKUIACAAMATncBAwB74V3WmlgnwDyn+tEuvhmin1syp/OWaDNw9RSgAAUoQAEKUIACFKAABShAAQpQgAIUiKYAAwDR7DtXTQEKUIACFGAAwO0eYABgL77LW2p+AZEPuuWPdPV+iH41eLnze42NCCItwcVTgAIUoAAFKEABClCAAhSgAAUoQAEKUCCCAgwARLDpXDIFKEABClAgFOATAJzuAwYA9hYAWFf7BRj9hlP9iBcX0et8iy82zut8MeIUXD4FKEABClCAAhSgAAUoQAEKUIACFKAABSInwABA5FrOBedSoKkJ5sj3zqh9bUwPfkxVJsYkiO9tHilVzxNMlpgXC4/RlA54Rvv3drwfExtLa39KyoZePyYIBh9bu2ugqQk2l+vlWBSgQHEJMADgtF8MAOyFd/naqfPhBWud6ke8uAKPweBTF8zuuDXiFFw+BShAAQpQgAIUoAAFKEABClCAAnsRGLl+cerUKnhe5euH6ODEWFmswqR1r9cPAysTpEyqXjvHIOiAL3t9CqGvXlpE+wLE/NfHqd3e3XgUUmwOBSjgRoABADeurFrCAk0Kc+yDUyab/lhVOiYTJLBTrNoKE160h4mp2AliMVkVBmo8GD3kNQ6FVIhqHQSvf3N8M5UAMQVmQqR85NdU2wF07I1UVQJjdJcqev70TRpdMNIBawOIpGCkXRTWig6JSgcCCYxnutMp7a+cFO85r37rQAm3jEujAAX2IsAAgNOtwQDA3vbdurr9YOwfAExw2oFoFx8UwZd8qbqqcfaWwWhTcPUUoAAFKEABClCAAhSgAAUoQIFoCaxqrZsEYJIVU2kDWw1PPRVNGJWKQOEZtTNGRIzxYDUBwZQ/CclUUVSrqHkbtQREXr/xEVZfgLzNxXzFgIq0CfT1mxgFulUV/WqgAjMoQKe1Yj34vdZ4/Z7YoUC1p7LSH+h7uq+DrzmM1h7majMXYAAgc0NWKEGBa65BvObdU2ttmV/nKWo8lRlWpEqgNQLUWGgCkIkCTBJorUIqIUgAiEMxGUANgEL5+gpTdNshsKoYMNCdCvGh6ISgW4EuUfQBsksF/Qa6FcamhofxQnmZP7B4Tt/OEmwxl0QBCvAVAK73AAMAexG+bmNicmWAu6E43HUTolxfgeWIeZdfcPKuMGzBDwUoQAEKUIACFKAABbIq8MvWupnl0JMtEF5k4ifLAhIEz5VNqNrEm3ayDMtyFCghgV+uTRwAa72KWOwga4IJqqZONLzZQqeGF/QVmDLyvwU1Ao1ZyDQJb0xUeAAOKBQKCW+BBPohaFOFFdUuEfQoZACQTqiGv7YDikBFnocgMBK8ZAJvCFa39pWj++KTO/50c2ShLIzzoECeBQrlAmWeGTh8VAXCu/mP2TDlAKS9aRrXA9XqdBGZbiDTIBp+k6yBovqVb5pS8cp/Y2KJenVAMAiVnSKaVpWXRUYSeTtVET6FYKsRvJS2ph0aexHbtzN1V6IbgcuKjgCfAOC01wwA7IV39aaZVanhoZ9DcaHTDkS9uGILjP7d4tmdvxHhK4Givh24fgpQgAIUoAAFKJBtgeXrp8xXmG8J8I5s12a98GqY3GzLzNcbT9y1nR4UoEB0BZJJeJgxIwHxDxQE+5lXnhw8XQS1qpgFiAF0lggqX72WET7KP7xRsTQ/gpcRhgQE26AYViC8ebFXgF2BSruIPqdW2r04tk6oir149rE79vpq5dIE4qoo8CcBBgC4GyIjsGYNygcnTd8fNjhavGCmhRwiioNffbzNJCgSGt7RLyPJZT6W+LWdEV40UPRD0S2CzpE0HtAhYfoOeMkKNovKyybtP7eooev5yGwoLpQCJSDAAIDTJjIAsBfe5GaUxTpqP6Wi33LaARYP3733zXINfnDuvO7wezY/FKAABShAAQpQgAIUyJrAitbEmQq5CtBDs1aUhd4gIDcEBp9tnN3+MlkoQIHoCCTXJY6MeTJj5PdWlfDVwgcoNHzacEKAySqoHnkCsWACwlcQ8zMioEDaAH0q0v7qEwO6VbVz5BqGyjMANnsxbE2lh59tnN+3i2wUiIIAAwBR6HJE15jcVFMtA6beM/oeVRwmgoN1JP0mNYBWhe/AKeG7+XPR9fDCwgAw8iqB8N+9UHRB5AERfdIP9Clo+kl+Q81FKzgGBcYnwADA+NxGeRYDAHuBCp++854Ntaep6u2jtORh4xUQuT8Q+6HG2Z2PjLcEz6MABShAAQpQgAIUoMCeBBgAcL0vGABwLcz6FMi3QHLdxKmelB8rBkcqcBhU3w2RWlWtCl89/Or1i/A6RvjIfn7GJ+BD0PPKdQsMiKJXBVugeESBJ43aJ31v4lONs7cMjq88z6JA4QowAFC4veHMxiiwqrVuZlrsKVCcDOAoAQ6GYiLC99oAlRCUMxU3RtSxH64YeUKADgISftPsUZXnBXqfMdhgBmMPPXD6zl1NfBTx2GV5BgUcCDAA4AD1TyUZAHgb3mUbp77L+MEGBeqcdiHixcMEPKx+uKqv86YFCzAccQ4unwIUoAAFKEABClAgiwIMAGQRc4+lGABwLcz6FMilQHgzxPHr62b41s6GJ/WqerwB3qGKCeH1CxGErx8OH+PPa3buG5OGYmDkdcgIX4msHRDzpCjuTgW4y6h5vLFhV5/7aXAECrgV4G8mbn1Z3aHAzWsTBwQeZgN6KiB/JsChCpQDiL/6D5NxDv1HU1oEqhYWglT4jyjSKnhKoC2BYm0ZvNaFc9t6R1OLx1CAAtkXYAAg+6ZvqMgAwNvwrt5Qu3/K6k0ATnHaBRYPH4T3K1jv75bMb9tGDgpQgAIUoAAFKEABCmRLgAGAbEnurQ4DAK6FWZ8CrgWSG2r3F9/O8wxOtZA5Asz846v6ynj9wrX8mOuHNzX6AFJQpF8NBtwvwJ3qy9qETnqkoeH5oTFX5QkUyLMAAwB5bgCHH73A6k0zq4ZSQ8dJoOcJ5DwI3iWCuCpTcaNXLJwjBVAL+ALcA8FtSMuaJae131s4M+RMKFD6AgwAOO0xAwBvw/vrluqaYTFXAPKPTrvA4iMCEsNZ/osddzQ2Inx9Dz8UoAAFKEABClCAAhTIWIABgIwJ91GAAQDXwqxPgWwLJDfMqoQdmOsBCwCcKeFj/QUer19kWzo39UZubgyjAZA2qF2vxvwuLua2ycO7nm9oGAkM8EOBghZgAKCg2xPNyYWPwzn1zoPKXh7sKaucaCZYE5zviZyuivcCqI2mSmRWvQ0itwrsrb5v706Ve+2J2sTwPdc/nW5qgo2MAhdKgRwJMADgFJoBgLfhDf9SbHTwQ6L6Y6ddYPERAVX8t/W9T/ARdtwQFKAABShAAQpQgALZEmAAIFuSe6vDAIBrYdanwHgFkkl4mDWrDP39ZbHJ3nT19WxVfZ8AJwFIjLcuzysOAQWeE5XfiOjNGErf73sVw5i2K3XhkUiHoYHiWAVnGQUBBgCi0OUiWGNzM2K7yidP9tRMigHvCNScbhVzRHB6EUyfU3Qj0AngAVH5naptTam8OMkEfRP87l4m7NyAs2r0BBgAcNpzBgD2wbtifeIUVWkGNHx9Dz9uBQaMmvmL5rXd53YYVqcABShAAQpQgAIUiIoAAwCuO80AgGth1qfAWASSm1FW1VE9YRioMWIOs8BcQM5UxTEiqBhLLR5bOgIC9EBwKyCt1g9abNzbWW6lZ3hr2wCfwlg6fS7WlTAAUKydK4F5hxf9B72JNalYfIbv66HiyXtVZZ4AR776LpwSWCWXkD0BbVXIvaLS4nn26ZSf3t5Z1de1tB7p7I3BShSIlgADAE77zQDAPnhX3FV7hFr9ORQnOu0Ei78iYOX6JfPbLyYHBShAAQpQgAIUoAAFsiHAAEA2FN+uBgMAroVZnwL7ElizBuXBlNq6lC/TxQRHKKReIecK9J37Ope/HkmBXgXuFugdnmfulUBeGjapXdjSEHr5ZAAAIABJREFU080wQCT3Q94XzQBA3lsQrQmE77u5qWViXTxWfrD69hA1cpICp428DweojJYGVzsuAUFKFY8ZwR0qeh/U/EEw/II/u6+9Ufhu43GZ8qTICjAA4LT1DADsg3f5urr9VOwVIvio006w+GsCg8azRy46pet5klCAAhSgAAUoQAEKUCBTAQYAMhXc1/kMAOxLiL9OARcCmzYhvqU/MSPt6UEG8m6Ed/or5ovgQAViLsZkzZIU6ILKQxC7ASL3q5rnrUk92zi7p6MkV8tFFaQAAwAF2ZbSm1Ryw+SE53tHiDHvBPRYFcyBxZEQTCy91XJFORToA/CoKO5WwSMANsdgNi+c29abwzlwKAoUrQADAE5bxwDAPniTG2ZVejp4KVR/5LQTLP5GgZ8FNR2XNR6FFFkoQAEKUIACFKAABSiQiQADAJnojeZcBgBGo8RjKJANgfCmxV+tr9vPVz0SsO8WIydAcbJCDgGUj/fPBnKEa4SvCVDBo4C2qkr4asbNA/3x5y85e0d/hFm49BwIMACQA+SoDrF608yqIDV4qIU5Xq2tFwkfkYMjoaiOqgnX7VSgKwwDKHCvQu/zVB9dPK/rIacjsjgFilyAAQCnDWQAYBS8y9YlzhYP10NRO4rDeUjmAkMSyF8sPrX9jsxLsQIFKEABClCAAhSgQJQFGABw3X0GAFwLsz4F1mxMTB5IyxEA6o3RE1RxAoBDAUygDgVcCKhiOyCbjNhHIXhIrb0n4Xe/2NAA38V4rBltAQYAot1/J6tPbqjdP2ZxElTnqOAYhBf9gf0AGCcDsigF3irwggiehsq9AO717XBL4/y+XYSiAAV2F2AAwOmOYABgFLzL1tW8R4z5IaANozich2RDQGV1j9/eeGkDhrJRjjUoQAEKUIACFKAABaIpwACA674zAOBamPWjK7Dirtoj4Ad/rmLm45VXE4fXLxLRFeHKcy0ggK/AFkAehuoDIliPofT9i8/obc/1XDhe6QowAFC6vc3pyq7ZhPj0VM3hgcW5gMwB8C4ABwCozOlEOBgFdhcYEuAFQJ+AmHthg18fWNn1WH090oSiAAUABgCc7gIGAEbBu2L9xGlA2RdU8YlRHM5DsiPQAdFLlszpvCU75ViFAhSgAAUoQAEKUCCKAgwAuO46AwCuhVk/WgLh04r9wYETrfHep4oTBXqwAgcIb1qM1kYowNWOvCIAeB7A4yq6Ni7BbcNbep5rbERQgNPllIpIgAGAImpWIU41vPA/daj2PIUuEOAEBQ4EMIV3+xdityI9JwsgfEXASwA2qZpVtjJY11jf2R1pFS4+8gIMADjdAgwAjIK3uRmxrrKaj1qVHwIoG8UpPCRzgUAEa33xL2yc3dOReTlWoAAFKEABClCAAhSIogADAK67zgCAa2HWj4bAqo3TpqcD/3wBzoSOPK141quP+Oe1sWhsgWJaZXjTYhugW0VlrcCsXjSv7c5iWgDnWlgC/E2usPpRNLNJ3jNhhpcuuwQqF6jiAAimCFBRNAvgRCMroMCQATo0fDKAYHlMzS/Pn9O2TQQaWRQuPLICDAA4bT0DAKPkXbk+cZYqfqCvPHKPn9wIdKri6xfM6/h+bobjKBSgAAUoQAEKUIACpSbAAIDrjjIA4FqY9UtXoElh3rOx9jAb6IdFcRYEMxWoFiBeuqvmykpJQBX9AnSq4DGj+D+Y1K8Xz+nbWUpr5FrcCzAA4N64pEZY1po46o93Uf+tAI0Q1EBHHvHPfVRSXY7IYgQWOvL+412A/tYrk2+8/8SO8AkB/FAgMgIMADhtNQMAo+Rdsbb2COvhWwJdOMpTeFjmAgrFvYGYSxrntj2ZeTlWoAAFKEABClCAAhSImgADAK47zgCAa2HWL02Bm9ZOm+3F0v9PVc4GUAWgnNcvSrPXEVlV+BqAQYhuV2t+7kNuumhe21MRWTuXmaEAL9xmCBiV01duqD0xUPwLVM/gnf5R6Xrk1qkQrFE1TRfMbdsUudVzwZEUYADAadsZABglb3IzykxHzZdF5IujPIWHZUegT4GrL5jb8ZnslGMVClCAAhSgAAUoQIEoCTAA4LrbDAC4Fmb90hFINk+dKHF7loF+FUB4AyM/FChJgZGnAgCrNKY/uODkzodLcpFcVNYEGADIGmVpFbpmE+KTeidVV8RiJwPyTyqYx3fzllaPuZq9CqShuAdivhNUBGvxbOdgYyPC9+/wFQHcNCUnwACA05YyADAG3hXrE5eq4psAZozhNB6aoYAAT6rK5Yvntt/MV+FkiMnTKUABClCAAhSgQMQEGABw3XAGAFwLs37xCqhCfn7nQeWJeF/CR3CeqHzCCg4TwBTvqjhzCoxBQNANizuMyo8QBPdNQVdfQwP8MVTgoREQYAAgAk0eyxLXrEF534TqmfGYzFU1SxU4AUDFWGrwWAqUiMAgFPdB8T+Q4I5g26RtjY1bwlcGMAhQIg3mMgAGAJzuAgYAxsC7cv2U49Saf1XB6WM4jYdmLuADkvTK9PN8DU7mmKxAAQpQgAIUoAAFoiTAAIDrbjMA4FqY9YtPoKkJ5p3nJCZONjggndLzAXwEkEOKbyWcMQWyJjAogl+L2Bskbe6bNaFje339yM2M/FCA727nHnhFYM3GxOSBQZlpYsGJEPMRxcgd//xQgAJASoC7FfhFIHZTucaeWTi3rY9BAG6NUhBgAMBpFxkAGANv+Li+WNx+V6EfBeCN4VQemqGAAG0B8O2Kioofn1e/dSDDcjydAhSgAAUoQAEKUCAiAgwAuG40AwCuhVm/eATCO/5vaplRF5PhwxRyugKNIjiyeFbAmVLAvYAIblfFf2ng3W/rdr3QeBRS7kflCIUswCcAFHJ3cjC3a5unTJkcN4cD0gDYM1/5Nz8UoMBbBWRYYB+F4CZA1sXLKx7ihRLuk2IXYADAaQcZABgj77LWxCcF+AKAujGeysMzF9goIl98ONW+romPjMtckxUoQAEKUIACFKBABAQYAHDdZAYAXAuzfnEIJNfNmOrF08fC6jkAlkBxUHHMnLOkQF4EFIpbYeT/gkDvmdjX8cyCBRjOy0w4aN4FGADIewvyM4E1f0D54I7E8QqcJZDzAT0WQCw/s+GoFCg6gU1QWeWJXdvTX3b/JWfv6C+6FXDCFABfAeB4EzAAMEbgVXfVzPED+SGA+jGeysMzFVD4KrjeBsEVjad2P5dpOZ5PAQpQgAIUoAAFKFD6AgwAuO4xAwCuhVm/sAVWrJ8+zWqqHpAzBFgIgI/6L+yWcXaFJTAgondAcYuFtNiajj/wiQCF1aBczIYBgFwoF9AYyc0oi3VMOQJizlRgoQL1AlQU0BQ5FQoUhYAIFMC9UPzWM/bm/cu6HuX7dYqidZzkGwT4BACn24EBgDHyXrcxMbkyLVdBtJGhxDHiZeFwBToE+NpgDP998ckdPVkoyRIUoAAFKEABClCAAiUswACA6+YyAOBamPULUyC84z/mpWdbxZkCnAnouwtzppwVBQpfQIBOiKy3Vn9vYvK7XfH2p5fWI134M+cMsyHAAEA2FIugRnMzYt1e4t1W9HwVOR3ACQBqimDqnCIFClpABAOq2ADIHbGYvWX7Q52PL13Kb6IF3TRO7nUBBgCcbgYGAMbBu6I18c8K+SygU8dxOk/JXOBhqHy6rbJ9Lf9CmDkmK1CAAhSgAAUoQIFSFmAAwHV3GQBwLcz6hSWQ3DCrssz21/tAo0DOAHAogHhhzZKzoUCxCuguQO6D4veB76/Crp7nGhsRFOtqOO/RCTAAMDqn4j1KIWtaJtYNSXkjRP9SgSMB1BbvgjhzChSkQPg0gE4Aj4rqGh/4ZeO8zhcLcqacFAXeIMAAgNPtwADAOHhXtVbXB/B+qkD4aiJ+ci2gCBTyG4H/icVzu5979Wk3uZ4Fx6MABShAAQpQgAIUKAIBBgBcN4kBANfCrF8YAkmFV37XlPf41lwC0flQOQzAhMKYHWdBgZIT2AnF/QLcNKlSl59Z39ldcivkgl4XYACgxDfDivWJj6rVv4LI4QD2K/HlcnkUyK+AwMKiA4KHNZBfDJXrSj5GOb8t4ehvL8AAgNMdwgDAOHivbUZFdTxxvQLn8zUA4wDMzimDovhJvLLiC+fVbx3ITklWoQAFKEABClCAAhQoNQEGAFx3lAEA18Ksn1+BpiaYY0+dcqCNeRdDdCGA8PrFxPzOiqNTIBICAQTbRPE4IFcvntu+IhKrjuAiGQAo0aYnm2vmejH50sij/gUJAKZEl8plUaAQBQJA2iHYIKo/rkl3NDc0wC/EiXJO0RZgAMBp/xkAGCfv8paay0TkCgXqxlmCp2Uu0AuRf1gyp/1/My/FChSgAAUoQAEKUIACpSjAAIDrrjIA4FqY9fMnkEyizJuZ+KACnxDFgTCYBOX1i/x1hCNHUUABK8AOKDYalSsXzW+/J4oOpbxmBgBKrLsr75pykKr3ObVYAmh44d8rsSVyORQoJgFfgQER3OjF8fX3n9jxUjFNnnMtfQEGAJz2mAGAcfLefE/iAJvCbQqEj/3jJ38C20T0rMVzOh/N3xQ4MgUoQAEKUIACFKBAoQowAOC6MwwAuBZm/fwI3LR22mzj+d9WxfEiqALAa1T5aQVHpcBrAuGNizsh+GWlhx8uOLljC2lKQ4C/uZZGH5HcMKvS076PQM3nAcwskWVxGRQoGQEBOkXxjUXzOr5XMoviQopegAEApy1kACAD3uUtiZsgCB8BGM+gDE/NXOCFYFCPbTyT74TLnJIVKEABClCAAhSgQGkJMADgup8MALgWZv3cCqxqrZvpa3AlRC7mRf/c2nM0CoxWQIEnY8BXOtMdqy5twNBoz+NxhSnAAEBh9mVUswrfk3PCuTMrUoPDs0X0cgXm8Qflo6LjQRTIl0Cgik1ivM+Wlcc3nXvC1kERaL4mw3EpwACA0z3AAEAGvCvvqnmfDeQGAFMyKMNTsyPQ2t8fP+eSs3f0Z6ccq1CAAhSgAAUoQAEKlIIAAwCuu8gAgGth1ncvkEzCSx2YmFCR1g8K5NMQHMSL/+7dOQIFMhRIAbgNVr8VxCbcf+EpW4Z4DSND0TydzgBAnuAzHfba5oMqJlV2v1t8uRSKiyF8T26mpjyfAjkU6FTo9Ub1p/HKqj+cV791IIdjcygKvC7AAIDTzcAAQAa8t946fULfhPT9AN6dQRmemhUBHQbw35Ux+fyCkzt6slKSRShAAQpQgAIUoAAFil6AAQDXLWQAwLUw67sTaFKY+tbq6kEv9mcm0H+GSAOg5e5GZGUKUMCBwHZA/lsN/tduaX+2sRFhMICfIhJgAKCImhVOVRWy4s7E/hqX00X0Y1DMLrIlcLoUoMArAr4AjwJ6TUyxZltl57al9UgThwK5FGAAwKk2AwAZ8q5oTXxZBV+BwmRYiqdnLtAhwLckbX+6qKGrK/NyrEABClCAAhSgAAUoUOwCDAC47iADAK6FWd+NQPiqYgRDR8bE/qUCH+Drit04syoFciWg0Ds9yFUmFlu78OSdO3I1LsfJXIABgMwNc1Zh9aaZVemhoTlWcaEIPgigImeDcyAKUMCVQBcUv1XR/62uwPozTujs4SN1XFGz7psFGABwuicYAMiQN7l+6nGeBusATMqwFE/PjsDLKvoNKxN+3jh7y2B2SrIKBShAAQpQgAIUoECxCjAA4LpzDAC4Fmb97Aqowqxal9jfxnEmLD6kwMl8XXF2jVmNAnkUGFTFfxnPrIi3l9173nl8onEeezHqoRkAGDVVfg9MrkscGTP6FypmKVQPze9sODoFKOBA4FEFVthAlz02v3Nzk8A6GIMlKbCbAAMATjcEAwBZ4F3emrgFwIIslGKJ7AhsNoKvxMorfsPX12QHlFUoQAEKUIACFKBAsQowAOC6cwwAuBZm/ewJNDUj9h5TO189/WsI3g9FbfaqsxIFKFAoAgo86SmuUpjfLJ7X9lShzIvz2LMAAwAFvjN+3VJdk5JYg0IvBnAOgMoCnzKnRwEKjF8gJSK/UwTJnlTXTZc2YGj8pXgmBfYtwADAvo0yOIIBgAzwXjt1xfopC1XNzVkoxRLZEQgE+qBaubKsqmINQwDZQWUVClCAAhSgAAUoUIwCDAC47hoDAK6FWT87AsnmCTNMrKJRoB+A4MTsVGUVClCgYAUE3bD4TfhE4/KKyjv5s6GC7RQYACjc3mDl+inHQc3fKLBAgfCuf6+Ap8upUYAC2RN4AdBfBVaubpzf8Vj2yrISBXYXYADA6Y5gACALvKta6yb5sHcAqM9COZbIjsBICEBEvpWWqjV8HUB2UFmFAhSgAAUoQAEKFJsAAwCuO8YAgGth1s9cYEVLzbkqEt64eCaAROYVWYECFCgSgTSAJyG4OQjwS17DKMyuMQBQgH1ZvWlmVWpo6DwAfwvgFAATC3CanBIFKOBWIAWgVRXX9/odN/BpAG6xo1qdAQCnnWcAIEu8K1pq/0FF/zNL5VgmOwKBAo941l7RFXT9lt+jsoPKKhSgAAUoQAEKUKCYBBgAcN0tBgBcC7P++AXCu/5jZRV/g/Cuf+BoVd5oOn5NnkmBIhZQdMNIs4heU7Pf5DsbDn6eTzQuoHYyAFBAzQinklxbfbDnmY8CuBCQgwDECmyKnA4FKJA7AQvFyyJyiw/5YePctidzNzRHioIAAwBOu8wAQJZ4l6+f8g5Rs0mBuiyVZJnsCITfox73RD+bqun8feNRCINr/FCAAhSgAAUoQAEKRESAAQDXjWYAwLUw649PYPn6KfNh5ZMQmffqXf+8xjQ+Sp5FgRIRkGFAnwbwfzGYny2c27a1RBZW9Mvgb84F0sJkEp43o+Zk8cwVqhq+Kye865/9KZD+cBoUyLPAIIC7FPo9y4sseW5FaQ3PAIDTfjIAkCXe5uaDKjrjPV9V4DNZKsky2RIQWKg+CzV/H2xrb25sRJCt0qxDAQpQgAIUoAAFKFDYAgwAuO4PAwCuhVl/bAIr7p5Ui3T8UgtcKoJ3QlE2tgo8mgIUKGEBhaJHBBus1c8/ekfno01NsCW83qJYGi8wF0CbRh75Pzj8IYh+CcA0AF4BTItToAAFCksgvKiyA5AfBSZ9dePsno7Cmh5nU4wCDAA47RoDAFnibWqCOeaMRBiOvB1AVZbKskz2BFSAbcbgwvfP7tiQvbKsRAEKUIACFKAABShQyAIMALjuDgMAroVZf/QCK9bWHqGe/bxAzlegmjcujt6OR1IgSgIC+ArsEJUv1PjtNzQ0wI/S+gttrQwA5Lkjy9fV7QdjfwRgUZ6nwuEpQIEiEVCVX5sYPrv4lPbHi2TKnGaBCjAA4LQxDABkkTe800BT8e9CcGkWy7JUFgUE6AnULLxwXtudWSzLUhSgAAUoQAEKUIACBSrAAIDrxjAA4FqY9fct0NyMWJdXe6oV+z2IHLvvM3gEBShAgVcEBHq1pPXyRQ1dXTTJjwADAPlxR3LDrMp40HdSIOYqAQ7P0zQ4LAUoUKQCCjyp0E9WVFSuPa9+60CRLoPTzrMAAwBOG8AAQBZ5wx86dJTXngfVG/mYwSzCZrmUCNQCS3tTk//30obnh7JcnuUoQAEKUIACFKAABQpIgAEA181gAMC1MOu/jYBCki0z6ozxPyRqr4Cgkl4UoAAFxiHwkGdwWefw5Pv5c6Jx6GV4CgMAGQKO9fTwMbZ/vmDqtKG0/QisNkH4uP+xGvJ4ClDgFQEBBtTKFTEj1y2c27aVLhQYqwADAGMVG9PxDACMiWvfByfXVh8c88wPFLJw30fziDwKDAi0KZ72rz2vobctj/Pg0BSgAAUoQAEKUIACDgUYAHCI+8pPfW4IDD7bOLv9ZdcjsT4F3iiQTMIzs2rfJRb/AuhfU4cCFKBARgKK7VbwPU/iv3j4th1tTU2wGdXjyaMWYABg1FSZH3htMyoml9Ueo6qfE+A8AGWZV2UFClAg8gKKGwNjvz011fUo36sT+d0wJgAGAMbENdaDGQAYq9g+jk8mUebtP+UvAXM1FFVZLs9y2RXoE+h1nol97/xTdj0rwr/cZZeX1ShAAQpQgAIUoED+BRgAcN0DBgBcC7P+WwWSt9VUxyrkFDX4LhRH04gCFKBANgRU0S/Q5cboD8q7ux5fsADD2ajLGm8vwABAjnZIcsPkhGdjZwL4NIDjAcRyNDSHoQAFoiHwKCyuKJfg9nPndXdGY8lcZaYCDABkKvi25zMA4IA3uX7qcZ61P4ToqQ7Ks2R2BYYA+R2g3+pJdzx4aQP4SoDs+rIaBShAAQpQgAIUyKsAAwCu+RkAcC3M+rsLrFxffWhgYxcK9IsQTKQPBShAgawKCFJqdQOA79tKrGus7+zOan0We4sAAwCON0X4yJz4/tUHBdZcCMjHRHCw4yFZngIUiK5Au1r8u0hw3ZJ53c9Gl4ErH60AAwCjlRrXcQwAjIvt7U9KNk+daMqCj4miCcAkB0OwZHYFUgLdoFZ+ZCbZ3y86vqsru+VZjQIUoAAFKEABClAgXwIMALiWZwDAtTDrvyLQ3IxYRzxRD9W/h0gjgAraUIACFHAioAgg2Azg2hhMkq81dqL8elEGABz6XrMJ8WkDtcdb0b+D6LmATHU4HEtTgAIUCAV6ASQ9lf/a8Vj7/UuXIk0WCuxNgAEAp3uDAQBHvCtb6k6wot8FtMHRECybTYFX/nL3hKpe5/l640Nru17k+96yCcxaFKAABShAAQpQID8CDAC4dmcAwLUw6wPXrUlMLp8sZ4jqZQKdC5FyulCAAhTIgcA2FdxkrPnRw7e3Pc2fE7kRZwDAjSuamw+qaIt3NxjIJwHMAfiuWkfULEsBCrxVoF+A9WLkqjQqb22cvWWQSBTYkwADAE73BQMAjnh/cev0CVVV/j+K6OcATHE0DMtmX2CHCG5RyNVtj7Y/yIBa9oFZkQIUoAAFKEABCuRSgAEA19oMALgWjnr9G34/bXpZuX+RCD6swBECxKNuwvVTgAI5Fej747XT21Tl27V++30NDfBzOnoEBmMAwEGTwx9MT5yY/mur+EcBjgTgORiGJSlAAQrsVUAxcuf/E7ByVYX4N547r7uTXBR4swADAE73BAMADnmXtdbVA/pdgZ7mcBiWzr7AgIjcawP81Na2JxuPQir7Q7AiBShAAQpQgAIUoEAuBBgAcK3MAIBr4SjXX95SfQjgXQbgL2EwEwoTZQ+unQIUyJOAIhCD+wKVb29Ot/+qiSGArDaCAYCscgL/vgblsybVNFmRDwqwf5bLsxwFKECB0QsILBTbAfmfGOQ/+U6d0dNF5UgGAJx2mgEAh7zXNh9UMTne8xkBPqlAjcOhWDr7AgGAlxWyxqbNZxobdoWJb34oQAEKUIACFKAABYpMgAEA1w1jAMC1cBTrJ5PwvBnVx6rxPieKsyB8ql4U9wHXTIECFHhWgP9ZPLfjqwU4t6KdEgMAWWzdqta6ST70ulffSTspi6VZigIUoMC4BRToMdDVKvrFJXO6Xhh3IZ5YcgIMADhtKQMATnmBleunHmc1+M9XX7XkeDSWz7qAYAAWj9nA+9SFp+1qyXp9FqQABShAAQpQgAIUcCrAAIBTXgAMALgWjlr95mbEuuM1pwQqV0LwZwAqombA9VKAAgUsIOiGYFkw7P0TbxbJTp8YAMiOI1a1TjrMR/w6KI6H8JH/WWJlGQpQIHsCaag8oh4+sOSU9idFoNkrzUrFKsAAgNPOMQDglBcYuXNhZuIrUHwcgmrHw7G8G4Hwe1EHgGUiqS8vntO3080wrEoBClCAAhSgAAUokG0BBgCyLfrmegwAuBaOUv3w78/x/ROnW8XPAUzjK4uj1H2ulQJFJZBSyG9sOv3PjQ09TxfVzAtwsgwAZKEp4XtoBXojoIdmoRxLUIACFHAp8ASsfmTJ/M71Lgdh7eIQYADAaZ8YAHDK+0rx5LrEkZ7I/0I0vHuBn+IVCAR4RK1+acn8zjUAQ2rF20rOnAIUoAAFKECBqAgwAOC60wwAuBaOUv3lLbWXQfRKAHxqcZQaz7VSoBgFwtcaW9xvTHDRojndzxTjEgplzgwAZNCJ8P2zk8p6/kIsfgjBrAxK8VQKUIACuRToBezCyul1Gxa86+nhXA7MsQpLgAEAp/1gAMAp75+KL2+tuRwqn+W7C3ME7nIYQbdaLPdh/33yjK4n3vdOpPjEGpfgrE0BClCAAhSgAAXGL8AAwPjtRncmAwCjc+JRbyeQbJ460YvbjwP6DUpRgAIUKDKBJxT6aVvT+fvGo5AqsrkXxHQZABhnG5KbaqrNsPytUXxagZnjLMPTKEABCuRLIADwzzGYny2c29abr0lw3PwKMADg1J8BAKe8fyp+Q/OkuvJY/BYY1ENhcjQsh3Er8ASAazTwbqmaWf0iw2pusVmdAhSgAAUoQAEKjEeAAYDxqI3lHAYAxqLFY3cXaFKYY1rqposJrlSRi/l3Ze4QClCgSAWeEsg3PcgKXsMYewcZABijWVMTzJFn1e5nrP6tAZby4v8YAXk4BShQSAK9EP16YHFj47zOFwtpYpxLbgQYAHDqzACAU97di69Yn/ioKr4DYEoOh+VQDgUEMmxVWw3kF77I3RfOafuDhI+B44cCFKAABShAAQpQoCAEGABw3QYGAFwLl2r9ZBJefP8px1iYL0JxPoCyUl0r10UBCpS+gAietxY/TPnp6//qtN52Pily9D1nAGD0Vggv/h97ZvXB1sY+JaIXKzB5DKfzUApQgAKFKNAH4EYjwZV8p04htsftnBgAcOrLAIBT3t2LJ5OzKr39BlaKwVmq4J9vc2ifg6GGoLhTDX7qGXvfolO6ns/BmByCAhSgAAUoQAEKUGAfAgwAuN4iDAC4Fi7F+snNKPM6E38mgisUOA3Ki/+l2GeuiQKRExBsgcXPUhY/u2h+xxaGAEa3A/gD0tE5obkZsc6ymsOtNX8H0Q8KL/6PUo6HUYACBS8g6IbFCrXef9gdux4NiBgMAAAgAElEQVRubET4egB+IiDAAIDTJjMA4JT3rcVXtta8z6r8EoLqHA/N4XIgIECnhdwisL9JS/zu7vKdLy6tRzoHQ3MIClCAAhSgAAUoQIE9CDAA4HpbMADgWrjU6q9ePbMqXTv4Xqh8Uq3MgWh5qa2R66EABaIrEP5cSFX+Kybyb+fPadvGEMC+9wIDAPs2QlLhxVurj7PG+7wqzuLF/1Gg8RAKUKCoBBToF5HbrK/f1R0ddzMEUFTtG/dkGQAYN91oTmQAYDRKWTxmzRqUD05KXAXBpVksy1IFJyC7AL0DwEbP6O07Hul8YulSBgEKrk2cEAUoQAEKUIACJS/AAIDrFjMA4Fq4lOqPXPyvGT5HVS+H4HgAXimtj2uhAAUo8KpAlyp+UR73//Pck3qeZgjg7fcFAwD7+LoJH/t//Dk1Rwe+fFOBswHE+KVGAQpQoBQFFBgS4Hbx8Q1/Z8c9DAGUYpd3XxMDAE57zACAU949F0+21h3mid4C1UPzMDyHzJ2AAuiE4l4I1gO4rSfd8eClDRjK3RQ4EgUoQAEKUIACFIi2AAMArvvPAIBr4VKpn9wwq9ILBs+B6BcAXvwvlb5yHRSgwF4FBgD8Jkj7n29s6HmaTnsXYABgH7tj9Ybaw1OB/gcEp/HiP7+UKECBUhcIQwAGaFZfvrL41Pb7RGBLfc1RXh8DAE67zwCAU969F1++vuYyqPwoT8Nz2FwKhN+jFD0Q/AGQTSLaLMP2tkUNXV25nAbHogAFKEABClCAAlEUYADAddcZAHAtXAr1k7fVVHuVciGglwHyHt75Xwpd5RooQIFRCPgAfgexly2Z0/XCKI6P5CEMALxN229anzhLVL8tKsdA+NicSH6FcNEUiKSADAN6rzHSdEBZ+7p6vmO5ZHcBAwBOW8sAgFPevRdftXHadD/w/wc68uQmfqIjMAhgpwDPQPU2o/Kr98/veCw6y+dKKUABClCAAhSgQG4FGABw7c0AgGvhYq+/etPMquHh4b8Rq1+AYCYAU+xr4vwpQAEKjFpAEQhwp8TsRxad0vX8qM+L0IEMAOyl2cs2JM4Wi58AODBC+4FLpQAFKPCKgCKAwbNQuzTY2rWOrwMozY3BAIDTvjIA4JR378WTSXixmYn3ArhZgao8TYPD5ksgfCqARS8EnYA8INYm4aXvWDynb2e+psRxKUABClCAAhSgQCkKMADguqsMALgWLub612xCvC5Vc6lY+YYCdcW8Fs6dAhSgQAYCPqAtxtMPMwTwVkUGAPaws3jxP4MvN55KAQqUkoAKsE2BJUvmdmwspYVxLa8IMADgdCcwAOCU9+2LJzdMTsQQ+5JafDKP0+DQ+RcIHwk3BEWvCloE9vpy1ZZz53V35n9qnAEFKEABClCAAhQobgEGAFz3jwEA18LFXH/ZhsSHxeLfAUwo5nVw7hSgAAWyIOBDtcXEGAJ4syUDAG8SCR/7b3Tkzv93ZGHjsQQFKECBohcQoEfEnrpoTteDRb8YLmA3AQYAnG4IBgCc8u67+M0bao4JVG6A4uh9H80jIiTQptD1UPlVajh2y1+dvnPkyQAi0AgZcKkUoAAFKEABClAgYwEGADIm3EcBBgBcCxdlfYUsW197iUB/XpTz56QpQAEKuBEIoGg2vv3ooga+DuA1YgYAXpUIH5szLV1zhrXyPSiOcLMHWZUCFKBA0Qp0wOr5wbzOjY2CoGhXwYnvJsAAgNMNwQCAU959F1+zBuVDkxIfUJEfA1q+7zN4RAQFBlXxgIiuVStrzWD8gcGqofTkygnDW7E1/bET4DMYEMFdwSVTgAIUoAAFKDAqAQYARsWUwUEMAGSAV5KnrlnzzvL+yR0fNIqrIfBKcpFcFAUoQIHxC/gCXQP1P/Pw3N6nm8JXREb8wwDAH2/1v7b5oIrJZd2ni8rXFTgu4nuCy6cABSiwZwHFS8YLLk1Xd7c0HoUUmYpfgAEApz1kAMAp7+iKL2+pPkQkdoVCLwIQG91ZPCrCAr0AHoVggyrusWqegSfdlbCDEvgDA35ZGrt2DTY2MggX4T3CpVOAAhSgAAUo8KoAAwCutwIDAK6Fi6l+snnqRC/uf0Ag31FgcjHNnXOlAAUokEOBtChuNnE0pV7seDLqP7+JfADgmtUzq2rrUqdLYP8FwJ/ncCNyKApQgALFJqACPAXFP/nbOm6L+jfQYmvenubLAIDTLjIA4JR39MWXt9SeoaLfF+CY0Z/FIykwIjCkwDZRPCWCRyzMTiieEON3w8T6BDrop/wh+LFUPBH0928ztn9ax+DSeqTpRwEKUIACFKAABUpdgAEA1x1mAMC1cLHUX9k8ZYot8/5aoF9WxfRimTfnSQEKUCBPAmEIYJnx9FvVw52PNzTAz9M88j5spAMA4WP/6wZrT4Xo1wCcnPducAIUoAAFCl8gfHTOvcbIx9Nb2u9jCKDwG/Z2M2QAwGn/GABwyjv64qta6yalNfgHEfkMgMToz+SRFNizgCqGIHjBiG4HZKcquhXYqlaGjdEdAPrCM1XgG0WPwuzxL5uBBukYtDcmu//6kGpvzJQNvXF0SQ2nFjV0dbEnFKAABShAAQpQoFAEGABw3QkGAFwLF0P95IZZlZ7tvwSQLwI4oBjmzDlSgAIUyLeAAmkDTRqDbz843Pl4U0RDAJENADQ3I9ZRVns8NLzzX87L94bk+BSgAAWKRkBlGKK3i+Dr/ssd9zAEUDSde8tEGQBw2jsGAJzyjq34qg1T3+kHwdcgsgjQ8rGdzaMpMG6B8HU52xWyx9fmCHQAQBgg2O2JAfLKOb2AvmFgGYDg5TfPRKC7oLvXt5B0THXnuGfNEylAAQqMQUAVvX4cPa+d4g94/n5eVXdDw/O7BZnGUJKHUoACRSLAAIDrRjEA4Fq40OuvXj2zKjVl+GwxeoUqn2hX6P3i/ChAgcISeC0EAMGV/sudj0fxGkYkAwBJhRdvrT5OxfyLQhYAiBfW1uRsKEABChS2gAJDAtzuGXwztaXj7ih+Ay3sDo1udgwAjM5pnEcxADBOOFen3dRa8z4D+Q6Ao12NwboUyIPAdgDDu40rkhJgax7mwiEpQIEICoRPQQHwhieUaFqBTmMQhpxgw6ekKHo8QTDC48sLYsRao/3GxHelNZ2uLCvvPK9+68jx/FCAAsUjwACA614xAOBauJDrhxf/0zXD56jq5RAcD8Ar5PlybhSgAAUKVCAt0F968C5fOLctcj8niVwAQBXyq7trjgl8+aYCZwOIFejG5LQoQAEKFLrAIERuFRs0LZ7X9VChT5bze6sAAwBOdwUDAE55x1781oemT+jrTX9KgI8rUDf2CjyDAhSgAAUoQIFxCPQC6A+zAK+eG/7gTSEYhEoXRMOnoPRAtQ+QXaraASPbxUp32uLlsorUzsUn9baPY1yeQgEKOBZgAMAxMBgAcC1cqPWTm1HmddWc+cd3ijUBvPhfqH3ivChAgaIRGFDFTz3ffiVqr1aMXABgxe8n1WpF2bWAvo8X/4vmC5QTpQAFClegH4JkPBZ87fyTup8r3GlyZnsSYADA6b5gAMAp7/iKr95Qu/+wxY9E9H1QlI2vCs+iAAUoQAEKUCDbAgpYA/QpMABFr8rIE8fCpwv0QdALyHNqdauBPmM8vNAf2C0fmNfdme15sB4FKDB6AQYARm81viMZABifW3GfpQpzc0ttvTW4EtD5vPO/uPvJ2VOAAgUj0KuQ68sryj8dpSePRSoAkGyeOtGUBT8RxRKAP/QtmC89ToQCFChqAQnv2AGScSNN581uf8v7iYt6cSU+eQYAnDaYAQCnvOMvfvNdtScFvl4LweEAIvVn4fGr8UwKUIACFKBAXgV0JAiA8KkBI4GA8L8HFNgq0CfFmCdsgCfbH2u/f+lShE8U4IcCFMiBAAMArpEZAHAtXGj1m5pgjn5vzdFi5HuAzAO0vNDmyPlQgAIUKGKBfkD/bcnczi8W8RrGNPVI/dBzWWtimUDO5TfPMe0RHkwBClBgNALhkwC+G1Pz/YVz28LHfPJTBAIMADhtEgMATnnHX7y5GbHOstrLrNVvimDC+CvxTApQgAIUoAAF8izgCzCokCFAh0ZeNSDyhFi72Yo8LGLvXjKn64U8z5HDU6BkBRgAcN1aBgBcCxda/VUbp033ff/nCpwuQLzQ5sf5UIACFCgBgS5RvXLxvM5vl8Ba9rmEyAQAlq9PfA0qn+HF/33uCR5AAQpQYFwCCgxB8fmDKjt+XF/PO2/GhZjjkxgAcArOAIBT3syKr1mD8oFJNdeKyEV8CkBmljybAhSgAAUoUFACigBQXyG+kTAcgJdVcY+IuRMWzUvmt20rqPlyMhQoYgEGAFw3jwEA18KFVD+5YVZlXPuvUZW/UiBWSHPjXChAAQqUmMBOhXz2grnt/1Ni63rLcqIQAJAVrYkmBT4N8C6vUt/QXB8FKFAAAoE9dcmpXesKYCacwj4EGABwukUYAHDKm3nxNRsTkwd9uR/QQzOvxgoUoAAFKEABChSFgOBxqP5e1but159424dOe344nLcIwtcM8EMBCoxBgAGAMWCN61AGAMbFVownKWRFa+23VPRzxTh9zpkCFKBAEQq8YAUfu3BOx++KcO6jnnJJBwCuuQbxumNqz4XVfwNwwKhVeCAFKEABCmQi0BsTe+75s7ta+IO0TBjdn8sAgFNjBgCc8man+E1rE7ONh/AP+3wVQHZIWYUCFKAABShQPAKKPgXWG6PNsPpb37MvDfVWDlectWOoUcInCfBDAQq8nQADAK73BwMAroULoX74irr2eO3fCfQ/CmE+nAMFKECBqAgo5AFAPrZkTtv9IrCluO6SDQBcswnxmsHE6R7wfQiOKMXmcU0UoAAFCljgRRH9i8VzOh8t4DlGfmoMADjdAgwAOOXNXvEVrYl/VuArACZmryorUYACFKAABShQZAK+AE9Z4FYRc7tB+olYynZvndTbvZSvNyuyVnK6uRJgAMC1NAMAroXzXX/k1XSTa04XyCrwsf/5bgfHpwAFoiYw8uow3OZZ/ezC+Z2PluKNjCUZAGhqgjnmjMSJgH4TKvMh8KK2d7leClCAAnkWUCjujZcFF51/UvdzeZ4Lh9+LAAMATrcGAwBOebNXfPWmmVWpocHvA3IpgLLsVWYlClCAAhSgAAWKVCAN4BlAmo3o7Wrt0355fMdja3btbGoqzbuDirRPnHaeBRgAcN0ABgBcC+ezfjIJLz6z5iyr8hMIZuVzLhybAhSgQFQFVDFkDG5Q2K8umdP1Qqk5lFwAoElh3rOx9jAN9GsCLFSm50ptz3I9FKBA0QjosAA3aVouX9LQsaVoph2hiTIA4LTZDAA45c1ecR1532L1wRDvagBnZq8yK1GAAhSgAAUoUOwCAhlW2Mcg5i4JbIsR81yg8uKS+W3bin1tnD8FMhVgACBTwX2dzwDAvoSK+deXNVfXS9z7ARSn8ObFYu4k504BChS7gAA9CvlRYId/0Di/b1exr+eN8y+5AECypeZAI/isQP6Gj3Itpa3KtVCAAkUq0CWQqyGxHyyes2Nnka6hZKfNAIDT1jIA4JQ3u8XD9y52ltXOV9UfAHhPdquzGgUoQAEKUIACJSIwBMXDKnK/Ub0HBk8MeNh88ckdPSWyPi6DAmMSYABgTFzjOJgBgHGgFcUpq1rrDgtgv6rAeQAqi2LSnCQFKECB0hZ4CaJXVnpy3YIS+rN9SQUAft1SXTMM78MQfBrAfqW9H7k6ClCAAsUhIMBWBb472IP/vngBfzhWSF1jAMBpNxgAcMqb/eK3PjR9Ql9v+iIBvqLAAdkfgRUpQAEKUIACFCgFgZH3gyp6FXgYgruher8GsXur+ne9uGABhkthjVwDBUYjwADAaJQyOYYBgEz0CvXc5Iba/T1rPweRS6CoLtR5cl4UoAAFIiiwGTBfqOyZcuuCBU+XxJ/pSyYAcG3zQRWT4j3nC/QbgLwzgpuTS6YABShQmAICC8VjEFyRSHXc3NAAvzAnGr1ZMQDgtOcMADjldVM8uW7iVM8r+7gqPi7AZDejsCoFKEABClCAAiUkEP7d5mUAmwHcZ62s1cDc3diwq6+E1silUGCPAgwAuN4YDAC4Fs51/VWtdZPSYj8qOnLz4sxcj8/xKDAKgTQEO9TKYHisEfuyQvr/dJ4EUNulIu17qyXAu3f7NYUHg4RaqQn/fxENb9ydOIq58BAK5F5A0Wpg/im9re3BxkYEuZ9AdkcsiQBAMgnPm5n4c6j8CKJ/ll0iVqNA1gXSALZD8PpjAlUxaIBnRzHSFAVmvOHdUAaK6QASoziXh1AgbwIKpAVogdUvL5nfuT5vE+HAuwkwAOB0QzAA4JTXXfGVzVMO0rhpUuADAGLuRmJlClCAAhSgAAVKSkDQDYsXxMjD1mqz7fdvbjynp6Ok1sjFUOANAgwAuN4ODAC4Fs5l/ZHXzsUSiyBoUsHhUJhcjs+xKPC6gGBz+CQjUTyvIp0K3Q5IB0S3IZDAi6HXqgmvX8Ag3aPGe/1OaKtQ0WAwCCoG9iYai6fr3vhrNlAjIlWAGXndhVh/sjVSjkAr4Zl3QNUzwFEKrYDIoQCqoZjFjlEgLwKKAAY3ez4++f5TO7YA0LzMI0uDlkIAQFbeNeUd1jdXQ3AGAC9LNixDgbELKDph8LLoyCPPt4qi2xp51qikFP5WBOgSI1bi3mCAYOQb6cjHl0DE7vMOAfXjZbG4X+GbP/5xMfwmnFYxMa8iSAXlAi9mjZ0OY6YKdCoUMwCdBpiZAp2pTJaOvZ88I6sCqhiC6DKj3tcWz2t7KqvFWWxcAgwAjItttCcxADBaqQI7rqkJ5tgzp7zHqvk6gLMZAiiwBnE6FKAABShAgUIXEKSg2KWKLaL6q0CxuvHUzkcKfdqcHwXGKsAAwFjFxno8AwBjFSvk42/ekJgdWHwHipPfcGNXIU+ZcytugfC6wzYATwJ4QUSetgGeNAg6bZl02pT4FaJ9Q+WxFIw/iNSEVOPsLSN3/efqE97Ui5qaif0xlcllqIZVT+NmInyvzBgbhghm2kAPMYJ3hMEAVTkeYUiAHwq4FxgUxVV+ouPyxqOQcj+cuxGKPgCwZg3KhyYn/k0Fl0JR5o6KlSmwm0AvBA9A9SXAbFboM9bK8+Ux0+FrOo3yWKqsdzjdEzPB5MoJw4MpozhlS6pR3D02RBVy002IVx4yM+b5Q7EhScf9gYp4mQniQ7GgLCaxuLF6gLU4yAgOV6OHqJqjBXogwK8d7u+cCQxY4MqUBv/5gXndnTkblQPtUYABAKcbgwEAp7xui4d3Z7SXJ04Xi28DONbtaKxOAQpQgAIUoEDJCoRPBVBpg+BWq/bGC+d2tpTsWrmwyAkwAOC65QwAuBbOVf1f3V19cDplrlCRiwSI52pcjhMhAUUXDB5Wxd1G5VELPCnwd6UkPlQeHx72ByqGp2LXULG8lrVJYd5x50Fl0yt7yvpSqXKvrKxc0qZKxd9frXeUiB4Dg9lQHB2hLnOpuRXoVaNLL5jd+cvcDpvd0Yo+ALCsJfEJEXyHFzCzuzFY7U8CqugXI5tFda3CPCgSPOxLsLXclqW7+z1bF0zyKyufDk47DYFIYT8SJEzWHXIIzLOpWTEMD3txpGNeldb4fuxgDWw9RP4cIscp9BAJn/LDDwXcCHQK9B8rejqXLViA1x8j5WYoVn07AQYAnO4PBgCc8rovHoYAOmK1f6WiXxcgDMvxQwEKUIACFKAABcYnMPJUAOkWaIsY+XH51PbWBe/i34XGh8mzCkWAAQDXnWAAwLVwLuqvfGDKFNtnPgGDL/DmxVyIR2UM2QnYjQK5E8be7/fYR8onlqWHTYXfWbbF/9gJ8Av9OsV4OqUKc9NjiFUOzowNYjBeMYjqtMqJKnqaiJwG4F28TjgeWZ6zJ4HwuiAEJ10wt2NzsQoVdQBg5fopx1k1DxQrPuddOAICqApUFeGz9bcL0GoNNnhq16Zf7nqssbG4H/UxVunkbTXVUm5Oi3n2dKtyIoD68BU9b/hnrCV5PAXeLPB8IHZR45yuB0mTPwEGAJzaMwDglDd3xVe01nxGIZcDqMndqByJAhSgAAUoQIESFkgJcKcHc2VHuu2uD52G4VL8IX0J949Le1WAAQDXW4EBANfCrutfswnxaakpf2GtuR5AlevxWL8kBRThDYeKYQEeVMhqCH7fk2p/5NIGDJXkijNY1PKNiVnwdb5CzhQdeV34fhAYGbn488orlfmhwBgFnjJpe9Kihq6uMZ5XEIcX7aZfvaF2/5TFWkAPLQhJTqLYBBSqKUCGYNCrVjaJ6FoNvLVVM3c9xiT+7u1cszExeSBtThVjT4WGaTo9SBUVIijnu5GLbesX0nz1V4jJPyw5uWNLIc0qSnNhAMBptxkAcMqb2+LLWhI/E8FF/KFNbt05GgUoQAEKUCACAneJJ/8KO9xak+rrKJZH80agL1ziKAQYABgFUkaHMACQEV+eTw4vNq7cWHu4DfQWAQ7O83Q4fDEJqA6PXLMAegFsNKqrKqu828+pb9tWTMsohLkm19We6Hl6HhTzBTjSKip5PaMQOlNUcwgU+svadPVHGxqeL7rQTVEGAFY2T5liY+YnKljCx5QX1RdLXicrgK9A36vfPLcCek/4Hj5B+t7Fc/p25nVyRTT4mjUoH6queResea+Kht88j1BgigIJASqKaCmcagEIKPBVm/a+29iwK/za5CfHAgwAOAVnAMApb26L/+LW6RMmTPSvgtW/hsDL7egcjQIUoAAFKECB0hfQZmP0360xm94R69hRX4906a+ZKyx2AQYAXHeQAQDXwi7r3/D7adMrKtPXqMpCl+OwdskIDAjQpYJutbhNjP6O1yyy19vw1QErW+veaaHniOB0wB4JSA0Ek6GIZ28kVipFAQF6xODL6f/P3p3Ax1WW+wP/PefMZOmSJpMUSilQFITLIlsvS5aWAAJWoDQJIyhUcGORTVFkE4ILOyKKCyDiBnJDk1KLVUQMNEkpWGW/igVlKWBpMkm3bDPnfS5T0MvWNjNz3pkzM7/5fO7n///cnvd5n/f7ntuSzO+8Z1Lsh9Hd8+uk8LwLALQtnVbumqEvQvVCCCYU4g3FNfkooPAgWAPgNaj8A4JljoNH4iv7uortWH8fVd9Rqq2ravuQ4+xjjH7McbCHKqYAG/+n3NacrFs4AgIMquBTzXWx+YWzqvxZCQMAVveKAQCrvNkv3tEzYSug5E4oZikQyn4HnJECFKAABShAgUIXEOD3Cvwk5CT+PDJp7Uv59kvGQt8fru+dAgwA2L4jGACwLWyrfmcnQjE3cikcfM3WHKxbEAKjAFYBeAXQP0GdzlIkHjyqYU1/QawuoItI/t9nX/nkHR1jDlejhwLYGcBUCCqhcALaNtvKvcALriufG325rzMahZf7dsbWQV4FANoUbmhp5VGqzvcAbDe2JfKqIhRQJJ/0F31OVFYo5HEYs2TDUMnj845YtaEIPbK25F9110wtEVMLlVmq+l8iMh3QbcGTAbK2B/k4kUKeBbS5pT72TD72n889MwBgdfcYALDKm5vi7T2VO0Cd7wM4gq/Ayc0ecFYKUIACFKBAEQjEAf2dKn4lji71XhlYmU+/aCyC/eES3xJgAMD2rcAAgG1hW/Xnd1fNFkjyQRc+HGULOX/reqoSE9HnoPibQB7UsP7Reyn2Gv+tz/6mdj4zeUL/gLenqhwsYg5QlV0AJF85zlMBsr8dQZ8xIUAnXDmn6aC+vwa92X/3l1cBgPae6v9W1esd4CA+eZUvt1iW+xSsgMHTEDwGmG5nPB6bu8/AQJa7KPrpbl6OcM3QpO2MOvs7rswQYG812B3AZB6dXPS3x/sDqCzySp3PR/df/S8KZU+AAQCr1gwAWOXNXfGF3TW7eNAfKfTg3HXBmSlAAQpQgAIUKHABhWIVBL8To/eFQ07X0bV9rxT4mrm8PBNgAMD2hjEAYFvYRv35D1XuIyHnDij+y0Z91sxbgeQTwysAPKGKh1043XG37H+jtSuH8nZFBdb4wmXjt/a88IFQpw6Q/1ZgN0C3KrBlcjkZCCRf0wHgxxiOX9V02Lq+DEplbWjeBADallZv6xptVcUJIhifNSFOlA8C6wA8AuijauQvRr2/RGet+Wc+NF4MPd7eibLxJZW7hoyzjwIHqOgBAtkT4DuUi2H/U1ijB5Ury9f1fXP2bIykMI6XZiDAAEAGeFseygDAlo3y8orkiVThh6sPNqqXQjEzLxfBpilAAQpQgAIUyAsBBYwAK0Vxn4GzaATx7k/yaOC82LtiaJIBANu7zACAbWG/6y/qnFgzGgrdCkeO4VHifuvmaT2VEYhZCnX+BPF6XM957NhZsZfzdDXF0rYsWFazrzHefjCyP4A6KHaC8FWQxXIDbGGd/4DIN9aO9t11SiOGg26SFwGAtqXTyh0z9BmBXgAgeZw4PxQABCvUoEsED8M4fylf3/sMvzgM9o3RvqRmGziJXUVlfxVpeOP9hrUKVAW7a3aXNQHFShE5p6m+ryNrcxb5RAwAWL0BGACwypvb4m3PoMRdWz1TPFzMkwByuxecnQIUoAAFKFAkAsn3BK/YeCIA0J6ojP05ujuS/zt+KJAzAQYAbNMzAGBb2M/6ixejdLCi6myBXApggp+1WSv/BARYq8ADgN6ncP9s4vK3aOPq9fm3kuLtWBVOR1fN1nC9faGoA3A41NkDoqXFq8KVAzAK9IirFzYf1N8TdJG8CAC0d9c0Qs1VcDCD6bmg31LW+0tA8QwcLBLFkhEPf3vWxF5rbUTC+sycwDeBZKgnFB+a7gk+5Lg6B0AjFNN9m4CF8lNA4Ylolwv3tDn1vc/m5yLyq2sGAKzuFwMAVnlzX3zxip1Kh3r7GxgCyP1esAMKUIACFKBAEQmsA+TvIljghPXnx+7PpwiLaO8Dt1QGAGxvCQMAtoX9rH9Pd9VsA7lWBUodU08AACAASURBVLvy+ws/ZfOu1msAfiMOfg/PeSLxWu/z0SiSx//zk6cCra1wdju8ojKM8E6eMbMcOLMVmjwZYFyeLoltZy4wBMhPXU+vDPqJHoEPAMxfNnlnSZjLALQATNdkfm/maQXBKBSPKeSX4srS0kT8n4OvrVnLf0DzdD/fartV4ez2cPU2rjofhJojBTrnzffr8FPEAoNQ+enaRN95+XCMTr7vEwMAVneQAQCrvMEo/u8QAIx+ja8DCMaesAsKUIACFKBAUQgI+kTxvxDc3lQXu70o1sxFBk6AAQDbW8IAgG1hv+q391TuoMa9SUSPABD2qy7r5JXAS4D+2gCLE3CfmBLvfb2RDyzm1QaOpdlfLotUjBNnionrQSI4BUbrIXzN8VjsCvCamKheun6w5Kfzjli1IajrC3QAoK1z8gQ35J0KweUAxgcVkX1ZFBAYKP6qghvjCfxuwviyvqP2e3VIBGpxVpbOskBbG1x8oGqCMyzTkiEAQD4LYMcst8HpgiPwolFcflwDf5Fle0sYALAqzACAVd7gFE++DiC8pnq2Z/TrbxzJu2dwOmMnFKAABShAAQoUuIARIKaQhz0ndHG0dtVTBb5eLi9gAgwA2N4QBgBsC/tRf/EKlA6/XvU1VfkCgEo/arJGXgn0CXC7Gu9XXkhfmDyydi2/+M+r/Uur2ds7p5eNL11X7UBmwuiXBDojrUIclO8CTzuOfGZubd+jQV1IoAMA9yyN1HpGfgboTkEFZF8WBQRLjbrfHB/yel4OxYZOnYG4xdlYOgACqpDf/hYl68snV7nhxBxR+aIKdgbgBKA9tpAtgWTwB9IFT77UPLP3L9mathjnYQDA6q4zAGCVN1jFOzsRioUjJwP4GoDtg9Udu6EABShAAQpQoMAFPAFeFcGNoVjZD48++tXBAl8vlxcQAQYAbG8EAwC2hf2o395T9TGBXAlgj+TvNf2oyRr5IKAjAvzYhfu9iviEFw8++IURPrCYD/vmb4/J3wUNlUfGDcadj0HM+QLs7e8MrBZwASOKn42Ic8kJ9b2vBrHXwP6j1L4sMg1xXAvB8UGEY0/WBBQifzJGvtFS3/sb/sNpzTkvCm88BcQ1p0D0Agi2Afgf0nmxcT40qUDcgd4icb1kbuPAgA8lWeJ9BBgAsHpbMABglTeYxduW1MxyHfN9ALsHs0N2RQEKUIACFKBAoQoIkFBgqXFwYctBsYf5+5RC3engrIsBANt7wQCAbeFM6yeP/odxroMkX13MT6ELJP9dVUXyu4uHBObsprr+pwt9zVzf2AXue2Lr8WvXxqMiOE/efMVxYL97HfuqeOVYBETNp8rWDfzP7NkYGcv12bwmkDdhZ+f0sv7wmpMV8sNsYnCu3AgIoAoMK/CSiPzEGfVu4Rd+udmLoM66sLtmYiKZolOcpqoTIVIa1F7Zl68CLxjoJfpq/13RKDxfK7PYRgEGAKzeCAwAWOUNbvH27ppGqPk+BLvyB77g7hM7owAFKEABChSwwL8A/ABx3O4dHHstKvxZqoD3OqdLYwDANj8DALaFM6n/8/u2Hj9+fOIcgV6gwMRManFswAXefEVx8nSdh6FyTXND3x8C3jHby6FA+5KabdQxpwkwD8BUACU5bIdTZ0FAFf804nw0Wt/7dyBYry4PXAAgeVRO+5LKveE69wiPUM3C7ZnTKRTAoAArVXB3iciPjq7teyWnHXHyQAu0La3YKazu2QZyDIxMgSiDAIHeMR+aU1kkjrlobm3/M3yCxQfPd5VgAMB/07dVZADAKm+wiydDAAJzk76Z+uaHAhSgAAUoQAEKZFtgVBUPOIIbXDjLjqnrXc+fp7K9BYU/HwMAtveYAQDbwunWb+1EaI/SyKGOwVXKI7/TZcyHccmHFtcJ8Kyq/Gw4rL848cDY2nxonD3mXqCjq3IvFecsAIe9FQQI574rdmBNQOXOkMhpc+p711mbI43CgQsA3Nk5saY0FL4FgrlprIdD8kVAMCqKf6rqA47r/Gy7kr7HZsxAPF/aZ5+5E2h7BiWhvsqD4LqfVdV6ANMAhHLXEWe2LDAKxTXehsQN0SPXxizPVXTlGQCwuuUMAFjlDX7xjScBwHyPrwMI/l6xQwpQgAIUoEABC7yo0O8buL8+rq53hSSfYuSHAj4JMADgE+QmyzAAYFs43foLHq6cbjz3m4B+Mt0aHBdsAVUMO4IVgC4ycecXZnXfCp5OGuw9C2J3ixejdLiy6iPGc04Vwf6ATuZJkUHcKX96Eleamw7q6/Cnmj9VAhcAWNBTdbpR+YE/y2OVAAokn/pfJcAShbkjUhX+Y+Puq9cHsE+2FHCBxcsiFYMJHAmVk0RwAESroXAC3jbbS0/gRVU9q6+8/3enMiiUnuAmRjEA4Cvnu4sxAGCVNz+Kt/dMngnjXQ1gBoRhtfzYNXZJAQpQgAIUKDABlREV8ztjcCv+1X9/NIrRAlshl5MjAQYAbMMzAGBbOJ36i5ZPHZcYHTrReHI9BBPSqcExgRZIvoL0VQj+4Cl+BWdcd7R25VCgO2ZzgRdo6xw/xSkt/bgYtAA4AABPAwj8rqXeoEKeTagcc3zDxlcBBOITqADAwmVVH04kZAGADwRCh034LZD8IbMbIu0Y1V83N8ZW+j0B6xWfwPyHJu/sOIkmFZmjwD4ClBWfQhGsWHC3A+/CY2vX/INHV/q33wwA+Gf5PpUYALDKmz/FFyyt3t8YPR/AMfwhL3/2jZ1SgAIUoAAFCk1AgX8K8N3RuLnnhMaBFwptfVxP9gUYALBtzgCAbeFU67e2wtnryJp9TNy7BSL7pjqe1wdeYAiCJVBdsGFDyYJ5R6x6PfAds8G8EljQVbOfBzNPHHwUip3zqnk2OyYBgf48UdX/uejuwQjcBiYAkDwOY7AicocAzWOS5EV5JaDQ5xxgvqg7f25D75/zqnk2G3iBtqXTykNYv796ztEiiOqbrwUIzN9vgQfMjwY3iMhF4dLSHx8949XB/Gg5+F0yAGB1jxgAsMqbP8WTvyTa+8jIriaOS1Q2hgDG50/37JQCFKAABShAgYISUBmBgzZR/UWiKvZQUH45WVDGRbQYBgBsbzYDALaFU62/oLOyUkucy1VxdqpjeX3gBV6C6q/U1f+ZXjLwNF9VHPj9ytsGk99jhM3g0QaIAjgC4EkiebuZ79/4OjHmpKaZAwuDsK7AfEE2vyvy6WQSGcJfigbhxvCrB4GMKPQeI+ZXI67TeeKBsbV+1WYdCrxb4M7OqTVlJUOHQWWeAh+lUMEJ/E1Ej5tb2/8MTwHwZ28ZAPDHcRNVGACwyptfxdva4JZOrdnJE/N5KE5RoCq/VsBuKUABClCAAhQoIAEPgr8o9HYnlGhrOmBdXwGtjUvJogADALaxGQCwLZxK/eTPdO421ceI6C0K1KQyltcGXuA3InKrjPMemrvPwEDgu2WDeS/w/78j0hZVPQHA7nm/KC7g3wIqQE9C9ZPRhv6Xcs0SiADAXT1bfTCkifkC7MWndnN9S/g5vz4Pg1tUQwvMqtX/iEaRfIcOPxSwKtDZiVBfOLKLCI6E4hwA21mdkMWzK+DgtrUjFWee0vjCcHYnLszZGACwuq8MAFjlzb/iqpCFSyLTPFdOg+CzUN0q/1bBjilAAQpQgAIUKBCBZAjgNVW51xHz/aa6/qcLZF1cRhYFGACwjc0AgG3hVOq3LZkw2XVKfgPgv1MZx2sDLfCqI/LDuKcd0Zmx/w10p2yu4ASSvyO658HKSV5YagXyabz5MOO4gltocS5oUIHvt9THkq8DzeknEAGA+d3VNwH6Gb67O6f3gn+TC0bV6GJ15IcjLpadeEBsHQTq3wSsRIEtC7R1Tp4QCiX2VuA8iBy75RG8Ik8E1qnBcS0zY/flSb+BbpMBAKvbwwCAVd78LJ78Ae/urik1joyeJA7OhmKH/FwJu6YABShAAQpQoBAEVLEBgh4X+p3Xy/r/cOoMxAthXVxDdgQYALDtzACAbeFU6rd3V10IyDcAuKmM47WBFfidAN9OlOmj0Rn9awLbJRsreIHlyxF+YcPk6Y7rJU8C+KzyYcZC2PPkd6ErjIezjpsV+30uF5TzAED7Q5XHwHVuEMGOyV+K5hKDc/si8Aqg3x/15JdTTOy1xkYkfKnKIhRIQyD53uXdDq2a5jo4HioXgEcup6EYwCEqfwmJHDynvnddALvLq5YYALC6XQwAWOXN7+LJkJq4iaMckUsh+K/8Xg27pwAFKEABClAgzwWSX/o/K4obBtdh/omz+erGPN/PrLXPAIBtagYAbAuPtf78pRN3FRN+GEDlWMfwuoAKKJJf9v9Y4NySqO99Pio8sTigO1VUbSW/F73jkcjEsoTWC+Rrb500wrBRHt8FyVejQ3VBCbwzjmpY05+rpeT0C/eORyZWIx6+VYGjAIRzhcB5fRBQJI+PewxwvlG+tve+2bMx4kNVlqCAHwKyaPnU8vjQ8EwVXAKgzo+irJFTAaNGL2iZ2X9tTrsogMkZALC6iQwAWOXN/+I334xwZLeaOkfMtQrsK4CT/6viCihAAQpQgAIUyEsBgYFiQCG3OBK6oalu1et5uQ42nVUBBgBsczMAYFt4rPXbu6sXAnrMWK/ndcEUUOhzgH4zjFDHMXW964UnFgdzo4q4qzaF63ZP2gFOqBWqLQDKi5gj75euwEsO5NKm+r6f5WoxuQwASHt3JPl+7gsB8B2ouboD/Jl3SIFFrmu+OveggRf8KckqFPBfoL1r6w+oxi8VBx8HUOb/DKyYRYHRcJnufMyM/peyOGfBTcUAgNUtZQDAKm/hFF/QM+mDqqEfK7QeQKhwVsaVUIACFKAABSiQjwICdCQcOTta2/dKPvbPnrMnwACAbWsGAGwLj6X+3d1VH3UgC/nw4li0AnuNCtCtwPnN9bFlge2SjVHgbQIdXdVfMNCrRTCeMPkroMDvjeN+IVq7+rlcrCJnAYD53ZHdBfJdQA/JxcI5py8CyXdZrAZw04QN4W8fccSqDb5UZREKWBRoW141KTTinKmqpwKYynd3WcS2W9oA+qvesv5T+J7K9KEZAEjfbgwjGQAYAxIveVMg+UoAJ2xuSia8+cMd7woKUIACFKAABXIvIM87Kh9/vbz3Sf68lfvdCGoHDADY3hkGAGwLb6l+x30TtsL40sUK3Rfgq4u35BXAP09+d9EPxd0hcb4+p7731QD2yJYosEmBtiXV+7uOuQOQ6XxgJF9vFFmt0Cur47Hv5eJ16TkJANzeOb1sUnjt+QY4T4CKfN264u5bhgH8VWEuaanvX1zcFlx9PgrMX1p9rKN6vhrZF6Kl+biGou9Z0CcGJzY1xH5X9BZpAjAAkCbc2IYxADA2J171NoH2nqrzYeRMFWzLVwLw1qAABShAAQpQIMcCqwTmDInjj3MbBwZy3AunD6AAAwC2N4UBANvCm6vfqnD26K46X0QuBjAhl71w7jQEkq+2AZ4XxQ8TzrgfRWtXDqVRhUMokHOBBZ2VlSbs/kygByu/S835fqTVgGCJABfMrY0ty/arR7IeAGhthbPnYTWzAHMlgAPSAuOgXAv0A/Jb0dHLmxrW/T3XzXB+CqQr0PZQ1Z4hRy5R4HAIKtOtw3E5E0gIcH/CSZwYrV0by1kXeTwxAwBWN48BAKu8hVv8zV+k4nIAe/N9b4W7z1wZBShAAQpQIB8EVLHBEVyvIdzafGBsZT70zB6zJ8AAgG1rBgBsC2+u/sLuml08mLsU2ItP/+dyJ9KaOwHgzyJyZVNdX/L1DfxQIK8FkqdGhsKJixVyAoAd8noxxdn8oIjeUGLM9Uc1rOnPJkHWAwBtSyZMdp2Si6A4E8L3nGZzs32a6wURvSPhxW+MzlyfPP6fHwrktcDC7pqpCegXFPopAbbN68UUZ/OvQ/VrzQ39txTn8jNbNQMAmfltYTQDAFZ5C7e4KpxfP1y5V8LIuYAcCWCrwl0tV0YBClCAAhSgQPAFdAQqP/MUN0Znxv43+P2yw2wJMABgW5oBANvCm6q/eAVKh1ZFrgLwWT79n6tdSHveQQD3OeJ+fW7d6sfTrsKBFAiYwH1PbD1+3bpEi4g5Byof5muNA7ZBW27nCWPkvGf+2NfZ2rrxhJKsfLIaAOjsRChWUnWEGrlGBLtlZYWcxBcBARIKPKPQH4Xh3jGnvnedL4VZhAIBEOjsnF4WC62ZB8FpgOwTgJbYwlgFFB6ATsfxTptbt+b5sQ7jdW8KMABg9U5gAMAqb2EXV4UsXBKZlnBknoieAMWuELiFvWqujgIUoAAFKECBAAsMKfBb8cyNETOwNBfvMA2wTdG2xgCA7a1nAMC28KbqL3i45mDjmZsA7J6rHjhv6gIC9EPxc8fg+mNnxV5OvQJHUCDYAslw0uBrkYPFwZchqIViXLA7ZndvE4grcFM4FLp6zoGvr8qWTFYDAPc8FNnOc3EpgJMBPv2frU3OdJ63vvx/UI18f40jD3yGX/5nSsrxQRRQSEd35AgDfFkEhwaxRfa0SYE+QK7vfabvulNPRZxOYxdgAGDsVmlcyQBAGmgc8k6BtuVVk5xhOULefPKkDuAPd7xHKEABClCAAhTIkYBgFIplCr26Oj7pj42NLwznqBNOGxABBgBsbwQDALaF369+29KKiGtCVytwogBlueiBc6YjoM8J5Bcl6n0v20dsp9Mtx1AgXYHlyxF+cTiyH4BzAcwGMDHdWhyXXQEBXjbQ00xd/31R2fhQo/VP1gIAG5/+D1fOBpybAUyxvjJO4IvAW+97u8+Bfqdkbf+js2djxJfCLEKBAAq0diK0d1n1fsYzZyjkeAAlAWyTLb1bQGCgeFCNfrFlZv+TBBq7AAMAY7dK40oGANJA45D3CtzeibKKcGRvqJ4EkRa+EoB3CQUoQAEKUIACORQYBfCkI3pjfDR0T7Rx9foc9sKpcyzAAIDtDWAAwLbw+9Vv7645RmCuVPD04lz4pzOnCJ4G8O0S491zVMOaAQCaTh2OoUC+CLS1wXWmRnYVyBcA/TiASL70zj5xcygUuixbpwBkLQDQ3hmZhhJcC0XySzV+8kNgEJB7PM9cNdn0/5VHvOXHprHLzAQ2/gM6uXpnJ2zOVMgJ/Ac0M88sjo6JyLfDpaU3HD3j1eT7vvgZgwADAGNASv8SBgDSt+PIdwkk/20q2ToyNRGSo8TouXCwExQOoShAAQpQgAIUoEAOBIwInk1+QbZufWnHvCNWbchBD5wyAAIMANjeBAYAbAu/u37bkimTXSd+ORSfhmhptufnfGkJLFFHbjAjzh8YSkvLj4PyWODXXVXbj4qc9caT5Z8BUJXHSymi1nW1A3yqMt5/fza+b81KAKDtGZQ4sZpmEZN8+p9HUuTB7fzWO3NuV8d896n7B15ubYXJg7bZIgV8EUh+0eJuH9lGE/icCM6EMkXnC6zdIgrBw67qBcfW93fZnapwqjMAYHUvGQCwylucxds6J09ww94eqmh963U1oeKU4KopQAEKUIACFMipwJunsK1U6E3G8W6L1q6N5bQfTp4TAQYAbLMzAGBb+N317+6ubnKAqwHdKdtzc740BBQ9xsHX149WLDmFr6VJA5BDCkFg4bKttvY87+OqehkfZMyPHVWRe0tLR085esa6XtsdZyUA0NGz9VaqibsAbbS9INb3RWA9BDcPG+9bn2xY0+9LRRahQJ4JqELu7ppQ4zolpwFyJqBb5dkSirHdUQiuKCktu5anAIxt+xkAGJtTmlcxAJAmHIdtXqC1Fc6eh9RsDcd8FoqvQBiu5T1DAQpQgAIUoEDOBAbeeEr2ypC6P5xT37suZ11w4pwIMABgm50BANvCb6/f3lO5A+C0QnESADebc3OulAUSqrgfkMtNpO+x6O5Ivp6GHwoUrcB9T2w9ft36xDyofluAsqKFyJuFy7ARHK+v9N0bjcKz2bb1AMDGJ2m3jcyFwV0Q/uNpczN9qj3qOLi6cqTiikYm53wiZZl8Fli8eKfS4Yq+U1TlYgim5fNaiqT3R2D0vOaZ/T1Fst6MlskAQEZ8WxrMAMCWhPjnGQksXozSwQlVu4jr3ArV/TMqxsEUoAAFKEABClAgfYFhCC4pXxO5afbs50bSL8OR+SbAAIDtHWMAwLbw2+sv6Ik0G5UfAjo5m/NyrhQFFJ4I7ofGz3myft1zrckTafihAAWwfDnCLw5HPgXgVnLkhcASzxl3ZLR25ZDNbq0HABYtnzpudGSkk7+YtLmN/tRWJI9w0xNbGvp/5U9FVqFA4Qh0dFV9QSGXQDClcFZVmCsR0QvCpeXf4ykAW95fBgC2bJTBFQwAZIDHoWMXaFs6rdzVwYtEcXbyVVsKWP/v+7F3xyspQAEKUIACFCgWARHcOrc2dprwy5hi2XIwAGB7qxkAsC387/ptXVXbuyKXAzg5W3NynrQEPKh2OyE9ee5BAy+kVYGDKFDgAgu6Ju1n4P4BgsoCX2reL88zzlHRmb2/sbkQ678gvLsrcpwjaLO5CNbOXECAtQrn9Ob63jszr8YKFChMgY6e6rNV9QIBpvALluDusQj+JJ6cObeh708QaHA7zX1nDABY3QMGAKzysvjbBW5ejnDNcE09YL4Owb6iKOe/U7xHKEABClCAAhTItoAAbWUhfG72gbG12Z6b82VfgAEA2+YMANgWTtZvVTi7d1fNdkR+DqAqG3NyjrQEEgI8HPK8Tx0za80/06rAQRQoAoHka407llY2wDh3QLAt+JBIcHdd5FGvsq/B5mtMrAYAku+eWL8+0QXVfYKrzM4A/EtUvvrkA32/bG3lsTm8IyiwOYH5XZFzRPBVANtQKrgC4uAriRH3R9HG1euD22XuO2MAwOoeMABglZfF309gYXfN1ISYzwP4BIxuD5FSSlGAAhSgAAUoQIHsCuidZSWh8z62/+p/ZXdezpZtAQYAbIszAGBbOFl/489Q8K4EZF425uMcaQkk35HdEw57Jx9zAL/8T0uQg4pKoLMToYGSyCHG4CY4+CAUTlEB5NNiBcc118Xm22rZagCgo6t6nor+zFbzrOuLwIsiuLxsq8ids3fmu9p8EWWRghdo76k+C6oXMgQQ4K0WfUyMnjK3fuBJ4SkAm9woBgCs3sMMAFjlZfFNCbx5GkBlPeCcKoKDVZF8hyV/2OMtQwEKUIACFKBAtgRGAb3Lietlcxt5RHO20HMxDwMAttUZALAt3NYGNzyt+mBjNPnlC4/Ltg2eRn0BEgrtCnvmM3zyPw1ADilagcWLUTo4sepwEbkSwO5FCxH0hSdPARg0h0c/0r/GRqvWAgB3dk6tKS0Z+T2f/rexbT7VFHnOqF6tcfcuPiXrkynLFI1Ae1fVGRBJngSwfdEsOs8WKqpnJtzxP4nWrhzKs9az1i4DAFapGQCwysviWxJoe3TyFGfE+7gALRDsDWDClsbwzylAAQpQgAIUoIBPAhve+GXz3Rpyr2g5cPUKn2qyTMAEGACwvSEMANgWXvBYZaVZ734LomfYnov10xJIALgv7Hln8cv/tPw4qMgFOjunl/WH1zQr5FsAdihyjqAuf1SBk1rqY202GrQWAJjfU306VG8UIGyjcdbMWOBFiFzjDZo7bKVLMu6QBSgQYIGN79Ppqfo8IOcD+ECAWy3a1gToCqmeeExD/0tFi7CFhTMAYPXOYADAKi+Lj1VgwdLq/Y2HZkCPhODDYx3H6yhAAQpQgAIUoEAmAgKs1WQIwJHrWmr7/pZJLY4NpgADALb3hQEAm8KtrXB2O6R6hutqOxTTbM7F2ukJCLDAOHIR/w1Jz4+jKJAU6HhkYrXGwycpcLYAO1IlcAJGVRdPrCg5/oi9ViUDtL5+rAQAFnVOrBkNh+8FsD8AK3P4qlB8xZLvYfuBSPjmprpVrxff8rliCvgjcHvn9LKJ4TUnC+QyAFP8qcoqPgqMquL06kTs542NSKaG+XmXAAMAVm8JBgCs8rJ4KgILu2smeo6pMx6OE8FhPL0mFT1eSwEKUIACFKBABgIDIvj5SALXnTAr9nIGdTg0gAIMANjeFAYAbAovXrxT6WBF/3UCPdPmPKydnoAIutTxzm06cM3jIjDpVeEoClAgKbBo+cSa0eHwiQDOATCdKoET6APMp5vrB37td2dWvpxf0FN1oqp8V4EqvxtmvcwERLAK0Nt0VH7Y3BhbmVk1jqYABdqWV01yhpwzIfolASIUCZiA6p83DJbMmneE/wm6gK00rXYYAEiLbayDGAAYqxSvy5pA+/KabXTE1Apwgig+okBF1ibnRBSgAAUoQAEKFKvAvyD4kTfq3hxtXJ18IIWfAhFgAMD2RjIAYFO4vadyB6j7KKBb2ZyHtdMSWGIE3xq/JvLQ7NnPjaRVgYMoQIF3CNzZObGmLBw+S6GnAzKZPIESiAP626GQnHTigbG1fnbmewBgQWdlpQk5d72R0jpUgZCfzbJWxgKDAO4MwblsTn3vqxlXYwEKUADJVwHc/eDkrd2QdxoEZ4EhgKDdFQmjOve4hv7kqTT8vEuAAQCrtwQDAFZ5WTxdAVU4d/fU7OzCO1ghnxTgAAAl6dbjOApQgAIUoAAFKDAGgddU5fuOE7qVJ1GOQStPLmEAwPZGMQBgU7i9J3IZFK0252DttASeEcila+ITF5/S+MJwWhU4iAIUeF+B9s7INAnhK+rgU1BMIlOgBF4Q4PNN9bH7/ezK/wBAT9WJRuUaANv42ShrZSagwLAoFqlxL26ZtXpFZtU4mgIUeLtAMgRwz7LKHYxxLgRwMpRfpATqDhEsba6L1QWqp4A0wwCA1Y1gAMAqL4tnKCCLlk8tHxke3lFUZ0GczwK6T4Y1OZwCFKAABShAAQpsTuB1QL7jOfGbo7VrY6TKfwEGAGzvIQMAtoTbHh0/xR0teZJPwdoSTreuPq8qV5iE2xZtXL0+3SocRwEKbFpgYXfN1ISYb0PlWEBLaRUMAVUMO4JfronHzjqlEb6F2BqN0QAAIABJREFUn3wNALS1TSsPbTN4mxG0CBAOBh27QPI9OQbL4JhPNNUOvCTyRr6RHwpQwFeB5BOV7UsqPiiO+zWIHA/+Heirb4bFEuLJEU2z+v6YYZ2CG84AgNUtZQDAKi+L+yGw8RSbh6eVlSQGdzQOPq7AZwBs60dt1qAABShAAQpQgALvEVD8S4CzV66L/frs2eCxznl+izAAYHsDGQCwJdzRVX22it5oqz7rpiUwAMi1JWWl3zl6xqvJU4z5oQAFLAm0PTRpR9cN3QboTACupWlYNmUB/TPEOb25ru9PKQ/dxABfAwAdXVVHqci1AHb1q0HWyVgg+WX/s6Lm+Ln1A0/yy/+MPVmAApsUSH6R0tETSR6lnPx7sJ5UwRFQkXtb6vqODk5HweiEAQCr+8AAgFVeFvdTIPnv129/i5KRSZOmKZzPKeQ0HgfnpzBrUYACFKAABSiQFBBAVaXXFXPy4/H+37c2IkGZ/BVgAMD23jEAYEN4YXfNxISaZyDYzkZ91kxdQIHkO69vNkP6rehH+tekXoEjKECBVASSvwNa0D1xZ0W4E4KpqYzltfYEVLFBIDc1N/Rd4NcsvgUAkjdNe0/kegFOA1DuV4Osk6GAYj0g85ob+hZkWInDKUCBMQq0L6n6GBy5GsDuYxzCy6wLyAjE26W5buBF61Pl0QQMAFjdLAYArPKyuE2BjUfCwbsQySCAwIHCsTkfa1OAAhSgAAUoUGQCivVq3H35isr83ncGAGzvHwMANoTbuyMfB/ALntxpQzetmgmB/kZDcmbzgbGVaVXgIApQIC2Bjp6qPVTlcZ4CkBaflUEKedB45uzorP6n/JjAtwBAR0/kIKO4QYDk06/8BENgWCFfaanvuykY7bALChSPwN1LKs9yHOcCAbbRjQ868JNjAc8RvfnY2v4zeRLK/+8EAwBW70oGAKzysng2BO55KLKdcfUihdMM6AQAZW8+vMcPBShAAQpQgAIUyExAIc+KJmY3N6z5R2aVODpXAgwA2JZnAMBv4ZuXI1wzHOkBMIM/1/itm3o9BYwolqtxT2uZtfqx1CtwBAUokKlAe3fNJwDzYz7UnamkX+NlNQTfaKrtu8mP7zB8+QVeZydCsVDkHAguBFDt11JZJxMBGYaanzQ39H8hkyocSwEKpCfQtnRauauD3xDF5xSoSK8KR/kroM95I87B0UP7XvG3bv5WYwDA6t4xAGCVl8WzJaAKZ8Gy6l3g6SkAjlTB9tCN/6758nNEttbBeShAAQpQgAIUCKCAyJ88wdxoLX9GC+DubLElBgC2SJThBQwAZAj4nuHtXdWHQfQufn/ht2xa9RSK5xwHZ86ti/0+rQocRAEKZCzQ1gbXnRq5DpDTAS3NuCALZC4g+ouycOj8j+2/+l+ZFvPlF3cLl1bslDChawDMzbQhjvdBQOFB8GuvTE+JzuB7c3wQZQkKpCXQtrR6W9fojQDmAAilVYSD/BRYp4rWlobYt/0sms+1GACwunsMAFjlZfFsCyR/KCydWrNTQs0JIjgEgg+pooZHxWV7JzgfBShAAQpQoHAEkk82KdBeXl5yxux9/7W6cFZWHCthAMD2PjMA4Kdw2zMocfojtziQ45VfcvlJm14tRa8qrmiZGbshvQIcRQEK+CWw4LHKSrPB+QmAY/g7Hr9U068jwLOqcuFTD/QtbG2FSb+SD0/utL7xVNBeS6s+YYxcCcG0TJrhWJ8EFEsF5oy59QNP+nFMhE9dsQwFilIg+S4dKH6qkP2KEiBAi954tBjQ7cTNnLmNAwMBai1nrTAAYJWeAQCrvCyeS4H2nsod1DjHCjBLgT1EMJ3v0MzljnBuClCAAhSgQF4LDAG4bli9Gz7ZsKY/r1dSZM0zAGB7wxkA8FO4o6tyLxWnDcCH/KzLWmkJxBW4yTjjLo7Wrkz+G8APBSiQQwFVyN1dkf9yHdwG4MActsKpkwKKBCDfHkbiqkz/2zjjEwA6erbeSs3oZRA5g7sTBAF93ijOjZX333fqDMSD0BF7oECxC3R0VR2lIpcUu0MQ1q/AKzChy1tmvv5kEPrJdQ8MAFjdAQYArPKyeBAE2h6dPMUd9uoh2gjI3pCN79IsCUJv7IECFKAABShAgfwREKDXqHxjOKw/PfHA2Nr86by4O2UAwPb+MwDgp3D7kuqL4OiXAVT5WZe1UhdQlXtF5fPNM3tfS300R1CAAjYEFi/eqXRoYv9siLkWkA/amIM1xy6QfIjRqHy5paHvkbGPeu+VGQcAFjxcc7DxTPKI6w9n0gjH+iIwIMDXXTg/nlPfu86XiixCAQr4InBPd1WDL4VYJDMBdUaNE/pnU92q1zMrVBijGQCwuo8MAFjlZfEgCSzsrpk46pk94aLWgTQodD8Btg1Sj+yFAhSgAAUoQIFAC7z5LmhXL3u9pH8+H2gJ9F79pzkGAGzvEwMAfgkv7K6ZmlDzEwgO4/HWfqmmV0cET5mE+6mWWasfS68CR1GAArYE7uiaVFUC5/OOyPkAIrbmYd0xCaxX6FfGbd1/++ydMTKmEe9zUUYBgPue2Hr82nXx0x3IN8F356S7B36Ni0NwO1x8o/nA2Eq/irIOBShAAQoUrgADAFb3lgEAq7wsHlSBtiWR3VwXu8HoDIjMfCskPD6o/bIvClCAAhSgAAUCIxAXYJnCXNZcP9AZmK7YyCYFGACwfXMwAOCX8N1Lqo53HLkCwI5+1WSdNAQUaxzo6cfW99/F1xan4cchFMiCwFuvfLxUBPMAhLIwJafYtMD/QL2LmhvW/CNdpIwCAB1dNR9S8ZJHQhyTbgMc54+AQB5MiF6EV2KPRqPw/KnKKhSgAAUoUMgCDABY3V0GAKzysniQBVpb4ex2eEWlmyiZDtHd1dGDRdEIxfYQuEHunb1RgAIUoAAFKJA7AQWGRbDojXfRXt5SH3smd51w5rEIMAAwFqVMrmEAIBO9f49t65w8wQ17NwB6EiClftRkjTQFBN/0BvW66Ef616RZgcMoQAHLAsnf53z40KpaiFypQL3l6Vh+8wKviTEnNM0ceChdqLQDAG1tcJ1tqmY7jvxSFRXpNsBxvgi8rIrWdYmKO09pfGHYl4osQgEKUIACBS/AAIDVLWYAwCovi+eLQNszKCntr6mJq24HVw+Ep4eJyCEAxuXLGtgnBShAAQpQgAJZFFCsV8GtYpxr+X7oLLqnMRUDAGmgpTSEAYCUuDZx8fzumhkC8x0AdX7UY420BX4n6pwzt753BZ/+T9uQAymQFYHbO6eXTQyt/YQILgbwgaxMykneT8AocLkbN9+d2zgwkA5R+gGApRUR14S/DOiF6UzMMb4JxAH9kbfea40euTbmW1UWogAFKECBghdgAMDqFjMAYJWXxfNN4I0n+eTeP08tN4nERC8+OsU4zqEwmC2CQ/NtLeyXAhSgAAUoQAG7AgL0GtFLjYz/abR25ZDd2Vg9XQEGANKVG+s4BgDGKrW56zp6Il9SxSUAqvyoxxrpCMjzjoNT4wf1PRgVnlycjiDHUCDbAr9bWhHZYEJXKPApAcqyPT/n+4/AIxpyT2o5cPWKdEzSDgDcsyyym5eQBYB+KJ2JOcYnAcV9mpBzWxr7/uZTRZahAAUoQIEiEWAAwOpGMwBglZfF81kgGQa4+26EhydtHZ4wztvWgzdXROYKcEA+r4u9U4ACFKAABSjgp4A8b1Q+e1xD74N+VmUt/wQYAPDP8v0rMQCQqfDiJRMmDzol1zrAvDeeokz7e5BM+yjy8cOOgwvGjQ//+Ii9Vm0ocgsunwL5JCALl1Z8MGFCt4OvAsjlvnmqOrc60f/bxkYkUm0krX/4kkd5hgcqP27U+XmqE/J6PwX0eYVc1FIfa/OzKmtRgAIUoEBxCDAAYHWfGQCwysvihSjQ9kD1tm5Yj4ODowXYR4EKCAQKpxDXyzVRgAIUoAAFKLAFAcFiTbjntsxK76kn+toVYADAri/AAECmwh1dVUdB5GoFdsu0FsenLpA86l8VHaLORU0NvX9PvQJHUIACuRZofyjycbi4BsD2ue6lWOcXwY2JQb0s+pH+NakapBUAuLNzYk1pOHwLgLmpTsjrfRPYoJCfGqf8KzwOzTdTFqIABShQVAIMAFjdbgYArPKyeKELtC+v2UaG9SCFfhTAIQAqVVEqglIAoUJfP9dHAQpQgAIUoMCbAqpylXHj10Zr+drLoN0TDADY3hEGADIRbmuD606pOg+OfANASSa1ODZ1geSX/0bxd8dxvtxU23tv6hU4ggIUCIrA/O7qHwj0ZADlQempuPqQ16GJg5ob1vwj1XWnEwCQ+d2R3RzgQQVqUp2Q1/siYAA84jnuvGjt6ud8qcgiFKAABShQdAIMAFjdcgYArPKyeDEJ3Hff1uPXjjf7ukgcaCAHCrALgIkCTFRgAoBwMXlwrRSgAAUoQIEiExhyxJz6eunAXafOQLzI1h7o5TIAYHt7GADIRHj+Q5N3Fsf7FgTHZVKHY9MTUGAtDK6fOCl8PY/+T8+QoygQFIH5S6t3FaN3Afgw+DqVnGyL6+gnR1f2/080Ci+VBlIOAHR2IhQLV38F0CtSmYjX+imgqwF8rbm+/2Y/q7IWBShAAQoUlwADAFb3mwEAq7wsXqwCqpB7H5xYnSgJ72tU9oPqhyGYBkX1xlMCBFUOUMp3fBbrHcJ1U4ACFKBAgQq87Ig5Zm7dwOMFur68XBYDALa3jQGAdIWTPzMs7Kn6qCfyHSh2TrcOx6UtkBDgfhFzEf/eTtuQAykQKIGOrsp5CudGCCoD1VjRNKO/Ll/bH509GyOpLDnlAMDtndPLKkJrH4CgNpWJeK0/AgIkFGiPxCtObmx8YdifqqxCAQpQgALFKMAAgNVdZwDAKi+LU+D/BdqWTJkccuN7GjUfEmA3gWyrItVQrQZka0Cr+NoA3jEUoAAFKECB/BZQlXsdJ/SZprpVr+f3SgqnewYAbO8lAwDpCi/srpkYh/miAJenW4PjMhJ4UVQubWro+3lGVTiYAhQIjEDb0mnlrhm6FdBPBqap4mokNho3+53QOPBCKstOOQDQ0VO1hxpnOUST79/kJ9sCIiscDyfOndn3aLan5nwUoAAFKFBYAgwAWN1PBgCs8rI4BTYt0La8apIzLNMcxXYG2MURbKtARFW2dhyt1uRpAYqtIZgIwKElBShAAQpQgAL5IiBXeFV9l0d3x2i+dFzIfTIAYHt3GQBIV3hhd80ucdHrRPWodGtwXJoCgkEB7lq/PnzhvCMY2EpTkcMoEEiBe5ZEdvMc/B7AtoFssPCb+mJzfew7qSwz5QDA/O6qKwVyQSqT8Fr/BETknKa6vu/6V5GVKEABClCgWAUYALC68wwAWOVlcQqMXSB5BOgdv41MLKlwtgmpN1nhTAawjcBUGHGmAZgk0CnAxhMDIgCS/5MMB/BDAQpQgAIUoECwBAbU4LMtM2PtwWqrOLthAMD2vjMAkI5wayucPQ6JfEQc/AzA1unU4Ji0BRTAU66D04+tjS1NuwoHUoACgRVoXxo5FwY3BLbBAm5MVP/c1NA/I5UlphQAePOYh8G/Adg+lUl4rW8Cyzwn8bFo7dqYbxVZiAIUoAAFilaAAQCrW88AgFVeFqeAPwIdj2xbres3TNByRBygwnihChWvwgEmiDpVRrRagBpAqhVaCsE2ovLWSWj6IX+6YBUKUIACFKAABVIQ+JPGZV5LY1/y95P85FCAAQDb+AwApCO8eFmkYighZwL6rXTGc0z6AgKsNcD11fHYFY2NSKRfiSMpQIGgCtzRNamqDG4bBIcFtccC7ms0Pmr2P/6QgSfGusaUAgDtXdWHQfT+sRbndb4KDIVgPjanfqDT16osRgEKUIACRSvAAIDVrWcAwCovi1PArkDy1IB7/zy1fN06jAuFhsY5rjOuxKgbByaKaig5u1GnJvn/qgPHgVZBZZv/dCWYCmjyJIF3f0IK7Gq3e1anAAUo8E4BB9hRgXF0oUCBCIzC4M6IV3F6Y+MLwwWyprxcBgMAtreNAYB0hNsemrSj47rfF+Cj6YznmLQFVCB/STiYE63teyXtKhxIAQoEWiD5u5IF3ZEjDLBABGWBbrYAmxPRC5rq+q8e69JSDABEroPgvLEW53U+CqjcWb6u79OzZ2PEx6osRQEKUIACRSzAAIDVzWcAwCovi1MgUALy3cUomRKu+v8ffkOh8pLxXvjdXXpx4wiErxcI1PaxGQoUvoCqTIBR998rdcNOufGw7RtP6f3n7yMxGKeiOzkONl6nCuet00+2e7uQvHmc8lbAm9fxQ4EcCax64y69rLm+/+Yczc9pATAAYPs2YAAgVeHk8f97H1ZV50F+w1d6paqX8fWDCpzSUh9ry7gSC1CAAoEWuLdrUtWI414FxecD3WhhNvdwc32sdqxLSzEAUP0cRD841uK8zh8BVVnthDCr6aC+v/pTkVUoQAEKUIACAAMAVu8CBgCs8rI4BShAAQpQgALpCiS/INl/f4TXV05z/l1j0rq4s2biUGnFW/+LwUEVlI9zdTRe8vZ5nDITcjQcisfxjt8nGVedkHqTjTrTHdGwCqYBOlkh24pgyhtPbH8IgmrgnePSXQPHFb2AeePp3kcSnp4andX/VNFr5AiAAQDb8AwApCqcfH2x4w1+XgTfSXUsr89MQEQeWDM68ahTeDJLZpAcTYE8EEj+LLHHYTX7CkwHgHeEhfOg/XxvcV3ISew7p3btc2NZyJgDAG0PVR/iuppMz/FYh7HI+nqNXDFhYuiKI/ZatcHXsixGAQpQgAJFLcAAgNXtZwDAKi+LU4ACFKAABSgQNIHkLwNnzUqeHACs3grOhtenOzUTR52hdXFnQrnnjAwZJ+6G6kS02lHdRxzdG5A9FNj4ShV+KJCiwCiAX3ivjjsrGl05lOJYXu6DAAMAPiButgQDAKkKty2ZMNl1wj8G5JhUx/L6zARCpc6uc/6799nMqnA0BSiQLwK/XBapKIvLWSL6zXzpuUD6jL91CtaVY1nPmAMAHT2R66E4W4GN77zkJzsCInjcFfe4ObWrx5ToyE5XnIUCFKAABQpBgAEAq7vIAIBVXhanAAUoQAEKUKBQBNqX1GyjjmkQaD0gBwHYBYpxEIgIJPmu0UJZK9fhs4BiBRxc1FwXa0++ucLn6iy3BQEGAGzfIgwApCrc9tCkHR3HfUoE41Mdy+szEvhpc33slIwqcDAFKJB3AvO7a2YA5mcC7JZ3zedvw6qKh1saYnVjWcKYfojq7EQoFo48LoLd+IPXWFh9uyahKucNDoZum3cEn/73TZWFKEABClBgowADAFZvBAYArPKyOAUoQAEKUIAChSqQfIJTJHyAK5ipKjMhmK5Aubx5IuU7XklQqAZcV0oCi9WR81pq+/6W0ihenLEAAwAZE26hAAMAqQi3diK0eyhykiP4SSrjeG3GAhsc1+wx96CBFzKuxAIUoEBeCSzorKxMhJ2zHMElUP43ehY37xXHNfVj+Xt3TAGAhd2TZiTgLgIwJYuL4FTAMjV6asvM/ieJQQEKUIACFPBbgAEAv0XfUY8BAKu8LE4BClCAAhSgQLEItPdU7gB1DgNQD8UBEFQAqAJQDvB0gGK5DzazzuTrMq8u6S+7/uijXx2kR/YEGACwbc0AQCrCt3dOL6sIr/0lgOZUxvHa9AUUMI7oVU/e3/+11laY9CtxJAUokK8C85dW7iPGuQ7AIfm6hjzse0ANzm+ZGbt1S72PKQDQ3hNpheI8ABO2VJB/7pOAIPlDy6UhdW6ZU9+7zqeqLEMBClCAAhT4jwADAFZvBgYArPKyOAUoQAEKUIACxSbQ1gYX1dVTJIQDxNFZItgbwDRAtwWktNg8uN63C8hjxtMLdFXsgWgUHm2yI8AAgG1nBgBSEV60fGJNfDj8VwVqUhnHazMQUKxwEubwuY18+j8DRQ6lQF4LdP5zeln/q2vPUIPLIfz+OCubKRiFQYf3WuzELf137xYDAJ2d08v6wmvbBTgcQCgrC+AkEEGXQs5rruv7EzkoQAEKUIACNgQYALCh+p+aDABY5WVxClCAAhSgAAWKXeCehyLbmTAOVA+HQbAnBLtBManYXYp0/XEBfuJ4+Naxs2IvF6lB1pfNAIBtcgYAUhFe0BM53CjuS2UMr81IIAGjF3uh8d+L1q4cyqgSB1OAAnkt0NY1ab+Q416tikPzeiF51LwIntJRzG5ujK3cXNtbDADM747sLsB8ALvm0frzvdV1b6TXrwxBbuLT//m+leyfAhSgQHAFGACwujcMAFjlZXEKUIACFKAABSjwpsDixSgdmlT9YTU4VIBaEd1Pgan0KTYBWa3AV6rjE/+nsfGF4WJbfS7WywCAbXUGAFIRbu+u+i4gZ6UyhtdmICBY4Sa0ec7M/qdFoBlU4lAKUCDPBW7vRNmk0qpz1chXAVTm+XLypf2XDeTc4+r7OjbX8JYDAF2RTwP4lgim5MvKC6DPJapyfktD3yMFsBYugQIUoAAFAirAAIDVjWEAwCovi1OAAhSgAAUoQIH3CtzVVfOhkOhBImZ/qBwG4EN0Kh4BVTzgwDmjqaH378Wz6tytlAEA2/YMAKQi3N4VeRqC3VMZw2vTFxDRq0uMufqohjX96VfhSApQoFAEOnoiB0FxvQIHFcqaAr6OdQr8qKU+dv7m+txiAKC9K3KzCuYJUBbwBRdEe6rYoMANQxXhq+bttWpDQSyKi6AABShAgUAKMABgdVsYALDKy+IUoAAFKEABClDg/QVUIXd3TahxJHyg48hhqnoUIB+gV+ELKDAsRi/zvNAPoo2r1xf+inO7QgYAbPszADBW4WT4KyzmKQAlYx3D6zIQUKyAYz7bVDvQLQKTQSUOpQAFCkRgYXfNxDjM5QJ8DsCEAllWkJfhAbLYizuf2Nx/8242ANDeGZmmYfmFQGcB2GJYIMgaedObyGNwcH7zQX1/yJue2SgFKEABCuSlAAMAVreNAQCrvCxOAQpQgAIUoAAFNi+gCudXj2w1udxL7KXAbAWaoZhGt8IWEODvot4nnnhgzWOtrfxiyuZuMwBgUzdZmwGAsQrPX1J9ujj6g7Fez+syFBC9WkKJa5sOWNeXYSUOpwAFCkigY0nNLHXMjQD2KqBlBXkpyz0xn4vWDTy+qSY3+6X+/CWRI0RwAwT/FeRVFkxvKiNwcNuECaHzj+DT/wWzrVwIBShAgaAKMABgdWcYALDKy+IUoAAFKEABClBgbAJtbXAn7DQhMrw+tJs60gLICQCqxzaaV+WhgAfoLSX95V8++uhXB/Ow/7xpmQEA21vFAMBYhed3R+ZLMuTFj30BwUp1nDOePrD3N618+t++N2egQB4JtC2dVu6awe8p8EmeKJ+FjVOsfOOx/dbm+thtm5pt8wGAnsiXROUCQCdnod2in0KBZwXO+c31vb8uegwCUIACFKCAdQEGAKwSMwBglZfFKUABClCAAhSgQGoCySBAfJtJFWVOaCcoLgH0owDCqVXh1XkikDz+/yPN9bFledJvXrbJAIDtbWMAYCzCbZ2TJ7gh72UIKsdyPa/JTEAFPwkl0HrsrNjLmVXiaApQoBAF2rtrjoGYG6GYXojrC9SaVEbE0R811cXO3VRfmw0AdPREblPFKTz+PwvbqvBEsNCFc/Kc+t51WZiRU1CAAhSgQJELMABg9QZgAMAqL4tTgAIUoAAFKECB9ARUIffeO7U8XjVcZxQ/FsH26VXiqEALiPyxua7v0ED3mOfNMQBgewMZABiL8N1Lqg91XF0MRclYruc16QsosFaA85rqYreJQNOvxJEUoEChCnR2ItRfEvmdKhoBOIW6zqCsS6ELxbinN8/sfe39etpkAKCtc/JObsi7CYIjgrKYAu/jdYj5ZnPdwPcKfJ1cHgUoQAEKBESAAQCrG8EAgFVeFqcABShAAQpQgAL+CHR0VX1VIV996+nRzT4o48+MrJItAWPksONm9j2QrfmKbR4GAGzvOAMAYxHu6Il8SRVXAwiN5Xpek76AQhY5Hr7aNKvvr+lX4UgKUKDQBeZ3RT4tgmsBRAp9rQFY35/gmS83zxpY8n69bPIHmwXdVR/1IFcLsGcAFlHoLSQTc3/2VJujDf0vFfpiuT4KUIACFAiGAAMAVveBAQCrvCxOAQpQgAIUoAAF/BFIngjQvqRiJ7jutSJyMBQT+cSSP7YBqPK054zbP1q7cigAvRRcCwwA2N5SBgDGItzeU70A0GOgfNJ0LF4ZXDMowNWJqthV0d0xmkEdDqUABQpcoKNnwlbQkiUK7FLgS8358hR4RYDLmutjt71fM5sMAMzvipwjgq8BqM75Kgq8AVVsgMj3Wur7LizwpXJ5FKAABSgQIAEGAKxuBgMAVnlZnAIUoAAFKEABCvgrcFt3zcRJ0CYH5iyF7ApgvL8zsFrWBQQGkHOb6/p42qYFfAYALKC+oyQDAFsSXrR86rjRoeFnIZi2pWv55xkKCP5kjDn/uIaBBzOsxOEUoEARCHR0V12pIl/i61msb3ZcVa43r/VdEo3Ce/ds7xsAuL1zellFyZproHKW9fY4QVLgZePh+ONmxZaSgwIUoAAFKJAtAQYArEozAGCVl8UpQAEKUIACFKCA/wLJ95auLa3cM6HOaVAcDWAKAL4WwH/qrFUU4H8h4camulWvZ23SIpmIAQDbG80AwJaE27trGqGmDYKaLV3LP89IIAHgp17c/WK0cfX6jCpxMAUoUBQC7Utq9hXH3Kfg38/2N1x/HgqFz59z4Our3j3X+/4QM39p9a5icA2gyR92+LEr4Alwf1W8Ym5j4wvDdqdidQpQgAIUoMD/CzAAYPVuYADAKi+LU4ACFKAABShAAXsCi5ZPrRkZGvmEI2aeKvaASKm92VjZssAGhV7eUt+ffBctPz4KMADgI+b7lmIAYEvC7d3VFwJ6EYAJW7qWf56+QPKIaUdweVNd7Nb0q3AkBSjRtrBxAAAgAElEQVRQbALzu6oXiehRxbbuHKx3iaqc39LQ98i7537fAEDyP+AM9BqB7J2DZotqSlUMO2JOa6of+FlRLZyLpQAFKECBnAswAGB1CxgAsMrL4hSgAAUoQAEKUMCuwPLlCL84VD1LxXxKILNFUKXK0wDsqluonnwNgOIvENPSXDfwooUZirYkAwC2t54BgC0Jt3dF7oZgDoDwlq7ln6cp8ObfoQ+q557WMmv1ijSrcBgFKFCEAu1d1XMh2lGES8/2kv8Bg682z4zNf/fE7xsAuLsrcoojejUgk7PdaRHO93JJPL7v0Y3reotw7VwyBShAAQrkUIABAKv4DABY5WVxClCAAhSgAAUokB2B9q5JHxCETlDRzwDYMTuzchafBQbEkaubavuu8rluUZdjAMD29jMAsDnhtqUVEdeE7gOwH1/VYvVeXCfAj1Y/E7v41FMRtzoTi1OAAgUlsHhZpGLIwxNQTC+ohQVvMYMALvZejX0vGoX39vbeEwBYvAKlQ6si5wO4DIAbvLUUWEeK25obYp8tsFVxORSgAAUokAcCDABY3SQGAKzysjgFKEABClCAAhTInsD9y6smDQzJ4Y7gHAB12ZuZM/kkYAAslbDzmaYDev/uU82iL8MAgO1bgAGAzQm3d0cOBPSXgHzQ9k4UdX3FPwV6dlND/71F7cDFU4ACaQm0d1VfDdHk9838WBRQ4IYR9b7xyYY1/W+f5j0BgF89FNmuxMXXAZxssR+WfkvAdVB3bG1sKUEoQAEKUIAC2RZgAMCqOAMAVnlZnAIUoAAFKEABCmRXoLMTob7Syj0ddb+kqidmd3bOlqmAAjGBXNdc33dlprU4/k0BBgBs3wkMAGxOuL2n+iRo8gRjbGN7J4q2vsCIomdIvTnv/lKpaE24cApQICWBjq7KvVScx1MaxItTFlDoQsdzLmya1ffXtw9+TwCgfcmkfcV1r1XFISnPwgEpCsjz5Wv7dp89GyMpDuTlFKAABShAgYwFGADImHBzBRgAsMrL4hSgAAUoQAEKUCA3Au09lTuoOp8W4CsAynPTBWdNWSD5RRbQaRTntNTHnkl5PAe8R4ABANs3BQMAmxNu7458HYKzoZhkeyeKuP46KL7d3BBrLWIDLp0CFMhAoG3ptHLXG3wQgv0zKMOhWxBQ6OPi6TnNswaWvP3S9wQAOpZFPqIJuQnQD1HVroAAX2+qjyVftcAPBShAAQpQIOsCDABYJWcAwCovi1OAAhSgAAUoQIEcCSjkzgcnVpeWuCdAna8C2DZHnXDaFAUE6FfRq5rr+q9JcSgvfx8BBgBs3xYMAGxOuL27eiFEj4LCsb0TxVpfgJeh5uimhoEnitWA66YABTITaGuDG9q2+gJV/WZmlTh6swKKXrjy+ebavgVvv+69AYCu6nkqejvAfzxt31IK7MHUsW1l1qcABShAgU0JMABg9d5gAMAqL4tTgAIUoAAFKECB3ApsfKLJDB4D4NsApua2G84+FgERqBr8Xhz9clNd/9NjGcNrNi3AAIDtu4MBgE0J3/NQZDvPxa8A1NnehSKubwB0P1UXa2wVJP///FCAAhRIR0AWLqnaM+EIg0Tp6I19jAr0jKp4/48bG5H497B3BAAWL4tUDCdwrgKXj70ur0xT4Gnv1dh+0ShG0xzPYRSgAAUoQIGMBBgAyIhvS4MZANiSEP+cAhSgAAUoQAEKFIDAgq7Kg43IdYDsC+A9D9oUwBILbQmvKuSilvq+nwPQQltcNtfDAIBtbQYANiV8T3dVgwf5AYA9bO9CEdcfBvTrzfX9VxaxAZdOAQr4INDxyMRqEw/dLZBGH8qxxCYEjMo1bsnoNU0HrOv79yXv+MGkratqe1ck+eX/yVS0LSAXea/2XRONwrM9E+tTgAIUoAAF3k+AAQCr9wUDAFZ5WZwCFKAABShAAQoER2BBT+RwA1wGxQwAJcHpjJ28n4BCfmnUXBxt6H+JQukLMACQvt3YRjIAsCmnjqXV89ToNwBsPzZLXpWygGCNJtzGllmrH0t5LAdQgAIUeJvAzYumjpscGTlLVa8ijEUBlUWeyFei9b3P/nuWdwQA7llatacx+K5CDrbYBksDcYg5rKl2oCt5/BhBKEABClCAArkQYADAqjoDAFZ5WZwCFKAABShAAQoES6BtadWejoevi8iRAMqC1R27ebuAAM9C9ctP1vcv5tHW6d8bDACkbze2kQwAbMqpvSdyGQy+CMGksVnyqlQFBHiqqT724VTH8XoKUIAC7xZQhSxYGjlQFQ8AKKeQHQERPKqed3rzzDV/+fcM7wgAdHRV1avILwHsYKcFVn1L4BmR8CFNdatepwgFKEABClAgVwIMAFiVZwDAKi+LU4ACFKAABShAgeAJzF9S9WFxpBXARxkC+D/27jywrrrM//jnOTdJWwpt700KCC4o6jgwjKNWKU3SGpVRUShNQgQFR1REwA3ZyiIE2TcFBB0URcVxCUnKoiijGNskZbHqKMqooyMqg0CTmy7QJck9z29u/ZUptaVZ7vfem3ve+U9yvs/zfV7fo8Tkc88pv/PZdkdm+lT1tJHLDp+3fqC8d1q+uyMAEPpsCADsSPimVaqu25i5SaZ3S0qFPoXk1vdLWxqGzk3u/EyOAAKFFOhYPvvFqarUl+VaWMi61HrWT7erJXtHS8NAz9Z/+kwAYEsKoy/9Njfr4nFloW8bv6FKqXMWNwysD92J+ggggAACCOxMgABA0HuDAEBQXoojgAACCCCAAALlKbBNCODtkqrLc5fsyqWHquSnLK4f6uPpnBO7HwgATMxt7KsIAOzIquPBuXunhuObJD9i7JZcOV4Bi6PXNy8cWD7edVyPAAII7Ejg272z08MWnemypQgFFTj6oZFsV3uTRvNdngkA3NKz3/Q9UuuOs0ifD9qe4jJX2+oZ2dtPnKcROBBAAAEEECiVAAGAoPIEAILyUhwBBBBAAAEEEChfge7+9D/Ebhea1Fy+u0z8zkbctTQeTX2+rWn1U4nXmAAAAYAJoI1rCQGAHXF19Na9JmXxtZIaxsXJxWMXcA1kRme9oKnpkU1jX8SVCCCAwM4FVq1S9Z83ZZbE0pd5DUC4O8Xcl6Ys9dmtHz5/JgBwV88edZurqs8z00fDtaeypMdTVXrjkfOzD6OBAAIIIIBAKQUIAATVJwAQlJfiCCCAAAIIIIBAeQt031f79z7qn5Sptbx3mujdrcgp+kBbw8BvEq0wweEJAEwQbszLCADsiKpzRe2RFvllkl4xZkouHK/At1oaskePdxHXI4AAAs8l0NVf+1rF/hWZ/h6pQAJun7Wo6sKtr59/JgDwjeWZF9Sk9GlJLYFaU/avAnencvrgkYuyfwYEAQQQQACBUgoQAAiqTwAgKC/FEUAAAQQQQACB8hfovH/uy2wk9xmZ3lz+u03eDl3a5LEf77VD3W0Hajh5ApObmADA5Px2vZoAwI6Muvoy7/vfZxq3y/X8XRtyxUQE3Oy41vrBr01kLWsQQACBnQl09c5+iVnqMpfaUAom8P1cLndi26K1f8h3eCYA0Ll87ssslbtV0sHBWlM4L35xNBxfs6RpzRo4EEAAAQQQKKUAAYCg+gQAgvJSHAEEEEAAAQQQmBoCy3rrXhNbfCO/byvP8zLpK9XTR04/fN76gfLcYfnuigBA6LMhALAj4a7e2vNknn+H9MzQJ5DU+rma1PPaXrf68aTOz9wIIBBG4J6f7zXzqbXDpyiyK8J0oKqkX1vKmpsPGfzPvMYzAYDu3jmvdIt+KCkDU0ABt+bcXwbvbGtTLmAXSiOAAAIIILBLAQIAuySazAUEACajx1oEEEAAAQQQQKBCBDo6lErtnZ6vyK6WNL9CxqqkMdaYx69f0rDmF2byShos9CwEAEILEwDYXrijQzVV+2audNdHtv27RuiTSFj9X2ZGsq9qatJowuZmXAQQCCzgLuvuqz1S8s/LVBe4XTLLu23OyerbGgd+kgd4JgBwR1/dvFHFD/Ivz4D3hdnv5X5sS0P2/oBdKI0AAggggMCYBAgAjIlpohcRAJioHOsQQAABBBBAAIEKE8j/0Srau/Ywi/wGSftW2HhTfhx3O2+39YNXH3aYNk/5YYo4AAGA0NgEALYX7ri3dt+q6X6Vu44JrZ/Y+m6fzf1l8CN8eDGxdwCDIxBUoLO39uAo8k+765CgjZJc3PztuQVD32sz5bYEAG7p2W/6Hql1x1mkzyfZJfTsLr+jOqo6ffGC1b8L3Yv6CCCAAAII7EqAAMCuhCb1fQIAk+JjMQIIIIAAAgggUFkCd9+taRt2Tx9lkV0vKV1Z0035aX45o0r1h83PrpvykxRxAAIAobEJAGwv3N2f/gd3u0rSW0LrJ7V+Lpc6+qiFqzt4IkpS7wDmRiCswLL+PfePffQSSe8I2ynB1T06cd3o7l89vumRTVsCAHet2me3zZuGTzHFVyaYJfjo7nbJdI1e8/bGtUPBm9EAAQQQQACBXQgQAAh6ixAACMpLcQQQQAABBBBAYOoJfH9VevZTG6MPx+ZnS9pt6k1QyTuO39DSsKankics9GwEAAotun09AgDbi3T3phtcdpWM16kEuvt8WNHzj2kYeCxQfcoigEDCBe75+V4zN6wfOSuWPpFwimDju/Tp3arUng+2bgkALPvZnDn+VHSNm94brCuFc5JOzIxkv8I7dLgZEEAAAQTKQYAAQNBTIAAQlJfiCCCAAAIIIIDA1BS4fXnmBaORLjDTcZJqpuYUFbhr91tbGofeXYGTBRuJAEAw2v9fmADA9sKdKzItFvkVku0fWj+J9V16IKoeeVvzwesHkzg/MyOAQHEEuvszx7vrGp6IFcbbXLdsVO60dzWuHdoSAOhYsfvcqqjmay79c5iWVJX0R490YuuC7D1oIIAAAgggUA4CBACCngIBgKC8FEcAAQQQQAABBKauwLLeutfkLL5I0ptMqp66k1TQzl1P52b4vm3zhtZW0FRBRyEAEJRXEgGA7YVv6619d2T5AID2Dq2fxPpm+tKGlE49ltehJPH4mRmBogl09qUPi2RXuXRA0Zomq1GfWXVLc/0TT24JAHStqHueovj7kg5MlkNRp+2T2cdb6gd/XNSuNEMAAQQQQGAnAgQAgt4aBACC8lIcAQQQQAABBBCY2gK39abfHpld/L+/ljtIUjS1p6mM3bvZya31g5+rjGnCT0EAILQxAYDthbv7Mqe6lA8AEJwKcfuZTs8Mz7qxqemRTSHKUxMBBBDIC3SunPsqy+WulOlNiBRewKXfjCh6Q/51LlsCALc/mHlBbli/kDSn8O2omBcw0zc8zp3X0rj2vxFBAAEEEECgHAQIAAQ9BQIAQXkpjgACCCCAAAIITG2Bjg7VVO1b+0F3P5tPs5bNWf74RdOz9fPmaaRsdlTGGyEAEPpwCABsK3z33Zq2cY/M2TJdEFo+qfUj+WEjjw39e1ub8q8y5gsBBBAIItCxYu+5kQ1fbrySPoivpE2y+BUt9Wv+mA8AWHd/+kB3eyhUN+rmBezSKtnlixsG1uOBAAIIIIBAOQgQAAh6CgQAgvJSHAEEEEAAAQQQmPoCHStnZVJxVf7TrO+UtNvUn2hqT+BSHHn86ubGNT+f2pMUZ/cEAEI7EwDYVjj/CuMoqr7AZKeElk9kfdeAm17f2pD9VSLnZ2gEECiaQE+PqrI1mQvcdRavwgrDnvPcvKMa1v7U2l3RQb3ptyqyb4dpRVVJT0l+ekvD0E1oIIAAAgggUC4CBACCngQBgKC8FEcAAQQQQAABBCpD4PaV6YPi2G50aYGkVGVMNWWncEkXtDRkL5qyExRx4wQAQmMTANhWuKt/zosUpy6S+XGh5RNZ36xHyh2f/8RoIudnaAQQKKpA54r0SRZZu6Q9i9o4Kc3cmpsbBu+wjg6lUvvWHif3W5Iye7HndOmPFuv0loXZzmL3ph8CCCCAAAI7EyAAEPTeIAAQlJfiCCCAAAIIIIBA5Qh09c05Qoq+wC9By+FM/SeZkdkNvAN712dBAGDXRpO7ggDAtn7d/el/cNnlcr1tcq6s3pGAS1+prqo6a/H8J59ACAEEEAgt0NmbPlyy/GsADgjdK4n13ezkXw4PfsFuWqXquo2Z82U6L4kQRZr5x7HHZx7VuOZHRepHGwQQQAABBHYpQABgl0STuYAAwGT0WIsAAggggAACCCRIoKdnv+mD1esuMun0BI1drqMOKfbDWxYO9ZfrBstlXwQAQp8EAYBthTtXznmVxdGVkt4UWj6J9V26IN7o17UdOrQ2ifMzMwIIFFega0Xdq5XyT8l9UXE7J6ObyS5fPX3wfFu1StV/2pi5yk0fTcbopZjS7vRIZ7UuGPx1KbrTEwEEEEAAgR0JEAAIel8QAAjKS3EEEEAAAQQQQKCyBL5+/557Tcvl7pb7qytrsik3zUZJV7c0ZM+fcjsv8oYJAIQGJwCwrXBXb+2bJL9epr8PLZ/E+mZ+zOppQ10nztNIEudnZgQQKK7A7cszL8il/AbJjihu52R0M9d1L5yRPcPu/i9N2/hEuksyHp8T6Ozd9Y2qaTrryNdl/xyoBWURQAABBBAYtwABgHGTjWcBAYDxaHEtAggggAACCCCAgJatrH1dnPN7ZdodjpIJuKSf1EyfvujweY9tKNkupkBjAgChD4kAwLbCy+5LvzXO2Q2SXhJaPmn13bXJ3d5+1MLBe5M2O/MigEBpBDpcqVRf5gsyHV+aHVR4V7Pl64b3eIvlHzOWrV7XI2l+hY9cuvHMrnjo+4PntLcrLt0m6IwAAggggMCzBQgABL0jCAAE5aU4AggggAACCCBQeQLt7YoOelOmXdInKm+6KTXRI5KOaWnI3j+ldl3kzRIACA1OAGBb4e7+2sVy/6xL+4SWT1p9l/2mWnbs4oaBVUmbnXkRQKB0Ap19mStN+pCkGaXbRWV2dumB2pFZr/9rAKBm/XK5v64yRy35VMMuXdLakP1kyXfCBhBAAAEEENhGgABA0NuBAEBQXoojgAACCCCAAAKVKbCsZ86cuDrqk3RgZU5Y/lOZNCT3K5sbhy4v/92WbocEAELbEwDYVrizN/NeM30xtHoy6/sKl53c2pD9VTLnZ2oEECiFQPfKzOmKdZZLdaXoX9E9zR7MDO+xyL56z14zZ84ceaqihy3tcH+RdH5LQ/bm0m6D7ggggAACCDxbgABA0DuCAEBQXoojgAACCCCAAAKVKbDlkagr02+R2218Iqo0Z+xSbNJ3B6Znl/A+7J2fAQGA0PcnAYBthK2rL/NeSfx+PcBtZ1LHaC63tG3R2j8EKE9JBBBAYIcCXX2Zd0i6lFe7hLlBnn66encCAGFst6nqv49jnXfUwqFvBm9FAwQQQAABBMYhQABgHFjjv5QAwPjNWIEAAggggAACCCAg6es9e9RNq66+WNIJkiJQSiLwC1f0vlYeib1TfAIAoe9LAgBbhW/p2W/67Op1J7n0qdDqSazv0tVxXHNl28LHVydxfmZGAIHSCHT3Zt4i0zUuHVCaHVR21y0BgI6euXunqnP5T6nzFULA/Sey1BktDQM9IcpTEwEEEEAAgYkKEACYqNyY1hEAGBMTFyGAAAIIIIAAAghsL9DeruigN6QPUWRf5VNRJbo/XI9LflFL49BnS7SDsm9LACD0EREA2Crc/cC+tT686UyZnxlaPaH1z89t9OvbDh1am9D5GRsBBEog0Lki/Y8W2eclHVyC9hXfMjeSep519c9ZKI+WV/y0pRrQbLly9vGWhQM/LdUW6IsAAggggMCOBAgABL0vCAAE5aU4AggggAACCCBQ2QId35uViXav+mgkO8vl0yp72rKcbpPLvrzbusGPHXaYNpflDku8KQIAoQ+AAMBWYQIAoe81/+CLpg99ad48jYTuRH0EEEBgq0DX/Znn26jd6vLXoxJAwOJF1t079y1uue8GKE/JvIDpO4qrP9LS+MR/A4IAAggggEA5CRAACHoaBACC8lIcAQQQQAABBBCofIHb76s9OJfzGyTNq/xpy3LCH4xY7oNH16/9fVnursSbIgAQ+gAIAGwV/kZf3T418vMkPym0egLrj0o6tqUh+60Ezs7ICCBQQoFVq1T9x02ZZZLeVsJtVGxr89RbCQAEPl4z3VY9PP3kw5seGwjcivIIIIAAAgiMS4AAwLi4xnsxAYDxinE9AggggAACCCCAwLMEOlalZ9um6JRIvlTSHvAUXeBXLj+ztWHo7qJ3ngINCQCEPiQCAFuF71g596Wjce5ySS2h1ZNW32RPuMXva6kf+k7SZmdeBBAovUBXX6ZTpiVyRaXfTWXtYEsAoLO39iNmfl1ljVZG07huyf0le0Jbm3JltCu2ggACCCCAgAgABL0JCAAE5aU4AggggAACCCCQDIFvrqh7dXUUXyHpTcmYuKymXGPulzc3DuX9+dpOgABA6FuCAMBW4e7eupe75a6S7IjQ6smrb7+PIp24ZMHgvcmbnYkRQKDUAl39tdfL/X2Sdiv1Xiqw/wnW3Ze+xGXnVOBw5TLSzS0N2RPKZTPsAwEEEEAAga0CBACC3gsEAILyUhwBBBBAAAEEEEiGwC09+02fVbXuFJnyv7vLJGPqMpnSFJv0ZdstPm3Jq9asKZNdlc02CACEPgoCAFuFCQCEu9dM+g+5f7i5cagvXBcqI4AAAjsW6OqvvcTdP2TSLIwKK+DSJwkAFNb02dVMa2W6pmVB9qKQbaiNAAIIIIDARAQIAExEbcxrCACMmYoLEUAAAQQQQAABBJ5LoHNF+h8tsmt4CkDx7xN33ZuK4tOX1K/5j+J3L++OBABCnw8BgK3CBACC3ms/MI9Pb25c8/OgXSiOAAII7ECAAEC428LklxIACOebrzzoiq5obRi4KmwbqiOAAAIIIDB+AQIA4zcbxwoCAOPA4lIEEEAAAQQQQACBnQv09KgqW5M5z6RT3fmEVJHvld/GsrOPahjsLnLfsm9HACD0EREA2Crc0Tv7NSlLfU7Sa0OrJ66+655U7GccuWjoocTNzsAIIFByge6+2n9x+aWS9in5ZipsAwQAwh8oAYDwxnRAAAEEEJigAAGACcKNbRkBgLE5cRUCCCCAAAIIIIDAGAS67kvXK2fXSpo3hsu5pHACm2LpE0c1ZK8uXMnKqEQAIPQ5EgDYKnzb8swCS+lLJv1daPXE1ScAkLgjZ2AEykmgszd9jMmulOn55bSvStjLlgBAV3/6s3I7qRIGKsMZBmLpCv5PQhmeDFtCAAEEEBABgKA3AQGAoLwURwABBBBAAAEEkifQ1Ze+XrL3S5qRvOlLObF/rmZk9PzDm9YPlHIX5dabAEDoEyEAsFX4tpWZBRbbl0xOAKDAt5273RhFVZ9srn/iyQKXphwCCCCwSwECALskmvAFJrvcuvoyvZIaJlyFhTsVMOk3rvjMloY1d8KEAAIIIIBAuQkQAAh6IgQAgvJSHAEEEEAAAQQQSJ7AspW1b4xjv0HSK5I3fSkntjtzsZ/dtjD7cCl3UW69CQCEPhECAFuFCQCEu9cIAISzpTICCOxaoLs3c5RL18j0gl1fzRXjFOgjADBOsfFcTgBgPFpciwACCCBQbAECAEHFCQAE5aU4AggggAACCCCQPIGOjufPqNp3w1fcdaSk6uQJlGZikx7O5XTqUYuy/16aHZRnVwIAoc+FAMBWYQIA4e41AgDhbKmMAAK7Fujqr32t3L9KuHXXVhO4ggDABNDGvIQAwJipuBABBBBAoAQCBACCohMACMpLcQQQQAABBBBAIJkCXb1zjpNF+ffR75lMgeJP7a6nLbIPNS8Y/IqZvPg7KM+OBABCnwsBgK3CBADC3WsEAMLZUhkBBHYt0N2f/gd3+6akA3d9NVeMU4AAwDjBxnU5AYBxcXExAggggECRBQgABAUnABCUl+IIIIAAAggggEAyBTpWpWdHG+1uM82XFCVTofhTu9t5GzZUXfvuNz/xdPG7l2dHAgChz4UAwFZhAgDh7jUCAOFsqYwAArsWIACwa6NJXEEAYBJ4u1xKAGCXRFyAAAIIIFBCAQIAQfEJAATlpTgCCCCAAAIIIJBcga7e2vNkfo6kGclVKPLkrlty8va2xqE/Fblz2bYjABD6aAgAbBUmABDuXnPXddNGRy4+vGn9QLguVEYAAQR2LEAAIOidQQAgJC8BgJC61EYAAQQQmKwAAYDJCj7negIAQXkpjgACCCCAAAIIJFegY3n6oFTK7pH0vOQqFHdyk3rjKP5o64I1Pytu5/LtRgAg9NkQANgqTAAg4L1m9ol1w4NXH9+kTQG7UBoBBBDYoQABgKA3BgGAkLwEAELqUhsBBBBAYLICnb21S01KT7YO6/9WwKV18bC+3PbGwf/BBwEEEEAAAQQQQACBQgqsWqXqP25Md8jsyELWpdZzCvzJzI5vrh/8IU5/FSAAEPpOIACwVZgAQNB77dSWhuy1QTtQHAEEENiJAAGAoLcGAYCQvAQAQupSGwEEEEBgsgL/1js7PaNmd94bOlnIHayvGX4qnjm6dn1Tk0YDlKckAggggAACCCCAQMIFbuvNHBWZOhLOULzxTcOR67iRx7JdbW3KFa9x+XYiABD6bAgAbBUmABD0XiMAEJSX4ggg8FwCBACC3h8EAELyEgAIqUttBBBAAAEEEEAAAQQQQAABBBBAIJkCd/TV7THq8W9l2juZAiWY2uysKrfPLW4YWF+C7mXXkgBA6CMhAEAAIPQ9tqU+AYCiMNMEAQR2JEAAIOh9QQAgJC8BgJC61EYAAQQQQAABBBBAAAEEEEAAAQSSK9DVl/mCpPcnV6C4k5vsa17lZ7fMzz5a3M7l2Y0AQOhzIQCwVZgnAIS718x86eppQ586cZ5GwnWhMgIIILBjAQIAQe8MAgAheQkAhNSlNgIIIIAAAggggAACCCCAAAIIIJBcga7+Wa+VVz2YXIHiTm6mHyqOTmpuHPhtcbvAAYwAACAASURBVDuXZzcCAKHPhQDAVmECACHvNfuMWdXFzfVPPBmyC7URQACBHQkQAAh6XxAACMlLACCkLrURQAABBBBAAAEEEEAAAQQQQACBZAt09WaGZJqTbIWiTf9HxVFzy8KBnxatYxk3IgAQ+nAIAGwVJgAQ7l5ztxujqOqTBADCGVMZAQR2LkAAIOjdQQAgJC8BgJC61EYAAQQQQAABBBBAAAEEEEAAAQSSLdDVl7lF0nuSrVDM6aM3NNcP/MhMXsyu5diLAEDoUyEAQAAg9D0mEQAIb0wHBBAgAFCie4AAQEh4AgAhdamNAAIIIIAAAggggAACCCCAAAIIJFugc0WmxSJ1JluhqNOfsG5k1teOb3pkU1G7lmEzAgChD4UAAAGA0PcYAYDwwnRAAIHnEujorXtNyuKvSXoFUgUX6LOu/tofyr2p4KUpKJP93uTnLGnIdsCBAAIIIIAAAggggAACCCCAAAIIIIBAIQU6etMvTEX2C7lmF7IutXYsYGbnDbld/76GgfVJNyIAEPoOIACwVZhXAIS713gCQDhbKiOAwK4Funprl8j805JetOuruWI8Ai591zr70rea7NjxLOTaMQs86a5LWxuz1415BRcigAACCCCAAAIIIIAAAggggAACCCAwBoGv3Z+ZNWNU35L0ljFcziWTFDDXN0d9+CNtC59aPclSU345AYDQR0gAYKswAYBw95qZvrR5VO3HLMr+OVwXKiOAAAI7FujsTR9jsitlej5GBRe41rr70pe47JyCl6ZgXmDQFV3R2jBwFRwIIIAAAggggAACCCCAAAIIIIAAAggUUuCWnv2mz65a+1E3u7yQdam1YwGXeuPNdkzbGwf/J+lGBABC3wEEALYKEwAId6+527dj97PaFmYfDteFyggggMCOBQgAhLszTH4pAYBwvvnKBADC+lIdAQQQQAABBBBAAAEEEEAAAQQQSKxAe7uig96QPkSR/VBSTWIhijW469FcnFvYtmjtH4rVslz7EAAIfTIEALYKd/fOeaVbdIOkhtDqiavvuicV+xlHLhp6KHGzMzACCJRcoHtF5oTY9Ekz7V3yzVTYBggAhD/QDSa7vrlh8OzwreiAAAIIIIAAAggggAACCCCAAAIIIJA0gW/2z96/Kk5930wvTtrsRZ/XNWqKDmxuHPht0XuXWUMCAKEPhADAVuHu3rqXu+WukuyI0OoJrP/DyOLTltSv+Y8Ezs7ICCBQYoGuvswnTDrVpXSJt1Jx7QkAhD9Sl+sLLY3ZE8O3ogMCCCCAAAIIIIAAAggggAACCCCAQNIEOh6cu3dqOPdZSUuSNnsp5o0ie9ORhwz2mCkuRf9y6UkAIPRJEADYKkwAIOC9ZvqlFJ/SUr9mRcAulEYAAQR2KNDVX3uJu3/IpFkQFVbgrwGA3szxbvpSYUtTbRuBm1sasicgggACCCCAAAIIIIAAAggggAACCCCAQKEF7uir22NU/mHJLyl0bertSCB6V2ZkoKOpSaNJ9iEAEPr0CQBsFSYAEPJes99HkU5csmDw3pBdqI0AAgjsSKCzr/Zzkr/HpOkIFVbAXG3W2Tf3MFPuO4UtTbVtBLrMhk9urn/qSVQQQAABBBBAAAEEEEAAAQQQQAABBBAopEBPj6qyVbWHy7y7kHWptRMB04Uz9sxcdtjLfrc5yUYEAEKfPgGArcJdvbNfIktdKukdodUTV9/0qJlOaF6Q/V7iZmdgBBAouUBXXyb/s+uRkqzkm6mwDZin3mrdvXPf4pb7boXNVk7jfCdXXf3htoOf+EM5bYq9IIAAAggggAACCCCAAAIIIIAAAghUhkB3f+YQue50qa4yJirjKWK/IVc188y2BY9uLONdBt8aAYDQxAQAtgp/vWefuprUprMs0umh1RNY3939Xa2NQ99I4OyMjAACJRbo6qu9Q/IjSryNimy/JQDQuSLzZotEwivUEZtWRHH08SWNAz8J1YK6CCCAAAIIIIAAAggggAACCCCAAALJFfhmT/ofqqvsizK9LrkKRZrc/Pbdd6859s2vfOLpInUsyzYEAEIfCwGArcLdD+xb68ObzpT5maHVk1jf5Mc2Nwx9XZIncX5mRgCB0gh09NX9XeTxl8y0oDQ7qOyusenN9p0H5+69aTj3l8oetZTT2c9SrjOPbBz8QSl3QW8EEEAAAQQQQAABBBBAAAEEEEAAgcoU6OhNvzBl0WWSv7MyJyyjqcxWbUz5G4+dn11XRrsq+lYIAIQmJwCwVbhj5axMFFefYfKlodUTWd/s4mnx6Kfe3rh2KJHzMzQCCJRE4Pb7MwfkRvVFSfNLsoEKb/r009W721fv2WvmzJkjT1X4rKUbz/RrxXZOS+PgstJtgs4IIIAAAggggAACCCCAAAIIIIAAApUqcPf9mVkbcvZhc7+4Umcsm7lMj+Sm+T+1zRtaWzZ7KsFGCACERicAsFX4lh5Nn12dOcmlT4VWT2L92HWNe80VbQsfX53E+ZkZAQRKI7CsP/PPsW/53/UDS7ODyu66TQBgdEDy6ZU9bommM3vC3dpbGwb+tUQ7oC0CCCCAAAIIIIAAAggggAACCCCAQAULdHSoJrVP5t2SvlDBY5bNaLlotLZtwbps2WyoBBshABAanQDAtsKdvZn3mm35pChfBRZw+R3xSNXpbU2rf1fg0pRDAAEEdirQ2Zs+xmSXyPRimAou8FTN9Ol7WcfK589I5Tb+XOYvK3gLCuYFnsqnr5sbh66AAwEEEEAAAQQQQAABBBBAAAEEEEAAgRAC3f21i909/x7n3ULUp+Y2Ap7bv6Vx7X8n2YQAQOjTJwCwrXBXf+1xcr9ZUk1o+aTVN1Ov5Cc31w/9MmmzMy8CCJROoKuv9mzJz5CULt0uKrOzS7+Io93mW0/PftMHq9f9yKSDK3PU0k9lpk+Nzsme3Xaghku/G3aAAAIIIIAAAggggAACCCCAAAIIIFBpAretqH1jlPKb5dqv0mYrt3lM+ufmhuz3y21fxdwPAYDQ2gQAthXuXFl7pHL+OTPtHVo+gfX/KOnolobs/QmcnZERQKBEAl29matlOkUST6cv8Bm49EDtyKzX293/9dJpG58c6pD7EQXuQbmtAq5bLKpe2lz/xJOgIIAAAggggAACCCCAAAIIIIAAAgggUGiBO/rq5o0qvl7SIYWuTb1nC7hHR7Q2DtyVZBcCAKFPnwDAtsLL7ku/Nc7ZDZJeElo+gfU3StHbWhoGehI4OyMjgEAJBLY8md6fvklux5WgfeW3NN02Y232ONvyjrB905+W28mVP3VpJnTXPXI/s3Xh0C9KswO6IoAAAggggAACCCCAAAIIIIAAAghUssDt92cOyI3qKkmHVfKc5TCbm53cWj/4uXLYS6n2QAAgtDwBgG2Fu/rnLJRSn5b7q0PLJ7G+yY8dfWzotrY2nmCcxPNnZgSKLdCxsnbfKI5vNNniYvdOQj9zXffCGdkz7KZVqq7bVHuh5GcnYfDSzOg/i+LojCULB+8tTX+6IoAAAggggAACCCCAAAIIIIAAAghUskBXT+b5XqXzzXRCJc9ZHrP5pS0NQ+eWx15KswsCAKHdCQBsK7yst+41seWukqwptHwS65vb2SmzGxc3DKxP4vzMjAACxRXo7s8c4q5reGpVIHe3Tww8PHhF/gkAKXte5t2R6UuBWlFW+oOl7PTmQwa7wUAAAQQQQAABBBBAAAEEEEAAAQQQQKDQAh0r9p6biobPkfSxQtem3nYCble2NA6elWQXAgChT58AwLbCd/TV/d2ox5fJtCS0fELr32xWfS6vME7o6TM2AkUW6OqtXSLzSyW9ositE9EudvsX/8vgv/01ALB33VFRFH8jEZOXZshRMzutuX4w/x42vhBAAAEEEEAAAQQQQAABBBBAAAEEECioQEfP3N1TNbnT5GovaGGK/a0AAQARAAj9XwwCANsK39FXt8+o4gslvT+0fDLr2ypNq3pHy2uf+O9kzs/UCCBQTIGu/tqT//rzqs8tZt+k9DL3w3/RMHS35Qfu+vHsl2hz6vdJGb4Uc7p0dWpmfMmSV61ZU4r+9EQAAQQQQAABBBBAAAEEEEAAAQQQqGyBv/5C1W+s7ClLP51Lva0N2YWl30npdkAAILQ9AYBthbt/sEdtPK06/4qTj4SWT2j9x3Ox3ti2MPtwQudnbAQQKKJAV1/6Esnyr6Xf8jdqvgos4Ln9WxrX/vcW3G/0zNmvpjrKp7vALrDzNuW+nMrp/CMXZf8crgWVEUAAAQQQQAABBBBAAAEEEEAAAQSSKtDZnz4pkt3ozu/4At8D/S0N2YbAPcq6PAGA0MdDAGB74a7+9JlyuyK0fGLrW7zooe+v6WtvV5xYAwZHAIHgArcvz7xgNNIVZjomeLMkNjDFw8Px/sc0rXnkrwGAvrp9psl/6PK/S6JHkWb+oefi01sXrflZkfrRBgEEEEAAAQQQQAABBBBAAAEEEEAgQQLdfXXvcsWfkZRO0NilGJUAQF/mUJd9TvL9S3EAld+TAMD2Z9zVX/thuecDADMq//xLMKHbKTP2Tn/xsJf9bnMJutMSAQQSInBHX928UeWulKwpISMXd0yzn+aGo7e1Na1+fEsAoLt/rz3dR7okJTq5GvQUTI+6+4mtDUN3B+1DcQQQQAABBBBAAAEEEEAAAQQQQACBRAp099cudvm1cu2XSIDiDU0AgABA4LuNAMD2wLf1p4+O/voEgBcGxk9mebNbZ6T8Q4fNz65LJgBTI4BAMQRu602/PTK7StIritEvgT36zKpbmuufeHJLAGBZz5w5XhVd6aYTEohRtJE91gdqc9lbmpo0WrSmNEIAAQQQQAABBBBAAAEEEEAAAQQQSIQAAYDiHLNJDzc3ZA8sTrfy7MIrAEKfCwGA7YW7+tNvM7crXTogtH5C6/86F9csbFv4+OqEzs/YCCAQWKC9XdE/Hpp5n7uulDQncLtElnfZv8bT46Vt84bWbgkA3NFXt0dOfo7LlyZSpGhD+2W5KHd124J12aK1pBECCCCAAAIIIIAAAggggAACCCCAQCIECAAU75hbGrJbfq+a1C8CAKFPngDA9sLLVtS+Lo48/6nRhaH1E1p/k+Xs1c2LBv8zofMzNgIIBBbo6Jm7e1XN6FJ3Ozdwq+SWN7XnhlPXtDWtfmrLD6p33/3SaRv2yL7LTF9MrkpRJu+KLHfWkvq1vy9KN5oggAACCCCAAAIIIIAAAggggAACCCRGgABA8Y6aAEDmUJd9TvL9i6eepE4EALY/7e7eupe75QMAfkSS7oRizmqy9/ziB4O3trcrLmZfeiGAQDIE7nxg9otHRqoulvydyZi4+FO62XHxnMGOtgM1vCUA0NGhVPW+mTfGrnuKv53kdDTpNxbbu5csHHwwOVMzKQIIIIAAAggggAACCCCAAAIIIIBAMQQIABRD+a89CAAQAAh7txEA2N63Y+WsTCpXdbVMx4e1T3B11y25v2RPaGtTLsEKjI4AAoEEbl+ZWZCL7XrJXxOoReLLRqm46ef3rFmRD3I986iqzuVzXhWloh+5NCvxQsEAbJNJ70qPDN7Z1KTRYG0ojAACCCCAAAIIIIAAAggggAACCCCQOAECAMU7cgIABADC3m0EALb3zX+IMbVP5mpJHwtrn+Tq/vvMyNAr+NtFku8BZkcgnEBnf6bFXLdI2iNclyRXttXmuUObG9f8PK/wTACgY0XmgFRkyyR/eZJ5Qs9u0gWjG/26tkOH1obuRX0EEEAAAQQQQAABBBBAAAEEEEAAgeQIEAAo3lkTACAAEPZuIwCwI9/uvszpLuXfHT0nrH9iq4+ajxzY3Lj+t4kVYHAEEAgisKxnzpzRquhjkemCIA0oKpf/LPLU0c2NA1v+N/yZAMDtyzMvyEV+vcyOxCmkgN+pKjulZX720ZBdqI0AAggggAACCCCAAAIIIIAAAgggkCwBAgDFO28CAAQAwt5tBAB25NvZnz7W3C6StF9Y/wRXdz+xpXHo8wkWYHQEEAggcMfKuS8d9dGr5PwNOgDv1pJdwzmdesyi7J/z/2CbJwDsPbcqNXyeuz4SsDmlXY9alf1z8yGD/wkGAggggAACCCCAAAIIIIAAAggggAAChRIgAFAoyV3XIQBAAGDXd8lkriAAsCO92/rSbzXZFSYdNBld1u5cwKSO5obsOzBCAAEECilw+321B+dy+jfJ9y9kXWptI+B2RS41cmXbgnXZ/D99JgDwtbszs2bMslMkvxSwoALu0tGD07PLTpynkaCdKI4AAggggAACCCCAAAIIIIAAAgggkBgBAgDFO2oCAAQAwt5tBAB25Nu5fO7LLJW7UdKhYf0TXN2Va2nMViVYgNERQKDAAh2/Uk31mnRb7PbVbf8uXeA2iS9nHn+0esZuNx8+77ENeYxnAgD5/9DZlz7MZN/mAMLeJy59ulrRBYsbBtaH7UR1BBBAAAEEEEAAAQQQQAABBBBAAIGkCBAAKN5JEwAgABD2biMAsCPfb/fOTm+OUl+QqyWsf7Kru0dHtDYO3JVsBaZHAIFCCXQ/sEdtnKs+12KdWqia1PkbAXf521sbhu7e+p1nBQBu6617fWTxNyXtBV44ATc9FA+n/rmtafXj4bpQGQEEEEAAAQQQQAABBBBAAAEEEEAgSQIEAIp32gQACACEvdsIAOzMt7uv9gaXnyCpJuwZJLd6FOnaJQuy/KEuubcAkyNQUIFl/bP3j+PoWzJ7TUELU+z/BEyPWOzHNTcO9W39h89+AsDyOa+yVPRZSfNxCytgpgVLFmTvN5OH7UR1BBBAAAEEEEAAAQQQQAABBBBAAIEkCHT11i6R+bWSXpiEeUs5IwEAAgBh7z8CADvz7erPnCa3sySfG/YMklvdpd/U7jvrn5pe/Mim5CowOQIIFEKgvV3RP74xvcDN/l3SjELUpMYOBe73XHxy66I1P9v63WcFAO58YPaLR4ZTl8p0NIDBBS7KPZa9sK1NueCdaIAAAggggAACCCCAAAIIIIAAAgggUPECnf21x0bu17uUrvhhSzvgaEtDtrq0Wyht9+4+AgBhT4AAwM58u/tqm126UvL9w55Boqs/FcsPO6phqDfRCgyPAAKTFrjn53vNfHrd8Nludu6ki1HgOQTs36JU7rwlh6x5ZOtFzwoAdKyclUnF1adLfjaOgQVcK180I/v6efM0ErgT5RFAAAEEEEAAAQQQQAABBBBAAAEEEiDQ1Zs+WWY3JmDUUo/4x5aG7H6l3kQp+xMACK1PAGBnwnesnPOqUbeb5fbq0KeQ4PrDkl3T0jB4ToINGB0BBAog0LFi97mpqOY7kl5bgHKU2JmA2Sc2rvXrjz0su27rJc8KANy0StVzN6XfJ9lnXKpCMqCA2+aU+6uPXJh9OGAXSiOAAAIIIIAAAggggAACCCCAAAIIJESAAEDRDrq/pSHbULRuZdiIAEDoQyEAsDPhZT+bMyf3tC0z2etDn0Ji65tiuR7YfY/qQ9/8yieeTqwDgyOAwKQE3GW39aXrqyz6gcunTaoYi59DwDYp1km5xwdv3fap888KAORXd66sPdJi3ST5nngGFnC1tzRmLwzchfIIIIAAAggggAACCCCAAAIIIIAAAhUukH/E6vr1I6eZxO+awp81AQBeARD4LiMA8FzAXX2ZWyQ7RvxBKdx96PpLVBW/c8kha34UrgmVEUCgkgU6XKmoP3OZSWdU8pxlMNsfXX5ya8PQ3dvu5W8CAN39mUPc9SlJ88tg0xW9BZN+2dyQPaiih2Q4BBBAAAEEEEAAAQQQQAABBBBAAIHgAh0r9p6biobzj2v+WPBmNCAAQAAg8H8LCAA8F3D3yszp7loqV23gg0hy+Q3uurm1MfvRJCMwOwIITFygo0M1qX0yP5f0iolXYeUYBPrd7bTWxsEHtr32bwIAy/r33D/20UskvWMMRblkcgKjMlvQUj/448mVYTUCCCCAAAIIIIAAAggggAACCCCAQJIFvrE884KalC6Q9L4kOxRpdgIABAAC32oEAJ4LuLu/drG7f0bSCwIfRJLLu1z3VVVvbl48/+knkgzB7AggMDGBruVzFyqVu1e8cn5igGNd5XarotwnWurX/HHbJX8TALjnnr1mPj1z+ByX5RPDfAUW8NhvaF049OHAbSiPAAIIIIAAAggggAACCCCAAAIIIFDBAp0ra19hcXyFZEdU8JhlMZrJv9rcMPQvZbGZEm2imwBAYHkCAM8F3LF89ourUqlvu3RA4INIevk/mev05sbsbUmHYH4EEBi/QFdv5ksyHT/+lawYj4C7XzJtzYxLDz/8sQ3brvubAIC7rLuv9iTJr5Bp9/E04doJCTyRG0m9tK1p9VMTWs0iBBBAAAEEEEAAAQQQQAABBBBAAIHEC3T21c0zj6+TaUHiMQIDeKyrWxdmE/0+WwIAgW8yEQB4LuGODqWq9sn0uKlerij0aSS4/rCkW1sasu9PsAGjI4DABATu6KvbY9Tix+XabQLLWTJWAdOgXEub67NfNJNvu+xvAgD5b3b1p99mbleSoBur8MSvM9OGOGfval04ePvEq7ASAQQQQAABBBBAAAEEEEAAAQQQQCDJAt0r6xZ57J+X/OVJdijK7G5XtjQOnlWUXmXahABA6IMhALAr4a6+zKclnShpxq6u5fuTErjPY/9g68KhX0yqCosRQCBRAl296Q/I7KZEDV2CYd31sLmf2bJw6Dvbt99xAOC+uldbHF/prjeWYL9Ja5lz6Z6W+uzbt09nJA2CeRFAAAEEEEAAAQQQQAABBBBAAAEEJibQtSL9NpndKlN6YhVYNVYBd7+8tXHo7LFeX4nXEQAIfaoEAHYl3NWXeb9cV8s0e1fX8v1JCLged/NLWuuHbtR2ny6dRFWWIoBABQu0tys66E2ZPkmHVPCY5TLa3S6d2dqQ/dX2G9phAKD7gT1q4+HqKyPT8S7t8Jpymawi9uH6cy41+oa2Bet+VxHzMAQCCCCAAAIIIIAAAggggAACCCCAQNEE2l3RQf3poyX7t6I1TXAj9+iI1saBuxJMIAIAoU+fAMCuhDuW73VQKjXyfUl77epavj9JAVdnVfXmDy2e//QTk6zEcgQQSIDAnf2zXjscV/WYaWYCxi3liC7zz1V5aunihoH1229kp3/c7+6tPdfN80lWDij88a2PTNcsqc9eGL4VHRBAAAEEEPhbgevv1rR9Z9f+IzaFF8gpN6Lc9P9pW/j46sJXpyICCCCAAAIIIIAAAlLHylmZKFf9cTM/F4/wAgQARAAg+G1GAGAsxF29mYdl+vuxXMs1kxL4lbuf3do4lOjg06QEWYxAQgQ6OpSq2idzo0vvlVSdkLFLM6ZrrZkubm7IXr2jDew8ALAyc5S7LpHrZaXZeaK6uqSVVj2yuPng9YOJmpxhEUAAAQTKQmBZz5z94uroD2WxmYrbhK3+3+cptbfUD3624kZjIAQQQAABBBBAAIGyELijr26fUcX5D5a8vyw2VOGbyHmqsa1xdf7Rton94gkAoY+eAMBYhLv6MzfJ9T5JqbFczzUTFtjobtfFo9ElbU2rn5pwFRYigEDFC3T1zn6JWepuSS/nCfOBj9v0X2Y6t3lB9rYdddppAGBZ/5x/cqWudfdFgbdI+b8KPGayc5obBr8CCAIIIIAAAsUW6OhNv7DK7CGXZhW7d+X3s01yXdLSOHhx5c/KhAgggAACCCCAAAKlEOjurXu5W3yDpENL0T9pPXPRaG3bgnXZpM297bwEAEKfPgGAsQh3rqg91iL/Ep8yHYvWpK/pN9MZzfXZ+yZdiQIIIFCxAp29tUtlfrbxO+bgZ2xmy025jy2pX/MfO2q20wDA3fdnZm0ctc9JfrSkKPhOk97ANCzXslw0enLS/w9E0m8F5kcAAQRKIdC1ou55iuL8u/MOLEX/Su9pshtTsrN39D6mSp+d+RBAAAEEEEAAAQTCC3T1177W3ZeZtG/4bonv8NQmz73wXY1rh5IsQQAg9OkTABiLcNe9c16kaanfSD5tLNdzzSQEXGvc7BPrRwZvPr5JmyZRiaUIIFChAv//98vfdKnB+Lty6FOOJfvmjCo/6bD52XU7arbTAED+4q7eTLubTiWpEfqcnqn/K491WuvC7D1F60gjBBBAAAEEJHX377Wnx6MdMp78E+aGsDt9RGe1Ng3+Okx9qiKAAAIIIIAAAggkVSD/rtXUvum3yG0Zn4Itwl1g+s/cBj+k7dChtUXoVrYtCACEPhoCAGMV7urPPCzX34/1eq6blECXeXROc+PAbydVhcUIIFCRAt39meM91iUyPa8iByyjoUwakts1zY2Dl+xsW88ZAOjuzRzlpsslvaSM5qrkrTxtppuqp03/xOHzHttQyYMyGwIIIIBAeQl8u3d2etiiz7jsXeW1s4rZzY8tjs9oXrhmecVMxCAIIIAAAggggAACZSFw16p9dhvZvPn97n5dWWyo8jexokrR25P+dC8CAKFvdAIAYxXu6qv9jOQfGuv1XDcJAdeAzD/6oulDt82bp5FJVGIpAghUmEDHg3P3To3kbnDXESZVV9h4ZTeOSb9x89Na6oe+s7PNPWcAoGNF5oCU6RaZXld201Xuhu5PRTrtyAXZlZU7IpMhgAACCJSbQMf307NTM3SRZB8ut71VyH7+7NLprQ3ZjgqZhzEQQAABBBBAAAEEykSgY8Xuc1NWc4VMx5fJlip9G1+umT79lKR/eIcAQOjbnADAWIX/ei/q38d6PddNUsD81lys89oah/40yUosRwCBChJYtrL2yDj2KyS9vILGKudR+qNUfOySQ9Y8srNNPncA4FeqSWUzX5GphUeIFeecTVrnsstzjw1e09am4eJ0pQsCCCCAQNIFOlY+f0Yq3nCipE8n3SLQ/CMynT3wy+z1J55ISj6QMWURQAABBBBAAIFECnT0pl+YMssHTQ9OJEDRh/YbctHMM9sWPLqx6K3LqCEB6FDoZwAAIABJREFUgNCHQQBgrMJ33bXPbpvnbHrSTDPHuobrJi5g0hPudmxzw+APzRRPvBIrEUCgUgTu6KvbY9Tiq+V6j6SaSpmrjOcYcVdn7Wj23U1NGt3ZPp8zAJBf1N2fPsvdzpSUKeNhK2ZrJrm77lVVdFbLIQM/rZjBGAQBBBBAoKwFOn6lmuo1c94Re/TVst7oFN6cu66PvebitoWPr57CY7B1BBBAAAEEEEAAgTIT6F5e+/ee8v/gF67FOZhYOiE7PfuVExP++GsCAKHvNwIA4xHu7M38wExvHM8arp2wgJvsptF48/ltC5/i9xsTZmQhApUj0NWffpvc8p/+P7BypirnSXy1LLqopX7wM8+1y10GALpWpOuVir4s95eW87gVtreNFuvc0cezN/IUgAo7WcZBAAEEyljg9t7ag3Pm95fxFqf21lzfS6X8zCMXDD00tQdh9wgggAACCCCAAALlInDTKlXXba49Wu4EeYt1KG7vzowOfuO5PnFVrK2Usg8BgND6BADGI9zZW3uKmd8wnjVcO3EBl9aZ9OaHfpB9sL2dpwBMXJKVCEx9ga/dn5k1I+cXy+1Dknb5N+epP3E5TGC/Uxy/p2XhUP9z7WaXh/HVe/aaOXPmyI8kzSuHsZKzB7srF/vStoXZh5MzM5MigAACCJRSoLt3zivdUvdIvlcp91HBvf87Mp20pD7Luwkr+JAZDQEEEEAAAQQQKKZAR8/c3VPVozdJ9s5i9k1yr5yiV7Q1DPwmyQb52QkAhL4DCACMR/j2+zMH5HJ6SK5oPOu4dlICN8+o0mmHzc+um1QVFiOAwJQWWNaXfmssu4pP/xfvGN31QGtjdv6uOu4yALDlB7r+2mvd/QOSZuyqIN8vkIBrrZmfkh4Z+lbSE8UFEqUMAggggMAuBO7oq/u7UfNvyP1VYIURMLcPTV8/ePNhh2lzmA5URQABBBBAAAEEEEiSQPcDe9T6SPWDkl6SpLlLNqtrTW409dq2ptW/K9keyqQxAYDQB0EAYDzCd63aZ7eRTZv6Xfqn8azj2kkIuJ720ej1rU0DqyZRhaUIIDCFBb7dOzs9bKlzXDp9Co8x1bb+tOTXtTQMnburjY8pANDVV3eEKf6iS3W7Ksj3Cypwt0d2WuuCwXyq2AtamWIIIIAAAghsJ9DRm35hyuxaSUvACSTguqnKok8ubhh4LFAHyiKAAAIIIIAAAggkSGBZb91rYov540vxzvzHqlJzy/zso8VrWZ6dCACEPhcCAOMR7viVaqrWZC5z18fHs45rJyngfmvuL0Pv5zXGk3RkOQJTUKC9XdE/vinzRknXunTAFBxhqm55QObvaakf+s6uBhhTAOCulbX7Drt+JPeX7qog3y+kgG2OPP7ISGrmrW0LHt1YyMrUQgABBBBAYHuBO+7fc6/R0dELJZ2ITjCB+6uq/MTF84d+EawDhRFAAAEEEEAAAQQSI9DdlznfpfzP8HwVQ8D89qpU9QcXz3/yiWK0K+ceBABCnw4BgPEIb/lD1BvmNLpF98qUGs9arp24gEkbIvlbjmwY6p14FVYigMBUFOju32tP2chSj3XqVNz/VNyzmdxj/TqXGm1oW7Auu6sZxhQAyBfp6s10uKnFxHt0doVa4O+v8KrU+1vnb3m0GE8BKDAu5RBAAAEE/k/gq/fsNXOPPUbeH8fKPwWArxACrqfc/B0t9UPfM1McogU1EUAAAQQQQAABBJIj0N2X6XWpITkTl3hS1zXRaHzxkqY1a0q8k5K3JwAQ+ggIAIxXuKsn83xV+48k23+8a7l+EgKulbvPqv7nN7/yiacnUYWlCCAwhQRuWqXqucN1b/Y4/ryk502hrU/1reYkfbmlIfv+sQwy5gDA7X2Zd+Skr0qqGUthrimYwLDcPzxj79qvHPay3/G+4IKxUggBBBBAYHuBnh5VZaszLZK+iU44AYv87FScunFxw8D6cF2ojAACCCCAAAIIIFDpAp3L577MovghmU+r9FnLZT6L9L61m2d9/fimRzaVy55KtQ8CAKHlCQCMV3jZz+bMiZ+OLuephuOVm/z1bn5ca/3Q1yZfiQoIIDAVBDp65u6dqo4vk/w9U2G/FbTHYY/jd7QuXHP7WGYacwCg+4E9ajVS/V8upcdSmGsKKvBzrxo9qnX+uv8qaFWKIYAAAgggsJ1AV19dk8u/ZfK54AQSMPuhlHtvS/2aPwbqQFkEEEAAAQQQQACBBAh099ee6+4XJ2DUshnRXG9d0pD9d57mJREACH1bEgAYr3D+E6m1GzJHWKSv8yHG8epN7nqX/0fsWtzWOPSnyVViNQIIlLtAR4dqqp6fWeyx3Sh+f1zc43L9xWpGDmo+eP3gWBqPOQCQL9bVm/muTG8ZS2GuKbCA68LcX7IXtbUp/4gHvhBAAAEEEAgi0HVf3auVi2+SNC9IA4rmBdbL4rc3L1jTxy8OuSEQQAABBBBAAAEEJirQ3Zf5hUsHTXQ968YpYPqfKBUtXjJ/4CfjXFmRlxMACH2sBAAmItyxInNAFOmbxv82ToRvEmtss0xXtdQPfmISRViKAAJTQCD/uhWrtltd/vopsN2K2qKZvtlcnz1mrEONLwDQl3mfpJvHWpzrCijgenzEo7cdvXDgpwWsSikEEEAAAQSeJbDlMaKp3BWSlkATUsDOqRmadt3hhz+2IWQXaiOAAAIIIIAAAghUpkBnX908U3yfpKrKnLAMp3Kt9JS9r3XB4K/LcHdF3xIBgNDkBAAmIvz1H+y517RpufNlfvJE1rNmwgLu0m+l6NjWhoFVE67CQgQQKGsBd0Xd/ZmPyO1yXkFV/KOK5IctaRj67lg7jysAsKxnzpxcVfSomWaOtQHXFU7ApW+1NmSPLlxFKiGAAAIIIPBsge7+vfaMfWSpSadiE1DA9WDOh9/etvCp1QG7UBoBBBBAAAEEEECgQgW6+jMXyXVehY5XnmO5fT0V+9IjF2X/XJ4bLO6uCACE9iYAMBHh9h5VHViVWRLJbuWPUxMRnPgak212qTMXzTihbcGjGydeiZUIIFCuAnf2pl84YvagpL3KdY8VvK/Ha4am7z+eD5ONKwCQh+vuy3S51FzBiOU7mttmi/SO5vrBO8p3k+wMAQQQQGAqC3T8SjWpNbUnyv36qTzHFNj7SFV1bsERr1v7EzP5FNgvW0QAAQQQQAABBBAoE4GOnrm7p6py98t0YJlsKRHbcOmTmz137bsa1w4lYuBdDEkAIPRdQABgosLLeuteE1v8r7zacKKCk1r3RzNf2lw/9M1JVWExAgiUpUBnf+0ycz+yLDdX6Zsy3dJSn33veMYcdwDgtuV174pS8dfG04RrCyfgrj9UW/TKxQ0D6wtXlUoIIIAAAgj8n0B3b+YoN31e0hxcwgmYdFN6JPuhpiaNhutCZQQQQAABBBBAAIFKE+i8r+5w5eKvmTSr0mYr53nM7V/So4Nf5+f3v54SAYDQdysBgIkKd62oe55H/gmTnzTRGqybsIC7bLly0QdaF63+rwlXYSECCJSdQHdv5i2x6TsmRWW3uQRsyKq8sXn+UN94Rh13AOCuVfvsNrJp06MupcfTiGsLJjAs12UPNWQ/2W6KC1aVQggggAACCPx/ga6+OU1SlH8CwD+AElTgsYGh6S878fDHNgTtQnEEEEAAAQQQQACBihHI/2Wle2XtV9z9aJOqK2awch/ENeCuY1sXZu8p960Wa38EAEJLEwCYjHB3X/pdLst/sGG3ydRh7fgFXFpnrk/n/pK9qK1NufFXYAUCCJSbwPdWzspsiKt6XTqg3PaWkP38KRft9orxvl5l3AGAjg7VRPukP2WyUxICW45j/iX26J1HNQ78qBw3x54QQAABBKa2QGdP7StUFV9mZjzSKfBRxq73HtWYvSVwG8ojgAACCCCAAAIIVIjAsv7Z+8ce3SPZ/hUy0lQZo68qij+yeMGan02VDYfeJwGA0MIEACYjfNvyzIIopWskzZ9MHdZOTMClh8z87Ie+P/Td9nY+xDgxRVYhUB4CW14Xm629SJF/TK6a8thV0nbhn8k9NnR6W5uGxzP5uAMA7e2KDnrTnEWu6B6SxuOhLty1Lo3I7TvR5uH3N79p/WDhKlMJAQQQQAABqfsHe9TG06rPN9NH8AgrYPLe0fTQm9oOHN8PcGF3RXUEEEAAAQQQQACBchRwV7RsZe3ZHvsZMs0uxz1W6p7M7Gujo6Pnty1a+4dKnXG8cxEAGK/YeK8nADBesW2v73hw7t6p4fh8yT8gKTWZWqydkMCImW7dPKr2YxZl/zyhCixCAIGSC2z52fO+usPk8c3u2qvkG0rmBjZFsS06snHwx2by8RCMOwCQL55/j47Mvy3zV4+nGdcWUMA1YOZXjj42dN14Ux8F3AWlEEAAAQQqVKCzN/NRM10pkewMfcRmWtBcn70vdB/qI4AAAggggAACCExtgTv66vbJmX/d5Y1y3r9a5NO8aEaVrj5sfnZdkfuWbTsCAKGPhgDAZIW7e2vfHcuvMNPek63F+gkImD3p0iV77F71xTe/8omnJ1CBJQggUGKBzuVzXxZVxV9w9wbCVCU6DFd/VXVVy+L5Tz4x3h1MKADw1Xv2mjlz9+FT5HbFeBtyfQEFzH8qt1NaGrL3F7AqpRBAAAEEENBtvZmjIlP+3/MvhiOsgElfaW7IvidsF6ojgAACCCCAAAIITHWBrv7a9yj2i2R6/lSfZYrt/ymZndxSP3jrFNt30O0SAAjKK4kAwGSFO/rn/FPKo/wHGw6dbC3WT0zATA96bOcOzBhcfuI8jUysCqsQQKAUAh3fT89O7RadLfcTJc0pxR7oKZn08eqh6TcdfvhjG8brMaEAQP6xD3f0p+tziroknzveplxfMIENZvq3UbML2xYM/k/BqlIIAQQQQCDxAl39ta9115Umf33iMQIDmGtAiuqbGwd+G7gV5RFAAAEEEEAAAQSmqEDHir3npmz4szIdKalqio4xNbdt+qUiO7XlkMEfTM0BwuyaAEAY1/+rSgBgssI9PftNz9asb5f7RyVNn2w91k9IYESy26JU7twlh6x5ZEIVWIQAAkUX6OlR1WB1plmyS0z+0qJvgIZbBR6T2ZHNCwZXjffx//kCEwoA5Bfe/mDmBaPDutakZs6idAImPebSVbmR1M1tTaufKt1O6IwAAgggUEkC+df9WORXuvzYSpqrHGdxacSkG1sasqeW4/7YEwIIIIAAAggggEDpBbr7aptdfpmkl5d+Nwnbgek7Jl/aXD/0y4RN/pzjEgAIfTcQACiEcFdv7RI3v8ykvytEPWqMX+B/P72af3VKe0rRzYsbBtaPvwIrEECg2AJdK2a/WlHqEklvInhabP1t+rnfWmWppYsbBh6byC4mHAC4pWe/6bNr1h3jrn/l/cAToS/cGpP/RLnozOZFgz8sXFUqIYAAAggkWWDVKlX/cVO6XR6dJvNpSbYIPbtJLum3o4oWtzUM/CZ0P+ojgAACCCCAAAIITC2Br/fsUzetetPFkv2L5HyKtcjH567rU6PxBUua1qwpcuuybkcAIPTxEAAohHD+ww2e8s+b+9sLUY8aExMw2e/j2E+pzWXvbWrS6MSqsAoBBIoh0N2/156xj5wRSR9waVYxetJjhwJPSX5iLj3U2XaghidiNOEAQL7ZshW1r/OU3+yugybSnDUFExjOP0qnKoraFy9Y/buCVaUQAggggECiBbp7M8fLdKFLL0g0RHGGX29mVzTXD+bTtXwhgAACCCCAAAIIIPCMQGdv3eGRxZe7dAAsxRXw/CdXXef/8t7sZ9rbFRe3e3l3IwAQ+nwIABRCuKNDqdQ+6TMlO01SbSFqUmOCAm7LNerHtjRlH51gBZYhgEBggfyrU4aq1r3zfz+p1C7j98GBuXdV/gGP4pNaF6z52a4u3Nn3JxUA6Fix+9wqq1nqpo9PdAOsK5jA+lj65OYqff7Y+dn8Y3X4QgABBBBAYFICXfel65WzayQdPKlCLN61gCmW68HIqo5dUv/k73e9gCsQQAABBBBAAAEEkiDQsWLvualo5BMu/6BJ1UmYuZxmNOnh2H1pa+PQXeW0r3LYCwGA0KdAAKBQwl39ta9198+b9E+FqkmdCQmMuOvLLQ3ZD1r+dyB8IYBA2Qnc3pdujGXXu/TKybxCvuwGm4obMl0cDcfXTOYJVJMKALS3KzrwjZmWyOwGyfecioYVtucnItO7R/4ne29bm3IVNhvjIIAAAggUWaC7f/c93Wvyr/pZUuTWSW2XleyalobBS5MKwNwIIIAAAggggAACzxa4rS/91sjsU3K9ApuSCHzPpdNbG7K/Kkn3Mm5KACD04RAAKJTwTatUPXdj5iuxqZUgVaFUJ1xno8f6aOvC7BcmXIGFCCAQRGBZ/+z9XanL3NUsKRWkCUXHKvAnKfpwc/3AXWZbXh07oa9JBQDyHbt7617uUXyJXK0T2gGLCitg9tNIqTY+PVhYVqohgAACCRWw7t7M1W46SdKMhBoUbez8D3Sxq2/Uo/cf3Tjw26I1phECCCCAAAIIIIBAWQrkP/0f2fBSM53Kp7BKdESmz+dst4+1LXh0Y4l2ULZtCQCEPhoCAIUUXtafaYmla+V6fiHrUmtCAiPV0quOIFg1ITwWIRBC4O77M7OeHtVHI+kC/vgfQnicNU2dI3F07mR/PzzpAEBHh2qivdMftcgu5I8D4zzEQJe760ublTv9XY1rhwK1oCwCCIxdwDr7Zr8mUupel2aNfRlXBhFw/dkVndLaOMDjG8cI3N2fPtrd8p9If/EYl3DZJARMWufSdc312XYeiTcJSJYigAACCCCAAAJTXMBddvt9tW+IY90k+f5TfJypuv0hl1/W2jB01VQdIOS+CQCE1M3XJgBQSOF77tlr5tO7jX7HzRslRYWsTa0JCfwpFw/Pa1v41OoJrWYRAggUTOD6uzXthbPSLTlZ/skcuxWsMIUmJuBaY5HObK6f/JNSJh0AyE/Q3ZtucLMrJR0ysYlYVWgBU3RSemTg5qYmjRa6NvUQQGDsArcvz7wgrlKnu1439lVcGUjA5bqvZsb0Qw+f99iGQD0qrmzH8vRBqZR9UdJrK2648h3ofsV+esvCof7y3SI7QwABBBBAAAEEEAgp0PHg3L2jTfEFFvkHQ/ah9s4FXHo4ivys5gVD38bpbwUIAIS+KwgAFFq4sy99hrmdL9Puha5NvXELjLrsztRI7n2Teb/1uLuyAAEEniWQD5ze0Vf7ulHzbxgf/iqLu8PkP3KLzmypH/zxZDdUkABAR8/c3VPVuYsknSKperKbYn1BBJ5WLj6sZdGaFQWpRhEEEBi3wPdWzspsyFVdFZuO4x1j4+YLsWC9pPNbGrLXhiheqTVv6dH0WTXpb8jtcB4BVZxTNtMGd7suNxJd2ta0+qnidKULAggggAACCCCAQLkI3HSTqvc6oO4tOcVflWlOuewrcftw3TMc64RjFmX/nLjZxzAwAYAxIE3qEgIAk+LbweI7e9MvHInsB3K9rNC1qTd+AXc9baYvbKzSBcfOz64bfwVWIIDAZAW6+ue8yOPoW2Y6eLK1WF8QgU0u3RCPpC4sxO+ECxIAyI/VtSLT6maXmjn/Ai3IORekyCO5nB/RtmjooYJUowgCCIxZ4I6+uj1G3D9i8jNkmj3mhVwYUuCRXJQ6tG3B6t+FbFKJtTt7a5ea+RmSMpU4XznOZNJDsXzpL38w9L32dsXluEf2hAACCCCAAAIIIBBGYMsfqf4fe3cCH1dZ9Q/8d547k+5tMklb2rIqIFhFea1/2iRtCYtopZQk7byoCOJWBUEB2QXLvgjIJlKRVUSITUoFKsgSaJKyWFkFFBTKUkrbZCZds8zc5/x707q9ljbL3Jl7Z37z+fjxfe295znn+9xkMnPPfR7ILyA4zJ8RGLUXAt0KuXV2Zdt3e3FsQR7CBgC/p50NAH4IL2gpvVZUvYcYHT/iM2afBd6H6vmuM+xX8fL3Ovp8Nk+gAAX6LVC3tHSCY/UqAP/b7yA8MdMCLzkGpx9Znng4E4Ez1gDQ0DJ2jGrqOihmQ/gGmonJyUQMAR5xjHP8LN7wygQnY1CgVwKL38Cgjg9K4xC9GMAuvTqJB/kqoIAV4LbaysQ3fR0oT4PXtxRPE3VuVe49mr0ZVqQFOl/Vubh2WuvK7A3MkShAAQpQgAIUoAAFcilQV4ei6PjYV63KzyA6KJe5FPLYArxrIefOrmy7o5Adtlc7GwD8vjLYAOCHcH1L6Wdh9WEISvyIz5j9EnhFxJ6TluF/YBNAv/x4EgX6LLCwsbhYo+Y8BU7u88k8wScB6VLgHiOR02sqVq3OxCAZawDwkqlfWjIXVs4DMD4TyTFGRgRSUNzVbfFjLlmWEU8GocB2BRobEWkbFDvYWL148xY6+wMwJAuEwHqFOWh2ZeuyQGQTsiS87Sw22shDACYByOjfDiGjyG66iveMkbPau0csOK5qeWd2B+doFKAABShAAQpQgAK5EFjQHJsowL0AJuZifI65RUAhzwP61dmViVdosm0BNgD4fWWwAcAv4fqm2G8gOMqv+IzbZwEXimesynn6QdsT8TjcPkfgCRSgQK8FvC3dTST9PYGcyZWLe82WjQPfhsq5tVPbfpWpwTL6JX7dk6P2MMbcKkamQXnTK1OTlIE46wXys7RJ/SRevi6RgXgMQQEKfIhATyex6jxADgb4tEZQLhQBGtIliS/FJ6I7KDmFLY/6ptgvIXo0IHwKKbuT95AL84N4ZetfszssR6MABShAAQpQgAIUyIXAgiWlt4vRY3MxNsf8p0BKgfvHm6FHl3NJ6g+9LNgA4PdPDBsA/BL+7ZOxcuPgMQCD/RqDcfss0KEijxnoJekViWfZBNBnP55AgV4J1L2Cokh77Fi1uACCnXp1Eg/yX0DhquAPg4x8a2Z524pMDZjRBgDvyddEtPR0QH8IcBmdTE1SBuIoFKsEek06lvwpb4BlQJQhKLANgS1PaujZgBwBYDiRgiMgrntwzfS1jwcno/BlsqC59FhRvQaC4vBlH96MVbHRGLk0PcjeEJ+UXBveSpg5BShAAQpQgAIUoMCOBBYuKT3SGr0LwLAdHct/91UgKcAlNZWJK30dJeTB2QDg9wSyAcAvYW+rFWdc7HcQHObXGIzbdwEFOg10gXUjF8yevuaNvkfgGRSgwPYEtt78/4oqTgewF8Ct3INzxcgaCC6srWi7PpM5ZbQBwEusvmnUR1Sc+wX4eCYTZawBCyggb4roxekViV/H43wKdsCiDECBfxOoaxy9kxOxJ0P0uwBGECc4AgJ9Im2GzeA+YgObk/qW4t2gZim3+RmYY7/OVrzpOPjqrCmJp0Vg+xWDJ1GAAhSgAAUoQAEKBFrgwZbi3TqteQTS84UsX7kVeCsCNz6rci23kNvOPLABwO+LlA0Afgrf93TJDDctD/o5BmP3Q0CxdvN9pbo09KL41OQ7/YjAUyhAgQ8RaGiKfV4FFwLwti12CBUYAQXwJ4idXVvR/nYms8p4A4AqzMLm2NUq+DaAIZlMlrEGLOCK4FUV+XFtedvCAUdjAApQoEfg/sYRZd1F0RNUcZIAMbIETEBtTe3Udv7OG+C01NXBcSbEFgH4Arf5GSBm30+3EHmg06a/9pWpa5N9P51nUIACFKAABShAAQoEXaChOXa7Alz6P8cTpYCFypKhO7V9fsZe6MpxOoEeng0Afk8PGwD8FF7YWFxso9IASJWf4zB23wUEWK8qP3ed1OXczrjvfjyDAtsSaGgpPUjV/hiQyQCKqBQogfWbt9y9tKai7fJMP/iV8QaAnpthT4/cqzsdeRLAuEAxMhlPwFXFM2LsWbUV7UtIQgEKDEzgtkYMHllUPAdqbuSy/wOz9ONsBV5wUraquqq93Y/4hRZzQVPpCRD9qQDRQqs9APV2Q3F2TWXip5n+YzAAtTEFClCAAhSgAAUoUNACDU2lx6joNdxOM/eXgQg2QXF5TWXigtxnE+wM2ADg9/ywAcBP4S0POZR8HioP+DkOY/dbYKMC55amRv68qmp5Z7+j8EQKUAD1LcXToOZiAN7N/whJgiWgwIpoJPKZWZNXr8p0Zr40AKhCFjbHfgrBCcoLKtNzNvB43vLBFk8r5JTZU9ueGXhARqBAYQrMn4/omH2Lv2jF3MZ90YN5DViVY8vSbXdXVSEdzAzDldXWbQBe4wo/OZo3RdLAPbR66to/5SgDDksBClCAAhSgAAUokGGBBUvG7CdOegGUS/9nmLa/4doci2lHTku82t8AhXIeGwD8nmk2APgtXN8Y2xlReA0An/J7LMbvl0DKu39RW9H2MxF4S2TzRQEK9FFg0dLi/V01P1Ggiiu69hEvC4cLkIbiZzVTEz/wYzhfGgC8ROuWlk5wrP6FT8T6MW0ZiqlY6hp7wpzy9hf5JpohU4YpGIF/6xS+h7/nAjrtgtfQjc/VViXeC2iGoUyrvjn2ZwATQ5l8fiT9Z7ck8Zn4RHTnRzmsggIUoAAFKEABChSuwJYlqM2tAA4HV9kKxIXgrZo5e2rCe0KOrx0IsAHA70uEDQB+Czc27j64NbrhWAPrrepp/B6P8fsnoCLHl3a33cyHe/rnx7MKU8B7SLthafGuAnOeKr5emAqhqHq9a2TfeHnbCj+y9a0BwEu2vjl2M4Bv+pE4Y2ZGQAQ3i7GXHDm5/W02AWTGlFHyX6DuFRQNai85NK3Cm//BnW5XVX40YmTk+sM+tWpjcNMMX2YNzbHzFDg/fJnnUcaiPx8ypvTkGXv9jXuS5tG0shQKUIACFKAABQpLoG7pzkOM3XSmACdy6f/AzL2K6Fk1FcnLA5NRgBNhA4Dfk8MGAL+FvfgNTWV7q9g7ti6NnY0hOUY/BFTk+5s2RG455jB+x9cPPp5SYALezf/7ni7eTa05WxXfKrDyQ1WuEb2iuiJ5hl9J+9oAUNcy+tOOut4+8yOWaXl9AAAgAElEQVT8KoBxBy6gipudiL2kekr78oFHYwQK5LeA9yWNk970RRjcxif/AzzXgtdUMWd2ZeKVAGcZytQWLR25Z9pGPNeiUBaQH0l3WGu+rh+0/jYeh5sfJbEKClCAAhSgAAUoUDgCy5Yh+nZnrGbzE6fePvN7F07lga+0A+p+onbq2jcDn2kAEmQDgN+TwAYAv4W9+Hc+PHbYkCHpr4vRKwQYnI0xOUa/BDoEOEdS9rbqqvb2fkXgSRQoEIGFLWM+6tr0GSK8+R/wKW8bXOR84ov/b80HfuXpawOAl/SC5tLbBPo1vwpg3IwJ/BJiL6qtaH87YxEZiAJ5JuB9KBg+rPtIVbkGgrI8Ky9/yhF0Q+V8t8P+LH5ocm3+FBacSuqbY38EMCk4GRVWJgJ4zbxvAnp0bWXi6cKqntVSgAIUoAAFKECBcAvMmwez/yFl/5OGewUgVeGuJu+yf7y2MnFw3lXlU0FsAPAJ9p9h2QDgt/A/4jc0FX9KjbkOimnZGpPj9EsgKcAliKZuqzlgfVu/IvAkCuS5QP2SUf8DEzkV0C/neanhL09wfm1FYp6fhfjeALCwZfSnrdo/ADraz0IYOyMCt2NQ9MLaz65ip3NGOBkknwQaXxk9PJlw5yhwweatMyZsXgLd99+f+eSX3VrkeQjm1la0eTep+fJBYEFL7BRRXOVDaIbsvUAawBInghOPnJx4tfen8UgKUIACFKAABShAgVwK1DeN+gjEORfAUeDTprmciv8a2xipri5vuy9QSQU4GTYA+D05bADwW/gf8esaRw83EffbIvBuxHAl42zB92+cVWLkGi2SO2onta7sXwieRYH8FGhoiU3RLd/XTsnPCvOnKhEsN1FMO/L/Jd71syrfb2B5e2WbZOwyAU72sxDGzpSA/FqMe3NNefuTmYrIOBQIu8Ci5rIRadj/heIsCPYAb/4HeEql00IviaTs9VwSzL9pWtgy6qNWnef5wdg/415G3gDgHtfIvHh524pensPDKEABClCAAhSgAAVyJPDgs6N36ui23xfoXAAlOUqDw25DQIEVg9X95OFT1yYJ1DsBNgD0zqn/R7EBoP92fT9zYVPZZ6zoTwDlyix958v2GSshcqdYubVmauvr2R6c41EgiAINS4unqzUXA6gIYn7M6T8FxOhZa4qSV82dhJSfNr43AHhr1C56quQTriv3QrCvn8UwdkYEXAGWqsoFtVPbHs1IRAahQIgF7locGzlkhB4FyA9h8FEoTIjLyf/UBc/C6Cm1U5It+V9s7iq8rXH3wSOjaxdzydLczcG/jbwakGuHRPSGGZMT6wKREZOgAAUoQAEKUIACFPgvAa+xPCXu0aLiPf0/jkRBE5AbaivbTgxaVkHOhw0Afs8OGwD8Fv73+He+OHbYkHXp7wn0LBGMyubYHKtfAl6zVp2ouZpNAP3y40l5ItDzAHZ7bCYsThHBAQCcPCktf8tQvOaKqY5XtL4OgfpZqO8NAF7y9y8bPzTV2Xm8Aj/xsxjGzphACtCnrMjFcyoSf8hYVAaiQMgEGlrGjhGb+pIVHA/Bnrz5H/gJ7BDgJ5siuOpo3gj1dbLq6uBEJsSOUcWtvg7E4L0VeFMMLk5j6G/i5e919PYkHkcBClCAAhSgAAUokB2BngZas26WOjhfgI9lZ1SO0geBTjh6CBvJ+yAGgA0AffPq+9FsAOi72cDOWNBcNgnQnwj0wIFF4tnZEBAgqZDFRtwrUyvaX47H4WZjXI5BgaAI9Nz8T8SOhsEPxOLjEN78D8rcbC8PAU6LDh5848xJ72/yO9+sNAB4qwAsbC7eDyK3K+TTfhfF+BkR6FbF85s7Hn/qvp9YGI+jOyNRGYQCIRGoaxy9k1PkzoXiWxCM483/UEzcMxB7em1F+5JQZBvyJBctHb1nWt0noJgQ8lLCn77AAvIiYM+NdScfrqpCOvxFsQIKUIACFKAABSiQHwI9zbPjSqaoyM823zPdLz+qyq8qBGgqUncWl//v27yyAaBvXn0/mg0AfTcb2Bl1S3ce4thN3hYtp3OlloFZZvHsTQo8Cdee8+dp7S/O6/l+hC8K5L9A3dKRsYiNHKuK70LwET75H44539xg9kTayglzpiZeE5+f/vdEstIA4A1U1zh6eCTqfoerAITjQtyaZVqA16FyeXpl2z1sAgjV3DHZAQjULS2dEFE9TRVfBRAbQCiemiUBEayD4pq0GXoZn4DODnrdspJRTqe5CNDvZWdEjrIDAe+m/wuienLN1GQztShAAQpQgAIUoAAFgiGwsGnUZ1Sc2ywwUcAt5YIxK/+ZhQG+uXpw4k6/92ENYu0DyYkNAAPR6825bADojVKmj1n4VPHu1jU/B/D5TMdmPN8EuqH4i1H3lBfdtU/O40MRvkEzcDAEvFWLoakTFD0PLo7lg4vBmJcdZqHSBdETYqmRv66qWt65w+MzcEDWGgC8VQAWPVXyCWvlSgU+l4HcGSILAgpYUawwwFWpTr09fmhybRaG5RAUyJlA/bKycdJhr1bBEQCG5iwRDtw3AZUnXWtPjE9Pvty3E3l0fwW8J5nM+JLDBPJgf2PwvIwLeMvdPeTCnBqvbP1rxqMzIAUoQAEKUIACFKBAnwQWPx0b2ZnGAwpUZvMhnD4lWegHC5aLNYdxD+m+XwhsAOi7Wd/OYANA37wyc/Q8hdlvaen3VPVsAGMzE5VRsiDg7aP9jgjOry5P3J6NJ2uzUBOHoMB/CdQ1lezqGHMGVI/ZvBXuMM3iQ96cjgEKKB5WwamzKxOvDDBSr0/PWgOAl1FdHYrMTiVfFyM/BTC411nywJwKeG+YqtigKtdZjV4bn/bBmpwmxMEp4JNA3ZOj9jCOswh8MsMnYd/CJiFydU1528X8A983420GXtgy6qNWzc2AVGV3ZI62HQFvubuHHBffOXJ64l1KUYACFKAABShAAQrkRsC7+d+RwiMwmMQns3IzB70aVeUKk3Yvra5qb+/V8TzonwJsAPD7YmADgN/CHxZ/UXPZiDTsb7auAuDkKg+O2y+B1Oal0C+srUxc2K+zeRIFAixQtyT28YjgOhUcyCX/AzxR206tXRWn2pWJu7K50npWGwC8uhcsKdlPRC4XwWHsTgndReolfEu3i/OPmpZ4jzfaQjl/THobAo2NiCQjJZNV5B6A+5mH7CLxOnyfdmGO4xPP2Z8570NxCviOwF7OJ5qy77+9EQX4vVrzjdpprSuDlRmzoQAFKEABClCAAnkvIIuXDC/bZIrqBZia99WGu8D1UKmpqWx7XLhvdJ9nkg0AfSbr4wlsAOgjWEYPb2gpOUpVruT3hBllzVowVdQZ033iS49saJ03D96DEnxRILQC85chGussmWwgdwDYI7SFFG7iKoJ7uhE596iK1X/PJkPWGwC84hqaS48F9HLlMjrZnOuMjSWKx0wUJ3W/k/hrPA5vuWG+KBBaAe+pjI0p1BrBtQBGhLaQwk18NaDn1VYm5xcuQW4rv6+5ZKqrcjcEO+c2E46+DYHFsOabbALgtUEBClCAAhSgAAWyI+Btf9mwtHhXVfMLAxykQCQ7I3OU/giI6ANq7fdrp659sz/nF/o5bADw+wpgA4DfwtuLf/+y8UNTnZ23WaBagGguc+HY/RJwIdIM157jRoY9Fy9/r6NfUXgSBXIssLCxuBhFcri1chMEw3KcDofvn8A7VvSMORVJ7+HTrL5y0gBw35OxXayDCxX4MvgGmtUJz+Bgb0Hl2xGRZ2ZVtq7PYFyGokBWBFRhfrtk1G4Rx/muqp4EkUFZGZiDZFLAVcUT1knH4+XrEpkMzFi9F6h7rHSCM1jPg+LbvT+LR2ZNQPGQa93j49PXvpW1MTkQBShAAQpQgAIUKEABb9/o/VvK9kpDrwD08wCKCpAhNCUr0GmMzE2ParsnPhHdoUk8QImyAcDvyWADgN/CO4rf8HRJpablTj5xuyOpgP67wIriDQWuFIn+7qVHVnE1gIBOFdP6b4G6OjjYeeQeEY2cqIqTaBRagW5V3B6NRs6bNXn1qmxXkZMGAK/I+qWl1Wr1UgE+lu2iOV7GBDZZ4MfquvW8sZAxUwbKgsDDL44dtnFt1yRrzOkCORhQ3vzPgrsPQ6wW1W/UTE0+4ENshuylgPcHqTOu+MuAuR6CUb08jYdlVUAfFMecVjOl7bWsDsvBKEABClCAAhSgQIEIbGkwL5loHPkxgC8KMLhASg9zmc1qnJNml695PsxF5DJ3NgD4rc8GAL+FexO/vqX0Mqj+kPtt90YrsMesFuDXaVdvQ1nyr2z6Cuw8MbGtAj33LtanylX1HIhMJ0x4BRR4WaFnzKlM/j4XVeSsAcBbusKNmPNF8HUAw3NRPMccuIACKQP9jWtkfllX4tmqKqQHHpURKOCfQP2SsnHi2MO3ds59HIDxbzRG9k3A259R5Z51qbZvHFeFTt/GYeBeCTQ0FX9KYS6H4LBencCDsiogQNqqPqSOXMr36qzSczAKUIACFKAABQpA4LZGDB45uOQzSMupW/8eHloAZYe9xG5Azm+HXP8NrmrZ77lkA0C/6Xp5IhsAegnl62ELW8Z81Nr0/RDs6+tADO63wAaoPioObklvRFP80ORavwdkfAr0R+B3z4zaI5WOHA7F9wH9CICc3cPtT/48518CAqxTlZs2bopccMxhqzbmwianF099S+lnBXqDKj7LCzkX05+xMVMiWCaQG1OSWsyluDPmykAZFFi2DNF3Ooo/rsZ8VRVHCTAhg+EZKvsCKxyjXziyPPly9ofmiP9XYFFz2Yg09ERAzwQwgkKBFEgBeAail7X+OfmHuXPh/f98UYACFKAABShAAQoMQGDxGxjUtTo23Vo9G5BKCJwBhOOp2RN40Vo5dc60tseyN2T+jcQGAL/nlA0Afgv3Nn5DS+w4qPxcuYJob8mCepz34OIrFrhLu+Q3cw5qe18EGtRkmVdhCXgNpaMiJZMs5DgR1AAoLiyBvKvWhaBFrD2pZmr7i7mqLqcNAPPnIzr646Wnq+ipAEpyhcBxMyDQ8zQu3gHwq4hx7pxVvuZvGYjKEBTIiEDPsjkb0oeo6rcFqFRgZEYCM0guBc6rrUxcmMsEOPZ/Cvy2qexAY+wV2NLUx1cwBbyb/i8Yoz/daOTBoycn1gUzTWZFAQpQgAIUoAAFgi/gNcGmYL8gwAlQVPDmf/DnzMvQWx1LLW5wI+kL+QDLwOaMDQAD89vx2WwA2LFRdo5Y/HRsZEcK90Lw+eyMyFF8FlglwENuWm8p0+RTXNHYZ22G36FA3dLSCVG1R1iVLwP4DIAhOzyJBwRdYLWKzGv7c9svc/kQVk4bALwZuu/Z2C7pLtxmBNMViAR91pjfDgQEbQAaHdXb1m0sejJXS1twnijgCahCGp6ITdCIfkdEZkGxL7+UCf+1IcBTnZ2R6i8fsnpV+KvJnwoWPl9c7G4w5wtkLkQH5U9l+VWJ94UnBG+o4hci0btrKlatzq8KWQ0FKEABClCAAhTwX2BLk3nqy2pxMoC9+TnTf/OMjeD9LezirNnTEvUZi1mggdgA4PfEswHAb+G+xG9oiU3Z/MDDg8qHGPvCFuRj01A8Z6ENHZuKbuA9jCBPVf7m5q1Y/HZn7DMq+JZYfA6C8dyuOC/mOwWR37tu9JvxaR+syWVFOW8A8Iq/r7lkhoXcoUBZLjE4dsYEugV4SyF3DLHRX87I8UWesaoYKHQC3h/nqnImVKdBuGxO6CZw2wl3GCszq7lUYyCns7657AiovYx74wVyev6V1JZVez4QyJ1drt74pemJdwOeMdOjAAUoQAEKUIACgRFoeGZEqaajP1DFMQLsGpjEmMgOBXqaYYFfO5HIGbMms6F8h2A7OIANAAMV3NH5bADYkVA2/73uFRSZZOwcAc7L5rgcy2cB1VYRs1QFF9VWtP3R59EYngL/FKh7pGRUZLA5GtBjVPAJAEPJkzcCqx3o7CMrk025rigQDQDe/hYjoyU/AeS7APdLy/VFkanxFUgAeALGXmTfa38pHoebqdiMQ4HtCdQ1jh4eibqnKeQrgHpfyEQplh8Cqrh506boyezMDeZ8el+Gojt6vQJxPgUVzDn6P1m1C/QBCC6vLk++Kl5jAF8UoAAFKEABClCAAh8qUL+sbJx26I0ieiD3Zg3jhaJ/E4tzX3o8WTdvHv/2HegMsgFgoII7Op8NADsSyuq/K2Th0jEfsZq+A0BFVsfmYH4LeHt1v65Wf22K0jfVHLDeW+GYLwr4JlDXXPYxR+w8KA7CloeijW+DMXBWBXq2mlK5qnVI27lzJ8HbijWnr0A0AHgCdY+VTnAG4XlAR+dUhINnVECBlADJzb/Ibnj50cTF/ICVUV4G24ZAXVNJZQS4RkX2ATCMSHklsFyNfGH2lLa/QqB5VVmeFONtu3Ffc8lRFnIxBHvkSVl5XoZ2AfKSFfyorDvxOPe+y/PpZnkUoAAFKEABCvRbYEFz2SSB/RWAj7LJvN+MOT1RgN+rNd+onda6MqeJ5MngbADweyLZAOC3cF/jNzYiknSKv6jG/IZ7dPdVL9jHC3q+Z1wPxR/FkUury9seC3bGzC6MAouay0ak1X4bgtMgKIGiKIx1MOftCCjehJrKoPytGZgGAI/st82lNQbKPbjy8Ceop/NF5Hmbdn4wZ/rqpXlYIkvKsUDdkuGjI5FBP1ZXj4ZgJIBA/X7LMU9eDK8q37fOkJvj5e915EVBeVqEtwKH46R/DSNf5Ko+oZlkhaJdHDn3pT+0/ZzNeqGZNyZKAQpQgAIUoECWBOqbSr4NkctEUOw1vWZpWA6TSYGeLbD0opqpyRux5UYPXwMUYAPAAAF3eDobAHZIlIMD7n56zNiitHuuQE/IwfAc0n8B7/uRNjHya4X709qK9rf9H5IjFIJA3ZOlBzmOXr35NuhEAJFCqLkQa7RWDpkToK2LA/ehZUFzrN4A1cqbd3n686FdEPmJoPv6dPmGtrhwW4A8neislDVvHsxu03cvGumsOxxGzobqflx2PCv02R5EFVgoYk/hH97Zpu/fePXNsf+F4Eoodu5fBJ6VMwHVe6DOKe4Hrau5dU/OZoEDU4ACFKAABSgQAAFVmIXPjijRVPRiAEdzhbkATEr/U/Bu+DcVDU7Vzpy0vrX/YXjmvwuwAcDv64ENAH4L9zd+fXNsMgQ3Q3v27eYrfwX+LLBXIuo+UP3/1ie5bWL+TrRflc1fhuiYVPEE13XmCTTOlUP8ks59XG8VEQs0zK5MzM59Nv/KIHgNAE+P3EtSkcchvGkQpAslw7lYUfxFHL0olU49mnxtQ/vcubnfDyPDNTKcjwLejf/9DykblrbufhD5HoCZEC737yN5rkO/LYrvpFcmHuENyVxPRe/Gv//+8UNTxZ0LIDhU2dXaO7RAHSV/F8Gpjsrjsypb1wcqNSZDAQpQgAIUoAAFfBbwnvD/XUvZ8G7XTjEOzoViChvNfUb3ObwArSJ6XnVF8uc+D1VQ4dkA4Pd0swHAb+H+xm98a/fBbe+uPU5ELoGguL9xeF4IBFS6IPiDEb1BO1J/qj54fUK4LWkIJi63Kd7WuPvgYSY5zkScalF8H8Cuuc2Io2dBYHkkEpk8a/LqVVkYq9dDBK4BwNtLpy1a+h2BXsbu6l7PY1gP3KCQPyjsL9Wmls2ZuqGNnXRhncqs5S11jaOHOU733iqmRiDHslkoa/a5GqgDiqukKHVNzQHr23KVBMftu0BDc2mNAjcBOrrvZ/OMnAsI1hrFdV3i3mGK174bn4junOfEBChAAQpQgAIUoIDPAvPnIzpun1E7px3nqwrMBTDe5yEZ3mcBBawAS4eZ9KzPl69L+DxcQYVnA4Df080GAL+FBxJ/UXPZx9Kw5wOoARAdSCyeGwqBhEB+o9C7XJN+Pc73k1BMWraTrKtDkTOheJyoc6CqHg/B/vz9kO1ZyP54IlhnFd+y7yfqg/bwYuAaALzpaXhmRKl2R28AMIdd1tm/YHMw4orNe5/8Vqy9Lz1UXpjzmeQ6dtLlYBYCPqS3ZM7o9SUfk0FysLV6LCDeGyhf+S1gATwG655ZO23tc/ldav5VV7d05yGOu6kBBp+DwuRfhYVQkXQC2gyL+YBpeXlq66p5Au/nki8KUIACFKAABSiQVwLeU//3vVA8ym6SCljxlvvnKnP5M8PeTf/jaysT9+ZPScGohA0Afs8DGwD8Fh5o/N82lRwukMtF8PGBxuL54RDwVpRRyC9U8Tsn7f61uqq9PRyZM0s/Berq4GDn0XtIOj3JOPhfWDlk89aow/0ck7EDIqA9W5zf6TrpHwaxMSiQDQDeD4wzPvZZBX4hwCcDMpVMw3+BPwOog9XHi4YOeX7mpPc3+T8kRwi6wLJliC7fVLKvGEwB5EgABwIYHPS8mV8GBBRvGuiPitPJ31ZVIZ2BiAyRZYH7mktmuCr38o/eLMNnfrieRj1YXbCxo+iFYw5btTHzQzAiBShAAQpQgAIUyI2A9x1UZFzxJxSmGoJjAOyRm0w4aqYFvP1YofJgSXrEnKqq5Z2Zjl/o8dgA4PcVwAYAv4UHGn/x07GRXS5OtoqTAMQGGo/nh0dABS+rRYMxzuOdtvvlr0xdmwxP9sw0kwINTWV7u9DJInqEQc9WqCMzGZ+xAi4g8pxaHG9Xti0L2tP/nlwgGwC8xBY1l41Ii34NqvP4Bhrwizyz6XUL8CcRPJxWfXzYuuSzM2agK7NDMFoYBHqe+O8o/rjAHKiCwxSo4o3/MMxcxnJcD8UvitKDL5tZ9X5rxqIyUFYFFr+BQZ2rYnfrliXx+Aq3gPeF6TII7jNw70utWLs8iH/YhpuY2VOAAhSgAAUokG2BhpbhYxSDZohqXIGDARRlOweO56tAh6NyxJFT2x71dZQCDc4GAL8nng0AfgtnIr53809hL4Pgi3wPyYRoeGIokBKRl6F4CA4axXQ/z+1LwzN/A83U+9m3aqfD4DBReE/8jxpoTJ4fOoFVanHupo7o3UF9WCqwDQDeVNe3FO8GmB/D4qsQREI3/Ux4IALeXsPPCeQJdd3fD9nY/gwbAQbCGZ5zvT0XS/ct2VeAz0PkIBhMFmCktyRjeKpgpgMR8PZoNMATIvbU6or2FwYSi+fmXmBhS/GnrTWNEBTnPhtmkAGBBESXIC33uMP0ofik5NoMxGQIClCAAhSgAAUokFWBxYsxqGNE6QwYWw0V78b/+KwmwMGyIqDQRbYkGY9PhPcdE18ZFmADQIZB/yscGwD8Fs5U/IalJYfDylUK7J2pmIwTKoEOiPxFFc9A9FEr6cYgLgUeKtGAJuutVPxed8k+addUibFVUJnGh5cDOll+p6VIi+h8B84lsypb3/d7uP7GD/QNtTqF4zSXVkH0UgCT+lskzwuvgCo6DfASgGZVbXBLk3/kB7fwzuf2Mu/5AqZk1ERNOYcbwTQVfHrrG2igf0/l52zkvKrl1jU/0lWt9/AJ45zPRUYSaGiOXaHAaRkJxiBBEXgdVv5ojP11dWXy90FJinlQgAIUoAAFKECBHX3u7BxePBlialTwOQD7UCxvBRJqtWr2tKT3nRJfPgiwAcAH1P8IyQYAv4UzFf/hF8cO27gh/QNVPYU3AzOlGsI4gm4olgP6tKg8ARN9sLp81RoRaAirYcr/JlC3dOchxnZOFLWHQzAVkE9CtBQKQ6jCFBCRJ1X1zJcfTTw7bx5sUBUCf2OtrnH0cKfIHgfVM9mRHdTLyN+8vD3bNt848vYbflMEfxLgnsigwc0zJ72/yd+RGT0bAnWvoKgoUbq/NRpX1SqI7AagmG+g2dAP3hiq2ChG7xjiyFkzJifWBS9DZtQfAW9FH1XzsAAf68/5PCewAmkI/gZFM6zeXjst2RLYTJkYBShAAQpQgAIFL7Bgaek+Ru3RCvMFqHo3/ocWPEoeA4jg6pqKxKl5XGLOS2MDgN9TwAYAv4UzGf/uR8eMHTTEvQmq3lYA0UzGZqyQCWxpBFgF4C1Yfdg49t7qirV/D1kVTBeAd29SitxyR/UIhSkX6O7q3bcI8NbqnLisCLwN4ELXDL07Xv5eR1ZG7OcggW8A8Ory9mSDLbpIgeO4FUA/ZzpfTlPtgsgHKvKyuKjvlPSir0xdm8yX8gqtjvqW2GyoVAP2AEDGAhheaAas9z8EXAGWqrpfq5269k3a5I9AYyMiyaLS41X12vypipX8m0CnAO9s3je3CSLzayva/kgdClCAAhSgAAUoEBQBrxnVWnOcMTIT0I8CGMGG86DMjm95vOK67sz49LVv+TYCA4MNAH5fBGwA8Fs40/EXNo36jIqzQIHdMx2b8cIpIEBSgVUCecY1+NXgtkFPzZzJhxqDPpv3N44o6y4qikMxG9CPACgDMCzoeTO/rAh0APpL16YujE/bsCYrIw5gkFA0AHh7fy9sHrOfGvdaqE4fQL08NX8E0lBshGC5Qn9tJHVHTcWG1flTXv5WUvfssJ0iXUW1KnI0tjwN7L15FuVvxaysDwJtIhKvLm9r5PJYfVALyaH1T8d2Rhp3ADgoJCkzzT4IeD+zqtIN6CoIHhLo9TUVyT/3IQQPpQAFKEABClCAAhkVuH/ZiLLuzqJvQ/RoKHaFYAhv/GeUOLjBVE5wV7b9Mh5Hd3CTDH9mbADwew7ZAOC3cKbj19XBkZ1K5hgjvwIQyXR8xgu1QDcg7VD9mzH2HutGFtROa10Z6oryMPmGJ0sPUkdnAogLMFy33Ldw8rBUltRfAfWW/rcn1U5NvhyG+xehaADw5mJLE0DpV9XoBVB4S4TzRQFs3R7AhaoLkbusG7l1zvTVS0kTPIH6ltHTVNNfEsgcAKO2vnmG5ndQ8ETzLiNXVC976bHkeUHeNyfv1LNYkPdB2BlXWgXRRVxuNYvwuRnKBSQhwB/E4rpit+25qiqkc5MKR6UABShAAQpQoNAEFj06Zqw7KH26Cr4mwEgIHO87pUJzKNR6vU6jxHcAACAASURBVL9B00a+Hi9vW1GoBtmqmw0AfkuzAcBvYT/iq8I0tMRuAfA1P+IzZugFFIC3Amq7Kp4wBjdzq+PczunCxuLdNSpzVM1REP341i08eNM/t9MS0NHl7xA9s6Y8UR+Gm/8eYug+ADUsjV2tFt/iUuEB/RnIfVoWitdEcIuqu8h1Rqwc3fVe6sAD4YblhzL3hAPPwFvue82gnaNR2TBWXVNtgeME8PZY5B5YA+fNxwjeH79NtZUJrvCSj7P7bzVt3RPvPEC/w6ev8nyy/1Veh/RsDeBevslxlu0TSXRMmoRUwVTPQilAAQpQgAIU8F3A+/z5+obxRaPLunaDa89RlSMgGOH7wBwgcAIKrIO1x7YNbX9wLv/m9H1+2ADgNzEbAPwW9it+3SMlo5zB8iwEe/s1BuPmlcA73i7YIqgb7OCVDSMSna/+Fmk+IJX5Of7HPQunqLNYu2y5KL6yeTvLg3saRvmiwPYFNihw8+zKxClhggpdA0BdU8muRuRm2bKEMJfSCdPVlv1c13s3FVVRD8Ez3anUquKd16//wp7oZjNA5idj8WIM2jB8+MjIoMElSNsKKOaoohzS87Q/XxTYnsBbrpGpfEKjMC6S+ubY5M1LsN4Kwb6FUTGr/IeAijxvgHvFuPd2dLob1o9Yv5ZfzPL6oAAFKEABClCgPwLe6lL4SMnwoo0y0o3IwVD9MoAD2XTeH828OccFcLvbJT+OH8yn/7Mxq2wA8FuZDQB+C/sZv75l5GdFIw8rUOLnOIydZwIib6i1dQZ4yFh5O2LcDZtWrt3ILW36P893Pjx2WMTR4ZHBtjhi0gfAmi8qZDqgY/sflWcWmIC3qunDRanU12ZWrW8NU+2hawDwcOuaSiodkZu37h8eyhrCdJHkR66yRqCNUDysrrzsOnZV56aitmMOW7UxP+rLfhXekla/fyY2fEOXW2ogxSaKT6o1RwKYCqAs+xlxxJAKJCCYW1uRWBDS/Jl2HwV6OuGHmrlQ/RHAJ7P6yJcvh7d7fzjDYoE4+hfHia7pemd1kh9o82V6WQcFKEABClDAH4F582D2P6RsmJXUGBFnT6v4glp4T/vvyv1Z/TEPWdS/WOi351Qmm0KWd2jTZQOA31PHBgC/hf2MP38ZoqWdpXMN9GLl08V+UudrbLt5G4nlEDwKNU9GTPo1K0huSuvaN9Jr18/jNosfOu+L38CgztVjR1lJx8RqsaocKKIHCbC/8p5Fvv68+FmXt3LxK7Dm2Npprc/5OZAfsUN787y+uWQuRC6GotQPGMbMawFvH7inATRbKy8L7JpoUXRV1zurW+NxeB3jfH2IQN0rKBq2cXSsO4Wd0q7dzRhMBLQcwP8AGEc4CvRFQBUbRfS6IeuS58+Yga6+nMtjwy2wYGnpPkb1AlVUczWfcM/lALNPCfAmoI2bl1xrMsb8zabl3ZjbuqaKH2YHSMvTKUABClCAAvkjsPD54mJ3o5lgDHZR1f2gcujm5v4pEAzLnypZyQAFNqjKxUOjeuOMyYl1A4zF03spwAaAXkL1+zA2APSbLiAn1i0dGTNu5DIjcoxCBwUkLaYRToFVgD4LyAsK/Dli8F7aOGucQak11fu3ew9ZFOxr8eI9B3UMSYzWIRqTtFMK2I+oYj+IlAt0fzaJFuylkanC20T0ezUVyXsyFTCbcULbAFBXt/OQyIRNFynwPSiKsonGsfJJQFYL7KsKvAzIi0bwrnbr+x0Ru+KNyrVr5wm8bruCffU8YVE5bDSGRse7kAnWmt0Bu49APr15b6L9+PRuwV4amSg8LUCDcfHDI6cn3gPgddPxVSAC3p5b7UWxWa7iYgE+ViBls8ztC3QAeB2qLQBeNI75u9uFFUM72t5igxAvHQpQgAIUoEBhCcyfj+hOE8tGp627hzEywQo+qYr/t+VzqI4pLA1WuyMBRc/3Ng8homfNnpx8aUfH898zJ8AGgMxZbjsSGwD8FvY7vipkUVNsX1dwLQSH+D0e4xeMQLcAbynwKgSvQLFcDFY4Rt9H2mkdmRqeqKpa3pmvGg2PjihNDx5U5li3DGLGQHQ3ABOhuhcge0Pg/a3o5Gv9rCuLAoJuUbm6prLtrCyOmtGhQtsA4Ck8+Ozonbq63GtVEM+oCoMVqoD3xvgOgDe8/6jiXcfgbQXed9S8Pauy9f18h3n4xbHDNqzDWGj3OGuc3UV1d4HuIsCeVrCXbHnKP5rvDqwvKwJPOQY/fKEr8SyXrcqKd+AGubtxRNngaPR0AHO5HF7gpifXCXVvfS9+HRZ/hiNvirhvaQeW7zaq/f1Jk5DKdYIcnwIUoAAFKECBzAnU1cGJxEYUpx1nl0jE7KUie6rqngJ8QgR7cf/kzFnnaaTlUDnPrWy7Oy5c1TGbc8wGAL+12QDgt3A24tfVoSg6vuRgC7ls68NU2RiWYxSYgIr8Taz+HYL3RPUDK+aDngcdjW2VtLPGEaw8oqJ1g0h4HsDyHh5a4+xUYtA1zolqzLpmbM/NfsXOUNkZBhOg2IWrEhfYxZ7NclV+ZYa7J4V5lY1QNwB4c31PY8knolG5dXM/wGezOfccqyAEOgB9H5CVgLyj0FUQeSMCXeMq3nONvPuRorbVYb0RUbd05yERt3MXNemdFM6uYrE7BOOhupMCY8Vg1543VL4okGEBAV4Xo/NWtw1ZNHfm+5syHJ7hQiRQ11L8aWPNlRBUCWBClDpTzaqArBJRryHvbbF41wIrFHhXYd6E0/3WnCnr2qXAV+zJ6nRwMApQgAIUoMAABbyV5j55aPEuMLKzuNjdQvYWYFcAE1Sxp2z5QpcrPQ7QuUBO36CQO8TKxbXTWlcWSM2BKZMNAH5PBRsA/BbOVvxFzWUjUuIeLZCz+V1rttQLfpwN4n13ImiDSquqrhJIAgYr1OrGnuYAx7S5JpWEq2vj5esSuRKrW1o6wboyzAHGG0mPVGvGipEyVd1JRIshMhaKGNDzZL93w5/fH+ZqsgpoXAGaHON8fVb5mr+FuezQNwB4neJmfMlhIvIzKHYP82Qw91AIfADFenhvnvDeQDWhIt7/tsIYXaUu3nWKJPlCR+L1oDzVXL+sbJx26yhAdzMuRlrBvlAZI6JlAEoBFHv/rYoxIhgKIPS/F0JxJRVuku2qermT1puqqwp7j6rCvQT+VXnPe/i4kjggF4tgD5pQYEcCAqQVWAfteR9eDfH+Iyu9D7NG8Zp1sM5as3yoplYfPnVtckfx+O8UoAAFKEABCvgrcH/jiLIuJzLeCHZVkZ1UZHdReCvNxSA9n0NHAxgL9HwW5YsCfRX4o3XxgznTE0v7eiKPH7gAGwAGbrj9CGwA8Fs4m/HvfnTM2EGD3FMg+l1uqZpNeY71bwIphbQL1FsF2bvh793j2AjFJohugJq1Al2jkDSgq4yg3VrZsj2yytspVW/rxl6/iiLWAcwYtRjVc5JokYqMFcVwQAf3NMMYjUDFu7k/CNASgQxR9Bw/kj8nvabmgZkX+AtUTqypbHs87A8c5cWNPu9JZpPedLQYXLH1Zmbmp5wRKbAtAe+JQ0WHCDaookO9N06gS4Akep5GlL/DYoOFTUSMWaGuTbvifCBq/tlVt94d+vpxfdyXZ2Fj8e6uU+S9EXrDROC44wxMibV2KIyMU8VwA+8LFowSxTDteRPFCKDnKQrvTdX7coVPVPCqzraAt2z3ra6RC+PlbSuyPTjHC6bAXU/HRg5O6SUicizgfQjgiwJ9FvC2DPBWE0nA258LWKdWO9SY9Qa60irWGmCVeA178DaJtUkYZ6WmTPr/jmSN7eqO2JVHT06s63MWPIECFKAABShQQAI938PYTR+BjTjWUSOaHhcRU+p9yWtFvYczSgTYacvnUB0GiPd5dBi/0C2gi8T/Ur2/7S5fl0rcdFwV8navY/8Z+z8CGwD6b9e7M9kA0Dun8BzV8EzZ3pqylwCYBSASnsyZaSEICKRL0XOTX3saAyy6IaLetyiAWQfof32Hsl0XVSPi3dAX776EF9Z7cr/nnoQCjmz5DpBP8xfCxRWuGj9QyJnrUyPu7es9uyCWmRcNAB6s11XeHYl+H5DTILr1l0oQyZlTgQl4b5rem6N347Or5w3U+2/t+d96XiLYqKJbuul6+7Iy5B9/KKqIt32PdzM/CsCBYhAEDoDB/GOyt6A8LksCDzoWp8+amngtTHtOZcmmoIepbxr1EYhz7+a3889wFZKCvhQyXfyW99wtqwZ4jQHe/+29E6dVpEtUvX//j5cKbM9x0scPtpnOnPEoQAEKUIACQRdQ8T5zDun5itj76tb7HNrzmVQigA7Z+t/e/5Y33zsFfUoKKz/pAvQ+M8x+J8z7soZ9ztgA4PcMsgHAb+Fsx/dWQZSxsQOMg6sATM72+ByPAhSgAAW2I6DSBaOXSSR1fc0B672VR0P/ypsPYqqQ+mdG7ykp9wIIjgr9zLAAClCAAnkloH9yxZw+p7ztibAvnZNX0xKQYrz38AVNpQcZo/cA8LYn4YsCFKAABShAAQpQgAIUoMA2BVTxFqytnT29/XkS5U6ADQB+27MBwG/hXMRvbEQkUVRymKhcpcDHcpEDx6QABShAgW0IKG5zrXvhnGlrl+fLw4t50wDgTVfPDYSnYlOMxZUApvAipgAFKECBQAisNKIXHlmevClf3jwDoZpnSXjv4Q0tsfM3P7F9FlcvybPJZTkUoAAFKEABClCAAhTIkIAqNorKWTVT227g58sMofYzDBsA+gnX69PYANBrqpAdOG8ezH4Hl5ymIqdv3ao1ZBUwXQpQgAL5JSDA4xbmjNkVrX+C9KzinRevvGoA+MeM1DcXHwE1l0GwD5eby4vrlEVQgALhFWgH5MbayrZzwlsCM8+WwKLmshFp2AcATMvWmByHAhSgAAUoQAEKUIACFAiNgLeH0+9nVya+GJqM8zhRNgD4PblsAPBbONfxFzSX3i7QeM+WOnxRgAIUoEAuBFSAF43BmUeWJx7ORQJ+jpmXDQB1r6DISZR+U0TPhGBn76lCPxEZmwIUoAAFtinQAcWvitoHnzxz5vubaESB3ggsWDpiH7HRZgClvTmex1CAAhSgAAUoQAEKUIAChSEgkL/rYJlaO6l1ZWFUHOwq2QDg9/ywAcBv4VzHf/jhscM2DE39UgSzFYjkOh+OTwEKUKDABLwn/d+FyuVurO2X8Ynozrf68/bG+OLFGNQ5Mna2AicIEFOwCSDfLl7WQwEKBFpAoXg4Cp17xNTkO4HOlMkFTqChqfQYhV4HwajAJceEKEABClCAAhSgAAUoQIHsCyjajWBudWWiLvuDc8RtCbABwO/rgg0AfgsHIf7vnhm1R6rbuQuC8iDkwxwoQAEKFIKA9OwojzWwcu2QDW1XzZiBrnysO28bALzJWrxk+OgOEz0PkGMBjMjHCWRNFKAABQIqsExT8tXZVW1/CWh+TCvAAt5KPiYRu8IITmAXfIAniqlRgAIUoAAFKEABClAgOwJpiF5VW5E8MzvDcZTeCLABoDdKAzmGDQAD0QvTuQuaYxMFuBvAfmHKm7lSgAIUCKuAAOsUuHWI7b5kxrQNa8Jax47yzusGAK/4hS1jPmrVPR9qZ0Nk0I5A+O8UoAAFKDBggRdF8N2aisRTA47EAAUrUN9SvBvUuRXQgwoWgYVTgAIUoAAFKEABClCAAlDgD0a6v1pTsWE1OYIjwAYAv+eCDQB+Cwcp/m+Xlh5srF4LYGKQ8mIuFKAABfJOQLULxtShW8+urUq8l3f1/VtBed8A4NV6z5Ol+0YcvUYEh0Bh8nlCWRsFKECBXAoI8Feo/rBmavKBXObBscMv0NiISCJSeqBCrxXBx8NfESugAAUoQAEKUIACFKAABfoqoMDLVvV4rEw+FY/D7ev5PN4/ATYA+Ge7JTIbAPwWDlJ87zuQpFMyGwYXKeSjQcqNuVCAAhTIGwGBhcqDKRdnHDW97bW8qetDCimIBgCv9vrm2GQAVwOYku+TyvooQAEK5EJAgRWwemapm7ynqgrpXOTAMfNLoK5x9HAnkv6yipwnwIT8qo7VUIACFKAABShAAQpQgAI7EPgAIme5MuTeePl7HdQKlgAbAPyeDzYA+C0ctPj3Lxs/NN3dcbS1cjaA3YKWH/OhAAUoEHoBwVK45sTaaa3Phb6WXhRQMA0AnoXXBKDQnwvk072w4SEUoAAFKNBrAVkD6CXDR0RvPuxTqzb2+jQeSIEdCDS0DB8DjZ6skBMBDCMYBShAAQpQgAIUoAAFKFAQAt2AXinR9NU1B6xvK4iKQ1YkGwD8njA2APgtHMT4v24aVTIEZq6KnAYgFsQcmRMFKECBUAp4N/8Vp9ZWJp4OZf79SLqgGgA8n7onYoc6EdwCYJd+ePEUClCAAhT4LwFZI9ArEE3dVnPA+gTgbdHIFwUyI6AKqX+q9GNG9QJVzMlMVEahAAUoQAEKUIACFKAABQItoFigaTm39sC2v4rwM2YQ54oNAH7PChsA/BYOYnzvO5DFfxw9tqvb/a4C32MTQBBniTlRgAIhFHjXqD2memr7EyHMvd8pF14DQB2KnAklh0LlRgC79luOJ1KAAhSggCfQDdWfiim6uqZ81RrwixleFT4IzGtEZGKkrNIYezEU5T4MwZAUoAAFKEABClCAAhSgQHAEllkX55TZxOPcXi44k/J/M2EDgN9zwwYAv4WDGt9rAvjNY2PGDBrknqLQE0S4GmJQ54p5UYACoRB4B6LHuyuSj8Tj6A5FxhlKsuAaADy36xZj0LgRJYca6WkC4EoAGbqYGIYCFCg4gW6B3GqK9JJZn028x6cyCm7+s1rw/GWIlnXGjgFwLvfCyyo9B6MABShAAQpQgAIUoEA2Bd7ZfPPrfLsycVehfUmbTeRMjMUGgEwobi8GGwD8Fg50fIX8bsmo3VMmchFEvdUQo4HOl8lRgAIUCKbAu1b1+JXrk4+cNANdwUzRv6wKsgHA46xrHD3cKUodBzWXAxjiHzEjU4ACFMhLgRQUd0XE/GhWZetKLvufl3McuKJUYRqWlp4N1VMAlAQuQSZEAQpQgAIUoAAFKEABCgxEoB3A9UWDB182c9L7mwYSiOf6L8AGAL+N2QDgt3AI4svvmkp2SUGugWAmgEgIcmaKFKAABYIi0AHguNbBiYa5k5AKSlLZzKNgGwA85LsWx0YOHYlvW+BcAUZmE55jUYACFAivgHQJsECtnFY7refmP18UyJrA/fePH9pd0nEZIMcBGJ61gTkQBShAAQpQgAIUoAAFKOCngLck68IIzCmzKlvf93Mgxs6MABsAMuP44VHYAOC3cFji3/dkbJe0kRtF9HMAisKSN/OkAAUokCsBBdYZ4MJN6/CLo2ck1uUqj1yPW9ANAB7+wsbiYuvI8SJysgpKARS8Sa4vSo5PAQoEWiANxWPGRE6orlj990BnyuTyVuC+Z2O72G7MV+BQdsDn7TSzMApQgAIUoAAFKECBQhFQuIA0O4498cjy5MuFUnbY62QDgN8zyAYAv4XDFP93TSW7prZsZ+x9D8ImgDBNHnOlAAWyKaCiaFPVnxpXb6yuavdWlyrYF292A3igaVRJlzjfA3ACgDFsAijYnwcWTgEKbF8gLZBmMTijurztWWJRIJcC9ywp+5+ocX8ByP/wfTuXM8GxKUABClCAAhSgAAUoMAABgYXiZaPmB9VTW58YQCSemmUBNgD4Dc4GAL+Fwxa/pwkAMh+Cw/g9SNhmj/lSgAJZEFAAqwH8bJC6Nxw+dW0yC2MGegg2AGydnoeWjox1aOREa/EdCMbyTTTQ1y2TowAFsi+gAnkybXFGfBpv/mefnyNuS6C+qfQQEXuTQj5KIQpQgAIUoAAFKEABClAglALvq9UzZk9L3hXK7As4aTYA+D35bADwWziM8Rc0lu4jUb0TwGfDmD9zpgAFKOCTgEKxyhjcNETS13++fF3Cp3FCFZYNAP82XQ2PjijVQdHvQXC8AKOV2wGE6mJmshSggJ8C2qhwTp9d2brMz1EYmwJ9FWhoKj5GxbkCUK95jy8KUIACFKAABShAAQpQIDwCbYBcVVvZdml4Umam/xBgA4Df1wIbAPwWDmv8hpbYFGvlEhGtABANax3MmwIUoEAmBARQBdZAcaN0pW6oOWR9Wybi5kMMNgD8n1msWzoyFnWjx1vRkwHE8mGSWQMFKECBAQkoHlbHOWt2+ZrnBxSHJ1PAJ4GGltgpqjgbQKlPQzAsBShAAQpQgAIUoAAFKJBBAYF0qehP1nUnLj6uCp0ZDM1QWRJgA4Df0GwA8Fs4zPEXPDl6f+OkT1GROBRFYa6FuVOAAhQYoEDCqPw05aRujPPJ//+gZAPANq6sB5pGlXTDzFWRcwAMH+DFx9MpQAEKhFZARR4QIz+undL6XGiLYOJ5L1DXOHq4E3F/KCJnKnRQ3hfMAilAAQpQgAIUoAAFKBBmAe25+X+jtd2XxqdtWBPmUgo5dzYA+D37bADwWzjM8VUhDzwzcs/udMR7GOLLAJsAwjyfzJ0CFOi3wAZRvbgIdv7hU9cm+x0lT09kA8CHTOwjy0pGre+Qb6jgIgBD8nT+WRYFKECBbQr0PI0Be6uozn+psv3leQJLKgoEWEB+01w2bpDaMyAyl00AAZ4ppkYBClCAAhSgAAUoQAHI3UUGp88sb1tBjPAKsAHA77ljA4DfwmGPrwpT/1Tp3kb1NFUczSaAsM8o86cABfoo0CGKH40YorccOim5to/nFsThbADYzjQvai4b4ap7jELOgGCXgrgiWCQFKFDwAt7Nf4jOj6Tda55rXPv2vHm8+V/wF0UIAObNg/nUoaP2sOqcCeCbIUiZKVKAAhSgAAUoQAEKUKAQBe4V0YteKk++ykbzcE8/GwD8nj82APgtnA/x6+rgDNm5dK8UmwDyYTpZAwUo0FsBxbsCvdwR585Zla3re3taoR3HBoAdzHjPssJF6elQuRHAroV2gbBeClCg4AS6Af2F69qrX5229m1+IVNw8x/qgr0PvpFxxZ+w4pwv0FmhLobJU4ACFKAABShAAQpQIP8EHjFqzkqtbH0hHoebf+UVVkVsAPB7vtkA4LdwvsT3vgsZNL5sTxf2LAt8WYBovtTGOihAAQpsQ+AdiB7vdkeejFet2UChDxdgA0Avro66V1DktJUcCiM/B7gSQC/IeAgFKBBOgW6B3hpRXPrcY8n3+OR/OCex0LP2PvianUfvZ9ReoKqHF7oH66cABShAAQpQgAIUoEAgBFSfg+gP3Yr2JXHhzf9AzMkAk2ADwAABd3g6GwB2SMQD/ikwb/N2AJ98JjYeaZwKwXFQjCIPBShAgTwUeBdWv+uWJh+JT0R3HtaX0ZLYANBLzvnLEB3TWXKIhbkG0L17eRoPowAFKBAOAUU7gGs2bopeecxhqzaGI2lmSYFtC6hCfru0+FMRNZcr8Dk6UYACFKAABShAAQpQgAI5FXhRgNOqKxKPikBzmgkHz5gAGwAyRvkhgdgA4LdwPsb3VjM2UfcCAb4FYHg+1siaKECBQhWQ1w3sD1YPTj46dxJSharQl7rZANAXLQD3LY2Vuy5+AsEBAJw+ns7DKUABCgRNwPvyJSGiN5V0j7qoqmp5Z9ASZD4U6K/AwpZYrSouUME+UJj+xuF5FKAABShAAQpQgAIUoEC/BLzPmy/D6tm105IP9isCTwqsABsA/J4aNgD4LZyv8e+/f/zQ7ljXear6LSMo8R6SyNdaWRcFKFAQAi4UzzgOTjuyPLG0ICrOUJH85d8PyK1NAOepYLoAg/sRgqdQgAIUCIKA92XMO6q4zjpDfx4vf68jCEkxBwpkUqC+Ofa/AM4FsA8b9zIpy1gUoAAFKEABClCAAhTYjoDAAvIWgItqK9pup1X+CbABwO85ZQOA38L5Hn9hU+z7VnAagAn5XivrowAF8lNAgU5RPOk4uIA3//s+x2wA6LtZzxkNT5XuC6vnqsVMEQxTsJOun5Q8jQIUyIGAt+yiKl5Vi2tnT0vcnIMUOCQFsiawsKnkS1bkHAX2FXAlgKzBcyAKUIACFKAABShAgcIU8G7+K94V4NrB6xI3zpiBrsKEyO+q2QDg9/yyAcBv4UKIX98c+ybQ0wTALY0LYcJZIwXyREDQc+9ioxjcDyMX1kxpey1PSstqGWwAGAD3fU/HPu6m5ASIHiVcTmcAkjyVAhTIgcAyAc6uqUw8koOxOSQFsi6woKnkS4D8SAT7gk17WffngBSgAAUoQAEKUIACBSOgCrwLxbVD1yd+xpv/+TvvbADwe27ZAOC3cKHEr28uqwL0J4B+avOqLJFCqZt1UoAC4RTY+uBiEir3OFH92ZGTE6+Gs5LcZ80GgAHOQd2S4aMdE/2BQo41gvHcU2eAoDydAhTwWyAF6EMicmlNReIpvwdjfAoESWBhcyxuFfOwpQmALwpQgAIUoAAFKEABClAg0wKC99TiyqHrEzfx5n+mcYMVjw0Afs8HGwD8Fi6k+PWNscka1TMF8jkAQwqpdtZKAQqER8C7+W8V7wv0DtemrolP27AmPNkHL1M2AGRgThb9pWxEqk2PhupJsmWPYb4oQAEKBFEgKYoFErGXVE9pXx7EBJkTBfwWqG8qrYbohQAm+j0W41OAAhSgAAUoQAEKUKCwBGSVKC4cvL7tl7z5n/8zzwYAv+eYDQB+CxdS/HnzYD4xvXRvieIkqH4ZglGFVD9rpQAFwiGgwF8gcl20VO6atU/r+nBkHdws2QCQobmpewVFTnvJoVA5C0BFhsIyDAUoQIFMCbwN4JYIzC1HVLSu9LrpMhWYcSgQNoEFTSUzReQiAPuFLXfmSwEKUIACFKAABShAgWAK6POwcqNbmrgzPhHdwcyRWWVSgA0AmdTcViw2APgtXGjxvZWLG56JTdCUfkdEvgJg90IzYL0UoECgBVogeqlbnHyEf0tmZp7YAJAZx39GaWiJTbEWJ4qgGsDgDIdnfj+aHgAAIABJREFUOApQgAL9EXgFwDXSmVpYffD6BG/+94eQ5+STQF0dHDO+5DCBnAtgcj7VxlooQAEKUIACFKAABSiQbQGB/knVnOmubFsSj/Pmf7b9czUeGwD8lmcDgN/ChRjfawJYuHT4aNWimQJ8T4FPF6IDa6YABQImoLhHDK7jlsWZnRc2AGTWE96baP2S0XuaSPpYVTmVTQAZBmY4ClCgLwIpQJtFzLXpbvNYvGrNhr6czGMpkM8Cy5Yh+l5nyWQXcjLQ07THFwUoQAEKUIACFKAABSjQd4FlxsiZqSltT8QFbt9P5xlhFWADgN8zxwYAv4ULOX5d4+jhJqJVIvaHAMoBRArZg7VTgAI5E+iE6rUajdxSe8Cav/HBxczOAxsAMuvZE81rAnjgiRGl3UVFcSjOA3SsD8MwJAUoQIHtCXSI4D513SuHjBv9yoy9/tZFLgpQ4D8FGhsRSQwu209dPU+gs+hDAQpQgAIUoAAFKEABCvRJYJmInLFmUFvT3ElI9elMHhx6ATYA+D2FbADwW7jQ4y9evOegruHJT1lHfwjFFwEMLXQT1k8BCmRTQFZBcEFRd3fd4Qeub+PN/8zbswEg86b/jHhb4+6DR0TXHiSQ8wFM8nEohqYABSjwLwHFWhXcalPOFXMOXLNaBJY8FKDAtgW87QCcnco+pcaeI8DhAIpoRQEKUIACFKAABShAAQpsX0CBekfsRcXd7X+uqkKaXoUnwAYAv+ecDQB+CzM+sPU7kTHi2DNU8XUAI+hCAQpQwG8BEbxsXTlvvTvioeOqlnf6PV6hxmcDgM8z37MlwFOjPy2uPV9FPy9A1OchGZ4CFChsgVWiOCu9MnFnPM7lFwv7UmD1vRXw3qt/11I2zlV7oRV8le/VvZXjcRSgAAUoQAEKUIAChSkgv1Po2bMrEq9CoIVpwKrZAOD3NcAGAL+FGf9fAl4jQGTn0q9Yq9cLMJI2FKAABfwQUCAlKg+pY35cO2XNC3zq3w/lf8VkA4C/vv+MXr+kbJwae5pAjga0DPj/7d17lFX1lSfw7/6dc6uoKop6UEUBAUQeviBBA8YICJQaTdPBF1AdE8eMyZq4Mp1M1sr09Mok3Um57D96kl5JVmY6E5N00jHpJF4EJCpq1KACQhSDqKAY5I086k297z3nt8dTkNEkPqDqnnvPOfd7l66Fcs/+7f3ZZ3Gpe/b5HdA+T/ZchgJFIaBDF/tfsb7zuZVLWjYWRc0skgI5Fjj1Wa3Bo3s+YQSVwWBAjpdgOApQgAIUoAAFKEABCsRZoA+Ke3xoc9MVHQfjXAhzH7kABwBGbvjuETgAELYw4/+lQPqpsR9yjN4DYBIAl0YUoAAFciSggLQq9OdizTeXL2o9mqO4DPMuAvxiO4+nR/rpSWWO7b0VKl+EYCY/RPOIz6UokGQBQRcgG+DLf+WHZ5IbzdryITD0Wa39/wDVYOu7Bg7s5UOda1CAAhSgAAUoQAEKRFwguMu/E4q07w02NzX2Hot4vkwvDwIcAAgbmQMAYQsz/tsLrNtUV5mF/ZEA1wCophMFKECBEQp4Crwm0G/7puLupvmH+0cYj4efoQAHAM4QKpdvS2+sWeiKfEWBKwCMzmVsxqIABYpKwAdkP8T+YPmCjm8UVeUslgIhCgRDAMbv+yxEPy+Q6RwCCBGboSlAAQpQgAIUoAAFoi0gsKo4LMCParNjvtnI57RGu195zI4DAGFjcwAgbGHGf2eB765H6fsqaz8Pkc8p9FwBDL0oQAEKDEOgB4rN1uBbKxe0/2YYx/OQEQhwAGAEeCM59L5naid7g/g7ESwDcO5IYvFYClCgKAW6BdgCxbdf8Nofa26EV5QKLJoCIQqs2VzzcVX5EoBLQ1yGoSlAAQpQgAIUoAAFKBBlgZ0W+r/rslU/5cX/KLcp/7lxACBscw4AhC3M+O8u8N31M0onjGm70kD+DoK5b3wHWUUzClCAAmcsIDisFmvcUvzLDR9qP3TGx/GNORPgAEDOKM8+0KlthntWQM1nAVwGIHX2UXgEBShQhAJ71WCd+P7/uWlh1z4RBNsx8kUBCoQgsHpT7YcF+j8V8lf8nA4BmCEpQAEKUIACFKAABaIrIPKk+vjOikVt90U3SWZWKAEOAIQtzwGAsIUZ/70FVGFWbxl7nli9HcANACYDcN77SL6DAhQoYoEsgN8Z1Z9lnYqfccv/wp0JHAAonP3QysGH6H0bx86zop+ByI2A1hc4JS5PAQpEV6BPRJ4F9KeeeOua5p9sj26qzIwCyRFYvbn6HFjzFRisgKI2OZWxEgpQgAIUoAAFKEABCrytQEagabXOt5cvav09jSjwdgIcAAj7vOAAQNjCjH/mAuu2jmvwfe86tfjU0G4AwKgzP5rvpAAFikdAWgB90FH5/vUL254VgS2e2qNXKQcAItATVciqJ+obnJT/cQCfhOJiCNwIpMYUKECB6AicEGCtWv1ZrV/1HLdejE5jmEnyBYLP6V9vrpuQVb1NoMEPuzOTXzUrpAAFKEABClCAAhQoUoFWQH/g+PL9GxZzu9YiPQfOqGwOAJwR0wjexAGAEeDx0BAE7t82sXxgoH+uwHxCoCsBjA1hGYakAAViKyDbAb3bV12za2HH4WZe/C94JzkAUPAWvJlAekP9aNfYD6nRWyC4HuBdhhFqD1OhQEEEBPBUsVNFvy+iD/lHOg83NcEvSDJclAJFLBAMATy4qao665iPqsoXVHF5EXOwdApQgAIUoAAFKECBBAoI8DwE3+u3/r2fvKKrI4ElsqQcCnAAIIeYbxuKAwBhCzP+8ATSG2umOMZcL6p/qxi6QcIMLxKPogAFEiLQDcUjAvyb5zmbmhpbehJSV+zL4ABAxFqYVjglz9ZOtBmssIoviODciKXIdChAgTwJKDBggJ/7Pn4ypjq149o5x3vztDSXoQAF3kEg/fSkMsfr/aA48kXVoeffpYhFAQpQgAIUoAAFKECBOAsokDXAY2887uq7qc5RTy1b9npfnOth7vkR4ABA2M4cAAhbmPGHL7BuU12l53uXwJHPAvIJALzONHxOHkmB2AqoYp8Y/GvK9dccdboO3z4P2dgWk8DE+QdzRJsafIha9eZaMf8DKldBtDSiqTItClAgHIEjKvLlTL/z6M1XnWjh83LCQWZUCgxHIBjWS22tnuz75m9FcBuU294Nx5HHUIACFKAABShAAQpEQqATIr90xP7fTFXH7qZZyEQiKyYReQEOAITdIg4AhC3M+CMTUIVZs7GuAcYuBfBPAMaPLCKPpgAFYiOgMgjRx43abxpxn7t+YWt3bHIvokQ5ABDhZqfTcLITqsaMMu7NUP0qgIkRTpepUYACuRIQ/Zl6/p32+MkDTU388iVXrIxDgVwKBI8EWPVEfYXr+ith8DVVTM1lfMaiAAUoQAEKUIACFKBA2AICHLKK75R62bufW9Ldzme1hi2erPgcAAi7nxwACFuY8XMjkN6JkpLWmvOtK//4xmNMV+YmKqNQgAKRFVD0QPXOAbE/TB3tOsnHFUe2U9yaJbqteTOz5maYOddWT/F958cCbYxDzsyRAhQYlsBxC/PfK05W37t06Z7BYUXgQRSgQF4Fgs/oC66su9gV+29i8AEon32X1wZwMQpQgAIUoAAFKECBsxZQwIrK89bB3+/8TduG5mbYsw7CA4pegAMAYZ8CHAAIW5jxcyuQ3lk/2rTpzcaxX+FNErm1ZTQKREVAIRus731m16KuAxwcjUpX3jkP7gAQ/R79SYb3bqz9tBHcqUA9nzscs+YxXQq8vUDwRcuAKO7RFL62/MPthwlFAQrETyC9oX60uN7/EsinRFDO59/Fr4fMmAIUoAAFKEABChSJQA8ED8jozBdvmtNzokhqZpkhCHAAIATUPwnJAYCwhRk/HIE1G+vOA+ydKlgGQSlvlAjHmVEpkEcBT4ATCnxz+cL27+RxXS41QgEOAIwQMN+HB1sOr3m6eopY8zUV+RigtW88Y8fNdx5cjwIUGLGAAugFsEMg3/JM2UNN8w/3jzgqA1CAAgUVWL1x7H8S0S8rMANASUGT4eIUoAAFKEABClCAAhR4U8CD4hgEdyxf2P4jwlBgpAIcABip4HsdzwGA9xLi70dX4JEdDRU9Pd5NsPp5CGaLoCy4rhHdjJkZBSjwNgI+IO1QfTxl/a8sW9S1XwTBNQ2+YiLAP3Rj0qg/T/PuHQ0V5T3Zj4ridgHmqaCK03QxbSbTLkIBGQR0n1o8YF3nrqb5LXuKEIElUyCxAms218yGyj8CWKxAQ2ILZWEUoAAFKEABClCAAnERaAewVY3zDyvmt2yPS9LMM9oCHAAIuz8cAAhbmPHDF1i7edx0td4XrOhfC+Qc7mgcvjlXoMCIBSR4VBS6VPAiFN/rrUw9cOuc48GNjHzFTIADADFr2J+nu3Zz1XRrnVsALIVgFoCKmJfE9CmQXAEZeq7i6wJsNEZ+nBnT9lTTLGSSWzAro0DxCgSPBDCu/xkR/RQgFwAoK14NVk4BClCAAhSgAAUoUBABha/AbhH8SlLZ7910WXdbQfLgookU4ABA2G3lAEDYwoyfH4H161HaW1nzEQP5NASXAxifn5W5CgUoMAyBfkBfEcj9Iv7dNy7oem0YMXhIRAQ4ABCRRowkjbvuQqrh/bWXelZuAfRKAaZxmm4kojyWAqEIdAPyhIX+usJm1i1d1NMSyioMSgEKREYgvRMlJV2183yLT79xx9VHAbwvMskxEQpQgAIUoAAFKECBRAso0C6qT6nFD7tt1W9va9w/kOiCWVzeBTgAEDY5BwDCFmb8/AqkN1SMd0tHLVdflymwUIQ3Mua3A1yNAu8sIICnwEEoHgNkle+UbebjiuN/xnAAIP49/P8VpJ8aXy8me4UBblLFNSJan6DyWAoF4ioQ3OH/HBSrszD3f/yK1lfjWgjzpgAFhiewblPdRM/qcnH0Zqu4RIBRw4vEoyhAAQpQgAIUoAAFKPCeAhmF7FToWs16v9y15OTe5lO70fFFgZwKcAAgp5xvE4wDAGELM35hBNY8OfZCdXAjoDdAMAeKksJkwlUpQIEhAUEXVB601t6vKH28adEx3riYkFODAwAJaeRby1i9sWqaEafRAjcBuBK80JDALrOkWAgoXgZwjw99vOmKjk2xyJlJUoACoQjcv21ieX9//wcdMZ8A9HoIxkNhQlmMQSlAAQpQgAIUoAAFilRAW1TlfsfgnlIHW5d+uP1kkUKw7DwIcAAgbGQOAIQtzPiFE9iwAW6nW7fQin8NRFZAMbNw2XBlChS1wHqoPgjYh5df0bW3qCUSWDwHABLY1KCku7YhVT9Ycz58uVwN/guASxNaKsuiQBQFDkBwrygecWC2Xr+wtTuKSTInClAg/wL3PVk72bq6QCGfg2I+ADf/WXBFClCAAhSgAAUoQIGECWQh2C5qfiKO93D2UOehpib4CauR5URMgAMAYTeEAwBhCzN+YQVUIQ9uqqoeEHO5QK4D5CaAOxoXtitcvYgEnhUgDdGHW0o7dt8+D9kiqr1oSuUAQMJbvX49SvtrqmaJ7ywG9FaFXJzwklkeBQop0ArIelib9pF9ZtcVPW3carGQ7eDaFIimQHonSkxv7UwdlI85ol9RYEw0M2VWFKAABShAAQpQgAIxEGgTyA+ta39p+929TY0tPTHImSkmQIADAGE3kQMAYQszfjQE0mk4pRPrGrLWXg6DJgGuAVAdjeyYBQUSJiDYD4ufqpgH+nqdl2+99nhvwipkOW8R4ABAEZwOwTTdb15oKO876V9gjb0ZwMeheF8RlM4SKZAvgW4IHvQtflqacrcfc0+0c2ouX/RchwLxFVi3qa7Sg50FwZegWBnfSpg5BShAAQpQgAIUoEAhBFT1CWPsnSUW2z92RVdHIXLgmsUrwAGAsHvPAYCwhRk/WgLpNEqc8XVjRexCDb4nAeYCSEUrS2ZDgZgKCI4A+JVaWWUH7Csrr+44KQKNaTVM+wwFOABwhlBJeFuzwlz0RH25M0rPU18/LdC/AVCXhNpYAwUKJOBD5AWB/YZXiod2dXf0NjfCK1AuXJYCFIihQHMzzLyrqqoGjZkPyD9DMTuGZTBlClCAAhSgAAUoQIG8Cshr6uNOm8rej8Mnu7jdf17xudhpAQ4AhH0qcAAgbGHGj6bAtm1IHfQrx6hXskxVvyzA+dHMlFlRIBYCrQq5Rxz5sT8gr+5a0tLHHYtj0becJMkBgJwwxi6IpNMwaKi5yHHNl6C6AsDo2FXBhClQWIH9gPlqbbY1vWQJfE7MFbYZXJ0CcRcIdutZ+3RDvdrs52DwBSjGxr0m5k8BClCAAhSgAAUokHOBPkB/PDiQ+qebrzpxgj+H5tyXAc9CgAMAZ4E1rLdyAGBYbDwoMQLBDROLF8O0ldbeKj7ugGBSYopjIRQIX6AHIvf6nv0WjnfsamqCBXjHf/js0VqBAwDR6kdBsrn3yfpLxPh/L4KlCpQDcAuSCBelQLQFfAADUBxUB/+yYn77j6OdLrOjAAXiKrBmY/UchfkqBFcDGAPAiWstzJsCFKAABShAAQpQYMQCf/xZdD3U/+dav+uFRu48N2JUBhi5AAcARm747hE4ABC2MOPHRyC9EyWmY+xnRfW/QTAZQCkAXtuKTwuZaX4EPAH6VLFerfONFYtbtudnWa4SVQH+IRnVzhQgr9Wbx14K6JdgsRCCGgAVBUiDS1IgagJZQDpV9fdw5PtjBysfbmzcPxC1JJkPBSiQLIHgh1unreYjMPJFAB8EUM1BgGT1mNVQgAIUoAAFKECBdxNQwApwEsDvBfKvFZXuI9fOOd5LNQpERYADAGF3ggMAYQszfvwE1vyucqzNup8WMR+H6jkAqngzY/z6yIxzLSCDAm1TwVOAfGv5grZnc70C48VTgAMA8exbaFmrwvx6S/Uc3ze3qODa01vrVEJhQluUgSkQTYEBQI8A8oKqWeV43kM3NnZ2RjNVZkUBCiRVYO2G6mpb4twAtbcCMgdAbVJrZV0UoAAFKEABClCAAkMCKkCbAq+oYG3Ww6qbF7cfog0FoibAAYCwO8IBgLCFGT++Ar/YMLEuVTKwzCiaIJgNRQOAVHwrYuYUGJZAN4CDCtmmKv+uR1s3NjUh2DmKLwoMCXAAgCfC2wrctQ2p8Znq2b6VFQDmK+RCKOog3IaYp0zCBRS9KviDAM+L4p6evtTGW6/lXRYJ7zrLo0DkBdKPj32fU4pbAf0oBLOgGBv5pJkgBShAAQpQgAIUoMDZCrQC8qJCHrK+c2/T4uP7zjYA30+BfAlwACBsaQ4AhC3M+PEXWP1U3QQr+hEjuhQa7J4oUyAaPB6ALwokU0BgYdEOwR4BNjnG/uJYSedLt89DNpkFs6qRCHAAYCR6RXDshg1wu5za83xHrlLVxQLMg2ISBwGKoPnFV2K3Kp4RyHOw/oOu426/fmFrMEXHFwUoQIHICPxqY915JUZvVNWrTj8agIMAkekOE6EABShAAQpQgALDFZAWQHdbYJ0r7tobF5x4bbiReBwF8iXAAYCwpTkAELYw4ydHYP3W2jEDnlytsEsgMlct5ojw8cbJ6TArOf1oqGOAbDNiN6vVR7q8zt23NYKPKubp8Y4CHADgyXHGAmu3VE/1rbNQVBcKdJ5CgmcS8xw6Y0G+MYoCAuy2GjxTEc+p6qPlPR27ly7FYBRzZU4UoAAFAoHmZpjZV9deaIBrLPARAJcJHw3Ak4MCFKAABShAAQrEUSC443+LCh6zPrY2LWp7Jo5FMOfiFOAAQNh95wBA2MKMnzyB9X9A6cCJ2g9aK4sBLBDBpYAGjwfgiwJxFVAAO1WxBcBWx7hPnnjpxMHbb+cd/3FtaD7z5sXbfGonZK1fPDauoXSUvUjU/5CKWQDVRRBUJaQ8llEcAn1QvKSCzcbaJ9XB88sXdB4ojtJZJQUokBSB9E6UoLXmfONioejQD7fBv+OTUh/roAAFKEABClCAAokVELRDZZNaPGyhT3aUt/+BW7cmttuJLYwDAGG3lgMAYQszfnIF0mk4JeNrz7euzFO1lwHSCMVMAG5yq2ZliRJQdAF4FsBmdbAl0+c+/4mrTxxPVI0sJnQBDgCETpzcBdJplGB87QzX0Q+oytWALgFkenIrZmUJEDihwEYDfUwhz0sq+4cXHuruaG6GTUBtLIECFChSgfXrUdpTNmayk3LnAroMKlfBYBwUpkhJWDYFKEABClCAAhSIpoCiFaKPiDG/geDZroHKfbc17ufWrdHsFrN6DwEOAIR9inAAIGxhxk++QDAIgKn19alBvUDFv9SqXAvBpQKMSX71rDCeAvoaIE+I6GOw+nLFmNI918453hvPWph1oQU4AFDoDiRg/aEP0kljx7uqU6zKXAFuAvQyAOUJKI8lxF/AA/CKAqusL5sc4+33ncqjTfMP98e/NFZAAQpQ4E2Bu7YhNaG/ZoJnzAxVewMg14tgsiof18PzhAIUoAAFKEABChRQQKE4Lgb3KPTRlMWLA7Udx5pmIVPAnLg0BUYswAGAERO+RwAOAIQtzPjFJZDeWT/adNlJrtiZ1pe/VsU1EJwD8OaJ4joTIlltsFvxdjF6v694Wo3Zi8Ntx5qa4EcyWyYVGwEOAMSmVdFPNLjA8MBzE8syXX31NuXMcBy9ThU3KDBJ+EEa/QYmL8NuAR5S2P/wTWoXer2WXZs7unm3f/IazYooQIE/FWhWmPOeqKytSJWOzYqugOoKAS6mEwUoQAEKUIACFKBAngUURxXyXXjymCkf3FfT193V2IhgSJ0vCsRegAMAYbeQAwBhCzN+cQps2AC3xRldAzOq1oheKWo/Csh1xanBqgsloIAV4DAgDyrsA46ju4zvtm1/rLWX1y8K1ZXkrcsBgOT1NBIVDe0KUF9fNtpxynqQWeyIXgeRWwDehRiJBiU5CcXDgFnrpsy6we7sQL3b0csvWJLccNZGAQq8m0D66UllrmYrBdkrrOJ2AAsBlFGNAhSgAAUoQAEKUCBEAcUjEHO3iPOYJ6nulZcfHhCBhrgiQ1Mg7wIcAAibnAMAYQszPgXWr59ROljWWpY1Mtlx5AYAfwNgFmUoEKKAKvTXBmbtKJta3+P7/bvQMtDMAdEQyYs3NAcAirf3eav89NbDsvaZyhqbdVcKZCWAK/OWABcqBoEXoLLKF1k1bVTr3rlz4fHLlWJoO2ukAAXOVCD4LF61CynTVT1LfHM7BNcDGH+mx/N9FKAABShAAQpQgALvKdAO1QcF+EGNV7VtyZL9g/y59D3N+IYYC3AAIOzmcQAgbGHGp8BbBZqbYaZd3lA2piLzQT+4kVER7ArA7014muRK4LcKXWVS3irvQHfnypWw/HtirmgZ550EOADAcyPvAqow922tnqK+uRHQGxUSbEucUqCEjwrIezvitqBCNQORDBSHIbpW4ay1Na0v8PmJcWsl86UABQopsGbz6HHQ1E0KuRXAhQDKRZA6PbRXyNS4NgUoQAEKUIACFIi8QPCFrerQVv6Db9wt+LKK/ER8uW/5otajkU+eCVIgRwIcAMgR5DuG4QBA2MKMT4F3E0g/WlMlZZhvYD4J0SVQ1EDgQlFCOQq88x/dsFBkAGQF+jwgayH6aEtpx+7b5yFLOQrkU4ADAPnU5lp/IbBtG1L7vZoLkcVSiDRCMVMMxkBRCfDDlKfMkEDwpUoPFN0ADgHykK/4DdyyF5vmH+6nEQUoQAEKjExg9ZaaBbBYBivXQTAWkCpAS0cWlUdTgAIUoAAFKECBJArIoIh2qkU7DDbC17tP+h3P3daIgSRWy5oo8G4CHAAI+/zgAEDYwoxPgTMVuH9bZd3gYGqxAa5QYCkUYwQoV0EFFOZM4/B9CRUQZETRqwiuX+h+VTyEFNZPdTtenseL/gltejzK4gBAPPpUNFmmn6x5v+vKh61Fo4heAEgNEFyMGBoI4KsYBAQWFn0i6ADQBpEDCt2onvPbFYtbthcDAWukAAUoUAiBYFcA35YsNkaWqdrZolIPkTpARxUiH65JAQpQgAIUoAAFoiCgQNYI2tXiuIpsF8U6Xwc3NS3qaYlCfsyBAoUS4ABA2PIcAAhbmPEpMByB9Ib60WaUNhrrX6aK+QKZGFy/UBm6qZG7AwwHNZ7H9EODaxfaApXdxsHWbFZ/27S448V4lsOskyjAAYAkdjUhNa3dUj0V6lzsW50vgougwYepjgNkLC9GJKTJb5YR3OXfBsjrqjhiRF9+4/EQO0Ts1h2ZrgPNjUO7APBFAQpQgAJ5EAgeA3D/pprJGTWLxNHFUFwAYDKACdydJw8N4BIUoAAFKEABChReQGUQosF2/kcUsg/A71LIPHr9wu7dhU+OGVAgGgIcAAi7DxwACFuY8SkwUoG7H2moqBhl50rK/xAsZgOYpoLxsBgHg0ruDjBS4UgdH2zf3wrIMaieUJE9BnaLOLr5xss790cqUyZDgdMCHADgqRALgUd2NFT0nsxcAiMXwuICFZkB6DkAGqCoh8CJRSFM8q0CbQAOn/pXDiqwy6h9HoPeyzdd3R38Hl8UoAAFKFBggfROlLjtdVOt6OVG9BJVzFBgugDTOAxQ4OZweQpQgAIUoAAFci0QbOO/H4IDCuw2ap7xrN0+ekL7a0tnYjDXizEeBeIuwAGAsDvIAYCwhRmfArkUuGsbUmO9+qnw/Q+IlQtFNPj+JLiZYhKAYJeA0blcj7HCFVDACoZ2KD51/ULkgIF9SS1eDK5f3HhVd7sINNwsGJ0CIxPgAMDI/Hh0AQQ2bIDbiepJfqk5H4opRnWqqkyDwTRYTIQMfajyFS0BD5A2qB6AwV6o7hM1R6yje+yg8xrGtRxsmoVMtFJmNhSgAAUo8FaB4IfZcYPjpvh+5v0izmwxepFaTFfBBQKMoRYFKEABClCAAhSInYCiC6J7AfMyRF9VX3aYFHbXjK/c13ju/mAggC8KUOAdBDi95eGdAAAHhElEQVQAEPapwQGAsIUZnwJhCvx8a+2Y8qw9F+JMV7EzEFy/OHUzRXBTY7DDIh95HGYDhhVbWiC6D4p9IjgCK3uD6xeOunuqM+VHGhv5d8NhsfKggglwAKBg9Fw4VwLpNEr8+uqJJQZT4JpxwYeoWpxnBFMVmHH6A7UsV+sxzpkISHB3xCER3WtV9hrYvWJw2Gb1iLE4uGNJ58FmgT2TSHwPBShAAQpEU2D15upzHJUp1shMqE63KsEgwPkApgKoiGbWzIoCFKAABShAgaIWkGDwXA8Gz2oV0ecVZo8ABz1r90wr6zg6bx6C7V35ogAFzkCAAwBngDSit3AAYER8PJgCERIIHrW4asuYmpSaKZ6VSQaYKAZT1MrQTRUGQ9cxqgDwel3++tYP4KhADypkDwSviJpj6nuHTAkOlpeXtlw753hv/tLhShTIvQD/QMm9KSMWWCCtcEo31zVkrV8nYsaJsXVWMVlULoRg5uktd4JJOz42IGe9klehuheCY8Hzb9Tqq1BplxLbIhmnpayntX3pUm6ZmDNuBqIABSgQIYHgB9mHfldb2eOZCa71xqsr7xOL90PMbFVcqNApAqQilDJToQAFKEABClCgWAQUfvBzKoAXBXhRRXZZH4fE6LEBF4du+XD7yWKhYJ0UyLUABwByLfrn8TgAELYw41OgUAKqMP/xu9rRFb5bb012vFhTZ2EnGpVzFZimwGwDjFOgplA5JmpdgRXFMUWwMzH+oKIvG8EhtaYV6rXDd074S9qPNgn8RNXNYopegAMARX8KJB+gWWEueqK+3Cnzq9VDlbVSIUClODpHgmk7xWQVvP/04wOCSTu+3lmgTYF9BnoEkFcVeFUUh62YVqM4OWhtv1+KLn6JwlOIAhSgQPEKBIN47uOV1TY1qtaKrTGOToaVmUb0Ej21Q8Cc4tVh5RSgAAUoQAEKhC8grwK6HYKXReVFiB6Fa9pSfYPto9Hd2dgIL/wcuAIFki/AAYCwe8wBgLCFGZ8CURJYvx6lftnEyozbO0YlVWusVwFHJkDlPAtMM5BzAD0PpwYD3CjlHqlcgsc7GbwuGgx+4pACrwePeHIc7bOKk+Kiy+93OnctaenjDsWR6hyTCUGAAwAhoDJkPAQe2dFQ0dXbX+p4JaW+KxUlnl+SdWWCeDhPDCYDOk2DnQMEkxSYJICJR2U5yXIHRLJQPAvRNvVlt3H9QxDnhJfxBuC5mfISr6/Fq+n/z0v2D4pAc7Iqg1CAAhSgQOIENmyAezJVV+ZZjIY4ZcYMjlGVWQozS8RepCoXn34GXuJqZ0EUoAAFKEABCoQucOpOLmC3wOzUlL8Vg26/iPb4g35fvdvRywv+ofeACxSpAAcAwm48BwDCFmZ8CkRd4K5tSE32ass6e9wytzRbajxTbo1NuUYusJDpAjsZEuy8KDUCBMMB5VGvKUf5Bdci2lWxWwSHANmrFofUxaspT49mXCfjeNrru5nBqoqyQW7lnyN1homdAAcAYtcyJhymQDoNZ/ToGW6r0+2OMhkXFb4Dr9xx4LmQ7CwLp8YRnAPFJAgmqASDAlIP1SkASsLMLXexZRDQ3RB0qtUjYuR1tbIPqsdSxrzkWZyU0sEMugHPGTVYVpmyE/B69oG58DkVl7suMBIFKECBYhbYtg2po5iY8rr7SrLOqJTB4AQVOd8ILgh2CBBgerDlHTjVXsynCWunAAUoQAEKvFUgo5CdorpHITtg9BWT0d2eU3o8VTmQzXamvNH9VdmlS/cMko0CFMiPAAcAwnbmAEDYwoxPgbgKBIMBNZlJLgYHnXI3k8qUWOP1jUoBg6NTKWemb2WSGJ0qIuNVMRWCsqHdGDU2AwIZiBwEtEUUh6A4CsFhX3HAwO+ApnYOZox1ywey6HX8AVvi1fmVXk/PHq+pidv4x/W8Zt65F+AAQO5NGTGhAsEzjoPS7rgDgq8j+AerVkGwEqh/4tTvtbh1c0S1Ovi14+o5ajE1+LVYjFKDaRDUv5VHVBosdNrZPhtZgJMqeP6tsdQiK8DB4MPwj/9fLXYopDP471F+Zkew3eFQni2n7thfuRJ6B4ZqGfpv3smf0JOXZVGAAhSIgUDwORt8xl500anP1Pp6SGdJ1TkenOmiOgca/ACLi4FgCzydGYOSmCIFKEABClCAAmcpoMArIjghFttU0AuVp4zxW6sznS/98efYXbugX/86lD+/niUu306BHAtwACDHoH8RjgMAYQszPgWSKPDWaxhf//rp6xenv2P5Y72tztjFp389WsReKCKndg7QoZ2Qp4hB6q02orhYgTFn46VA1gR35ose/5PjFC1isVcNBoaWVHSqyo6hX4t01nutQ79uWQLFqjevX+AOIPj7X/B7/Dvg2XSC7y1mAQ4AFHP3WTsFKEABClCAAhSIqcDqjQ3T4OoEqD9OfT3XQFNWzAIxgKiWQoNt8FBxurzgMT7O25Qa/D/+fTim5wDTpgAFKECByAgEX8b6b5NN8P/s6S+Ue98Yn98JI1lV+Mbarb4V3zjmdTjmAPoyh5df1XkgMhUxEQpQgAIUoAAFKEABClCAAjEW+H8DUI0o3BaohgAAAABJRU5ErkJggg=="""
-logo_image = Image.open(io.BytesIO(base64.b64decode(base64_logo.encode())))
-# Resize logo for custom title bar (example: 80x40)
-logo_image_resized = logo_image.resize((80, 40), Image.LANCZOS)
-logo_tk_image = ImageTk.PhotoImage(logo_image_resized)
-logo_label = tk.Label(title_bar, image=logo_tk_image, bg="lightgray")
+# The logo is decoded and scaled once the window is shown, so it does not delay the first frame
+logo_label = tk.Label(title_bar, bg="lightgray")
 logo_label.pack(side="left", padx=10)
+
+def load_logo():
+    logo_image = Image.open(io.BytesIO(base64.b64decode(base64_logo.encode())))
+    # Resize logo for custom title bar (example: 80x40)
+    logo_image_resized = logo_image.resize((80, 40), Image.LANCZOS)
+    logo_label.image = ImageTk.PhotoImage(logo_image_resized)  # Keep a reference, Tk does not
+    logo_label.config(image=logo_label.image)
+
+def report_startup_time():
+    """Prints how long the window took to become ready and warns if startup got slow again."""
+    elapsed = time.perf_counter() - startup_started
+    print(f"Startup: {elapsed:.2f} s")
+    if elapsed > startup_budget:
+        print(f"Warnung: Start dauerte länger als {startup_budget:.1f} s")
+    loaded = [name for name in deferred_modules if name in sys.modules]
+    if loaded:
+        print(f"Warnung: Beim Start geladen, obwohl erst bei Bedarf benötigt: {', '.join(loaded)}")
+
+root.after_idle(load_logo)
 # You can add a label for the window title next to the logo
 title_label = tk.Label(title_bar, text="Multimedia Werkzeug", bg="lightgray", font=("Arial", 14))
 title_label.pack(side="left", padx=10)
@@ -377,6 +437,9 @@ notebook.pack(expand=True, fill='both')
 # Create a label for the copyright notice
 copyright_label = tk.Label(root, text="Copyright © 2025 ciSio. All Rights Reserved.", anchor='w')
 copyright_label.pack(side='bottom', fill='x')
+# Queued and running jobs, each with a Cancel button
+jobs_frame = tk.Frame(root)
+jobs_frame.pack(side='bottom', fill='x')
 
 # Create frames for each tab
 video_frame = ttk.Frame(notebook)
@@ -397,7 +460,8 @@ video_input_label = tk.Label(video_frame, text="Eingabevideo:")
 video_input_label.grid(row=0, column=0, padx=10, pady=10, sticky="w")
 video_input_entry = tk.Entry(video_frame, width=50)
 video_input_entry.grid(row=0, column=1, padx=10, pady=10, sticky="w")
-video_input_browse_button = tk.Button(video_frame, text="Durchsuchen...", command=lambda: browse_input_file(video_input_entry))
+video_input_browse_button = tk.Button(video_frame, text="Durchsuchen...", command=lambda: (browse_input_file(video_input_entry),
+                                      show_thumbnails(video_thumbnail_strip, split_input_paths(video_input_entry.get()))))
 video_input_browse_button.grid(row=0, column=2, padx=10, pady=10)
 
 video_output_label = tk.Label(video_frame, text="Ausgabedatei:")
@@ -422,6 +486,10 @@ video_progress_label = tk.Label(video_frame, text="")
 video_progress_label.grid(row=5, column=0, columnspan=3, padx=10, pady=5)
 video_progress_label.grid_remove()  # Hide the label initially
 
+# Preview frames of the selected video
+video_thumbnail_strip = tk.Frame(video_frame)
+video_thumbnail_strip.grid(row=6, column=0, columnspan=3, padx=10, pady=5)
+
 # Labels for original and compressed sizes
 video_original_size_label = tk.Label(video_frame, text="")
 video_original_size_label.grid(row=7, column=0, columnspan=3, padx=10, pady=5)
@@ -456,6 +524,13 @@ quality_label.grid(row=3, column=0, padx=10, pady=5, sticky="w")
 quality_dropdown = tk.OptionMenu(pdf_frame, quality_var, "Niedrig", "Mittel", "Hoch")
 quality_dropdown.grid(row=3, column=1, padx=10, pady=5, sticky="w")  # Place dropdown in the same row
 
+# Compression engine selection, "Nur Bilder" only recompresses the images and needs no Ghostscript
+engine_var = tk.StringVar(value="Ghostscript")
+engine_label = tk.Label(pdf_frame, text="Methode:")
+engine_label.grid(row=4, column=0, padx=10, pady=5, sticky="w")
+engine_dropdown = tk.OptionMenu(pdf_frame, engine_var, "Ghostscript", "Nur Bilder")
+engine_dropdown.grid(row=4, column=1, padx=10, pady=5, sticky="w")
+
 # Draw a line between the buttons
 line_canvas = tk.Canvas(pdf_frame, width=2, height=100, bg="black")
 line_canvas.grid(row=3, column=1, rowspan=3, padx=5, pady=5)  # Adjusted row for the line
@@ -479,7 +554,8 @@ audio_input_label = tk.Label(audio_frame, text="Audio Eingabedatei:")
 audio_input_label.grid(row=0, column=0, padx=10, pady=10)
 audio_input_entry = tk.Entry(audio_frame, width=50)
 audio_input_entry.grid(row=0, column=1, padx=10, pady=10)
-audio_input_button = tk.Button(audio_frame, text="Durchsuchen", command=lambda: browse_input_file(audio_input_entry))
+audio_input_button = tk.Button(audio_frame, text="Durchsuchen", command=lambda: (browse_input_file(audio_input_entry),
+                               show_waveform(audio_waveform_canvas, split_input_paths(audio_input_entry.get()))))
 audio_input_button.grid(row=0, column=2, padx=10, pady=10)
 
 # Audio output
@@ -490,18 +566,24 @@ audio_output_entry.grid(row=1, column=1, padx=10, pady=10)
 audio_output_browse_button = tk.Button(audio_frame, text="Speichern unter...", command=lambda: browse_output_file(audio_output_entry, "audio"))
 audio_output_browse_button.grid(row=1, column=2, padx=10, pady=10)
 
-# Format selection
-audio_format_label = tk.Label(audio_frame, text="Wählen Sie ein Format:")
+# Format selection, several formats are converted from one decoding pass
+audio_format_label = tk.Label(audio_frame, text="Wählen Sie die Formate:")
 audio_format_label.grid(row=2, column=0, padx=10, pady=10)
-audio_format_var = tk.StringVar(value="mp3")  # Default format
-audio_format_options = ttk.Combobox(audio_frame, textvariable=audio_format_var, values=["mp3", "wav", "ogg"])
+audio_format_options = tk.Frame(audio_frame)
 audio_format_options.grid(row=2, column=1, padx=10, pady=10)
+audio_format_vars = {name: tk.BooleanVar(value=(name == "mp3")) for name in audio_format}  # Default format: mp3
+for name, var in audio_format_vars.items():
+    tk.Checkbutton(audio_format_options, text=name, variable=var).pack(side="left")
 
 # Process buttons and labels
 audio_progress_label = tk.Label(audio_frame, text="")
-audio_process_button = tk.Button(audio_frame, text="Audio verarbeiten", command=lambda: start_audio_processing(audio_format_var.get(), audio_progress_label))
+audio_process_button = tk.Button(audio_frame, text="Audio verarbeiten", command=lambda: start_audio_processing([name for name, var in audio_format_vars.items() if var.get()], audio_progress_label))
 audio_process_button.grid(row=3, column=1, padx=10, pady=10)
 
+# Waveform preview of the selected file
+audio_waveform_canvas = tk.Canvas(audio_frame, width=600, height=100, bg="white")
+audio_waveform_canvas.grid(row=4, column=0, columnspan=3, padx=10, pady=10)
+
 # Add the labels for progress
 audio_progress_label.grid(row=5, column=1, padx=10, pady=10)
 
@@ -561,4 +643,12 @@ canvas.config(scrollregion=canvas.bbox("all"))
 
 # ---------------------- Start the Tkinter main loop ---------------------- #
 
+def close_window():
+    # Stop running ffmpeg, Ghostscript and tesseract processes, they would keep running without the window
+    scheduler.cancel_all()
+    root.destroy()
+
+root.protocol("WM_DELETE_WINDOW", close_window)
+root.after_idle(report_startup_time)
+events.start(root)
 root.mainloop()